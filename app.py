@@ -18,7 +18,7 @@ import ipaddress
 import json
 import queue
 import copy
-from collections import deque
+from collections import OrderedDict, deque
 import threading
 import time
 import logging
@@ -30,6 +30,11 @@ import uuid
 import secrets
 import sqlite3
 import argparse
+import bisect
+import struct
+import mmap
+from array import array
+import weakref
 from urllib.parse import urlparse
 from pathlib import Path
 from email.utils import parsedate_to_datetime
@@ -51,15 +56,16 @@ from flask import (
 )
 from flask_wtf import CSRFProtect
 from taximeter import Taximeter
+import geodaesie
 import requests
-from functools import wraps
+from functools import lru_cache, wraps
 from dotenv import load_dotenv, set_key
 from version import get_version
 import qrcode
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from importlib import metadata
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room, leave_room
 from flask_compress import Compress
 
 try:
@@ -1392,6 +1398,9 @@ STAT_FILE = os.path.join(DATA_DIR, "statistics.json")
 PARKTIME_FILE = os.path.join(DATA_DIR, "parktime.json")
 TAXI_DB = os.path.join(DATA_DIR, "taximeter.db")
 STATISTICS_DB = os.getenv("STATISTICS_DB_PATH") or os.path.join(DATA_DIR, "statistics.db")
+# Ohne Umgebungsvariable liegt der Trip-Index im jeweils aktuellen DATA_DIR
+TRIP_INDEX_DB = os.getenv("TRIP_INDEX_DB_PATH")
+TRIP_INDEX_TIMEOUT_SECONDS = max(1.0, float(os.getenv("TRIP_INDEX_TIMEOUT_SECONDS", "30")))
 AGGREGATION_INTERVAL = float(os.getenv("AGGREGATION_INTERVAL_SECONDS", "300"))
 STATISTICS_STARTUP_DELAY = float(os.getenv("STATISTICS_STARTUP_DELAY_SECONDS", "10"))
 STATISTICS_AGGREGATION_PROCESS_TIMEOUT = max(
@@ -1865,13 +1874,71 @@ current_trip_file = None
 current_trip_date = None
 drive_pause_ms = None
 FAHRTPFAD_NACH_PARKEN_MS = 10 * 60 * 1000
-latest_data = {}
+
+
+class _RevisionierteDaten(dict):
+    """Live-Cache mit monotoner Revision je Fahrzeug.
+
+    Jede Zuweisung und jedes Entfernen erhöht die Revision des Schlüssels;
+    Änderungen am bereits gespeicherten Objekt meldet ``aenderung_merken``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.revisionen = {}
+        self._revision_lock = threading.Lock()
+
+    def aenderung_merken(self, cache_id):
+        with self._revision_lock:
+            revision = self.revisionen.get(cache_id, 0) + 1
+            self.revisionen[cache_id] = revision
+        return revision
+
+    def revision(self, cache_id):
+        return self.revisionen.get(cache_id, 0)
+
+    def __setitem__(self, cache_id, daten):
+        super().__setitem__(cache_id, daten)
+        self.aenderung_merken(cache_id)
+
+    def __delitem__(self, cache_id):
+        super().__delitem__(cache_id)
+        self.aenderung_merken(cache_id)
+
+    def pop(self, cache_id, *default):
+        vorhanden = cache_id in self
+        ergebnis = super().pop(cache_id, *default)
+        if vorhanden:
+            self.aenderung_merken(cache_id)
+        return ergebnis
+
+
+def _latest_data_geaendert(cache_id):
+    """Melde eine Änderung an ``latest_data[cache_id]`` ohne neue Zuweisung."""
+
+    merken = getattr(latest_data, "aenderung_merken", None)
+    if merken is not None:
+        merken(cache_id)
+
+
+def _latest_data_revision(cache_id):
+    """Liefere die Revision eines Live-Caches oder ``None`` ohne Revisionen."""
+
+    revision = getattr(latest_data, "revision", None)
+    return revision(cache_id) if revision is not None else None
+
+
+latest_data = _RevisionierteDaten()
 address_cache = {}
 _fleet_telemetry_address_queue = queue.Queue(maxsize=100)
 _fleet_telemetry_address_pending = {}
 _fleet_telemetry_address_lock = threading.Lock()
 _fleet_telemetry_address_thread = None
 subscribers = {}
+_stream_revisionen = {}
+_stream_verlauf = {}
+_stream_letzte_trennung = {}
+STREAM_EPOCHE = uuid.uuid4().hex[:8]
 threads = {}
 _vehicle_list_cache = []
 _vehicle_list_cache_ts = 0.0
@@ -1903,6 +1970,7 @@ _fleet_telemetry_position_lock = threading.Lock()
 _fleet_telemetry_position_letzte_abfrage = {}
 _fleet_telemetry_parkabgleich_letzte_abfrage = {}
 _fleet_telemetry_vehicle_cache = {"mtime": None, "vehicles": []}
+_fleet_telemetry_runtime_cache = {"schluessel": None, "cfg": {}}
 FLEET_TELEMETRY_MQTT_QUEUE_MAX = max(
     1000, int(os.getenv("TESLA_FLEET_TELEMETRY_MQTT_QUEUE_MAX", "20000"))
 )
@@ -1912,9 +1980,21 @@ FLEET_TELEMETRY_MQTT_BATCH_MAX = max(
 FLEET_TELEMETRY_MQTT_BATCH_SECONDS = max(
     0.01, float(os.getenv("TESLA_FLEET_TELEMETRY_MQTT_BATCH_SECONDS", "0.05"))
 )
+FLEET_TELEMETRY_MQTT_BULK_SECONDS = max(
+    0.1, float(os.getenv("TESLA_FLEET_TELEMETRY_MQTT_BULK_SECONDS", "2.0"))
+)
 FLEET_TELEMETRY_CACHE_WRITE_SECONDS = max(
     0.2, float(os.getenv("TESLA_FLEET_TELEMETRY_CACHE_WRITE_SECONDS", "1.0"))
 )
+FLEET_TELEMETRY_OUTBOX_BATCH_MAX = max(
+    1, int(os.getenv("TESLA_FLEET_TELEMETRY_OUTBOX_BATCH_MAX", "200"))
+)
+FLEET_TELEMETRY_OUTBOX_QUEUE_MAX = max(
+    1, int(os.getenv("TESLA_FLEET_TELEMETRY_OUTBOX_QUEUE_MAX", "5000"))
+)
+CACHE_JOURNAL_MAX_BYTES = max(
+    4096, int(os.getenv("TESLA_CACHE_JOURNAL_MAX_BYTES", "262144"))
+)
 FLEET_TELEMETRY_STREAM_QUEUE_MAX = max(
     1, int(os.getenv("TESLA_FLEET_TELEMETRY_STREAM_QUEUE_MAX", "1"))
 )
@@ -1924,6 +2004,19 @@ FLEET_TELEMETRY_STREAM_KEEPALIVE_SECONDS = max(
 FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS = max(
     0.05, float(os.getenv("TESLA_FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS", "0.25"))
 )
+FLEET_TELEMETRY_STREAM_SLOW_CONSUMER_SECONDS = max(
+    5.0, float(os.getenv("TESLA_FLEET_TELEMETRY_STREAM_SLOW_CONSUMER_SECONDS", "30"))
+)
+FLEET_TELEMETRY_STREAM_RATE_MAX_INTERVAL_SECONDS = 60.0
+FLEET_TELEMETRY_STREAM_DELTA_SNAPSHOT_SECONDS = max(
+    5.0, float(os.getenv("TESLA_FLEET_TELEMETRY_STREAM_DELTA_SNAPSHOT_SECONDS", "60"))
+)
+FLEET_TELEMETRY_STREAM_REPLAY_MAX = max(
+    1, int(os.getenv("TESLA_FLEET_TELEMETRY_STREAM_REPLAY_MAX", "32"))
+)
+FLEET_TELEMETRY_STREAM_REPLAY_SECONDS = max(
+    0.0, float(os.getenv("TESLA_FLEET_TELEMETRY_STREAM_REPLAY_SECONDS", "120"))
+)
 FLEET_TELEMETRY_STREAM_DIAGNOSE_FELDER = (
     "fleet_telemetry_raw",
     "fleet_telemetry_field_received_at",
@@ -1932,13 +2025,157 @@ FLEET_TELEMETRY_STREAM_DIAGNOSE_FELDER = (
     "fleet_telemetry_last_field",
     "fleet_telemetry_last_received_field",
 )
-_fleet_telemetry_message_queue = queue.Queue(maxsize=FLEET_TELEMETRY_MQTT_QUEUE_MAX)
+
+
+class _FleetTelemetrieEingangspuffer:
+    """Halte je MQTT-Topic nur die neueste Nachricht in Ankunftsreihenfolge.
+
+    Das Topic enthält bereits die VIN, daher entspricht der Schlüssel dem Paar
+    aus Fahrzeug und Feld. Ein erneut eintreffendes Topic ersetzt seinen
+    älteren Wert an dessen Platz in der Warteschlange; häufige Topics wie
+    ``Location`` werden so bei anhaltendem Rückstau nicht immer weiter nach
+    hinten geschoben.
+
+    Verbindungsereignisse sind dabei Grenzen: Ein ersetztes ``connectivity``
+    rückt ans Ende, ebenso ein Feld, dessen alter Platz vor dem zuletzt
+    eingereihten Verbindungsereignis seiner VIN liegt. So überholt kein neuerer
+    Wert ein Verbindungsereignis, das vor ihm eingetroffen ist.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._eintraege = OrderedDict()
+        self._bedingung = threading.Condition()
+        self._nummer = 0
+        # Laufende Nummer des zuletzt eingereihten Verbindungsereignisses je VIN
+        self._verbindung_nummer = {}
+
+    def qsize(self):
+        return len(self._eintraege)
+
+    def empty(self):
+        return not self._eintraege
+
+    def put_nowait(self, eintrag):
+        """Reihe ein und melde ``(topic, ersetzt)`` für einen verworfenen Wert."""
+
+        topic = eintrag[0]
+        vin = _fleet_telemetrie_topic_vin(topic)
+        verbindung = _fleet_telemetrie_topic_feld(topic) == "connectivity"
+        verworfen = None
+        with self._bedingung:
+            nummer = self._nummer
+            self._nummer += 1
+            if topic in self._eintraege:
+                verworfen = (topic, True)
+                alte_nummer = self._eintraege[topic][0]
+                if verbindung or alte_nummer < self._verbindung_nummer.get(vin, -1):
+                    del self._eintraege[topic]
+                else:
+                    nummer = alte_nummer
+            elif self.maxsize > 0 and len(self._eintraege) >= self.maxsize:
+                verworfen = (self._entnehmen()[0], False)
+            self._eintraege[topic] = (nummer, eintrag)
+            if verbindung:
+                self._verbindung_nummer[vin] = nummer
+            self._bedingung.notify()
+        return verworfen
+
+    put = put_nowait
+
+    def _entnehmen(self):
+        topic, (nummer, eintrag) = self._eintraege.popitem(last=False)
+        vin = _fleet_telemetrie_topic_vin(topic)
+        if self._verbindung_nummer.get(vin) == nummer:
+            del self._verbindung_nummer[vin]
+        return eintrag
+
+    def get_nowait(self):
+        with self._bedingung:
+            if not self._eintraege:
+                raise queue.Empty
+            return self._entnehmen()
+
+    def get(self, timeout=None):
+        with self._bedingung:
+            if timeout is None:
+                while not self._eintraege:
+                    self._bedingung.wait()
+            else:
+                deadline = time.monotonic() + timeout
+                while not self._eintraege:
+                    rest = deadline - time.monotonic()
+                    if rest <= 0:
+                        raise queue.Empty
+                    self._bedingung.wait(rest)
+            return self._entnehmen()
+
+
+_fleet_telemetry_message_queue = _FleetTelemetrieEingangspuffer(
+    FLEET_TELEMETRY_MQTT_QUEUE_MAX
+)
 _fleet_telemetry_profile_queue = queue.Queue(maxsize=1)
 _fleet_telemetry_cache_pending = {}
 _fleet_telemetry_cache_schreib_lock = threading.Lock()
 _fleet_telemetry_profile_reconnect_sent_at = {}
 _fleet_telemetry_queue_verworfen = 0
+_fleet_telemetry_queue_zusammengefasst = 0
+_fleet_telemetry_queue_verworfen_felder = {}
+_fleet_telemetry_queue_zusammengefasst_felder = {}
 _fleet_telemetry_queue_warnung = 0.0
+# Zeitpunkt des zuletzt übernommenen Offline-Ereignisses je VIN
+_fleet_telemetry_offline_seit = {}
+FLEET_TELEMETRY_LATENZ_GRENZEN_MS = (
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+)
+FLEET_TELEMETRY_LATENZ_STUFEN = (
+    "queue_wait",
+    "apply",
+    "enrichment",
+    "profile",
+    "fanout",
+    "sse_write",
+)
+FLEET_TELEMETRY_LATENZ_SCHLUESSEL_MAX = 512
+
+
+class _LatenzHistogramm:
+    """Zähle Laufzeiten in festen Millisekunden-Klassen.
+
+    Der Speicherbedarf hängt nur von ``FLEET_TELEMETRY_LATENZ_GRENZEN_MS`` ab;
+    Perzentile werden auf die Obergrenze ihrer Klasse gerundet.
+    """
+
+    def __init__(self):
+        self.klassen = [0] * (len(FLEET_TELEMETRY_LATENZ_GRENZEN_MS) + 1)
+        self.anzahl = 0
+        self.summe_ms = 0.0
+        self.max_ms = 0.0
+
+    def erfassen(self, dauer_ms):
+        dauer_ms = max(0.0, float(dauer_ms))
+        self.klassen[bisect.bisect_left(FLEET_TELEMETRY_LATENZ_GRENZEN_MS, dauer_ms)] += 1
+        self.anzahl += 1
+        self.summe_ms += dauer_ms
+        if dauer_ms > self.max_ms:
+            self.max_ms = dauer_ms
+
+    def perzentil(self, anteil):
+        if not self.anzahl:
+            return None
+        ziel = anteil / 100.0 * self.anzahl
+        summe = 0
+        for index, anzahl in enumerate(self.klassen):
+            summe += anzahl
+            if summe >= ziel and anzahl:
+                if index < len(FLEET_TELEMETRY_LATENZ_GRENZEN_MS):
+                    return min(float(FLEET_TELEMETRY_LATENZ_GRENZEN_MS[index]), self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+
+_fleet_telemetry_latenzen = {}
+_fleet_telemetry_latenz_lock = threading.Lock()
 FLEET_TELEMETRIE_PROFILE = {"live", "live_extended", "parked", "charging"}
 FLEET_TELEMETRIE_PROFILE_STANDARD = "live"
 FLEET_TELEMETRIE_PROFILE_CONFIG_REVISION = 1
@@ -2546,39 +2783,775 @@ _aprs_sender_thread = None
 _aprs_sender_lock = threading.Lock()
 
 
-def _subscriber_daten_kopie(data):
-    """Erzeuge einen stabilen Snapshot für Live-Stream-Queues."""
+class _OutboxWarteschlange:
+    """Begrenzte Outbox, die bei Überlauf ältere Einträge desselben Fahrzeugs ersetzt.
+
+    ``schluessel`` ordnet einem Eintrag sein Fahrzeug (oder seine Datei) zu.
+    Ist die Warteschlange voll, wird der älteste Eintrag mit demselben
+    Schlüssel verworfen, sonst der älteste überhaupt; der neue Eintrag wird
+    immer angehängt, damit das jüngste Sample erhalten bleibt. ``task_done``
+    und ``join`` verhalten sich wie bei ``queue.Queue``.
+    """
+
+    def __init__(self, maxsize, schluessel):
+        self.maxsize = maxsize
+        self.unfinished_tasks = 0
+        self._schluessel = schluessel
+        self._eintraege = deque()
+        self._bedingung = threading.Condition()
+
+    def qsize(self):
+        return len(self._eintraege)
+
+    def empty(self):
+        return not self._eintraege
+
+    def ersetzend_einreihen(self, eintrag):
+        """Reihe ``eintrag`` ohne Blockieren ein.
+
+        Liefert ``None`` oder den Eintrag, der dafür verworfen wurde.
+        """
+
+        verworfen = None
+        with self._bedingung:
+            if self.maxsize > 0 and len(self._eintraege) >= self.maxsize:
+                schluessel = self._schluessel(eintrag)
+                index = next(
+                    (
+                        position
+                        for position, vorhanden in enumerate(self._eintraege)
+                        if self._schluessel(vorhanden) == schluessel
+                    ),
+                    0,
+                )
+                verworfen = self._eintraege[index]
+                del self._eintraege[index]
+            else:
+                self.unfinished_tasks += 1
+            self._eintraege.append(eintrag)
+            self._bedingung.notify_all()
+        return verworfen
+
+    def get_nowait(self):
+        with self._bedingung:
+            if not self._eintraege:
+                raise queue.Empty
+            return self._eintraege.popleft()
+
+    def get(self):
+        with self._bedingung:
+            while not self._eintraege:
+                self._bedingung.wait()
+            return self._eintraege.popleft()
+
+    def task_done(self):
+        with self._bedingung:
+            if self.unfinished_tasks <= 0:
+                raise ValueError("task_done() called too many times")
+            self.unfinished_tasks -= 1
+            if not self.unfinished_tasks:
+                self._bedingung.notify_all()
+
+    def join(self):
+        with self._bedingung:
+            while self.unfinished_tasks:
+                self._bedingung.wait()
+
+
+# Nebenwirkungen der Telemetry-Verarbeitung, die außerhalb der Sperre laufen
+_outbox_warteschlangen = {
+    "v2l": _OutboxWarteschlange(
+        FLEET_TELEMETRY_OUTBOX_QUEUE_MAX, lambda eintrag: eintrag[0]
+    ),
+    "parken": _OutboxWarteschlange(
+        FLEET_TELEMETRY_OUTBOX_QUEUE_MAX, lambda eintrag: eintrag[0]
+    ),
+    "trip_index": _OutboxWarteschlange(
+        FLEET_TELEMETRY_OUTBOX_QUEUE_MAX, lambda eintrag: eintrag
+    ),
+}
+_outbox_threads = {}
+_outbox_lock = threading.Lock()
+_outbox_verworfen = {}
+_outbox_warnung = 0.0
+
+
+_daten_kopie_fehlt = object()
+# Letzter eingefrorener Stand je (Zweck, cache_id) für Copy-on-Write-Kopien
+_daten_kopien = {}
+
+
+def _daten_cow_kopie(wert, vorher=None):
+    """Kopiere JSON-artige Daten und teile unveränderte Teilbäume mit ``vorher``.
+
+    ``vorher`` ist eine frühere Kopie derselben Daten, die nie verändert wird.
+    Gleiche Teilbäume werden als dasselbe Objekt übernommen, sodass Snapshots
+    aufeinanderfolgender Revisionen sie strukturell teilen. Koordinatenlisten
+    wie der Fahrtpfad wachsen nur an; ihr unveränderter Anfang wird per
+    Vergleich auf C-Ebene erkannt und nicht erneut kopiert.
+    """
+
+    if isinstance(wert, dict):
+        alt = vorher if isinstance(vorher, dict) else None
+        geteilt = alt is not None and len(alt) == len(wert)
+        neu = {}
+        for schluessel, kind in wert.items():
+            kind_alt = (
+                alt.get(schluessel, _daten_kopie_fehlt)
+                if alt is not None
+                else _daten_kopie_fehlt
+            )
+            if isinstance(kind, (dict, list, tuple)):
+                kopie = _daten_cow_kopie(
+                    kind, None if kind_alt is _daten_kopie_fehlt else kind_alt
+                )
+            elif type(kind_alt) is type(kind) and kind_alt == kind:
+                kopie = kind_alt
+            else:
+                kopie = kind
+            neu[schluessel] = kopie
+            if geteilt and kopie is not kind_alt:
+                geteilt = False
+        return alt if geteilt else neu
+    if isinstance(wert, list):
+        alt = vorher if isinstance(vorher, list) else None
+        if alt:
+            anzahl = len(alt)
+            if (
+                isinstance(alt[0], (list, tuple))
+                and len(wert) >= anzahl
+                and wert[:anzahl] == alt
+            ):
+                if len(wert) == anzahl:
+                    return alt
+                return alt + [_daten_cow_kopie(kind) for kind in wert[anzahl:]]
+        geteilt = alt is not None and len(alt) == len(wert)
+        neu = []
+        for index, kind in enumerate(wert):
+            kind_alt = alt[index] if geteilt else None
+            if isinstance(kind, (dict, list, tuple)):
+                kopie = _daten_cow_kopie(kind, kind_alt)
+            elif geteilt and type(kind_alt) is type(kind) and kind_alt == kind:
+                kopie = kind_alt
+            else:
+                kopie = kind
+            neu.append(kopie)
+            if geteilt and kopie is not kind_alt:
+                geteilt = False
+        return alt if geteilt else neu
+    if isinstance(wert, tuple):
+        return tuple(_daten_cow_kopie(kind) for kind in wert)
+    return wert
+
+
+def _daten_kopie_teilen(zweck, cache_id, data):
+    """Kopiere ``data`` gegen die letzte Kopie desselben Zwecks und Fahrzeugs.
+
+    Die oberste Ebene ist immer ein neues Dict; alle tieferen Ebenen gehören
+    zum gemeinsamen Stand und dürfen nicht verändert werden.
+    """
+
+    schluessel = (zweck, cache_id)
+    kopie = _daten_cow_kopie(data, _daten_kopien.get(schluessel))
+    _daten_kopien[schluessel] = kopie
+    return dict(kopie)
+
+
+def _subscriber_daten_kopie(data, cache_id=None):
+    """Erzeuge einen stabilen Snapshot für Live-Stream-Queues.
+
+    Ohne ``cache_id`` ist die Kopie vollständig unabhängig. Mit ``cache_id``
+    teilt sie unveränderte Teilbäume mit dem vorigen Snapshot des Fahrzeugs.
+    """
 
     if not isinstance(data, dict):
         return data
     try:
-        return copy.deepcopy(data)
+        if cache_id is None:
+            return _daten_cow_kopie(data)
+        return _daten_kopie_teilen("stream", cache_id, data)
     except Exception:
         return dict(data)
 
 
-def _subscriber_stream_payload(data):
+def _subscriber_stream_payload(data, cache_id=None):
     """Entferne reine Serverdiagnose aus einem Browser-Stream-Payload."""
 
-    payload = _subscriber_daten_kopie(data)
+    payload = _subscriber_daten_kopie(data, cache_id)
     if not isinstance(payload, dict):
         return payload
+    if cache_id is not None and isinstance(payload.get("fleet_telemetry_raw"), dict):
+        # Die Anreicherung schreibt in diese Teilbäume; geteilte Stände bleiben
+        # unverändert.
+        for feld in ("vehicle_state", "charge_state", "climate_state"):
+            if isinstance(payload.get(feld), dict):
+                payload[feld] = dict(payload[feld])
     _fleet_telemetrie_rohdaten_anreichern(payload)
     for feld in FLEET_TELEMETRY_STREAM_DIAGNOSE_FELDER:
         payload.pop(feld, None)
     return payload
 
 
+class _StreamSnapshot(dict):
+    """Gemeinsamer Stream-Stand einer Revision für alle Subscriber.
+
+    Der Inhalt wird je Update einmal kopiert und bereinigt und danach nicht
+    mehr verändert. ``frame`` kodiert ihn je Pfad-Ausgangslage eines Clients
+    höchstens einmal; Clients mit gleicher Ausgangslage teilen den Text.
+    """
+
+    def __init__(self, daten, revision=0, feldklasse=None):
+        super().__init__(daten)
+        self.revision = revision
+        self.feldklasse = feldklasse
+        self._frames = {}
+        self._frames_lock = threading.Lock()
+
+    def _pfad_zustand(self, letzte_pfadlaenge, letzte_generation):
+        """Ordne die Pfad-Ausgangslage eines Clients einer Frame-Art zu."""
+
+        path = self.get("path")
+        path_generation = self.get("path_generation")
+        generation_geändert = (
+            path_generation is not None and path_generation != letzte_generation
+        )
+        if isinstance(path, list):
+            path_reset = generation_geändert or len(path) < letzte_pfadlaenge
+            schluessel = ("reset",) if path_reset else ("delta", letzte_pfadlaenge)
+            pfadlaenge = len(path)
+        else:
+            schluessel = ("leer",) if generation_geändert else ("ohne",)
+            pfadlaenge = 0
+        if path_generation is not None:
+            letzte_generation = path_generation
+        return schluessel, pfadlaenge, letzte_generation
+
+    def frame(self, letzte_pfadlaenge, letzte_generation):
+        """Liefere ``(json_rumpf, pfadlaenge, generation)`` für einen Client.
+
+        ``json_rumpf`` ist das JSON-Objekt ohne schließende Klammer, damit der
+        Versandzeitpunkt je Client angehängt werden kann.
+        """
+
+        schluessel, pfadlaenge, generation = self._pfad_zustand(
+            letzte_pfadlaenge, letzte_generation
+        )
+        with self._frames_lock:
+            rumpf = self._frames.get(schluessel)
+            if rumpf is None:
+                rumpf = _stream_json_rumpf(
+                    _stream_pfad_anwenden(dict(self), schluessel)
+                )
+                self._frames[schluessel] = rumpf
+        return rumpf, pfadlaenge, generation
+
+    def projektion(self, abo):
+        """Liefere den auf ein Feld-Abo beschränkten Stand dieser Revision."""
+
+        if abo is None:
+            return self
+        abo_schluessel, felder = abo
+        with self._frames_lock:
+            projiziert = self._frames.get(("abo", abo_schluessel))
+        if projiziert is None:
+            projiziert = _StreamSnapshot(
+                _stream_projizieren(self, felder), self.revision, self.feldklasse
+            )
+            with self._frames_lock:
+                self._frames[("abo", abo_schluessel)] = projiziert
+        return projiziert
+
+    def delta_frame(self, basis, letzte_pfadlaenge, letzte_generation):
+        """Liefere einen JSON-Merge-Patch gegenüber ``basis`` als Rumpf.
+
+        Der Pfad wird wie im vollständigen Frame als Reset oder Delta
+        übertragen und ist nicht Teil des Patches.
+        """
+
+        pfad_schluessel, pfadlaenge, generation = self._pfad_zustand(
+            letzte_pfadlaenge, letzte_generation
+        )
+        schluessel = ("patch", id(basis), pfad_schluessel)
+        with self._frames_lock:
+            eintrag = self._frames.get(schluessel)
+            if eintrag is not None and eintrag[0]() is basis:
+                return eintrag[1], pfadlaenge, generation
+        payload = {
+            "revision": self.revision,
+            "base_revision": basis.revision,
+            "patch": _json_merge_patch(basis, self, STREAM_PFAD_FELDER),
+        }
+        pfad = {feld: self[feld] for feld in ("path", "path_delta") if feld in self}
+        payload.update(_stream_pfad_anwenden(pfad, pfad_schluessel))
+        rumpf = _stream_json_rumpf(payload)
+        with self._frames_lock:
+            self._frames[schluessel] = (weakref.ref(basis), rumpf)
+        return rumpf, pfadlaenge, generation
+
+
+STREAM_PFAD_FELDER = frozenset({"path", "path_delta", "path_reset"})
+STREAM_PROFILE = {
+    "map": (
+        "drive_state.latitude",
+        "drive_state.longitude",
+        "drive_state.heading",
+        "drive_state.speed",
+        "drive_state.shift_state",
+        "drive_state.active_route_active",
+        "drive_state.active_route_destination",
+        "drive_state.active_route_latitude",
+        "drive_state.active_route_longitude",
+        "drive_state.active_route_line",
+        "drive_state.active_route_minutes_to_arrival",
+        "drive_state.active_route_miles_to_arrival",
+        "drive_state.active_route_traffic_minutes_delay",
+        "drive_state.active_route_energy_at_arrival",
+        "path",
+        "location_address",
+        "nearby_superchargers",
+        "park_start",
+        "state",
+        "state_checked_at",
+    ),
+}
+# Zeitstempel gehen mit jedem Abo-Stand mit, wecken aber keinen Client
+STREAM_ABO_META_FELDER = frozenset(
+    {"_live", "timestamp", "fleet_telemetry_received_at"}
+)
+
+
+class _StreamQueue(eventlet_queue.Queue):
+    """Subscriber-Queue eines Streams mit Feld-Abo und Ratenklasse.
+
+    ``letzter_stand`` ist der zuletzt eingereihte Stand; unveränderte
+    Projektionen werden nicht erneut eingereiht. ``wartet_seit`` markiert,
+    seit wann ein Stand auf Auslieferung wartet; daraus ergeben sich der
+    Sendeverzug und die Erkennung langsamer Clients.
+    """
+
+    def __init__(
+        self,
+        maxsize=None,
+        abo=None,
+        intervall=None,
+        rate=None,
+        client=None,
+    ):
+        super().__init__(maxsize=maxsize)
+        self.abo = abo
+        self.letzter_stand = None
+        self.intervall = (
+            FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS
+            if intervall is None
+            else intervall
+        )
+        self.rate = rate
+        self.client = client
+        self.wartet_seit = None
+        self.verdraengt = False
+        self.gesendet = 0
+        self.zusammengefasst = 0
+        self.sende_verzug_ms = None
+        self.sende_verzug_max_ms = None
+
+    def abgeholt(self):
+        """Gib den Beginn der Wartezeit des abgeholten Stands zurück."""
+
+        seit = self.wartet_seit
+        self.wartet_seit = None
+        return seit
+
+    def versand_erfassen(self, seit):
+        """Merke den Sendeverzug eines ausgelieferten Stands."""
+
+        self.gesendet += 1
+        if seit is None:
+            return
+        verzug_ms = max(0.0, (time.monotonic() - seit) * 1000)
+        self.sende_verzug_ms = round(verzug_ms, 1)
+        if self.sende_verzug_max_ms is None or verzug_ms > self.sende_verzug_max_ms:
+            self.sende_verzug_max_ms = round(verzug_ms, 1)
+
+    def zu_langsam(self, jetzt=None):
+        """Prüfe, ob ein Stand länger als erlaubt unausgeliefert bleibt."""
+
+        seit = self.wartet_seit
+        if seit is None:
+            return False
+        if jetzt is None:
+            jetzt = time.monotonic()
+        return (
+            jetzt - seit
+            > FLEET_TELEMETRY_STREAM_SLOW_CONSUMER_SECONDS + self.intervall
+        )
+
+    def status(self):
+        """Fasse Ratenklasse und Sendeverzug für ``/clients`` zusammen."""
+
+        return {
+            "rate": self.rate,
+            "interval_s": self.intervall,
+            "sent": self.gesendet,
+            "coalesced": self.zusammengefasst,
+            "lag_ms": self.sende_verzug_ms,
+            "lag_max_ms": self.sende_verzug_max_ms,
+            "pending_s": (
+                round(time.monotonic() - self.wartet_seit, 1)
+                if self.wartet_seit is not None
+                else None
+            ),
+        }
+
+
+def _stream_rate_lesen(rate=None):
+    """Lese ``rate=`` (z. B. ``1hz``, ``0.2hz``) als Sendeintervall in Sekunden.
+
+    Ohne Angabe gilt ``FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS``; schneller
+    als diese globale Grenze wird nie gesendet. Ungültige Raten lösen
+    ``ValueError`` aus.
+    """
+
+    from math import isfinite
+
+    if not rate:
+        return None
+    text = str(rate).strip().lower()
+    if text.endswith("hz"):
+        text = text[:-2]
+    try:
+        frequenz = float(text)
+    except ValueError:
+        raise ValueError(f"invalid stream rate: {rate}") from None
+    if not isfinite(frequenz) or frequenz <= 0:
+        raise ValueError(f"invalid stream rate: {rate}")
+    intervall = 1.0 / frequenz
+    if intervall > FLEET_TELEMETRY_STREAM_RATE_MAX_INTERVAL_SECONDS:
+        raise ValueError(f"stream rate too low: {rate}")
+    return max(FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS, intervall)
+
+
+def _stream_verdraengen(cache_id, ziel_queue):
+    """Entferne einen langsamen Client aus dem Verteiler."""
+
+    try:
+        subscribers.get(cache_id, []).remove(ziel_queue)
+    except ValueError:
+        return
+    ziel_queue.verdraengt = True
+    info = active_clients.get(ziel_queue.client) if ziel_queue.client else None
+    if info is not None:
+        info["stream_evictions"] = info.get("stream_evictions", 0) + 1
+    app.logger.warning(
+        "Langsamen Stream-Client für %s getrennt (%s s ohne Auslieferung)",
+        cache_id,
+        round(time.monotonic() - (ziel_queue.wartet_seit or time.monotonic()), 1),
+    )
+
+
+def _stream_client_status(client_schlüssel):
+    """Sammle Ratenklasse und Sendeverzug der Streams eines Clients."""
+
+    streams = []
+    for queues in list(subscribers.values()):
+        for ziel_queue in list(queues):
+            if getattr(ziel_queue, "client", None) == client_schlüssel:
+                streams.append(ziel_queue.status())
+    return streams
+
+
+def _stream_status_text(streams, verdraengt=0):
+    """Formatiere den Stream-Status eines Clients für die Tabelle."""
+
+    teile = []
+    for stream in streams:
+        text = stream.get("rate") or "Standard"
+        if stream.get("lag_ms") is not None:
+            text += f", Verzug {stream['lag_ms']:.0f} ms"
+            text += f" (max {stream['lag_max_ms']:.0f} ms)"
+        if stream.get("pending_s"):
+            text += f", wartet {stream['pending_s']} s"
+        if stream.get("coalesced"):
+            text += f", {stream['coalesced']} zusammengefasst"
+        teile.append(text)
+    if verdraengt:
+        teile.append(f"{verdraengt}× wegen Rückstau getrennt")
+    return "; ".join(teile)
+
+
+def _stream_abo_lesen(fields=None, profile=None):
+    """Lese ``fields=``/``profile=`` zu ``(schluessel, felder)`` oder ``None``.
+
+    ``felder`` ordnet Schlüsseln der obersten Ebene ``None`` (ganzer Teilbaum)
+    oder die Menge der gewünschten Unterschlüssel zu. ``path`` bringt
+    ``path_generation`` immer mit. Unbekannte Profile lösen ``ValueError`` aus.
+    """
+
+    angaben = []
+    if profile:
+        for name in str(profile).split(","):
+            name = name.strip()
+            if not name:
+                continue
+            if name not in STREAM_PROFILE:
+                raise ValueError(f"unknown stream profile: {name}")
+            angaben.extend(STREAM_PROFILE[name])
+    if fields:
+        angaben.extend(str(fields).split(","))
+    felder = {}
+    for angabe in angaben:
+        oben, _, unten = angabe.strip().partition(".")
+        if not oben:
+            continue
+        if not unten:
+            felder[oben] = None
+        elif oben not in felder:
+            felder[oben] = {unten}
+        elif felder[oben] is not None:
+            felder[oben].add(unten)
+    if not felder:
+        return None
+    if "path" in felder:
+        felder["path_generation"] = None
+    schluessel = ",".join(
+        oben if unten is None else ",".join(f"{oben}.{u}" for u in sorted(unten))
+        for oben, unten in sorted(felder.items())
+    )
+    return schluessel, {
+        oben: None if unten is None else frozenset(unten)
+        for oben, unten in felder.items()
+    }
+
+
+def _stream_projizieren(daten, felder):
+    """Beschränke Stream-Daten auf die abonnierten Teilbäume."""
+
+    ergebnis = {feld: daten[feld] for feld in STREAM_ABO_META_FELDER if feld in daten}
+    for oben, unten in felder.items():
+        if oben not in daten:
+            continue
+        wert = daten[oben]
+        if unten is None or not isinstance(wert, dict):
+            ergebnis[oben] = wert
+        else:
+            ergebnis[oben] = {k: wert[k] for k in unten if k in wert}
+    return ergebnis
+
+
+def _stream_abo_geaendert(alt, neu):
+    """Prüfe, ob sich ein abonnierter Stand außer in Zeitstempeln geändert hat."""
+
+    if alt is None or neu is None:
+        return alt is not neu
+    schluessel = (set(alt) | set(neu)) - STREAM_ABO_META_FELDER
+    return any(alt.get(feld) != neu.get(feld) for feld in schluessel)
+
+
+def _json_merge_patch(alt, neu, ignorieren=()):
+    """Berechne einen JSON-Merge-Patch (RFC 7386) von ``alt`` nach ``neu``.
+
+    Entfernte Schlüssel werden als ``None`` übertragen; ein Wert ``None`` in
+    ``neu`` ist daher nicht von einem fehlenden Schlüssel zu unterscheiden.
+    """
+
+    patch = {}
+    for schluessel, wert in neu.items():
+        if schluessel in ignorieren:
+            continue
+        if schluessel not in alt:
+            patch[schluessel] = wert
+            continue
+        bisher = alt[schluessel]
+        if bisher is wert:
+            continue
+        if isinstance(bisher, dict) and isinstance(wert, dict):
+            unterschied = _json_merge_patch(bisher, wert)
+            if unterschied:
+                patch[schluessel] = unterschied
+        elif bisher != wert or type(bisher) is not type(wert):
+            patch[schluessel] = wert
+    for schluessel in alt:
+        if schluessel not in neu and schluessel not in ignorieren:
+            patch[schluessel] = None
+    return patch
+
+
+def _stream_pfad_anwenden(payload, schluessel):
+    """Ersetze den vollständigen Pfad durch Reset oder Delta für einen Client."""
+
+    art = schluessel[0]
+    if art == "reset":
+        payload["path_reset"] = True
+        payload.pop("path_delta", None)
+    elif art == "delta":
+        delta = payload.pop("path")[schluessel[1]:]
+        if delta:
+            payload["path_delta"] = delta
+        else:
+            payload.pop("path_delta", None)
+    elif art == "leer":
+        payload["path_reset"] = True
+        payload["path"] = []
+    else:
+        payload.pop("path", None)
+    return payload
+
+
+def _stream_json_rumpf(payload):
+    """Kodiere ein Stream-Payload ohne schließende Klammer."""
+
+    text = json.dumps(payload)
+    return text[:-1] + (", " if payload else "")
+
+
+def _stream_frame(
+    rumpf,
+    stream_sent_at=None,
+    revision=None,
+    ereignis=None,
+    ereignis_id=None,
+):
+    """Schließe einen JSON-Rumpf mit Versandzeit zu einer SSE-Nachricht ab."""
+
+    if stream_sent_at is None:
+        stream_sent_at = int(time.time() * 1000)
+    zusatz = ""
+    if revision is not None:
+        zusatz = f'"stream_revision": {int(revision)}, '
+    kopf = f"id: {ereignis_id}\n" if ereignis_id else ""
+    if ereignis:
+        kopf += f"event: {ereignis}\n"
+    return f'{kopf}data: {rumpf}{zusatz}"stream_sent_at": {stream_sent_at}}}\n\n'
+
+
+def _stream_ereignis_id(revision):
+    """Bilde die SSE-``id`` einer Revision; die Epoche trennt Prozessstarts."""
+
+    if not revision:
+        return None
+    return f"{STREAM_EPOCHE}-{int(revision)}"
+
+
+def _stream_ereignis_id_lesen(ereignis_id):
+    """Lese die Revision aus einer ``Last-Event-ID`` dieses Prozesses."""
+
+    if not ereignis_id:
+        return None
+    epoche, _, revision = str(ereignis_id).strip().rpartition("-")
+    if epoche != STREAM_EPOCHE:
+        return None
+    try:
+        return int(revision)
+    except ValueError:
+        return None
+
+
+def _stream_verlauf_aktiv(cache_id):
+    """Prüfe, ob für ``cache_id`` ein Client verbunden ist oder bald zurückkehrt."""
+
+    if subscribers.get(cache_id):
+        return True
+    getrennt = _stream_letzte_trennung.get(cache_id)
+    return (
+        getrennt is not None
+        and time.monotonic() - getrennt <= FLEET_TELEMETRY_STREAM_REPLAY_SECONDS
+    )
+
+
+def _stream_verlauf_merken(cache_id, snapshot):
+    """Lege einen Stream-Stand im Ringpuffer des Fahrzeugs ab."""
+
+    verlauf = _stream_verlauf.get(cache_id)
+    if verlauf is None:
+        verlauf = deque(maxlen=FLEET_TELEMETRY_STREAM_REPLAY_MAX)
+        _stream_verlauf[cache_id] = verlauf
+    verlauf.append(snapshot)
+
+
+def _stream_fortsetzung(cache_id, ereignis_id):
+    """Liefere ``(basis, aktuell)`` für einen wiederverbundenen Client.
+
+    ``basis`` ist der zuletzt empfangene, ``aktuell`` der neueste Stand. Ist
+    die Revision bereits verdrängt oder fehlen seitdem Stände im Ringpuffer,
+    ergibt sich ``None`` und der Client erhält den vollständigen Stand.
+    """
+
+    revision = _stream_ereignis_id_lesen(ereignis_id)
+    verlauf = _stream_verlauf.get(cache_id)
+    if revision is None or not verlauf:
+        return None
+    aktuell = verlauf[-1]
+    if aktuell.revision != _stream_revisionen.get(cache_id):
+        return None
+    for snapshot in reversed(verlauf):
+        if snapshot.revision == revision:
+            return snapshot, aktuell
+        if snapshot.revision < revision:
+            break
+    return None
+
+
+def _stream_snapshot_erzeugen(data, revision=0, cache_id=None):
+    """Erzeuge einen gemeinsamen Stream-Stand aus Live-Daten.
+
+    Mit ``cache_id`` teilt der Stand unveränderte Teilbäume mit dem vorigen
+    Snapshot desselben Fahrzeugs.
+    """
+
+    feldklasse = None
+    if isinstance(data, dict):
+        feldklasse = _fleet_telemetrie_feld_spur(data.get("fleet_telemetry_last_field"))
+    payload = _subscriber_stream_payload(data, cache_id)
+    if not isinstance(payload, dict):
+        return payload
+    return _StreamSnapshot(payload, revision, feldklasse)
+
+
 def _subscriber_daten_senden(cache_id, data):
-    """Sende Live-Daten an die Frontend-Streams."""
+    """Sende Live-Daten an die Frontend-Streams.
+
+    Alle Subscriber eines Fahrzeugs erhalten denselben ``_StreamSnapshot``
+    bzw. dieselbe Projektion ihres Feld-Abos; der Socket.IO-Raum des
+    Fahrzeugs bekommt ihn als Binärframe. Solange ein Client verbunden
+    ist oder kürzlich getrennt wurde, bleibt der Stand zusätzlich im
+    Ringpuffer für ``Last-Event-ID`` erhalten.
+    """
 
-    for ziel_queue in list(subscribers.get(cache_id, [])):
-        payload = _subscriber_daten_kopie(data)
+    revision = _stream_revisionen.get(cache_id, 0) + 1
+    _stream_revisionen[cache_id] = revision
+    _latest_data_geaendert(cache_id)
+    ziel_queues = list(subscribers.get(cache_id, []))
+    if (
+        not ziel_queues
+        and not _stream_verlauf_aktiv(cache_id)
+        and cache_id not in _fahrzeug_kanaele
+    ):
+        return
+    snapshot = _stream_snapshot_erzeugen(data, revision, cache_id)
+    if isinstance(snapshot, _StreamSnapshot):
+        _stream_verlauf_merken(cache_id, snapshot)
+        _fahrzeug_kanal_melden(cache_id, snapshot)
+    jetzt = time.monotonic()
+    for ziel_queue in ziel_queues:
+        if isinstance(ziel_queue, _StreamQueue) and ziel_queue.zu_langsam(jetzt):
+            _stream_verdraengen(cache_id, ziel_queue)
+            continue
+        payload = snapshot
+        abo = getattr(ziel_queue, "abo", None)
+        if abo is not None and isinstance(snapshot, _StreamSnapshot):
+            payload = snapshot.projektion(abo)
+            if not _stream_abo_geaendert(ziel_queue.letzter_stand, payload):
+                # Keine abonnierte Änderung: Client nicht wecken
+                continue
+            ziel_queue.letzter_stand = payload
         try:
             maxsize = getattr(ziel_queue, "maxsize", 0) or 0
             if maxsize > 0:
                 while ziel_queue.qsize() >= maxsize:
                     ziel_queue.get_nowait()
+                    if isinstance(ziel_queue, _StreamQueue):
+                        ziel_queue.zusammengefasst += 1
+            if isinstance(ziel_queue, _StreamQueue) and ziel_queue.wartet_seit is None:
+                ziel_queue.wartet_seit = jetzt
             if hasattr(ziel_queue, "put_nowait"):
                 ziel_queue.put_nowait(payload)
             else:
@@ -2596,23 +3569,30 @@ def _subscriber_daten_senden(cache_id, data):
             pass
 
 
-def _fleet_telemetrie_cache_kopie(data):
-    """Erzeuge eine cachefähige Kopie ohne Live-Metadaten."""
+def _fleet_telemetrie_cache_kopie(data, cache_id=None):
+    """Erzeuge eine cachefähige Kopie ohne Live-Metadaten.
+
+    Mit ``cache_id`` teilt die Kopie unveränderte Teilbäume mit der zuletzt
+    vorgemerkten Kopie desselben Caches.
+    """
 
-    cached_copy = dict(data)
-    cached_copy.pop("_live", None)
-    cached_copy.pop("state_checked_at", None)
     try:
-        return json.loads(json.dumps(cached_copy))
+        if cache_id is None:
+            cached_copy = _daten_cow_kopie(data)
+        else:
+            cached_copy = _daten_kopie_teilen("cache", cache_id, data)
     except Exception:
-        return cached_copy
+        cached_copy = dict(data)
+    cached_copy.pop("_live", None)
+    cached_copy.pop("state_checked_at", None)
+    return cached_copy
 
 
 def _fleet_telemetrie_cache_spaeter_speichern(cache_id, data):
     """Merke den letzten Cache-Stand für gebündeltes Schreiben vor."""
 
     try:
-        cached_copy = _fleet_telemetrie_cache_kopie(data)
+        cached_copy = _fleet_telemetrie_cache_kopie(data, cache_id)
     except Exception:
         return
     with _fleet_telemetry_cache_schreib_lock:
@@ -3425,7 +4405,8 @@ def _process_parking_log_increment(conn):
 
 def _snapshot_trip_file_state(conn):
     meta = {}
-    for path in _get_trip_files():
+    for eintrag in _trip_index_metriken(_trip_index_eintraege()):
+        path = eintrag["pfad"]
         try:
             stat = os.stat(path)
         except OSError:
@@ -3433,8 +4414,8 @@ def _snapshot_trip_file_state(conn):
         meta[path] = {
             "mtime": stat.st_mtime,
             "size": stat.st_size,
-            "km": _trip_distance(path),
-            "speed": _trip_max_speed(path),
+            "km": eintrag["distanz"] or 0.0,
+            "speed": eintrag["max_speed"] or 0.0,
         }
     _set_meta(conn, "trip_files_meta", json.dumps(meta))
 
@@ -3567,6 +4548,8 @@ def _statistics_aggregation_tick():
             _process_parking_log_increment(conn)
             _process_trip_files_increment(conn)
             _rebuild_monthly_scope(conn)
+            _trip_spalten_aktualisieren()
+            _trip_index_aktualisieren()
         finally:
             if conn is not None:
                 conn.close()
@@ -3695,7 +4678,9 @@ def _log_trip_point(
             ]
             f.write(",".join(str(v) for v in row) + "\n")
     except Exception:
-        pass
+        return
+    if os.path.basename(os.path.dirname(filename)) == "trips":
+        _outbox_vormerken("trip_index", filename)
 
 
 def _fahrtpfad_zurücksetzen(vehicle_data=None):
@@ -3720,12 +4705,13 @@ def _fahrtpfad_zurücksetzen(vehicle_data=None):
     if isinstance(vehicle_data, dict):
         vehicle_data["path"] = trip_path
         vehicle_data["path_generation"] = trip_path_generation
-    for cache_data in list(latest_data.values()):
+    for cache_id, cache_data in list(latest_data.items()):
         if isinstance(cache_data, dict):
             if cache_data.get("path"):
                 geändert = True
             cache_data["path"] = trip_path
             cache_data["path_generation"] = trip_path_generation
+            _latest_data_geaendert(cache_id)
     return geändert
 
 
@@ -5126,13 +6112,81 @@ def _v2l_sitzung_beenden_ungesperrt(
     return abgeschlossen
 
 
-def _v2l_telemetrie_aktualisieren(vehicle_id, data, timestamp_ms=None):
-    """Starte, aktualisiere oder beende V2L anhand aktueller Telemetrie."""
+def _v2l_messpunkt_verarbeiten_ungesperrt(
+    verbindung,
+    vehicle_id,
+    data,
+    signatur_aktiv,
+    timestamp_ms=None,
+):
+    """Starte, ergänze oder beende die V2L-Sitzung für einen Messpunkt.
+
+    Liefert die danach aktive Sitzung oder ``None``; committet nicht.
+    """
 
-    if not isinstance(data, dict):
-        return data
-    vehicle_id = str(vehicle_id or "default")
     werte = _v2l_messwerte(data, timestamp_ms=timestamp_ms)
+    sitzung = _v2l_aktive_sitzung_ungesperrt(verbindung, vehicle_id)
+    if sitzung is None and signatur_aktiv:
+        sitzung = _v2l_sitzung_starten_ungesperrt(
+            verbindung,
+            vehicle_id,
+            data,
+            "automatic",
+            titel="Automatisch erkannt",
+            timestamp_ms=timestamp_ms,
+        )
+    if sitzung is not None:
+        sitzung = _v2l_messpunkt_speichern_ungesperrt(
+            verbindung,
+            sitzung,
+            werte,
+        )
+        if signatur_aktiv and sitzung is not None:
+            verbindung.execute(
+                """
+                UPDATE v2l_sessions
+                SET last_signature_at_ms = ?, updated_at_ms = ?
+                WHERE id = ?
+                """,
+                (
+                    int(werte["zeit_ms"]),
+                    int(werte["zeit_ms"]),
+                    int(sitzung["id"]),
+                ),
+            )
+        automatisches_ende = bool(
+            sitzung is not None
+            and sitzung["source"] == "automatic"
+            and werte["ladestatus"].lower()
+            not in {"", "starting"}
+        )
+        if _v2l_fahrzeug_bewegt(werte) or automatisches_ende:
+            _v2l_sitzung_beenden_ungesperrt(
+                verbindung,
+                sitzung,
+                data=data,
+                timestamp_ms=timestamp_ms,
+            )
+    return _v2l_aktive_sitzung_ungesperrt(verbindung, vehicle_id)
+
+
+def _v2l_status_in_daten(data, aktiv):
+    """Spiegele eine aktive oder fehlende Sitzung in Fahrzeugdaten."""
+
+    data["v2l_active"] = aktiv is not None
+    if aktiv is not None:
+        data["v2l_session_id"] = int(aktiv["id"])
+    else:
+        data.pop("v2l_session_id", None)
+    return data
+
+
+def _v2l_telemetrie_aktualisieren(vehicle_id, data, timestamp_ms=None):
+    """Starte, aktualisiere oder beende V2L anhand aktueller Telemetrie."""
+
+    if not isinstance(data, dict):
+        return data
+    vehicle_id = str(vehicle_id or "default")
     signatur_aktiv = _v2l_signatur_aktiv(data)
     with _v2l_lock:
         _v2l_aktive_fahrzeuge_laden_ungesperrt()
@@ -5142,51 +6196,14 @@ def _v2l_telemetrie_aktualisieren(vehicle_id, data, timestamp_ms=None):
             return data
         verbindung = _v2l_datenbank_öffnen()
         try:
-            sitzung = _v2l_aktive_sitzung_ungesperrt(verbindung, vehicle_id)
-            if sitzung is None and signatur_aktiv:
-                sitzung = _v2l_sitzung_starten_ungesperrt(
-                    verbindung,
-                    vehicle_id,
-                    data,
-                    "automatic",
-                    titel="Automatisch erkannt",
-                    timestamp_ms=timestamp_ms,
-                )
-            if sitzung is not None:
-                sitzung = _v2l_messpunkt_speichern_ungesperrt(
-                    verbindung,
-                    sitzung,
-                    werte,
-                )
-                if signatur_aktiv and sitzung is not None:
-                    verbindung.execute(
-                        """
-                        UPDATE v2l_sessions
-                        SET last_signature_at_ms = ?, updated_at_ms = ?
-                        WHERE id = ?
-                        """,
-                        (
-                            int(werte["zeit_ms"]),
-                            int(werte["zeit_ms"]),
-                            int(sitzung["id"]),
-                        ),
-                    )
-                automatisches_ende = bool(
-                    sitzung is not None
-                    and sitzung["source"] == "automatic"
-                    and werte["ladestatus"].lower()
-                    not in {"", "starting"}
-                )
-                if _v2l_fahrzeug_bewegt(werte) or automatisches_ende:
-                    _v2l_sitzung_beenden_ungesperrt(
-                        verbindung,
-                        sitzung,
-                        data=data,
-                        timestamp_ms=timestamp_ms,
-                    )
-                    sitzung = None
+            aktiv = _v2l_messpunkt_verarbeiten_ungesperrt(
+                verbindung,
+                vehicle_id,
+                data,
+                signatur_aktiv,
+                timestamp_ms=timestamp_ms,
+            )
             verbindung.commit()
-            aktiv = _v2l_aktive_sitzung_ungesperrt(verbindung, vehicle_id)
         finally:
             verbindung.close()
         if aktiv is not None:
@@ -5194,12 +6211,7 @@ def _v2l_telemetrie_aktualisieren(vehicle_id, data, timestamp_ms=None):
         else:
             _v2l_aktive_fahrzeuge.discard(vehicle_id)
 
-    data["v2l_active"] = aktiv is not None
-    if aktiv is not None:
-        data["v2l_session_id"] = int(aktiv["id"])
-    else:
-        data.pop("v2l_session_id", None)
-    return data
+    return _v2l_status_in_daten(data, aktiv)
 
 
 def _v2l_telemetrie_sicher_aktualisieren(
@@ -5220,6 +6232,82 @@ def _v2l_telemetrie_sicher_aktualisieren(
         return data
 
 
+def _v2l_telemetrie_vormerken(vehicle_id, data, timestamp_ms=None):
+    """Übernimm den bekannten V2L-Status und merke den Messpunkt vor.
+
+    Läuft unter der Telemetry-Sperre und berührt daher keine Datenbank; der
+    Outbox-Schreiber speichert den Messpunkt und spiegelt Statuswechsel über
+    ``_v2l_cache_status_setzen`` zurück in die Live-Daten.
+    """
+
+    if not isinstance(data, dict):
+        return data
+    vehicle_id = str(vehicle_id or "default")
+    status_geladen = _v2l_status_datenbankpfad == _v2l_datenbankpfad()
+    aktiv_bekannt = vehicle_id in _v2l_aktive_fahrzeuge
+    if status_geladen and not aktiv_bekannt and not _v2l_signatur_aktiv(data):
+        data["v2l_active"] = False
+        data.pop("v2l_session_id", None)
+        return data
+    if aktiv_bekannt:
+        data["v2l_active"] = True
+    _outbox_vormerken(
+        "v2l",
+        (vehicle_id, _daten_kopie_teilen("v2l", vehicle_id, data), timestamp_ms),
+    )
+    return data
+
+
+def _v2l_outbox_schreiben(stapel):
+    """Schreibe vorgemerkte V2L-Messpunkte in einer gemeinsamen Transaktion."""
+
+    global _v2l_status_datenbankpfad
+
+    vorher = {}
+    aktiv_je_fahrzeug = {}
+    with _v2l_lock:
+        _v2l_aktive_fahrzeuge_laden_ungesperrt()
+        verbindung = _v2l_datenbank_öffnen()
+        try:
+            for vehicle_id, data, timestamp_ms in stapel:
+                signatur_aktiv = _v2l_signatur_aktiv(data)
+                if not signatur_aktiv and vehicle_id not in _v2l_aktive_fahrzeuge:
+                    continue
+                vorher.setdefault(vehicle_id, vehicle_id in _v2l_aktive_fahrzeuge)
+                aktiv = _v2l_messpunkt_verarbeiten_ungesperrt(
+                    verbindung,
+                    vehicle_id,
+                    data,
+                    signatur_aktiv,
+                    timestamp_ms=timestamp_ms,
+                )
+                if aktiv is not None:
+                    _v2l_aktive_fahrzeuge.add(vehicle_id)
+                else:
+                    _v2l_aktive_fahrzeuge.discard(vehicle_id)
+                aktiv_je_fahrzeug[vehicle_id] = aktiv
+            verbindung.commit()
+        except Exception:
+            # Der Stapel wurde verworfen; aktive Sitzungen neu aus der DB laden.
+            _v2l_status_datenbankpfad = None
+            raise
+        finally:
+            verbindung.close()
+    for vehicle_id, aktiv in aktiv_je_fahrzeug.items():
+        if vorher[vehicle_id] == (aktiv is not None):
+            continue
+        cache_daten = _v2l_cache_status_setzen(
+            vehicle_id,
+            aktiv is not None,
+            sitzungs_id=aktiv["id"] if aktiv is not None else None,
+        )
+        try:
+            if cache_daten is not None:
+                _fleet_telemetrie_profile_aktualisieren(vehicle_id, cache_daten)
+        except Exception as exc:
+            logging.warning("V2L-Liveprofil konnte nicht umgestellt werden: %s", exc)
+
+
 def _v2l_cache_status_setzen(vehicle_id, aktiv, sitzungs_id=None):
     """Spiegele den V2L-Status in alle passenden Live-Caches."""
 
@@ -5243,6 +6331,7 @@ def _v2l_cache_status_setzen(vehicle_id, aktiv, sitzungs_id=None):
                 daten["v2l_session_id"] = int(sitzungs_id)
             else:
                 daten.pop("v2l_session_id", None)
+            _latest_data_geaendert(cache_id)
             if erstes_ergebnis is None:
                 erstes_ergebnis = daten
     return erstes_ergebnis
@@ -5452,22 +6541,235 @@ def _cache_file(vehicle_id):
     return os.path.join(vehicle_dir(vehicle_id), "cache.json")
 
 
+def _cache_journal_file(vehicle_id):
+    """Return filename of the change journal belonging to ``cache.json``."""
+    return os.path.join(vehicle_dir(vehicle_id), "cache.journal")
+
+
+# Schlüssel in ``cache.json``, der die Generation des passenden Journals nennt.
+CACHE_JOURNAL_BASIS_SCHLUESSEL = "_cache_journal"
+
+_cache_journal_lock = threading.Lock()
+_cache_journal_staende = {}
+
+
+def _cache_journal_texte(data):
+    """Kodiere Cache-Daten feldweise für den Vergleich mit dem letzten Stand.
+
+    Dictionaries der obersten Ebene (``drive_state`` ...) werden je
+    Unterschlüssel kodiert, damit das Journal nur geänderte Felder enthält.
+    Vom Fahrtpfad ``path`` werden nur Generation, Länge und letzter Punkt
+    gemerkt, damit weitere Punkte als Anhang geschrieben werden können.
+    """
+
+    texte = {}
+    for schluessel, wert in data.items():
+        if schluessel == "path" and isinstance(wert, list):
+            texte[schluessel] = (
+                data.get("path_generation"),
+                len(wert),
+                json.dumps(wert[-1], sort_keys=True) if wert else None,
+            )
+        elif isinstance(wert, dict):
+            texte[schluessel] = {
+                feld: json.dumps(feldwert, sort_keys=True)
+                for feld, feldwert in wert.items()
+            }
+        else:
+            texte[schluessel] = json.dumps(wert, sort_keys=True)
+    return texte
+
+
+def _cache_journal_eintrag(alt, neu, data):
+    """Beschreibe die Änderungen von ``alt`` nach ``neu`` als Journal-Eintrag."""
+
+    setzen = {}
+    felder = {}
+    felder_entfernt = {}
+    pfad_anhang = None
+    for schluessel, text in neu.items():
+        bisher = alt.get(schluessel)
+        if isinstance(text, tuple) and isinstance(bisher, tuple):
+            if text == bisher:
+                continue
+            generation, laenge, letzter = text
+            bisherige_generation, bisherige_laenge, bisheriger_letzter = bisher
+            pfad = data[schluessel]
+            if (
+                generation == bisherige_generation
+                and laenge > bisherige_laenge
+                and (
+                    bisherige_laenge == 0
+                    or json.dumps(pfad[bisherige_laenge - 1], sort_keys=True)
+                    == bisheriger_letzter
+                )
+            ):
+                pfad_anhang = pfad[bisherige_laenge:]
+            else:
+                # Neue Generation oder gekürzter Pfad: vollständig ersetzen.
+                setzen[schluessel] = list(pfad)
+        elif isinstance(text, dict) and isinstance(bisher, dict):
+            geaendert = {
+                feld: data[schluessel][feld]
+                for feld, feldtext in text.items()
+                if bisher.get(feld) != feldtext
+            }
+            entfernt = [feld for feld in bisher if feld not in text]
+            if geaendert:
+                felder[schluessel] = geaendert
+            if entfernt:
+                felder_entfernt[schluessel] = entfernt
+        elif text != bisher:
+            setzen[schluessel] = data[schluessel]
+    eintrag = {}
+    if setzen:
+        eintrag["set"] = setzen
+    entfernt = [schluessel for schluessel in alt if schluessel not in neu]
+    if entfernt:
+        eintrag["del"] = entfernt
+    if felder:
+        eintrag["merge"] = felder
+    if felder_entfernt:
+        eintrag["merge_del"] = felder_entfernt
+    if pfad_anhang:
+        eintrag["path_append"] = pfad_anhang
+    return eintrag
+
+
+def _cache_journal_anwenden(daten, eintrag):
+    """Spiele einen Journal-Eintrag in geladene Cache-Daten ein."""
+
+    for schluessel, wert in (eintrag.get("set") or {}).items():
+        daten[schluessel] = wert
+    for schluessel in eintrag.get("del") or ():
+        daten.pop(schluessel, None)
+    for schluessel, felder in (eintrag.get("merge") or {}).items():
+        abschnitt = daten.get(schluessel)
+        if not isinstance(abschnitt, dict):
+            abschnitt = daten[schluessel] = {}
+        abschnitt.update(felder)
+    for schluessel, felder in (eintrag.get("merge_del") or {}).items():
+        abschnitt = daten.get(schluessel)
+        if isinstance(abschnitt, dict):
+            for feld in felder:
+                abschnitt.pop(feld, None)
+    if eintrag.get("path_append"):
+        pfad = daten.get("path")
+        if isinstance(pfad, list):
+            pfad.extend(eintrag["path_append"])
+        else:
+            daten["path"] = list(eintrag["path_append"])
+
+
+def _cache_snapshot_schreiben(vehicle_id, data):
+    """Schreibe ``cache.json`` atomar und beginne ein neues leeres Journal.
+
+    Snapshot und Journal tragen dieselbe Generation. Bricht das Schreiben
+    zwischen beiden Dateien ab, passt das alte Journal nicht mehr zum neuen
+    Snapshot und wird beim Laden ignoriert.
+    """
+
+    generation = uuid.uuid4().hex
+    ziel = _cache_file(vehicle_id)
+    tmp = f"{ziel}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({**data, CACHE_JOURNAL_BASIS_SCHLUESSEL: generation}, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, ziel)
+    journal = _cache_journal_file(vehicle_id)
+    tmp = f"{journal}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"basis": generation}) + "\n")
+    os.replace(tmp, journal)
+
+
+def _cache_journal_lesen(vehicle_id, generation):
+    """Liefere die Journal-Einträge, die zur Snapshot-Generation gehören.
+
+    Eine unvollständige letzte Zeile nach einem Absturz beendet das Lesen.
+    """
+
+    if not generation:
+        return []
+    try:
+        with open(_cache_journal_file(vehicle_id), "r", encoding="utf-8") as f:
+            zeilen = f.read().splitlines()
+    except OSError:
+        return []
+    if not zeilen:
+        return []
+    try:
+        kopf = json.loads(zeilen[0])
+    except ValueError:
+        return []
+    if not isinstance(kopf, dict) or kopf.get("basis") != generation:
+        return []
+    einträge = []
+    for zeile in zeilen[1:]:
+        try:
+            eintrag = json.loads(zeile)
+        except ValueError:
+            break
+        if isinstance(eintrag, dict):
+            einträge.append(eintrag)
+    return einträge
+
+
 def _load_cached(vehicle_id):
-    """Load cached vehicle data from disk."""
+    """Load cached vehicle data from disk.
+
+    The ``cache.json`` snapshot is read first, then the matching tail of
+    ``cache.journal`` is replayed on top of it.
+    """
     try:
         with open(_cache_file(vehicle_id), "r", encoding="utf-8") as f:
-            return json.load(f)
+            daten = json.load(f)
     except Exception:
         return None
+    if not isinstance(daten, dict):
+        return daten
+    generation = daten.pop(CACHE_JOURNAL_BASIS_SCHLUESSEL, None)
+    for eintrag in _cache_journal_lesen(vehicle_id, generation):
+        _cache_journal_anwenden(daten, eintrag)
+    return daten
 
 
 def _save_cached(vehicle_id, data):
-    """Write vehicle data cache to disk."""
+    """Write vehicle data cache to disk.
+
+    Changes since the previous call are appended to ``cache.journal``. The
+    full ``cache.json`` snapshot is only rewritten on the first call of a
+    process and whenever the journal grows beyond ``CACHE_JOURNAL_MAX_BYTES``.
+    """
     try:
-        with open(_cache_file(vehicle_id), "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        texte = _cache_journal_texte(data)
     except Exception:
-        pass
+        return
+    with _cache_journal_lock:
+        stand = _cache_journal_staende.pop(vehicle_id, None)
+        try:
+            if stand is None:
+                _cache_snapshot_schreiben(vehicle_id, data)
+                groesse = 0
+            else:
+                eintrag = _cache_journal_eintrag(stand["texte"], texte, data)
+                if not eintrag:
+                    _cache_journal_staende[vehicle_id] = stand
+                    return
+                zeile = json.dumps(eintrag, separators=(",", ":")) + "\n"
+                with open(
+                    _cache_journal_file(vehicle_id), "a", encoding="utf-8"
+                ) as f:
+                    f.write(zeile)
+                groesse = stand["bytes"] + len(zeile.encode("utf-8"))
+                if groesse > CACHE_JOURNAL_MAX_BYTES:
+                    _cache_snapshot_schreiben(vehicle_id, data)
+                    groesse = 0
+        except Exception:
+            # Ohne bekannten Stand schreibt der nächste Aufruf einen Snapshot.
+            return
+        _cache_journal_staende[vehicle_id] = {"texte": texte, "bytes": groesse}
 
 
 def _fleet_telemetrie_wahr(value):
@@ -6024,6 +7326,20 @@ def _fleet_telemetrie_packleistung_aktualisieren(data):
 
 def _fleet_telemetrie_runtime_config():
     """Lade die lokale Fleet-Telemetry-Laufzeitkonfiguration."""
+    try:
+        mtime = os.stat(TESLA_FLEET_TELEMETRY_RUNTIME_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    schluessel = (
+        TESLA_FLEET_TELEMETRY_RUNTIME_FILE,
+        mtime,
+        os.getenv("TESLA_FLEET_TELEMETRY_ENABLED"),
+        os.getenv("TESLA_FLEET_TELEMETRY_MQTT_HOST"),
+        os.getenv("TESLA_FLEET_TELEMETRY_MQTT_PORT"),
+        os.getenv("TESLA_FLEET_TELEMETRY_TOPIC_BASE"),
+    )
+    if _fleet_telemetry_runtime_cache.get("schluessel") == schluessel:
+        return dict(_fleet_telemetry_runtime_cache.get("cfg") or {})
     cfg = {}
     try:
         with open(TESLA_FLEET_TELEMETRY_RUNTIME_FILE, "r", encoding="utf-8") as f:
@@ -6049,6 +7365,8 @@ def _fleet_telemetrie_runtime_config():
     )
     cfg.setdefault("topic_base", os.getenv("TESLA_FLEET_TELEMETRY_TOPIC_BASE", "tesla"))
     cfg.setdefault("client_id", "tesla-dashboard-telemetry")
+    _fleet_telemetry_runtime_cache["schluessel"] = schluessel
+    _fleet_telemetry_runtime_cache["cfg"] = dict(cfg)
     return cfg
 
 
@@ -7420,24 +8738,140 @@ def _fleet_telemetrie_profile_ladeende_ueberbruecken(
     return ziel, parkbeginn, geändert
 
 
-def _fleet_telemetrie_profile_aktualisieren(cache_id, data):
-    """Aktualisiere das gewünschte Telemetry-Profil aus Live-Daten."""
+class _FleetTelemetrieProfilsteuerung:
+    """Zustandsautomat für das gewünschte Fleet-Telemetry-Profil.
 
-    del cache_id
-    if not _fleet_telemetrie_profile_aktiviert():
-        return _fleet_telemetrie_profile_status_an_daten(data)
-    ziel = _fleet_telemetrie_profile_ziel(data)
-    ladezustand = _fleet_telemetrie_profile_ladezustand(data)
-    jetzt = time.time()
-    live_takt_stabil = _fleet_telemetrie_profile_live_takt_stabil(data, jetzt)
-    fahrzeug_bewegt_sich = _fleet_telemetrie_profile_fahrzeug_bewegt_sich(
+    Eingänge sind wenige aus den Live-Daten abgeleitete Signale und der
+    Profilstatus. Eine Auswertung, die nichts ändert und nichts anfordert,
+    merkt sich ihre Eingänge sowie die nächste Frist, an der ein
+    Zeitvergleich umschlagen kann. Bis dahin liefern gleiche Eingänge dasselbe
+    Ergebnis, und die Auswertung entfällt. Fristen werden beim nächsten
+    Telemetry-Ereignis geprüft, wie bisher auch die Auswertung selbst.
+
+    Während der Fahrt ändert sich bei jedem Ereignis nur der Zeitpunkt der
+    letzten Bewegung. Er wird höchstens alle halben Bewegungsnachlauf-Sekunden
+    auf die Platte geschrieben, alle anderen Statusänderungen sofort.
+
+    ``uhr`` ersetzt ``time.time`` für Benchmarks und Tests mit simulierter
+    Zeit; mit ``sparen=False`` wird jedes Ereignis ausgewertet.
+    """
+
+    FLUECHTIGE_FELDER = frozenset({"live_retry_last_moving_at"})
+
+    def __init__(self, uhr=None, sparen=True):
+        self.uhr = uhr
+        self.sparen = sparen
+        self.auswertungen = 0
+        self.uebersprungen = 0
+        self._ruhe = None
+        self._bewegung_gespeichert = 0.0
+
+    def jetzt(self):
+        return time.time() if self.uhr is None else float(self.uhr())
+
+    def zuruecksetzen(self):
+        self._ruhe = None
+        self._bewegung_gespeichert = 0.0
+
+    @staticmethod
+    def signale(data, jetzt):
+        """Leite die Eingangssignale des Automaten aus Live-Daten ab."""
+
+        drive = data.get("drive_state")
+        if not isinstance(drive, dict):
+            drive = {}
+        geschwindigkeit = _as_float(drive.get("speed"))
+        return (
+            _fleet_telemetrie_profile_ziel(data),
+            _fleet_telemetrie_profile_ladezustand(data),
+            _fleet_telemetrie_profile_live_takt_stabil(data, jetzt),
+            _fleet_telemetrie_profile_fahrzeug_bewegt_sich(data, jetzt),
+            _normalize_shift_state(drive.get("shift_state")) != "P"
+            and geschwindigkeit is not None
+            and abs(geschwindigkeit)
+            > FLEET_TELEMETRIE_POSITION_MIN_GESCHWINDIGKEIT_MPH,
+        )
+
+    def aktualisieren(self, status, data):
+        """Werte den Automaten bei Bedarf aus.
+
+        Muss unter ``_fleet_telemetry_profile_lock`` laufen. Liefert das
+        anzufordernde Profil oder ``None``, das bisherige Profil und das Ziel.
+        """
+
+        jetzt = self.jetzt()
+        signale = self.signale(data, jetzt)
+        # Die Ladeende-Brücke kann ein Parkziel noch in Live umwandeln.
+        live_moeglich = signale[0] == "live" or (
+            signale[0] == "parked"
+            and (
+                signale[1] is False
+                or (_as_float(status.get("post_charge_live_since")) or 0) > 0
+            )
+        )
+        live_takt_bestaetigt = (
+            live_moeglich
+            and _fleet_telemetrie_profile_live_takt_bestaetigt(data, status, jetzt)
+        )
+        eingaben = (signale, live_takt_bestaetigt)
+        ruhe = self._ruhe
+        if (
+            ruhe is not None
+            and ruhe[0] == eingaben
+            and ruhe[1] <= jetzt < ruhe[2]
+            and ruhe[3] == status
+        ):
+            self.uebersprungen += 1
+            return None, ruhe[4], ruhe[5]
+        self._ruhe = None
+        self.auswertungen += 1
+        vorher = dict(status)
+        fristen = []
+        profil_anfordern, status_geändert, current, ziel, ruhig = self._auswerten(
+            status,
+            data,
+            jetzt,
+            signale,
+            live_takt_bestaetigt,
+            fristen,
+        )
+        if status_geändert and self._speichern_noetig(vorher, status, jetzt):
+            _fleet_telemetrie_profile_status_speichern()
+        if self.sparen and ruhig and not profil_anfordern:
+            frist = min(
+                (frist for frist in fristen if frist > jetzt),
+                default=float("inf"),
+            )
+            self._ruhe = (eingaben, jetzt, frist, dict(status), current, ziel)
+        return profil_anfordern, current, ziel
+
+    def _speichern_noetig(self, vorher, status, jetzt):
+        geändert = {
+            feld for feld in status.keys() | vorher.keys()
+            if status.get(feld) != vorher.get(feld)
+        }
+        if not geändert <= self.FLUECHTIGE_FELDER or (
+            jetzt - self._bewegung_gespeichert
+            >= FLEET_TELEMETRIE_PROFILE_LIVE_NEUVERSAND_BEWEGUNGSNACHLAUF_SECONDS / 2
+        ):
+            self._bewegung_gespeichert = jetzt
+            return True
+        return False
+
+    def _auswerten(
+        self,
+        status,
         data,
         jetzt,
-    )
-    profil_anfordern = None
-    with _fleet_telemetry_profile_lock:
-        status = _fleet_telemetry_profile_status
+        signale,
+        live_takt_bestaetigt,
+        fristen,
+    ):
+        ziel, ladezustand, live_takt_stabil, fahrzeug_bewegt_sich, bewegung_aktiv = (
+            signale
+        )
         status_geändert = False
+        profil_anfordern = None
         ziel, parkbeginn, ladezustand_geändert = (
             _fleet_telemetrie_profile_ladeende_ueberbruecken(
                 status,
@@ -7449,6 +8883,9 @@ def _fleet_telemetrie_profile_aktualisieren(cache_id, data):
         if ladezustand_geändert:
             status["updated_at"] = jetzt
             status_geändert = True
+        live_bis = _as_float(status.get("post_charge_live_until"))
+        if live_bis is not None and live_bis > 0:
+            fristen.append(live_bis)
         ziel_geändert = status.get("target") != ziel
         if ziel_geändert:
             status["target"] = ziel
@@ -7487,6 +8924,10 @@ def _fleet_telemetrie_profile_aktualisieren(cache_id, data):
                 jetzt - live_unstable_since
                 < FLEET_TELEMETRIE_PROFILE_LIVE_INSTABIL_TOLERANZ_SECONDS
             )
+            fristen.append(
+                live_unstable_since
+                + FLEET_TELEMETRIE_PROFILE_LIVE_INSTABIL_TOLERANZ_SECONDS
+            )
             if (
                 not live_takt_toleriert
                 and live_stable_since is not None
@@ -7504,25 +8945,8 @@ def _fleet_telemetrie_profile_aktualisieren(cache_id, data):
                 status_geändert = True
             live_stable_since = None
         live_takt_akzeptiert = live_takt_stabil or live_takt_toleriert
-        live_takt_bestaetigt = (
-            ziel == "live"
-            and _fleet_telemetrie_profile_live_takt_bestaetigt(
-                data,
-                status,
-                jetzt,
-            )
-        )
-        drive = data.get("drive_state")
-        if not isinstance(drive, dict):
-            drive = {}
-        aktuelle_geschwindigkeit = _as_float(drive.get("speed"))
-        bewegung_aktiv = (
-            ziel == "live"
-            and _normalize_shift_state(drive.get("shift_state")) != "P"
-            and aktuelle_geschwindigkeit is not None
-            and abs(aktuelle_geschwindigkeit)
-            > FLEET_TELEMETRIE_POSITION_MIN_GESCHWINDIGKEIT_MPH
-        )
+        live_takt_bestaetigt = ziel == "live" and live_takt_bestaetigt
+        bewegung_aktiv = ziel == "live" and bewegung_aktiv
         if status.get("live_retry_motion_active") is not bewegung_aktiv:
             status["live_retry_motion_active"] = bewegung_aktiv
             status_geändert = True
@@ -7543,6 +8967,16 @@ def _fleet_telemetrie_profile_aktualisieren(cache_id, data):
                     int(status.get("live_retry_attempts") or 0),
                 )
         letzter_versand = float(status.get("last_sent") or 0)
+        fristen.extend((
+            max(target_since, letzter_versand)
+            + FLEET_TELEMETRIE_PROFILE_LIVE_NEUVERSAND_STARTVERZOEGERUNG_SECONDS,
+            max(target_since, letzter_versand)
+            + FLEET_TELEMETRIE_PROFILE_LIVE_TAKT_PRUEFVERZOEGERUNG_SECONDS,
+            target_since + FLEET_TELEMETRIE_PROFILE_PARK_DELAY_SECONDS,
+            letzter_versand,
+            letzter_versand + FLEET_TELEMETRIE_PROFILE_ERWARTETE_NEUVERBINDUNG_SECONDS,
+            letzter_versand + FLEET_TELEMETRIE_PROFILE_SEND_COOLDOWN_SECONDS,
+        ))
         live_neuversand_pruefbar = (
             ziel == "live"
             and fahrzeug_bewegt_sich
@@ -7566,6 +9000,10 @@ def _fleet_telemetrie_profile_aktualisieren(cache_id, data):
         live_stable_seconds = None
         if live_stable_since is not None:
             live_stable_seconds = jetzt - live_stable_since
+            fristen.append(
+                live_stable_since
+                + FLEET_TELEMETRIE_PROFILE_LIVE_EXTENDED_DELAY_SECONDS
+            )
         live_stable_lang_genug = live_stable_seconds is not None and (
             live_stable_seconds >= FLEET_TELEMETRIE_PROFILE_LIVE_EXTENDED_DELAY_SECONDS
         )
@@ -7673,12 +9111,15 @@ def _fleet_telemetrie_profile_aktualisieren(cache_id, data):
             status.get("last_sent_profile") != aktivierbares_ziel
             or (physisches_profil_weicht_ab and not auftrag_ausstehend)
         )
-        if (
+        stream_pruefung = (
             status.get("config_sync_profile") == aktivierbares_ziel
             and not _fleet_telemetrie_profile_sync_bestaetigt(
                 status,
                 aktivierbares_ziel,
             )
+        )
+        if (
+            stream_pruefung
             and _fleet_telemetrie_profile_stream_bestaetigt(
                 data,
                 status,
@@ -7738,9 +9179,30 @@ def _fleet_telemetrie_profile_aktualisieren(cache_id, data):
                 jetzt,
             )
             status_geändert = True
+        ruhig = not (
+            status_geändert
+            or ziel_ausstehend
+            or stream_pruefung
+            or status.get("live_retry_active") is True
+        )
+        return profil_anfordern, status_geändert, current, ziel, ruhig
+
+
+_fleet_telemetry_profile_steuerung = _FleetTelemetrieProfilsteuerung()
+
+
+def _fleet_telemetrie_profile_aktualisieren(cache_id, data):
+    """Aktualisiere das gewünschte Telemetry-Profil aus Live-Daten."""
+
+    del cache_id
+    if not _fleet_telemetrie_profile_aktiviert():
+        return _fleet_telemetrie_profile_status_an_daten(data)
+    steuerung = _fleet_telemetry_profile_steuerung
+    with _fleet_telemetry_profile_lock:
+        status = _fleet_telemetry_profile_status
+        profil_anfordern, current, ziel = steuerung.aktualisieren(status, data)
         status_kopie = dict(status)
-        if status_geändert:
-            _fleet_telemetrie_profile_status_speichern()
+    jetzt = steuerung.jetzt()
     if profil_anfordern:
         _fleet_telemetrie_profile_spaeter_anwenden(profil_anfordern)
     data["telemetry_profile"] = status_kopie.get("current") or current
@@ -8065,710 +9527,992 @@ def _fleet_telemetrie_navigation_cache_bereinigen(data):
     _fleet_telemetrie_navigation_beenden(drive, int(timestamp_ms))
 
 
-def _fleet_telemetrie_setze_feld(data, field, value, timestamp_ms):
-    """Schreibe ein einzelnes Fleet-Telemetry-Feld in die Dashboard-Struktur."""
-    value = _fleet_telemetrie_wert(value)
-    rohwerte = data.setdefault("fleet_telemetry_raw", {})
-    drive = data.setdefault("drive_state", {})
-    charge = data.setdefault("charge_state", {})
-    vehicle_state = data.setdefault("vehicle_state", {})
-    climate = data.setdefault("climate_state", {})
-    config = data.setdefault("vehicle_config", {})
-    gui = data.setdefault("gui_settings", {})
-    if field not in FLEET_TELEMETRIE_TPMS_DRUCKFELDER:
-        rohwerte[field] = value
+def _fleet_telemetrie_enum_umwandlung(prefix):
+    """Erzeuge eine Umwandlung, die das Enum-Präfix eines Werts entfernt."""
 
-    if field == "Location":
-        if isinstance(value, dict):
-            lat = value.get("latitude")
-            lon = value.get("longitude")
-            if lat is not None and lon is not None:
-                drive["latitude"] = lat
-                drive["longitude"] = lon
-                drive["native_latitude"] = lat
-                drive["native_longitude"] = lon
-                drive["native_location_supported"] = True
-                drive["native_type"] = "wgs"
-                drive["gps_as_of"] = timestamp_ms
-                drive["timestamp"] = timestamp_ms
-                data["fleet_telemetry_position_source"] = "fleet_telemetry"
+    def umwandeln(value):
+        return _fleet_telemetrie_enum_suffix(value, prefix)
+
+    return umwandeln
+
+
+FLEET_TELEMETRIE_FELDHANDLER = {}
+FLEET_TELEMETRIE_FELDHANDLER_PRAEFIXE = {}
+FLEET_TELEMETRIE_FELDBEREICHE = {}
+FLEET_TELEMETRIE_FELDBEREICH_PRAEFIXE = {}
+
+
+def _fleet_telemetrie_feldhandler(*felder, bereich, praefix=None):
+    """Registriere eine Schreibfunktion für ein oder mehrere Telemetry-Felder."""
+
+    def registrieren(handler):
+        for feld in felder:
+            FLEET_TELEMETRIE_FELDHANDLER[feld] = handler
+            FLEET_TELEMETRIE_FELDBEREICHE[feld] = bereich
+        if praefix:
+            FLEET_TELEMETRIE_FELDHANDLER_PRAEFIXE[praefix] = handler
+            FLEET_TELEMETRIE_FELDBEREICH_PRAEFIXE[praefix] = bereich
+        return handler
+
+    return registrieren
+
+
+def _fleet_telemetrie_einfacher_feldhandler(bereich, ziele, umwandlung=None):
+    """Erzeuge einen Handler, der einen Wert in feste Zielschlüssel schreibt."""
+
+    def handler(data, field, value, timestamp_ms):
+        abschnitt = data[bereich]
+        if umwandlung is not None:
+            value = umwandlung(value)
+        for ziel in ziele:
+            abschnitt[ziel] = value
+        abschnitt["timestamp"] = timestamp_ms
         return True
-    if field == "DestinationLocation":
-        if isinstance(value, dict):
-            koordinaten = _fleet_telemetrie_gueltige_zielkoordinaten(
-                value.get("latitude"),
-                value.get("longitude"),
-            )
-            if koordinaten is not None:
-                if (
-                    drive.get("active_route_active") is not False
-                    or _fleet_telemetrie_navigation_hat_zielkern(drive)
-                ):
-                    lat, lon = koordinaten
-                    drive["active_route_latitude"] = lat
-                    drive["active_route_longitude"] = lon
-            else:
-                drive.pop("active_route_latitude", None)
-                drive.pop("active_route_longitude", None)
-        elif value is None:
-            _fleet_telemetrie_navigation_beenden(drive, timestamp_ms)
-            return True
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "DestinationName":
-        if value is None or (isinstance(value, str) and not value.strip()):
-            _fleet_telemetrie_navigation_beenden(drive, timestamp_ms)
-        else:
-            drive["active_route_destination"] = value
-            _fleet_telemetrie_navigation_aktivieren(drive, timestamp_ms, data)
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "ExpectedEnergyPercentAtTripArrival":
-        if drive.get("active_route_active") is not False:
-            drive["active_route_energy_at_arrival"] = value
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "MilesToArrival":
-        if value is None:
-            drive.pop("active_route_miles_to_arrival", None)
-            if not _fleet_telemetrie_navigation_hat_zielkern(drive):
-                _fleet_telemetrie_navigation_beenden(drive, timestamp_ms)
-                return True
-        else:
-            drive["active_route_miles_to_arrival"] = value
-            _fleet_telemetrie_navigation_aktivieren(drive, timestamp_ms, data)
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "MinutesToArrival":
-        if value is None:
-            drive.pop("active_route_minutes_to_arrival", None)
-            if not _fleet_telemetrie_navigation_hat_zielkern(drive):
-                _fleet_telemetrie_navigation_beenden(drive, timestamp_ms)
-                return True
-        else:
-            drive["active_route_minutes_to_arrival"] = value
-            _fleet_telemetrie_navigation_aktivieren(drive, timestamp_ms, data)
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "RouteTrafficMinutesDelay":
-        if drive.get("active_route_active") is not False:
-            drive["active_route_traffic_minutes_delay"] = value
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "RouteLine":
-        value = _fleet_telemetrie_routeline_normalisieren(value)
-        if value is None or (isinstance(value, str) and not value.strip()):
-            _fleet_telemetrie_navigation_beenden(drive, timestamp_ms)
-        else:
+
+    return handler
+
+
+FLEET_TELEMETRIE_EINFACHE_FELDER = {
+    "GpsHeading": ("drive_state", ("heading",), None),
+    "GpsState": ("drive_state", ("gps_state",), None),
+    "VehicleSpeed": ("drive_state", ("speed",), None),
+    "Gear": ("drive_state", ("shift_state",), _fleet_telemetrie_shift),
+    "BatteryLevel": (
+        "charge_state",
+        ("battery_level", "usable_battery_level"),
+        None,
+    ),
+    "Soc": ("charge_state", ("battery_level", "usable_battery_level"), None),
+    "ChargeLimitSoc": ("charge_state", ("charge_limit_soc",), None),
+    "EstBatteryRange": (
+        "charge_state",
+        ("est_battery_range", "battery_range"),
+        None,
+    ),
+    "IdealBatteryRange": ("charge_state", ("ideal_battery_range",), None),
+    "RatedRange": ("charge_state", ("battery_range",), None),
+    "ChargeAmps": (
+        "charge_state",
+        ("charge_amps", "charger_actual_current"),
+        None,
+    ),
+    "ChargeRateMilePerHour": ("charge_state", ("charge_rate",), None),
+    "ACChargingPower": ("charge_state", ("charger_power",), None),
+    "DCChargingPower": ("charge_state", ("charger_power",), None),
+    "DCDCEnable": (
+        "charge_state",
+        ("dcdc_enable",),
+        _fleet_telemetrie_optional_wahr,
+    ),
+    "ChargeCurrentRequest": ("charge_state", ("charge_current_request",), None),
+    "ChargeCurrentRequestMax": (
+        "charge_state",
+        ("charge_current_request_max",),
+        None,
+    ),
+    "ChargeEnableRequest": (
+        "charge_state",
+        ("charge_enable_request", "user_charge_enable_request"),
+        None,
+    ),
+    "ChargerPhases": ("charge_state", ("charger_phases",), None),
+    "ChargerVoltage": ("charge_state", ("charger_voltage",), None),
+    "ChargePortDoorOpen": (
+        "charge_state",
+        ("charge_port_door_open",),
+        _fleet_telemetrie_wahr,
+    ),
+    "ChargePortColdWeatherMode": (
+        "charge_state",
+        ("charge_port_cold_weather_mode",),
+        _fleet_telemetrie_wahr,
+    ),
+    "ChargePortLatch": (
+        "charge_state",
+        ("charge_port_latch",),
+        _fleet_telemetrie_enum_umwandlung("ChargePortLatch"),
+    ),
+    "FastChargerPresent": (
+        "charge_state",
+        ("fast_charger_present",),
+        _fleet_telemetrie_wahr,
+    ),
+    "FastChargerType": (
+        "charge_state",
+        ("fast_charger_type",),
+        _fleet_telemetrie_enum_umwandlung("FastCharger"),
+    ),
+    "ChargingCableType": (
+        "charge_state",
+        ("conn_charge_cable",),
+        _fleet_telemetrie_enum_umwandlung("ChargingCableType"),
+    ),
+    "PreconditioningEnabled": (
+        "charge_state",
+        ("preconditioning_enabled",),
+        _fleet_telemetrie_wahr,
+    ),
+    "ScheduledChargingMode": (
+        "charge_state",
+        ("scheduled_charging_mode",),
+        _fleet_telemetrie_enum_umwandlung("ScheduledChargingMode"),
+    ),
+    "ScheduledChargingPending": (
+        "charge_state",
+        ("scheduled_charging_pending",),
+        _fleet_telemetrie_wahr,
+    ),
+    "ScheduledChargingStartTime": (
+        "charge_state",
+        ("scheduled_charging_start_time",),
+        _fleet_telemetrie_zeitstempel_ms,
+    ),
+    "SuperchargerSessionTripPlanner": (
+        "charge_state",
+        ("supercharger_session_trip_planner",),
+        _fleet_telemetrie_wahr,
+    ),
+    "Locked": ("vehicle_state", ("locked",), _fleet_telemetrie_wahr),
+    "FdWindow": ("vehicle_state", ("fd_window",), _fleet_telemetrie_fensterwert),
+    "FpWindow": ("vehicle_state", ("fp_window",), _fleet_telemetrie_fensterwert),
+    "RdWindow": ("vehicle_state", ("rd_window",), _fleet_telemetrie_fensterwert),
+    "RpWindow": ("vehicle_state", ("rp_window",), _fleet_telemetrie_fensterwert),
+    "Odometer": ("vehicle_state", ("odometer",), None),
+    "Version": ("vehicle_state", ("car_version",), None),
+    "ServiceMode": ("vehicle_state", ("service_mode",), _fleet_telemetrie_wahr),
+    "ValetModeEnabled": ("vehicle_state", ("valet_mode",), _fleet_telemetrie_wahr),
+    "DriverSeatOccupied": (
+        "vehicle_state",
+        ("is_user_present", "driver_present"),
+        _fleet_telemetrie_wahr,
+    ),
+    "BrakePedal": ("vehicle_state", ("brake_pedal",), _fleet_telemetrie_wahr),
+    "BrakePedalPos": ("vehicle_state", ("brake_pedal_pos",), None),
+    "PedalPosition": ("vehicle_state", ("pedal_position",), None),
+    "CenterDisplay": (
+        "vehicle_state",
+        ("center_display_state",),
+        _fleet_telemetrie_enum_umwandlung("DisplayState"),
+    ),
+    "HomelinkNearby": ("vehicle_state", ("homelink_nearby",), _fleet_telemetrie_wahr),
+    "SentryMode": (
+        "vehicle_state",
+        ("sentry_mode",),
+        _fleet_telemetrie_enum_umwandlung("SentryModeState"),
+    ),
+    "RemoteStartEnabled": (
+        "vehicle_state",
+        ("remote_start_enabled",),
+        _fleet_telemetrie_wahr,
+    ),
+    "LightsHazardsActive": (
+        "vehicle_state",
+        ("lights_hazards_active",),
+        _fleet_telemetrie_wahr,
+    ),
+    "LightsTurnSignal": (
+        "vehicle_state",
+        ("lights_turn_signal",),
+        _fleet_telemetrie_enum_umwandlung("TurnSignalState"),
+    ),
+    "LightsHighBeams": (
+        "vehicle_state",
+        ("lights_high_beams",),
+        _fleet_telemetrie_wahr,
+    ),
+    "InsideTemp": ("climate_state", ("inside_temp",), None),
+    "OutsideTemp": ("climate_state", ("outside_temp",), None),
+    "HvacFanSpeed": ("climate_state", ("fan_status",), None),
+    "HvacFanStatus": ("climate_state", ("fan_status",), None),
+    "HvacAutoMode": (
+        "climate_state",
+        ("hvac_auto_request",),
+        _fleet_telemetrie_enum_umwandlung("HvacAutoModeState"),
+    ),
+    "HvacLeftTemperatureRequest": ("climate_state", ("driver_temp_setting",), None),
+    "HvacRightTemperatureRequest": (
+        "climate_state",
+        ("passenger_temp_setting",),
+        None,
+    ),
+    "ClimateKeeperMode": (
+        "climate_state",
+        ("climate_keeper_mode",),
+        _fleet_telemetrie_klimawächtermodus,
+    ),
+    "CabinOverheatProtectionMode": (
+        "climate_state",
+        ("cabin_overheat_protection",),
+        _fleet_telemetrie_enum_umwandlung("CabinOverheatProtectionModeState"),
+    ),
+    "DefrostForPreconditioning": (
+        "climate_state",
+        ("is_front_defroster_on",),
+        _fleet_telemetrie_wahr,
+    ),
+    "RearDefrostEnabled": (
+        "climate_state",
+        ("is_rear_defroster_on", "side_mirror_heaters"),
+        _fleet_telemetrie_optional_wahr,
+    ),
+    "WiperHeatEnabled": (
+        "climate_state",
+        ("wiper_blade_heater",),
+        _fleet_telemetrie_wahr,
+    ),
+    "HvacSteeringWheelHeatAuto": (
+        "climate_state",
+        ("auto_steering_wheel_heat",),
+        _fleet_telemetrie_wahr,
+    ),
+    "SeatHeaterLeft": ("climate_state", ("seat_heater_left",), None),
+    "SeatHeaterRight": ("climate_state", ("seat_heater_right",), None),
+    "SeatHeaterRearLeft": ("climate_state", ("seat_heater_rear_left",), None),
+    "SeatHeaterRearCenter": ("climate_state", ("seat_heater_rear_center",), None),
+    "SeatHeaterRearRight": ("climate_state", ("seat_heater_rear_right",), None),
+    "ClimateSeatCoolingFrontLeft": ("climate_state", ("seat_fan_front_left",), None),
+    "ClimateSeatCoolingFrontRight": (
+        "climate_state",
+        ("seat_fan_front_right",),
+        None,
+    ),
+    "CarType": (
+        "vehicle_config",
+        ("car_type",),
+        _fleet_telemetrie_enum_umwandlung("CarType"),
+    ),
+    "EfficiencyPackage": ("vehicle_config", ("efficiency_package",), None),
+    "Trim": ("vehicle_config", ("trim_badging",), None),
+    "ExteriorColor": ("vehicle_config", ("exterior_color",), None),
+    "WheelType": ("vehicle_config", ("wheel_type",), None),
+    "EuropeVehicle": ("vehicle_config", ("eu_vehicle",), _fleet_telemetrie_wahr),
+    "RearSeatHeaters": ("vehicle_config", ("rear_seat_heaters",), None),
+    "RightHandDrive": ("vehicle_config", ("rhd",), _fleet_telemetrie_wahr),
+    "RoofColor": ("vehicle_config", ("roof_color",), None),
+    "SunroofInstalled": (
+        "vehicle_config",
+        ("sun_roof_installed",),
+        _fleet_telemetrie_enum_umwandlung("SunroofInstalledState"),
+    ),
+    "Setting24HourTime": (
+        "gui_settings",
+        ("gui_24_hour_time",),
+        _fleet_telemetrie_wahr,
+    ),
+    "SettingChargeUnit": (
+        "gui_settings",
+        ("gui_charge_rate_units",),
+        _fleet_telemetrie_enum_umwandlung("ChargeUnitPreference"),
+    ),
+    "SettingDistanceUnit": (
+        "gui_settings",
+        ("gui_distance_units",),
+        _fleet_telemetrie_enum_umwandlung("DistanceUnit"),
+    ),
+    "SettingTemperatureUnit": (
+        "gui_settings",
+        ("gui_temperature_units",),
+        _fleet_telemetrie_enum_umwandlung("TemperatureUnit"),
+    ),
+    "SettingTirePressureUnit": (
+        "gui_settings",
+        ("gui_tirepressure_units",),
+        _fleet_telemetrie_enum_umwandlung("PressureUnit"),
+    ),
+}
+for _feld, _zeitziel in FLEET_TELEMETRIE_TPMS_ZEITFELDER.items():
+    FLEET_TELEMETRIE_EINFACHE_FELDER[_feld] = (
+        "vehicle_state",
+        (_zeitziel,),
+        _fleet_telemetrie_zeitstempel_ms,
+    )
+for _feld, (_bereich, _ziele, _umwandlung) in FLEET_TELEMETRIE_EINFACHE_FELDER.items():
+    _fleet_telemetrie_feldhandler(_feld, bereich=_bereich)(
+        _fleet_telemetrie_einfacher_feldhandler(_bereich, _ziele, _umwandlung)
+    )
+del _feld, _zeitziel, _bereich, _ziele, _umwandlung
+
+
+@_fleet_telemetrie_feldhandler("Location", bereich="drive_state")
+def _fleet_telemetrie_feld_location(data, field, value, timestamp_ms):
+    """Übernehme die GPS-Position des Fahrzeugs."""
+
+    if isinstance(value, dict):
+        lat = value.get("latitude")
+        lon = value.get("longitude")
+        if lat is not None and lon is not None:
+            drive = data["drive_state"]
+            drive["latitude"] = lat
+            drive["longitude"] = lon
+            drive["native_latitude"] = lat
+            drive["native_longitude"] = lon
+            drive["native_location_supported"] = True
+            drive["native_type"] = "wgs"
+            drive["gps_as_of"] = timestamp_ms
+            drive["timestamp"] = timestamp_ms
+            data["fleet_telemetry_position_source"] = "fleet_telemetry"
+    return True
+
+
+@_fleet_telemetrie_feldhandler("DestinationLocation", bereich="drive_state")
+def _fleet_telemetrie_feld_navigationsziel(data, field, value, timestamp_ms):
+    """Übernehme die Zielkoordinaten einer aktiven Navigation."""
+
+    drive = data["drive_state"]
+    if isinstance(value, dict):
+        koordinaten = _fleet_telemetrie_gueltige_zielkoordinaten(
+            value.get("latitude"),
+            value.get("longitude"),
+        )
+        if koordinaten is not None:
             if (
                 drive.get("active_route_active") is not False
                 or _fleet_telemetrie_navigation_hat_zielkern(drive)
             ):
-                drive["active_route_line"] = value
-                _fleet_telemetrie_navigation_aktivieren(drive, timestamp_ms)
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "GpsHeading":
-        drive["heading"] = value
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "GpsState":
-        drive["gps_state"] = value
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "VehicleSpeed":
-        drive["speed"] = value
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "Gear":
-        drive["shift_state"] = _fleet_telemetrie_shift(value)
-        drive["timestamp"] = timestamp_ms
-        return True
-
-    if field in {"BatteryLevel", "Soc"}:
-        charge["battery_level"] = value
-        charge["usable_battery_level"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field in {"DetailedChargeState", "ChargeState"}:
-        ladestatus = _fleet_telemetrie_ladestatus(value)
-        if ladestatus is not None:
-            charge["charging_state"] = ladestatus
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargeLimitSoc":
-        charge["charge_limit_soc"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "EstBatteryRange":
-        charge["est_battery_range"] = value
-        charge["battery_range"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "IdealBatteryRange":
-        charge["ideal_battery_range"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "RatedRange":
-        charge["battery_range"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "TimeToFullCharge":
-        charge["time_to_full_charge"] = value
-        try:
-            charge["minutes_to_full_charge"] = int(round(float(value) * 60))
-        except Exception:
-            charge.pop("minutes_to_full_charge", None)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "EstimatedHoursToChargeTermination":
-        charge["time_to_full_charge"] = value
-        try:
-            charge["minutes_to_full_charge"] = int(round(float(value) * 60))
-        except Exception:
-            charge.pop("minutes_to_full_charge", None)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargeAmps":
-        charge["charge_amps"] = value
-        charge["charger_actual_current"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargeRateMilePerHour":
-        charge["charge_rate"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field in {"ACChargingPower", "DCChargingPower"}:
-        charge["charger_power"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field in {"ACChargingEnergyIn", "DCChargingEnergyIn"}:
-        if field == "ACChargingEnergyIn":
-            charge["ac_charge_energy_added"] = value
+                lat, lon = koordinaten
+                drive["active_route_latitude"] = lat
+                drive["active_route_longitude"] = lon
         else:
-            charge["dc_charge_energy_added"] = value
-        if value is not None:
-            charge["charge_energy_added"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field in {"ModuleTempMin", "ModuleTempMax"}:
-        target = "module_temp_min" if field == "ModuleTempMin" else "module_temp_max"
-        charge[target] = value
-        temp_min = _as_float(charge.get("module_temp_min"))
-        temp_max = _as_float(charge.get("module_temp_max"))
-        if temp_min is not None and temp_max is not None:
-            charge["battery_temp"] = (temp_min + temp_max) / 2
-        elif temp_min is not None:
-            charge["battery_temp"] = temp_min
-        elif temp_max is not None:
-            charge["battery_temp"] = temp_max
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "DCDCEnable":
-        charge["dcdc_enable"] = _fleet_telemetrie_optional_wahr(value)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field in {"PackVoltage", "PackCurrent"}:
-        target = "pack_voltage" if field == "PackVoltage" else "pack_current"
-        charge[target] = value
-        _fleet_telemetrie_packleistung_aktualisieren(data)
-        charge["timestamp"] = timestamp_ms
-        drive["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargeCurrentRequest":
-        charge["charge_current_request"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargeCurrentRequestMax":
-        charge["charge_current_request_max"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargeEnableRequest":
-        charge["charge_enable_request"] = value
-        charge["user_charge_enable_request"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargerPhases":
-        charge["charger_phases"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargerVoltage":
-        charge["charger_voltage"] = value
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargePortDoorOpen":
-        charge["charge_port_door_open"] = _fleet_telemetrie_wahr(value)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargePortColdWeatherMode":
-        charge["charge_port_cold_weather_mode"] = _fleet_telemetrie_wahr(value)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargePortLatch":
-        charge["charge_port_latch"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "ChargePortLatch",
-        )
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargePort":
-        charge_port_type = _fleet_telemetrie_enum_suffix(value, "ChargePort")
-        charge["charge_port_type"] = charge_port_type
-        config["charge_port_type"] = charge_port_type
-        charge["timestamp"] = timestamp_ms
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "FastChargerPresent":
-        charge["fast_charger_present"] = _fleet_telemetrie_wahr(value)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "FastChargerType":
-        charge["fast_charger_type"] = _fleet_telemetrie_enum_suffix(value, "FastCharger")
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ChargingCableType":
-        charge["conn_charge_cable"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "ChargingCableType",
-        )
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "PreconditioningEnabled":
-        charge["preconditioning_enabled"] = _fleet_telemetrie_wahr(value)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "NotEnoughPowerToHeat":
-        charge["not_enough_power_to_heat"] = _fleet_telemetrie_wahr(value)
-        climate["battery_heater_no_power"] = charge["not_enough_power_to_heat"]
-        charge["timestamp"] = timestamp_ms
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "ScheduledChargingMode":
-        charge["scheduled_charging_mode"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "ScheduledChargingMode",
-        )
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ScheduledChargingPending":
-        charge["scheduled_charging_pending"] = _fleet_telemetrie_wahr(value)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "ScheduledChargingStartTime":
-        charge["scheduled_charging_start_time"] = _fleet_telemetrie_zeitstempel_ms(value)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "SuperchargerSessionTripPlanner":
-        charge["supercharger_session_trip_planner"] = _fleet_telemetrie_wahr(value)
-        charge["timestamp"] = timestamp_ms
-        return True
-    if field == "BatteryHeaterOn":
-        batterieheizung = _fleet_telemetrie_optional_wahr(value)
-        charge["battery_heater_on"] = batterieheizung
-        climate["battery_heater_on"] = batterieheizung
-        climate["battery_heater"] = batterieheizung
-        charge["timestamp"] = timestamp_ms
-        climate["timestamp"] = timestamp_ms
+            drive.pop("active_route_latitude", None)
+            drive.pop("active_route_longitude", None)
+    elif value is None:
+        _fleet_telemetrie_navigation_beenden(drive, timestamp_ms)
         return True
+    drive["timestamp"] = timestamp_ms
+    return True
 
-    if field == "Locked":
-        vehicle_state["locked"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "DoorState" and isinstance(value, dict):
-        mapping = {
-            "DriverFront": "df",
-            "PassengerFront": "pf",
-            "DriverRear": "dr",
-            "PassengerRear": "pr",
-            "TrunkFront": "ft",
-            "TrunkRear": "rt",
-        }
-        for source, target in mapping.items():
-            if source in value:
-                vehicle_state[target] = 1 if _fleet_telemetrie_wahr(value.get(source)) else 0
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field in {"FdWindow", "FpWindow", "RdWindow", "RpWindow"}:
-        owner_key = {
-            "FdWindow": "fd_window",
-            "FpWindow": "fp_window",
-            "RdWindow": "rd_window",
-            "RpWindow": "rp_window",
-        }[field]
-        vehicle_state[owner_key] = _fleet_telemetrie_fensterwert(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "Odometer":
-        vehicle_state["odometer"] = value
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "VehicleName":
-        vehicle_state["vehicle_name"] = value
-        data["display_name"] = value
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "Version":
-        vehicle_state["car_version"] = value
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "ServiceMode":
-        vehicle_state["service_mode"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "ValetModeEnabled":
-        vehicle_state["valet_mode"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "DriverSeatOccupied":
-        vehicle_state["is_user_present"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["driver_present"] = vehicle_state["is_user_present"]
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "BrakePedal":
-        vehicle_state["brake_pedal"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "BrakePedalPos":
-        vehicle_state["brake_pedal_pos"] = value
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "PedalPosition":
-        vehicle_state["pedal_position"] = value
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "CenterDisplay":
-        vehicle_state["center_display_state"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "DisplayState",
-        )
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "HomelinkDeviceCount":
-        vehicle_state["homelink_device_count"] = value
-        vehicle_state["homelink_nearby"] = bool(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "HomelinkNearby":
-        vehicle_state["homelink_nearby"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "SentryMode":
-        vehicle_state["sentry_mode"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "SentryModeState",
-        )
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "RemoteStartEnabled":
-        vehicle_state["remote_start_enabled"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["timestamp"] = timestamp_ms
+
+@_fleet_telemetrie_feldhandler("DestinationName", bereich="drive_state")
+def _fleet_telemetrie_feld_navigationsname(data, field, value, timestamp_ms):
+    """Übernehme den Namen des Navigationsziels."""
+
+    drive = data["drive_state"]
+    if value is None or (isinstance(value, str) and not value.strip()):
+        _fleet_telemetrie_navigation_beenden(drive, timestamp_ms)
+    else:
+        drive["active_route_destination"] = value
+        _fleet_telemetrie_navigation_aktivieren(drive, timestamp_ms, data)
+    drive["timestamp"] = timestamp_ms
+    return True
+
+
+FLEET_TELEMETRIE_NAVIGATION_NEBENFELDER = {
+    "ExpectedEnergyPercentAtTripArrival": "active_route_energy_at_arrival",
+    "RouteTrafficMinutesDelay": "active_route_traffic_minutes_delay",
+}
+FLEET_TELEMETRIE_NAVIGATION_RESTFELDER = {
+    "MilesToArrival": "active_route_miles_to_arrival",
+    "MinutesToArrival": "active_route_minutes_to_arrival",
+}
+
+
+@_fleet_telemetrie_feldhandler(
+    *FLEET_TELEMETRIE_NAVIGATION_NEBENFELDER, bereich="drive_state"
+)
+def _fleet_telemetrie_feld_navigation_nebenwert(data, field, value, timestamp_ms):
+    """Übernehme Zusatzwerte nur für eine nicht beendete Navigation."""
+
+    drive = data["drive_state"]
+    if drive.get("active_route_active") is not False:
+        drive[FLEET_TELEMETRIE_NAVIGATION_NEBENFELDER[field]] = value
+    drive["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(
+    *FLEET_TELEMETRIE_NAVIGATION_RESTFELDER, bereich="drive_state"
+)
+def _fleet_telemetrie_feld_navigation_rest(data, field, value, timestamp_ms):
+    """Übernehme Restdistanz oder Restzeit einer Navigation."""
+
+    drive = data["drive_state"]
+    target = FLEET_TELEMETRIE_NAVIGATION_RESTFELDER[field]
+    if value is None:
+        drive.pop(target, None)
+        if not _fleet_telemetrie_navigation_hat_zielkern(drive):
+            _fleet_telemetrie_navigation_beenden(drive, timestamp_ms)
+            return True
+    else:
+        drive[target] = value
+        _fleet_telemetrie_navigation_aktivieren(drive, timestamp_ms, data)
+    drive["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("RouteLine", bereich="drive_state")
+def _fleet_telemetrie_feld_routeline(data, field, value, timestamp_ms):
+    """Übernehme die Routenlinie einer aktiven Navigation."""
+
+    drive = data["drive_state"]
+    value = _fleet_telemetrie_routeline_normalisieren(value)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        _fleet_telemetrie_navigation_beenden(drive, timestamp_ms)
+    else:
+        if (
+            drive.get("active_route_active") is not False
+            or _fleet_telemetrie_navigation_hat_zielkern(drive)
+        ):
+            drive["active_route_line"] = value
+            _fleet_telemetrie_navigation_aktivieren(drive, timestamp_ms)
+    drive["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(
+    "DetailedChargeState", "ChargeState", bereich="charge_state"
+)
+def _fleet_telemetrie_feld_ladestatus(data, field, value, timestamp_ms):
+    """Übernehme den Ladestatus, sofern er erkannt wird."""
+
+    charge = data["charge_state"]
+    ladestatus = _fleet_telemetrie_ladestatus(value)
+    if ladestatus is not None:
+        charge["charging_state"] = ladestatus
+    charge["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(
+    "TimeToFullCharge",
+    "EstimatedHoursToChargeTermination",
+    bereich="charge_state",
+)
+def _fleet_telemetrie_feld_restladezeit(data, field, value, timestamp_ms):
+    """Übernehme die Restladezeit in Stunden und Minuten."""
+
+    charge = data["charge_state"]
+    charge["time_to_full_charge"] = value
+    try:
+        charge["minutes_to_full_charge"] = int(round(float(value) * 60))
+    except Exception:
+        charge.pop("minutes_to_full_charge", None)
+    charge["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(
+    "ACChargingEnergyIn", "DCChargingEnergyIn", bereich="charge_state"
+)
+def _fleet_telemetrie_feld_ladeenergie(data, field, value, timestamp_ms):
+    """Übernehme die geladene AC- oder DC-Energie."""
+
+    charge = data["charge_state"]
+    if field == "ACChargingEnergyIn":
+        charge["ac_charge_energy_added"] = value
+    else:
+        charge["dc_charge_energy_added"] = value
+    if value is not None:
+        charge["charge_energy_added"] = value
+    charge["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("ModuleTempMin", "ModuleTempMax", bereich="charge_state")
+def _fleet_telemetrie_feld_modultemperatur(data, field, value, timestamp_ms):
+    """Übernehme Modultemperaturen und leite die Batterietemperatur ab."""
+
+    charge = data["charge_state"]
+    target = "module_temp_min" if field == "ModuleTempMin" else "module_temp_max"
+    charge[target] = value
+    temp_min = _as_float(charge.get("module_temp_min"))
+    temp_max = _as_float(charge.get("module_temp_max"))
+    if temp_min is not None and temp_max is not None:
+        charge["battery_temp"] = (temp_min + temp_max) / 2
+    elif temp_min is not None:
+        charge["battery_temp"] = temp_min
+    elif temp_max is not None:
+        charge["battery_temp"] = temp_max
+    charge["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("PackVoltage", "PackCurrent", bereich="charge_state")
+def _fleet_telemetrie_feld_packwert(data, field, value, timestamp_ms):
+    """Übernehme Packspannung oder -strom und aktualisiere die Packleistung."""
+
+    charge = data["charge_state"]
+    target = "pack_voltage" if field == "PackVoltage" else "pack_current"
+    charge[target] = value
+    _fleet_telemetrie_packleistung_aktualisieren(data)
+    charge["timestamp"] = timestamp_ms
+    data["drive_state"]["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("ChargePort", bereich="charge_state")
+def _fleet_telemetrie_feld_ladeanschluss(data, field, value, timestamp_ms):
+    """Übernehme den Ladeanschlusstyp in Lade- und Fahrzeugkonfiguration."""
+
+    charge = data["charge_state"]
+    config = data["vehicle_config"]
+    charge_port_type = _fleet_telemetrie_enum_suffix(value, "ChargePort")
+    charge["charge_port_type"] = charge_port_type
+    config["charge_port_type"] = charge_port_type
+    charge["timestamp"] = timestamp_ms
+    config["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("NotEnoughPowerToHeat", bereich="charge_state")
+def _fleet_telemetrie_feld_heizleistung_fehlt(data, field, value, timestamp_ms):
+    """Übernehme fehlende Heizleistung in Lade- und Klimadaten."""
+
+    charge = data["charge_state"]
+    climate = data["climate_state"]
+    charge["not_enough_power_to_heat"] = _fleet_telemetrie_wahr(value)
+    climate["battery_heater_no_power"] = charge["not_enough_power_to_heat"]
+    charge["timestamp"] = timestamp_ms
+    climate["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("BatteryHeaterOn", bereich="charge_state")
+def _fleet_telemetrie_feld_batterieheizung(data, field, value, timestamp_ms):
+    """Übernehme die Batterieheizung in Lade- und Klimadaten."""
+
+    charge = data["charge_state"]
+    climate = data["climate_state"]
+    batterieheizung = _fleet_telemetrie_optional_wahr(value)
+    charge["battery_heater_on"] = batterieheizung
+    climate["battery_heater_on"] = batterieheizung
+    climate["battery_heater"] = batterieheizung
+    charge["timestamp"] = timestamp_ms
+    climate["timestamp"] = timestamp_ms
+    return True
+
+
+FLEET_TELEMETRIE_TUERSTATUS_FELDER = {
+    "DriverFront": "df",
+    "PassengerFront": "pf",
+    "DriverRear": "dr",
+    "PassengerRear": "pr",
+    "TrunkFront": "ft",
+    "TrunkRear": "rt",
+}
+
+
+@_fleet_telemetrie_feldhandler("DoorState", bereich="vehicle_state")
+def _fleet_telemetrie_feld_tuerstatus(data, field, value, timestamp_ms):
+    """Übernehme Türen und Klappen aus dem gebündelten Türstatus."""
+
+    if not isinstance(value, dict):
         return True
+    vehicle_state = data["vehicle_state"]
+    for source, target in FLEET_TELEMETRIE_TUERSTATUS_FELDER.items():
+        if source in value:
+            vehicle_state[target] = 1 if _fleet_telemetrie_wahr(value.get(source)) else 0
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("VehicleName", bereich="vehicle_state")
+def _fleet_telemetrie_feld_fahrzeugname(data, field, value, timestamp_ms):
+    """Übernehme den Fahrzeugnamen auch als Anzeigenamen."""
+
+    vehicle_state = data["vehicle_state"]
+    vehicle_state["vehicle_name"] = value
+    data["display_name"] = value
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("HomelinkDeviceCount", bereich="vehicle_state")
+def _fleet_telemetrie_feld_homelink_anzahl(data, field, value, timestamp_ms):
+    """Übernehme die Anzahl der HomeLink-Geräte in Reichweite."""
+
+    vehicle_state = data["vehicle_state"]
+    vehicle_state["homelink_device_count"] = value
+    vehicle_state["homelink_nearby"] = bool(value)
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(
+    "SpeedLimitMode", "CurrentLimitMph", bereich="vehicle_state"
+)
+def _fleet_telemetrie_feld_geschwindigkeitslimit(data, field, value, timestamp_ms):
+    """Übernehme Status und Grenze des Geschwindigkeitslimits."""
+
+    vehicle_state = data["vehicle_state"]
+    speed_limit = vehicle_state.setdefault("speed_limit_mode", {})
     if field == "SpeedLimitMode":
-        speed_limit = vehicle_state.setdefault("speed_limit_mode", {})
         speed_limit["active"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "CurrentLimitMph":
-        speed_limit = vehicle_state.setdefault("speed_limit_mode", {})
+    else:
         speed_limit["current_limit_mph"] = value
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "LightsHazardsActive":
-        vehicle_state["lights_hazards_active"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "LightsTurnSignal":
-        vehicle_state["lights_turn_signal"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "TurnSignalState",
-        )
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field == "LightsHighBeams":
-        vehicle_state["lights_high_beams"] = _fleet_telemetrie_wahr(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field.startswith("SoftwareUpdate"):
-        software = _fleet_telemetrie_setze_software_update(vehicle_state)
-        if field == "SoftwareUpdateDownloadPercentComplete":
-            software["download_perc"] = value
-        elif field == "SoftwareUpdateInstallationPercentComplete":
-            software["install_perc"] = value
-        elif field == "SoftwareUpdateExpectedDurationMinutes":
-            try:
-                software["expected_duration_sec"] = int(float(value) * 60)
-            except Exception:
-                software.pop("expected_duration_sec", None)
-        elif field == "SoftwareUpdateScheduledStartTime":
-            software["scheduled_time_ms"] = _fleet_telemetrie_zeitstempel_ms(value)
-        elif field == "SoftwareUpdateVersion":
-            software["version"] = "" if value is None else str(value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field in FLEET_TELEMETRIE_TPMS_DRUCKFELDER:
-        target = FLEET_TELEMETRIE_TPMS_DRUCKFELDER[field]
-        value = _fleet_telemetrie_tpms_druckwert(
-            vehicle_state, rohwerte, field, target, value
-        )
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(bereich="vehicle_state", praefix="SoftwareUpdate")
+def _fleet_telemetrie_feld_software_update(data, field, value, timestamp_ms):
+    """Übernehme Fortschritt und Planung eines Software-Updates."""
+
+    vehicle_state = data["vehicle_state"]
+    software = _fleet_telemetrie_setze_software_update(vehicle_state)
+    if field == "SoftwareUpdateDownloadPercentComplete":
+        software["download_perc"] = value
+    elif field == "SoftwareUpdateInstallationPercentComplete":
+        software["install_perc"] = value
+    elif field == "SoftwareUpdateExpectedDurationMinutes":
+        try:
+            software["expected_duration_sec"] = int(float(value) * 60)
+        except Exception:
+            software.pop("expected_duration_sec", None)
+    elif field == "SoftwareUpdateScheduledStartTime":
+        software["scheduled_time_ms"] = _fleet_telemetrie_zeitstempel_ms(value)
+    elif field == "SoftwareUpdateVersion":
+        software["version"] = "" if value is None else str(value)
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(
+    *FLEET_TELEMETRIE_TPMS_DRUCKFELDER, bereich="vehicle_state"
+)
+def _fleet_telemetrie_feld_reifendruck(data, field, value, timestamp_ms):
+    """Übernehme Reifendrücke und erhalte den letzten gültigen Wert."""
+
+    vehicle_state = data["vehicle_state"]
+    rohwerte = data["fleet_telemetry_raw"]
+    target = FLEET_TELEMETRIE_TPMS_DRUCKFELDER[field]
+    value = _fleet_telemetrie_tpms_druckwert(
+        vehicle_state, rohwerte, field, target, value
+    )
+    rohwerte[field] = value
+    vehicle_state[target] = value
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(
+    "TpmsHardWarnings", "TpmsSoftWarnings", bereich="vehicle_state"
+)
+def _fleet_telemetrie_feld_reifenwarnungen(data, field, value, timestamp_ms):
+    """Übernehme harte oder weiche TPMS-Warnungen je Reifen."""
+
+    vehicle_state = data["vehicle_state"]
+    prefix = "tpms_hard_warning" if field == "TpmsHardWarnings" else "tpms_soft_warning"
+    for reifen, aktiv in _fleet_telemetrie_tpms_warnungen(value).items():
+        vehicle_state[f"{prefix}_{reifen}"] = aktiv
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+FLEET_TELEMETRIE_MEDIA_FELDER = {
+    "MediaAudioVolume": "audio_volume",
+    "MediaAudioVolumeIncrement": "audio_volume_increment",
+    "MediaAudioVolumeMax": "audio_volume_max",
+    "MediaNowPlayingAlbum": "now_playing_album",
+    "MediaNowPlayingArtist": "now_playing_artist",
+    "MediaNowPlayingDuration": "now_playing_duration",
+    "MediaNowPlayingElapsed": "now_playing_elapsed",
+    "MediaNowPlayingStation": "now_playing_station",
+    "MediaNowPlayingTitle": "now_playing_title",
+    "MediaPlaybackSource": "now_playing_source",
+    "MediaPlaybackStatus": "media_playback_status",
+}
+
+
+@_fleet_telemetrie_feldhandler(bereich="vehicle_state", praefix="Media")
+def _fleet_telemetrie_feld_media(data, field, value, timestamp_ms):
+    """Übernehme Wiedergabe- und Lautstärkeinformationen."""
+
+    vehicle_state = data["vehicle_state"]
+    media = vehicle_state.setdefault("media_info", {})
+    target = FLEET_TELEMETRIE_MEDIA_FELDER.get(field)
+    if target:
+        if field == "MediaPlaybackStatus":
+            value = _fleet_telemetrie_enum_suffix(value, "MediaStatus")
+        _fleet_telemetrie_setze_media(media, target, value)
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("HvacPower", bereich="climate_state")
+def _fleet_telemetrie_feld_klimaanlage(data, field, value, timestamp_ms):
+    """Übernehme den Betriebszustand der Klimaanlage."""
+
+    climate = data["climate_state"]
+    climate["is_climate_on"] = _fleet_telemetrie_hvac_aktiv(value)
+    climate["is_auto_conditioning_on"] = climate["is_climate_on"]
+    climate["is_preconditioning"] = _fleet_telemetrie_hvac_vorklimatisiert(value)
+    climate["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(
+    "CabinOverheatProtectionTemperatureLimit", bereich="climate_state"
+)
+def _fleet_telemetrie_feld_ueberhitzungsgrenze(data, field, value, timestamp_ms):
+    """Übernehme die Aktivierungstemperatur des Überhitzungsschutzes."""
+
+    climate = data["climate_state"]
+    limit = _fleet_telemetrie_enum_suffix(
+        value,
+        "CabinOverheatProtectionTempLimit",
+    )
+    limit = _fleet_telemetrie_enum_suffix(
+        limit,
+        "ClimateOverheatProtectionTempLimit",
+    )
+    climate["cop_activation_temperature"] = limit
+    climate["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("DefrostMode", bereich="climate_state")
+def _fleet_telemetrie_feld_enteisung(data, field, value, timestamp_ms):
+    """Übernehme den Enteisungsmodus der Frontscheibe."""
+
+    climate = data["climate_state"]
+    defrost = _fleet_telemetrie_enum_suffix(value, "DefrostModeState")
+    climate["defrost_mode"] = defrost
+    climate["is_front_defroster_on"] = bool(defrost and str(defrost).lower() != "off")
+    climate["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("HvacSteeringWheelHeatLevel", bereich="climate_state")
+def _fleet_telemetrie_feld_lenkradheizung(data, field, value, timestamp_ms):
+    """Übernehme die Stufe der Lenkradheizung."""
+
+    climate = data["climate_state"]
+    stufe = _fleet_telemetrie_heizstufe(value)
+    climate["steering_wheel_heat_level"] = stufe
+    climate["steering_wheel_heater"] = bool(stufe and stufe > 0)
+    climate["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler("SunroofState", "SunRoofState", bereich="vehicle_state")
+def _fleet_telemetrie_feld_schiebedach(data, field, value, timestamp_ms):
+    """Übernehme den Zustand des Schiebedachs."""
+
+    vehicle_state = data["vehicle_state"]
+    state = _fleet_telemetrie_enum_suffix(value, "SunroofState")
+    if state:
+        vehicle_state["sun_roof_state"] = state.lower()
+    else:
+        vehicle_state.pop("sun_roof_state", None)
+    vehicle_state["sun_roof_status_available"] = True
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+@_fleet_telemetrie_feldhandler(
+    "SunroofOpenPercent",
+    "SunroofPercentOpen",
+    "SunRoofOpenPercent",
+    "SunRoofPercentOpen",
+    bereich="vehicle_state",
+)
+def _fleet_telemetrie_feld_schiebedach_oeffnung(data, field, value, timestamp_ms):
+    """Übernehme den Öffnungsgrad des Schiebedachs."""
+
+    vehicle_state = data["vehicle_state"]
+    value_float = _as_float(value)
+    if value_float is None:
+        vehicle_state.pop("sun_roof_percent_open", None)
+    else:
+        vehicle_state["sun_roof_percent_open"] = value_float
+    vehicle_state["sun_roof_status_available"] = True
+    vehicle_state["timestamp"] = timestamp_ms
+    return True
+
+
+def _fleet_telemetrie_feldhandler_suchen(field):
+    """Ermittle die Schreibfunktion für ein Fleet-Telemetry-Feld."""
+
+    handler = FLEET_TELEMETRIE_FELDHANDLER.get(field)
+    if handler is not None or not isinstance(field, str):
+        return handler
+    for praefix, handler in FLEET_TELEMETRIE_FELDHANDLER_PRAEFIXE.items():
+        if field.startswith(praefix):
+            return handler
+    return None
+
+
+def _fleet_telemetrie_setze_feld(data, field, value, timestamp_ms):
+    """Schreibe ein einzelnes Fleet-Telemetry-Feld in die Dashboard-Struktur."""
+    value = _fleet_telemetrie_wert(value)
+    rohwerte = data.setdefault("fleet_telemetry_raw", {})
+    data.setdefault("drive_state", {})
+    data.setdefault("charge_state", {})
+    data.setdefault("vehicle_state", {})
+    data.setdefault("climate_state", {})
+    data.setdefault("vehicle_config", {})
+    data.setdefault("gui_settings", {})
+    if field not in FLEET_TELEMETRIE_TPMS_DRUCKFELDER:
         rohwerte[field] = value
-        vehicle_state[target] = value
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field in FLEET_TELEMETRIE_TPMS_ZEITFELDER:
-        target = FLEET_TELEMETRIE_TPMS_ZEITFELDER[field]
-        vehicle_state[target] = _fleet_telemetrie_zeitstempel_ms(value)
-        vehicle_state["timestamp"] = timestamp_ms
+    handler = _fleet_telemetrie_feldhandler_suchen(field)
+    if handler is None:
         return True
-    if field in {"TpmsHardWarnings", "TpmsSoftWarnings"}:
-        prefix = "tpms_hard_warning" if field == "TpmsHardWarnings" else "tpms_soft_warning"
-        for reifen, aktiv in _fleet_telemetrie_tpms_warnungen(value).items():
-            vehicle_state[f"{prefix}_{reifen}"] = aktiv
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field.startswith("Media"):
-        media = vehicle_state.setdefault("media_info", {})
-        media_map = {
-            "MediaAudioVolume": "audio_volume",
-            "MediaAudioVolumeIncrement": "audio_volume_increment",
-            "MediaAudioVolumeMax": "audio_volume_max",
-            "MediaNowPlayingAlbum": "now_playing_album",
-            "MediaNowPlayingArtist": "now_playing_artist",
-            "MediaNowPlayingDuration": "now_playing_duration",
-            "MediaNowPlayingElapsed": "now_playing_elapsed",
-            "MediaNowPlayingStation": "now_playing_station",
-            "MediaNowPlayingTitle": "now_playing_title",
-            "MediaPlaybackSource": "now_playing_source",
-            "MediaPlaybackStatus": "media_playback_status",
+    return handler(data, field, value, timestamp_ms)
+
+
+FLEET_TELEMETRIE_ABLEITUNGEN = {}
+FLEET_TELEMETRIE_DASHBOARD_ABLEITUNGEN = (
+    "rohdaten",
+    "tpms_sollwerte",
+    "ladeinformationen",
+    "routeline",
+    "navigation",
+    "parkzeit",
+    "fahrtpfad",
+    "adresse",
+)
+
+
+def _fleet_telemetrie_ableitung(name, eingaben=None, ausgaben=(), erzwingen=None):
+    """Registriere eine abgeleitete Berechnung samt ihrer Eingaben.
+
+    ``eingaben`` nennt Fleet-Rohfelder, Abschnitte wie ``"charge_state"``,
+    ``"state"`` oder Eingaben außerhalb der Telemetry wie
+    ``"occupant_present"``, die ihre Quelle selbst als geändert meldet. Ohne
+    Eingaben läuft der Schritt bei jedem Ereignis, weil er von
+    der Uhrzeit oder anderen Caches abhängt. ``erzwingen`` prüft die Daten und
+    kann den Schritt zusätzlich auslösen.
+    """
+
+    def registrieren(funktion):
+        FLEET_TELEMETRIE_ABLEITUNGEN[name] = {
+            "funktion": funktion,
+            "eingaben": None if eingaben is None else frozenset(eingaben),
+            "ausgaben": tuple(ausgaben),
+            "erzwingen": erzwingen,
         }
-        target = media_map.get(field)
-        if target:
-            if field == "MediaPlaybackStatus":
-                value = _fleet_telemetrie_enum_suffix(value, "MediaStatus")
-            _fleet_telemetrie_setze_media(media, target, value)
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
+        return funktion
 
-    if field == "InsideTemp":
-        climate["inside_temp"] = value
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "OutsideTemp":
-        climate["outside_temp"] = value
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "HvacPower":
-        climate["is_climate_on"] = _fleet_telemetrie_hvac_aktiv(value)
-        climate["is_auto_conditioning_on"] = climate["is_climate_on"]
-        climate["is_preconditioning"] = _fleet_telemetrie_hvac_vorklimatisiert(value)
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field in {"HvacFanSpeed", "HvacFanStatus"}:
-        climate["fan_status"] = value
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "HvacAutoMode":
-        climate["hvac_auto_request"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "HvacAutoModeState",
-        )
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "HvacLeftTemperatureRequest":
-        climate["driver_temp_setting"] = value
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "HvacRightTemperatureRequest":
-        climate["passenger_temp_setting"] = value
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "ClimateKeeperMode":
-        climate["climate_keeper_mode"] = _fleet_telemetrie_klimawächtermodus(value)
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "CabinOverheatProtectionMode":
-        climate["cabin_overheat_protection"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "CabinOverheatProtectionModeState",
-        )
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "CabinOverheatProtectionTemperatureLimit":
-        limit = _fleet_telemetrie_enum_suffix(
-            value,
-            "CabinOverheatProtectionTempLimit",
-        )
-        limit = _fleet_telemetrie_enum_suffix(
-            limit,
-            "ClimateOverheatProtectionTempLimit",
-        )
-        climate["cop_activation_temperature"] = limit
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "DefrostMode":
-        defrost = _fleet_telemetrie_enum_suffix(value, "DefrostModeState")
-        climate["defrost_mode"] = defrost
-        climate["is_front_defroster_on"] = bool(defrost and str(defrost).lower() != "off")
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "DefrostForPreconditioning":
-        climate["is_front_defroster_on"] = _fleet_telemetrie_wahr(value)
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "RearDefrostEnabled":
-        heckscheibenheizung = _fleet_telemetrie_optional_wahr(value)
-        climate["is_rear_defroster_on"] = heckscheibenheizung
-        climate["side_mirror_heaters"] = heckscheibenheizung
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "WiperHeatEnabled":
-        climate["wiper_blade_heater"] = _fleet_telemetrie_wahr(value)
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "HvacSteeringWheelHeatLevel":
-        stufe = _fleet_telemetrie_heizstufe(value)
-        climate["steering_wheel_heat_level"] = stufe
-        climate["steering_wheel_heater"] = bool(stufe and stufe > 0)
-        climate["timestamp"] = timestamp_ms
-        return True
-    if field == "HvacSteeringWheelHeatAuto":
-        climate["auto_steering_wheel_heat"] = _fleet_telemetrie_wahr(value)
-        climate["timestamp"] = timestamp_ms
-        return True
-    seat_heater_map = {
-        "SeatHeaterLeft": "seat_heater_left",
-        "SeatHeaterRight": "seat_heater_right",
-        "SeatHeaterRearLeft": "seat_heater_rear_left",
-        "SeatHeaterRearCenter": "seat_heater_rear_center",
-        "SeatHeaterRearRight": "seat_heater_rear_right",
-    }
-    if field in seat_heater_map:
-        climate[seat_heater_map[field]] = value
-        climate["timestamp"] = timestamp_ms
-        return True
-    seat_cooling_map = {
-        "ClimateSeatCoolingFrontLeft": "seat_fan_front_left",
-        "ClimateSeatCoolingFrontRight": "seat_fan_front_right",
-    }
-    if field in seat_cooling_map:
-        climate[seat_cooling_map[field]] = value
-        climate["timestamp"] = timestamp_ms
-        return True
+    return registrieren
 
-    if field == "CarType":
-        config["car_type"] = _fleet_telemetrie_enum_suffix(value, "CarType")
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "EfficiencyPackage":
-        config["efficiency_package"] = value
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "Trim":
-        config["trim_badging"] = value
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "ExteriorColor":
-        config["exterior_color"] = value
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "WheelType":
-        config["wheel_type"] = value
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "EuropeVehicle":
-        config["eu_vehicle"] = _fleet_telemetrie_wahr(value)
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "RearSeatHeaters":
-        config["rear_seat_heaters"] = value
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "RightHandDrive":
-        config["rhd"] = _fleet_telemetrie_wahr(value)
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "RoofColor":
-        config["roof_color"] = value
-        config["timestamp"] = timestamp_ms
-        return True
-    if field == "SunroofInstalled":
-        config["sun_roof_installed"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "SunroofInstalledState",
-        )
-        config["timestamp"] = timestamp_ms
-        return True
-    if field in {"SunroofState", "SunRoofState"}:
-        state = _fleet_telemetrie_enum_suffix(value, "SunroofState")
-        if state:
-            vehicle_state["sun_roof_state"] = state.lower()
-        else:
-            vehicle_state.pop("sun_roof_state", None)
-        vehicle_state["sun_roof_status_available"] = True
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
-    if field in {
-        "SunroofOpenPercent",
-        "SunroofPercentOpen",
-        "SunRoofOpenPercent",
-        "SunRoofPercentOpen",
-    }:
-        value_float = _as_float(value)
-        if value_float is None:
-            vehicle_state.pop("sun_roof_percent_open", None)
-        else:
-            vehicle_state["sun_roof_percent_open"] = value_float
-        vehicle_state["sun_roof_status_available"] = True
-        vehicle_state["timestamp"] = timestamp_ms
-        return True
 
-    if field == "Setting24HourTime":
-        gui["gui_24_hour_time"] = _fleet_telemetrie_wahr(value)
-        gui["timestamp"] = timestamp_ms
-        return True
-    if field == "SettingChargeUnit":
-        gui["gui_charge_rate_units"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "ChargeUnitPreference",
-        )
-        gui["timestamp"] = timestamp_ms
-        return True
-    if field == "SettingDistanceUnit":
-        gui["gui_distance_units"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "DistanceUnit",
-        )
-        gui["timestamp"] = timestamp_ms
-        return True
-    if field == "SettingTemperatureUnit":
-        gui["gui_temperature_units"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "TemperatureUnit",
-        )
-        gui["timestamp"] = timestamp_ms
+def _fleet_telemetrie_feldbereich(field):
+    """Liefere den Dashboard-Abschnitt, in den ein Telemetry-Feld schreibt."""
+
+    bereich = FLEET_TELEMETRIE_FELDBEREICHE.get(field)
+    if bereich is not None or not isinstance(field, str):
+        return bereich
+    for praefix, bereich in FLEET_TELEMETRIE_FELDBEREICH_PRAEFIXE.items():
+        if field.startswith(praefix):
+            return bereich
+    return None
+
+
+def _fleet_telemetrie_ableitung_betroffen(name, data, felder):
+    """Prüfe, ob geänderte Felder eine abgeleitete Berechnung betreffen."""
+
+    ableitung = FLEET_TELEMETRIE_ABLEITUNGEN[name]
+    eingaben = ableitung["eingaben"]
+    if felder is None or eingaben is None:
         return True
-    if field == "SettingTirePressureUnit":
-        gui["gui_tirepressure_units"] = _fleet_telemetrie_enum_suffix(
-            value,
-            "PressureUnit",
-        )
-        gui["timestamp"] = timestamp_ms
+    erzwingen = ableitung["erzwingen"]
+    if erzwingen is not None and erzwingen(data):
         return True
+    for feld in felder:
+        if feld in eingaben or _fleet_telemetrie_feldbereich(feld) in eingaben:
+            return True
+    return False
 
-    return True
 
+def _fleet_telemetrie_ableitungen_ausfuehren(cache_id, data, namen, felder=None):
+    """Führe die betroffenen Ableitungen in ihrer festen Reihenfolge aus.
+
+    ``felder`` enthält die seit der letzten Anreicherung geänderten Eingaben;
+    ``None`` rechnet alle Schritte neu.
+    """
 
-def _fleet_telemetrie_dashboard_daten_anreichern(cache_id, data):
-    """Aktualisiere abgeleitete Dashboard-Daten für Telemetry-Ereignisse."""
     if not isinstance(data, dict):
         return data
+    for name in namen:
+        if _fleet_telemetrie_ableitung_betroffen(name, data, felder):
+            FLEET_TELEMETRIE_ABLEITUNGEN[name]["funktion"](cache_id, data)
+    return data
 
+
+@_fleet_telemetrie_ableitung(
+    "vorklimatisierung",
+    eingaben=(
+        "state",
+        "drive_state",
+        "vehicle_state",
+        "climate_state",
+        "PreconditioningEnabled",
+        "BatteryHeaterOn",
+        "NotEnoughPowerToHeat",
+        # gesetzt über /api/occupant
+        "occupant_present",
+    ),
+    ausgaben=("preconditioning_display_allowed",),
+)
+def _ableitung_vorklimatisierung(cache_id, data):
+    data["preconditioning_display_allowed"] = (
+        _vorklimatisierung_im_stand_erlaubt(data)
+    )
+
+
+@_fleet_telemetrie_ableitung(
+    "rohdaten",
+    eingaben=(
+        *FLEET_TELEMETRIE_TPMS_DRUCKFELDER,
+        *FLEET_TELEMETRIE_TPMS_ZEITFELDER,
+        "RearDefrostEnabled",
+        "HvacFanSpeed",
+        "HvacFanStatus",
+        "BatteryHeaterOn",
+        "HvacSteeringWheelHeatLevel",
+        "HvacSteeringWheelHeatAuto",
+    ),
+    ausgaben=("vehicle_state", "climate_state", "charge_state"),
+)
+def _ableitung_rohdaten(cache_id, data):
     _fleet_telemetrie_rohdaten_anreichern(data)
+
+
+@_fleet_telemetrie_ableitung(
+    "tpms_sollwerte",
+    ausgaben=FLEET_TELEMETRIE_TPMS_SOLLWERTFELDER,
+)
+def _ableitung_tpms_sollwerte(cache_id, data):
     _fleet_telemetrie_tpms_sollwerte_ergänzen(cache_id, data)
+
+
+@_fleet_telemetrie_ableitung(
+    "ladeinformationen",
+    eingaben=("charge_state",),
+    ausgaben=("charge_state",),
+)
+def _ableitung_ladeinformationen(cache_id, data):
     _fleet_telemetrie_ladeinformationen_aktualisieren(cache_id, data)
+
+
+@_fleet_telemetrie_ableitung(
+    "routeline",
+    eingaben=("RouteLine",),
+    ausgaben=("active_route_line",),
+)
+def _ableitung_routeline(cache_id, data):
     _fleet_telemetrie_routeline_in_daten_normalisieren(data)
+
+
+@_fleet_telemetrie_ableitung(
+    "navigation",
+    eingaben=(
+        "DestinationLocation",
+        "DestinationName",
+        "ExpectedEnergyPercentAtTripArrival",
+        "MilesToArrival",
+        "MinutesToArrival",
+        "RouteLine",
+        "RouteTrafficMinutesDelay",
+    ),
+    ausgaben=FLEET_TELEMETRIE_NAVIGATIONSFELDER,
+)
+def _ableitung_navigation(cache_id, data):
     _fleet_telemetrie_navigation_cache_bereinigen(data)
 
+
+@_fleet_telemetrie_ableitung("parkzeit", ausgaben=("park_start", "park_duration"))
+def _ableitung_parkzeit(cache_id, data):
     try:
         track_park_time(data)
         data["park_start"] = park_start_ms
@@ -8776,6 +10520,9 @@ def _fleet_telemetrie_dashboard_daten_anreichern(cache_id, data):
     except Exception:
         pass
 
+
+@_fleet_telemetrie_ableitung("fahrtpfad", ausgaben=("path", "path_generation"))
+def _ableitung_fahrtpfad(cache_id, data):
     try:
         track_drive_path(data)
         data["path"] = trip_path
@@ -8783,31 +10530,58 @@ def _fleet_telemetrie_dashboard_daten_anreichern(cache_id, data):
     except Exception:
         pass
 
+
+@_fleet_telemetrie_ableitung("adresse", ausgaben=("location_address",))
+def _ableitung_adresse(cache_id, data):
     drive = data.get("drive_state")
     if not isinstance(drive, dict):
-        return data
+        return
     lat = drive.get("latitude")
     lon = drive.get("longitude")
-    if lat is not None and lon is not None:
-        try:
-            entry = address_cache.get(cache_id)
-            now = time.time()
-            needs_update = (
-                entry is None
-                or now - entry.get("ts", 0) >= 5
-                or abs(entry.get("lat") - lat) > 1e-4
-                or abs(entry.get("lon") - lon) > 1e-4
-            )
-            if needs_update:
-                _fleet_telemetrie_adresse_spaeter_aktualisieren(cache_id, lat, lon)
-            entry = address_cache.get(cache_id)
-            if entry and entry.get("address"):
-                data["location_address"] = entry["address"]
-            elif not data.get("location_address"):
-                data.pop("location_address", None)
-        except Exception:
-            pass
-    return data
+    if lat is None or lon is None:
+        return
+    try:
+        entry = address_cache.get(cache_id)
+        now = time.time()
+        needs_update = (
+            entry is None
+            or now - entry.get("ts", 0) >= 5
+            or abs(entry.get("lat") - lat) > 1e-4
+            or abs(entry.get("lon") - lon) > 1e-4
+        )
+        if needs_update:
+            _fleet_telemetrie_adresse_spaeter_aktualisieren(cache_id, lat, lon)
+        entry = address_cache.get(cache_id)
+        if entry and entry.get("address"):
+            data["location_address"] = entry["address"]
+        elif not data.get("location_address"):
+            data.pop("location_address", None)
+    except Exception:
+        pass
+
+
+@_fleet_telemetrie_ableitung(
+    "oeffnungen",
+    eingaben=tuple(FLEET_TELEMETRIE_FENSTER_FELDER),
+    ausgaben=tuple(FLEET_TELEMETRIE_FENSTER_FELDER.values()),
+    erzwingen=lambda data: "fleet_telemetry_stale_opening_fields" in data,
+)
+def _ableitung_oeffnungen(cache_id, data):
+    _fleet_telemetrie_veraltete_oeffnungen_bereinigen(data)
+
+
+def _fleet_telemetrie_dashboard_daten_anreichern(cache_id, data, felder=None):
+    """Aktualisiere abgeleitete Dashboard-Daten für Telemetry-Ereignisse.
+
+    Mit ``felder`` laufen nur die Ableitungen, deren Eingaben sich geändert
+    haben, sowie die zeitabhängigen Schritte.
+    """
+    return _fleet_telemetrie_ableitungen_ausfuehren(
+        cache_id,
+        data,
+        FLEET_TELEMETRIE_DASHBOARD_ABLEITUNGEN,
+        felder,
+    )
 
 
 def _fleet_telemetrie_gueltige_fahrzeugkoordinaten(lat, lon):
@@ -9229,6 +11003,32 @@ def _fleet_telemetrie_position_worker_loop():
 
 
 def _fleet_telemetrie_parkstatus_aufzeichnen(cache_id, data, vehicle_id=None):
+    """Merke ein Park-Sample aus Fleet-Telemetry-Daten zum Schreiben vor.
+
+    Übernommen werden nur die Felder, die ``_record_dashboard_parking_state``
+    auswertet; das Parklog schreibt der Outbox-Thread.
+    """
+
+    if not isinstance(data, dict):
+        return
+    auszug = {
+        schluessel: data.get(schluessel)
+        for schluessel in ("vin", "id_s", "vehicle_id", "state")
+    }
+    for abschnitt in ("charge_state", "drive_state"):
+        werte = data.get(abschnitt)
+        auszug[abschnitt] = dict(werte) if isinstance(werte, dict) else {}
+    _outbox_vormerken("parken", (cache_id, auszug, vehicle_id))
+
+
+def _parkstatus_outbox_schreiben(stapel):
+    """Schreibe vorgemerkte Park-Samples in Eingangsreihenfolge."""
+
+    for cache_id, data, vehicle_id in stapel:
+        _fleet_telemetrie_parkstatus_schreiben(cache_id, data, vehicle_id)
+
+
+def _fleet_telemetrie_parkstatus_schreiben(cache_id, data, vehicle_id=None):
     """Zeichne Park-Samples aus Fleet-Telemetry-Daten auf."""
 
     if not isinstance(data, dict):
@@ -9278,16 +11078,27 @@ def _fleet_telemetrie_v_felder_aktualisieren(vin, feldwerte):
     v2l_relevantes_update = any(
         feld in v2l_relevante_felder for feld, _wert, _zeit in feldwerte
     )
+    feldklasse = _fleet_telemetrie_feldklasse(
+        feld for feld, _wert, _zeit in feldwerte
+    )
     aktualisierte_daten = []
+    uebernahme_beginn = time.perf_counter()
     with _fleet_telemetry_lock:
         for cache_id in _fleet_telemetrie_cache_ids(vin):
             data = latest_data.get(cache_id)
+            # Neu geladene oder zwischenzeitlich abgefragte Daten tragen noch
+            # keine Ableitungen aus Telemetry und werden vollständig angereichert.
+            geänderte_felder = (
+                set() if isinstance(data, dict) and data.get("_live") is True
+                else None
+            )
             if not isinstance(data, dict):
                 data = _load_cached(cache_id) or {}
             hatte_timestamp = "timestamp" in data
             timestamp_vorher = data.get("timestamp")
             hatte_update_zeit = "fleet_telemetry_updated_at" in data
             update_zeit_vorher = data.get("fleet_telemetry_updated_at")
+            state_vorher = data.get("state")
             geändert = False
             letzter_zeitstempel = None
             letztes_feld = None
@@ -9314,6 +11125,8 @@ def _fleet_telemetrie_v_felder_aktualisieren(vin, feldwerte):
                 data = _fleet_telemetrie_basisdaten(
                     data, vin, cache_id, timestamp_ms
                 )
+                if geänderte_felder is not None:
+                    geänderte_felder.add(field)
                 if not _fleet_telemetrie_setze_feld(
                     data, field, value, timestamp_ms
                 ):
@@ -9344,9 +11157,16 @@ def _fleet_telemetrie_v_felder_aktualisieren(vin, feldwerte):
                     v2l_relevantes_update
                     and _fleet_telemetrie_primärer_cache(cache_id, data)
                 ):
-                    _v2l_telemetrie_sicher_aktualisieren(cache_id, data)
+                    _v2l_telemetrie_vormerken(cache_id, data)
                     v2l_aktualisiert = True
+                profil_beginn = time.perf_counter()
                 data = _fleet_telemetrie_profile_aktualisieren(cache_id, data)
+                _fleet_telemetrie_latenz_erfassen(
+                    "profile",
+                    vin,
+                    feldklasse,
+                    (time.perf_counter() - profil_beginn) * 1000,
+                )
                 stale_bereinigt = _fleet_telemetrie_veraltete_oeffnungen_bereinigen(
                     data
                 )
@@ -9360,27 +11180,60 @@ def _fleet_telemetrie_v_felder_aktualisieren(vin, feldwerte):
                 continue
             data["state_checked_at"] = letzter_zeitstempel
             data["fleet_telemetry_last_field"] = letztes_feld
-            data["preconditioning_display_allowed"] = (
-                _vorklimatisierung_im_stand_erlaubt(data)
+            if geänderte_felder is not None and data.get("state") != state_vorher:
+                geänderte_felder.add("state")
+            _fleet_telemetrie_ableitungen_ausfuehren(
+                cache_id, data, ("vorklimatisierung",), geänderte_felder
+            )
+            anreicherung_beginn = time.perf_counter()
+            data = _fleet_telemetrie_dashboard_daten_anreichern(
+                cache_id, data, geänderte_felder
+            )
+            _fleet_telemetrie_latenz_erfassen(
+                "enrichment",
+                vin,
+                feldklasse,
+                (time.perf_counter() - anreicherung_beginn) * 1000,
+            )
+            _fleet_telemetrie_ableitungen_ausfuehren(
+                cache_id, data, ("oeffnungen",), geänderte_felder
             )
-            data = _fleet_telemetrie_dashboard_daten_anreichern(cache_id, data)
-            _fleet_telemetrie_veraltete_oeffnungen_bereinigen(data)
             if (
                 v2l_relevantes_update
                 and _fleet_telemetrie_primärer_cache(cache_id, data)
             ):
-                _v2l_telemetrie_sicher_aktualisieren(cache_id, data)
+                _v2l_telemetrie_vormerken(cache_id, data)
+            profil_beginn = time.perf_counter()
             data = _fleet_telemetrie_profile_aktualisieren(cache_id, data)
+            _fleet_telemetrie_latenz_erfassen(
+                "profile",
+                vin,
+                feldklasse,
+                (time.perf_counter() - profil_beginn) * 1000,
+            )
             _fleet_telemetrie_parkstatus_aufzeichnen(cache_id, data)
             data["_live"] = True
             data.pop("api_error", None)
             latest_data[cache_id] = data
             _fleet_telemetrie_cache_spaeter_speichern(cache_id, data)
             aktualisierte_daten.append((cache_id, data, True))
+    _fleet_telemetrie_latenz_erfassen(
+        "apply",
+        vin,
+        feldklasse,
+        (time.perf_counter() - uebernahme_beginn) * 1000,
+    )
+    verteilung_dauer = 0.0
     for cache_id, data, daten_geaendert in aktualisierte_daten:
+        verteilung_beginn = time.perf_counter()
         _subscriber_daten_senden(cache_id, data)
+        verteilung_dauer += time.perf_counter() - verteilung_beginn
         if daten_geaendert:
             _aprs_spaeter_senden(data)
+    if aktualisierte_daten:
+        _fleet_telemetrie_latenz_erfassen(
+            "fanout", vin, feldklasse, verteilung_dauer * 1000
+        )
     return bool(aktualisierte_daten)
 
 
@@ -9489,6 +11342,10 @@ def _fleet_telemetrie_verbindung_aktualisieren(vin, payload, timestamp_ms=None):
         return False
     aktualisierte_daten = []
     with _fleet_telemetry_lock:
+        if state == "offline":
+            _fleet_telemetry_offline_seit[vin] = timestamp_ms
+        else:
+            _fleet_telemetry_offline_seit.pop(vin, None)
         cache_daten = []
         for cache_id in _fleet_telemetrie_cache_ids(vin):
             data = latest_data.get(cache_id)
@@ -9539,14 +11396,62 @@ def _fleet_telemetrie_verbindung_aktualisieren(vin, payload, timestamp_ms=None):
     return bool(aktualisierte_daten)
 
 
-def _fleet_telemetrie_decode_payload(payload):
-    """Dekodiere MQTT-Nutzdaten aus Fleet Telemetry."""
-    if isinstance(payload, bytes):
-        payload = payload.decode("utf-8", errors="replace")
-    try:
-        return json.loads(payload)
-    except Exception:
-        return payload
+FLEET_TELEMETRIE_PAYLOAD_CACHE_MAX = 4096
+_fleet_telemetry_payload_cache = {}
+
+
+def _fleet_telemetrie_decode_payload(payload, topic=None):
+    """Dekodiere MQTT-Nutzdaten aus Fleet Telemetry.
+
+    Bytes werden direkt an ``json.loads`` übergeben; nur Nicht-JSON-Nutzdaten
+    werden als Text dekodiert. Mit ``topic`` wird der zuletzt dekodierte Wert
+    je Topic gemerkt, sodass unveränderte Nutzdaten nicht erneut geparst
+    werden. Die dekodierten Werte werden nachgelagert nicht verändert.
+    """
+
+    if isinstance(payload, (bytearray, memoryview)):
+        payload = bytes(payload)
+    zwischenspeichern = topic is not None and isinstance(payload, bytes)
+    if zwischenspeichern:
+        bekannt = _fleet_telemetry_payload_cache.get(topic)
+        if bekannt is not None and bekannt[0] == payload:
+            return bekannt[1]
+    if isinstance(payload, bytes):
+        try:
+            value = json.loads(payload)
+        except UnicodeDecodeError:
+            value = payload.decode("utf-8", errors="replace")
+            try:
+                value = json.loads(value)
+            except Exception:
+                pass
+        except Exception:
+            value = payload.decode("utf-8", errors="replace")
+    else:
+        try:
+            value = json.loads(payload)
+        except Exception:
+            value = payload
+    if zwischenspeichern:
+        if (
+            len(_fleet_telemetry_payload_cache) >= FLEET_TELEMETRIE_PAYLOAD_CACHE_MAX
+            and topic not in _fleet_telemetry_payload_cache
+        ):
+            _fleet_telemetry_payload_cache.clear()
+        _fleet_telemetry_payload_cache[topic] = (payload, value)
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _fleet_telemetrie_topic_zerlegen(topic, topic_base):
+    """Zerlege ein MQTT-Topic einmalig in VIN, Typ und Feld."""
+
+    topic_base = str(topic_base or "tesla").strip("/")
+    parts = topic.split("/")
+    if len(parts) < 3 or parts[0] != topic_base:
+        return None
+    field = "/".join(parts[3:]) if len(parts) >= 4 else None
+    return parts[1], parts[2], field
 
 
 def _fleet_telemetrie_mqtt_event(
@@ -9562,16 +11467,17 @@ def _fleet_telemetrie_mqtt_event(
         cfg = _fleet_telemetrie_runtime_config()
     if timestamp_ms is None:
         timestamp_ms = int(time.time() * 1000)
-    topic_base = str(cfg.get("topic_base") or "tesla").strip("/")
-    parts = topic.split("/")
-    if len(parts) < 3 or parts[0] != topic_base:
+    topic_base = cfg.get("topic_base")
+    if not isinstance(topic_base, str):
+        topic_base = None if topic_base is None else str(topic_base)
+    zerlegt = _fleet_telemetrie_topic_zerlegen(topic, topic_base)
+    if zerlegt is None:
+        return None
+    vin, typ, field = zerlegt
+    if retained and typ == "v":
         return None
-    vin = parts[1]
-    typ = parts[2]
-    value = _fleet_telemetrie_decode_payload(payload)
+    value = _fleet_telemetrie_decode_payload(payload, topic)
     if retained:
-        if typ == "v":
-            return None
         if typ == "connectivity":
             status = None
             if isinstance(value, dict):
@@ -9582,8 +11488,7 @@ def _fleet_telemetrie_mqtt_event(
                 value,
                 timestamp_ms,
             )
-    if typ == "v" and len(parts) >= 4:
-        field = "/".join(parts[3:])
+    if typ == "v" and field is not None:
         return {
             "typ": "v",
             "vin": vin,
@@ -9689,43 +11594,178 @@ def _fleet_telemetrie_mqtt_events_verarbeiten(events):
     return hat_aktualisiert
 
 
-def _fleet_telemetrie_mqtt_messages_verarbeiten(nachrichten, cfg=None):
-    """Dekodiere und verarbeite eine Gruppe MQTT-Nachrichten."""
+FLEET_TELEMETRIE_KRITISCHE_LIVE_FELDER = frozenset({
+    "Location",
+    "VehicleSpeed",
+    "Gear",
+    "GpsHeading",
+})
+FLEET_TELEMETRIE_BULK_FELD_PRAEFIXE = ("Tpms", "SoftwareUpdate", "Media")
+
+
+@lru_cache(maxsize=1024)
+def _fleet_telemetrie_feld_spur(field):
+    """Ordne ein Telemetry-Feld der kritischen, normalen oder Bulk-Spur zu."""
+
+    if field in FLEET_TELEMETRIE_KRITISCHE_LIVE_FELDER:
+        return "kritisch"
+    if isinstance(field, str) and field.startswith(FLEET_TELEMETRIE_BULK_FELD_PRAEFIXE):
+        return "bulk"
+    return "normal"
+
+
+def _fleet_telemetrie_event_spur(event):
+    """Ermittle die Verarbeitungsspur eines Telemetry-Ereignisses."""
+
+    if event.get("typ") == "connectivity":
+        return "kritisch"
+    return _fleet_telemetrie_feld_spur(event.get("field"))
+
+
+def _fleet_telemetrie_mqtt_messages_verarbeiten(nachrichten, cfg=None, bulk_puffer=None):
+    """Dekodiere und verarbeite eine Gruppe MQTT-Nachrichten.
+
+    Kritische Live-Felder werden vor den übrigen Feldern übernommen und an die
+    Streams verteilt. Mit ``bulk_puffer`` werden Bulk-Felder nicht sofort
+    verarbeitet, sondern je VIN und Feld für einen späteren, gebündelten
+    Durchlauf vorgemerkt.
+
+    Verbindungsereignisse bleiben in Ankunftsreihenfolge: Vor ihnen werden
+    alle zuvor eingetroffenen Felder und die vorgemerkten Bulk-Felder des
+    Fahrzeugs übernommen, denn jedes Feld setzt ``state`` auf ``online`` und
+    würde ein späteres Offline-Ereignis sonst überschreiben.
+    """
 
     if cfg is None:
         cfg = _fleet_telemetrie_runtime_config()
-    events = []
+    aktualisiert = False
+    kritisch = []
+    normal = []
+
+    def _spuren_verarbeiten():
+        nonlocal aktualisiert, kritisch, normal
+        if kritisch:
+            aktualisiert = _fleet_telemetrie_mqtt_events_verarbeiten(kritisch) or aktualisiert
+        if normal:
+            aktualisiert = _fleet_telemetrie_mqtt_events_verarbeiten(normal) or aktualisiert
+        kritisch = []
+        normal = []
+
     for topic, payload, timestamp_ms in nachrichten:
         event = _fleet_telemetrie_mqtt_event(topic, payload, cfg, timestamp_ms)
-        if event is not None:
-            events.append(event)
+        if event is None:
+            continue
+        if event.get("typ") == "connectivity":
+            _spuren_verarbeiten()
+            if bulk_puffer:
+                aktualisiert = (
+                    _fleet_telemetrie_bulk_verarbeiten(bulk_puffer, event.get("vin"))
+                    or aktualisiert
+                )
+            aktualisiert = _fleet_telemetrie_mqtt_events_verarbeiten([event]) or aktualisiert
+            continue
+        spur = _fleet_telemetrie_event_spur(event)
+        if spur == "kritisch":
+            kritisch.append(event)
+        elif spur == "bulk" and bulk_puffer is not None:
+            schluessel = (event.get("vin"), event.get("field"))
+            bulk_puffer.pop(schluessel, None)
+            bulk_puffer[schluessel] = event
+        else:
+            normal.append(event)
+    _spuren_verarbeiten()
+    return aktualisiert
+
+
+def _fleet_telemetrie_vor_offline(event):
+    """Prüfe, ob ein Feld vor dem zuletzt übernommenen Offline-Ereignis lag."""
+
+    offline_seit = _fleet_telemetry_offline_seit.get(event.get("vin"))
+    timestamp_ms = event.get("timestamp_ms")
+    return (
+        offline_seit is not None
+        and timestamp_ms is not None
+        and timestamp_ms < offline_seit
+    )
+
+
+def _fleet_telemetrie_bulk_verarbeiten(bulk_puffer, vin=None):
+    """Übernehme gesammelte Bulk-Felder in einem gemeinsamen Durchlauf.
+
+    Mit ``vin`` nur die Felder dieses Fahrzeugs. Felder, die älter als ein
+    bereits übernommenes Offline-Ereignis sind, werden verworfen.
+    """
+
+    if not bulk_puffer:
+        return False
+    if vin is None:
+        schluessel = list(bulk_puffer)
+    else:
+        schluessel = [eintrag for eintrag in bulk_puffer if eintrag[0] == vin]
+    events = [
+        event
+        for event in (bulk_puffer.pop(eintrag) for eintrag in schluessel)
+        if not _fleet_telemetrie_vor_offline(event)
+    ]
     if not events:
         return False
-    return _fleet_telemetrie_mqtt_events_verarbeiten(events)
+    try:
+        return _fleet_telemetrie_mqtt_events_verarbeiten(events)
+    except Exception:
+        logging.exception(
+            "Fleet-Telemetry-Bulk-Felder konnten nicht verarbeitet werden"
+        )
+        return False
+
+
+def _fleet_telemetrie_topic_vin(topic):
+    """Lese die VIN aus einem Fleet-Telemetry-Topic, ohne es zu validieren."""
+
+    if not isinstance(topic, str):
+        return None
+    teile = topic.split("/", 2)
+    if len(teile) < 2:
+        return None
+    return teile[1]
+
+
+def _fleet_telemetrie_topic_feld(topic):
+    """Ermittle das Feld bzw. den Ereignistyp eines Telemetry-Topics."""
+
+    if not isinstance(topic, str):
+        return ""
+    teile = topic.split("/", 3)
+    if len(teile) >= 4 and teile[2] == "v":
+        return teile[3]
+    if len(teile) >= 3:
+        return teile[2]
+    return topic
 
 
 def _fleet_telemetrie_mqtt_einreihen(topic, payload, timestamp_ms):
     """Lege MQTT-Nachrichten ohne Blockieren in die Verarbeitungsqueue."""
 
     global _fleet_telemetry_queue_verworfen, _fleet_telemetry_queue_warnung
+    global _fleet_telemetry_queue_zusammengefasst
 
     if isinstance(payload, bytearray):
         payload = bytes(payload)
     eintrag = (topic, payload, timestamp_ms)
-    try:
-        _fleet_telemetry_message_queue.put_nowait(eintrag)
+    verworfen = _fleet_telemetry_message_queue.put_nowait(eintrag)
+    if verworfen is None:
         return
-    except queue.Full:
-        pass
-
-    try:
-        _fleet_telemetry_message_queue.get_nowait()
-    except queue.Empty:
-        pass
-    try:
-        _fleet_telemetry_message_queue.put_nowait(eintrag)
-    except queue.Full:
-        _fleet_telemetry_queue_verworfen += 1
+    verworfenes_topic, ersetzt = verworfen
+    feld = _fleet_telemetrie_topic_feld(verworfenes_topic)
+    if ersetzt:
+        _fleet_telemetry_queue_zusammengefasst += 1
+        _fleet_telemetry_queue_zusammengefasst_felder[feld] = (
+            _fleet_telemetry_queue_zusammengefasst_felder.get(feld, 0) + 1
+        )
+        return
+    _fleet_telemetry_queue_verworfen += 1
+    _fleet_telemetry_queue_verworfen_felder[feld] = (
+        _fleet_telemetry_queue_verworfen_felder.get(feld, 0) + 1
+    )
     now = time.time()
     if now - _fleet_telemetry_queue_warnung >= 60:
         _fleet_telemetry_queue_warnung = now
@@ -9735,12 +11775,172 @@ def _fleet_telemetrie_mqtt_einreihen(topic, payload, timestamp_ms):
         )
 
 
+def _fleet_telemetrie_feldklasse(felder):
+    """Ermittle die höchste Verarbeitungsspur mehrerer Telemetry-Felder."""
+
+    klassen = {_fleet_telemetrie_feld_spur(feld) for feld in felder}
+    for klasse in ("kritisch", "normal", "bulk"):
+        if klasse in klassen:
+            return klasse
+    return "normal"
+
+
+def _fleet_telemetrie_topic_klasse(topic):
+    """Ermittle die Verarbeitungsspur einer MQTT-Nachricht anhand des Topics."""
+
+    feld = _fleet_telemetrie_topic_feld(topic)
+    if feld == "connectivity":
+        return "kritisch"
+    return _fleet_telemetrie_feld_spur(feld)
+
+
+def _fleet_telemetrie_latenz_erfassen(stufe, vin, klasse, dauer_ms):
+    """Trage eine Laufzeit in das Histogramm von Stufe, Fahrzeug und Feldklasse ein."""
+
+    if dauer_ms is None:
+        return
+    schluessel = (str(vin or "unbekannt"), klasse or "normal", stufe)
+    with _fleet_telemetry_latenz_lock:
+        histogramm = _fleet_telemetry_latenzen.get(schluessel)
+        if histogramm is None:
+            if len(_fleet_telemetry_latenzen) >= FLEET_TELEMETRY_LATENZ_SCHLUESSEL_MAX:
+                return
+            histogramm = _LatenzHistogramm()
+            _fleet_telemetry_latenzen[schluessel] = histogramm
+        histogramm.erfassen(dauer_ms)
+
+
+def _fleet_telemetrie_wartezeit_erfassen(nachrichten):
+    """Erfasse die Queue-Wartezeit einer Gruppe ab dem MQTT-Empfang."""
+
+    jetzt_ms = time.time() * 1000
+    for topic, _payload, timestamp_ms in nachrichten:
+        if timestamp_ms is None:
+            continue
+        _fleet_telemetrie_latenz_erfassen(
+            "queue_wait",
+            _fleet_telemetrie_topic_vin(topic),
+            _fleet_telemetrie_topic_klasse(topic),
+            jetzt_ms - timestamp_ms,
+        )
+
+
+def _fleet_telemetrie_latenz_status():
+    """Fasse die Latenz-Histogramme für ``/api/health`` zusammen."""
+
+    zusammenfassung = []
+    with _fleet_telemetry_latenz_lock:
+        for (vin, klasse, stufe), histogramm in _fleet_telemetry_latenzen.items():
+            anzahl = histogramm.anzahl
+            zusammenfassung.append(
+                {
+                    "vehicle": vin,
+                    "field_class": klasse,
+                    "stage": stufe,
+                    "count": anzahl,
+                    "mean_ms": round(histogramm.summe_ms / anzahl, 3) if anzahl else None,
+                    "p50_ms": histogramm.perzentil(50),
+                    "p95_ms": histogramm.perzentil(95),
+                    "p99_ms": histogramm.perzentil(99),
+                    "max_ms": round(histogramm.max_ms, 3),
+                }
+            )
+    reihenfolge = {stufe: index for index, stufe in enumerate(FLEET_TELEMETRY_LATENZ_STUFEN)}
+    zusammenfassung.sort(
+        key=lambda item: (
+            item["vehicle"],
+            item["field_class"],
+            reihenfolge.get(item["stage"], len(reihenfolge)),
+        )
+    )
+    return zusammenfassung
+
+
+def _metrik_label(wert):
+    """Maskiere einen Label-Wert für das Prometheus-Textformat."""
+
+    return str(wert).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fleet_telemetrie_metriken_text():
+    """Gib Ingest-Zähler und Latenz-Histogramme im Prometheus-Textformat aus."""
+
+    status = _fleet_telemetrie_ingest_status()
+    zeilen = [
+        "# HELP tesla_dashboard_telemetry_queued Wartende MQTT-Nachrichten.",
+        "# TYPE tesla_dashboard_telemetry_queued gauge",
+        f'tesla_dashboard_telemetry_queued {status["queued"]}',
+        "# HELP tesla_dashboard_telemetry_dropped_total Verdrängte MQTT-Nachrichten.",
+        "# TYPE tesla_dashboard_telemetry_dropped_total counter",
+        f'tesla_dashboard_telemetry_dropped_total {status["dropped"]}',
+        "# HELP tesla_dashboard_telemetry_coalesced_total Zusammengefasste MQTT-Nachrichten.",
+        "# TYPE tesla_dashboard_telemetry_coalesced_total counter",
+        f'tesla_dashboard_telemetry_coalesced_total {status["coalesced"]}',
+        "# HELP tesla_dashboard_pipeline_latency_ms Laufzeit je Pipeline-Stufe in Millisekunden.",
+        "# TYPE tesla_dashboard_pipeline_latency_ms histogram",
+    ]
+    with _fleet_telemetry_latenz_lock:
+        eintraege = sorted(
+            (schluessel, list(h.klassen), h.anzahl, h.summe_ms)
+            for schluessel, h in _fleet_telemetry_latenzen.items()
+        )
+    for (vin, klasse, stufe), klassen, anzahl, summe in eintraege:
+        labels = (
+            f'vehicle="{_metrik_label(vin)}",field_class="{_metrik_label(klasse)}",'
+            f'stage="{_metrik_label(stufe)}"'
+        )
+        kumuliert = 0
+        for grenze, klassen_anzahl in zip(FLEET_TELEMETRY_LATENZ_GRENZEN_MS, klassen):
+            kumuliert += klassen_anzahl
+            zeilen.append(
+                f'tesla_dashboard_pipeline_latency_ms_bucket{{{labels},le="{grenze}"}} {kumuliert}'
+            )
+        zeilen.append(
+            f'tesla_dashboard_pipeline_latency_ms_bucket{{{labels},le="+Inf"}} {anzahl}'
+        )
+        zeilen.append(f"tesla_dashboard_pipeline_latency_ms_sum{{{labels}}} {round(summe, 3)}")
+        zeilen.append(f"tesla_dashboard_pipeline_latency_ms_count{{{labels}}} {anzahl}")
+    return "\n".join(zeilen) + "\n"
+
+
+def _fleet_telemetrie_ingest_status():
+    """Fasse Füllstand und Worker der MQTT-Verarbeitung zusammen."""
+
+    worker = _fleet_telemetry_worker_thread
+    return {
+        "queued": _fleet_telemetry_message_queue.qsize(),
+        "queue_max": _fleet_telemetry_message_queue.maxsize,
+        "worker_alive": bool(worker is not None and worker.is_alive()),
+        "dropped": _fleet_telemetry_queue_verworfen,
+        "coalesced": _fleet_telemetry_queue_zusammengefasst,
+        "dropped_by_field": dict(_fleet_telemetry_queue_verworfen_felder),
+        "coalesced_by_field": dict(_fleet_telemetry_queue_zusammengefasst_felder),
+        "outbox": {
+            art: {
+                "queued": warteschlange.qsize(),
+                "queue_max": warteschlange.maxsize,
+                "dropped": _outbox_verworfen.get(art, 0),
+            }
+            for art, warteschlange in _outbox_warteschlangen.items()
+        },
+    }
+
+
 def _fleet_telemetrie_worker_loop():
     """Verarbeite MQTT-Nachrichten außerhalb des Paho-Netzwerkthreads."""
 
+    nachrichten_queue = _fleet_telemetry_message_queue
+    bulk_puffer = OrderedDict()
+    bulk_faellig = None
     while _fleet_telemetrie_aktiv():
+        if bulk_faellig is not None and time.monotonic() >= bulk_faellig:
+            _fleet_telemetrie_bulk_verarbeiten(bulk_puffer)
+            bulk_faellig = None
+        wartezeit = 1.0
+        if bulk_faellig is not None:
+            wartezeit = max(0.0, min(wartezeit, bulk_faellig - time.monotonic()))
         try:
-            erste_nachricht = _fleet_telemetry_message_queue.get(timeout=1)
+            erste_nachricht = nachrichten_queue.get(timeout=wartezeit)
         except queue.Empty:
             continue
         nachrichten = [erste_nachricht]
@@ -9751,16 +11951,23 @@ def _fleet_telemetrie_worker_loop():
                 break
             try:
                 nachrichten.append(
-                    _fleet_telemetry_message_queue.get(timeout=min(0.01, rest))
+                    nachrichten_queue.get(timeout=min(0.01, rest))
                 )
             except queue.Empty:
                 break
+        _fleet_telemetrie_wartezeit_erfassen(nachrichten)
         try:
-            _fleet_telemetrie_mqtt_messages_verarbeiten(nachrichten)
+            _fleet_telemetrie_mqtt_messages_verarbeiten(
+                nachrichten,
+                bulk_puffer=bulk_puffer,
+            )
         except Exception:
             logging.exception(
                 "Fleet-Telemetry-MQTT-Gruppe konnte nicht verarbeitet werden"
             )
+        if bulk_puffer and bulk_faellig is None:
+            bulk_faellig = time.monotonic() + FLEET_TELEMETRY_MQTT_BULK_SECONDS
+    _fleet_telemetrie_bulk_verarbeiten(bulk_puffer)
 
 
 def _fleet_telemetrie_listener_loop():
@@ -10704,64 +12911,424 @@ def _aprs_sender_loop():
     while True:
         data = _aprs_sendewarteschlange.get()
         try:
-            send_aprs(data)
-        except Exception:
-            logging.exception("APRS-Sendung fehlgeschlagen")
-        finally:
-            try:
-                _aprs_sendewarteschlange.task_done()
-            except Exception:
-                pass
+            send_aprs(data)
+        except Exception:
+            logging.exception("APRS-Sendung fehlgeschlagen")
+        finally:
+            try:
+                _aprs_sendewarteschlange.task_done()
+            except Exception:
+                pass
+
+
+def _start_aprs_sender():
+    """Starte den APRS-Hintergrundsender bei Bedarf."""
+
+    global _aprs_sender_thread
+
+    if aprslib is None:
+        return
+    with _aprs_sender_lock:
+        if _aprs_sender_thread is not None and _aprs_sender_thread.is_alive():
+            return
+        _aprs_sender_thread = threading.Thread(
+            target=_aprs_sender_loop,
+            daemon=True,
+        )
+        _aprs_sender_thread.start()
+
+
+def _outbox_vormerken(art, eintrag):
+    """Reihe eine Nebenwirkung für ihren Schreiber-Thread ein.
+
+    Bei voller Outbox ersetzt der Eintrag ein älteres Sample desselben
+    Fahrzeugs; verworfene Einträge werden gezählt und gemeldet.
+    """
+
+    global _outbox_warnung
+
+    verworfen = _outbox_warteschlangen[art].ersetzend_einreihen(eintrag)
+    _outbox_starten(art)
+    if verworfen is None:
+        return
+    _outbox_verworfen[art] = _outbox_verworfen.get(art, 0) + 1
+    now = time.time()
+    if now - _outbox_warnung >= 60:
+        _outbox_warnung = now
+        logging.warning(
+            "Outbox %s war voll; verworfene Einträge: %s",
+            art,
+            _outbox_verworfen[art],
+        )
+
+
+def _outbox_starten(art):
+    """Starte den Schreiber-Thread einer Outbox bei Bedarf."""
+
+    with _outbox_lock:
+        thread = _outbox_threads.get(art)
+        if thread is not None and thread.is_alive():
+            return
+        thread = threading.Thread(
+            target=_outbox_loop,
+            args=(art,),
+            name=f"outbox-{art}",
+            daemon=True,
+        )
+        _outbox_threads[art] = thread
+        thread.start()
+
+
+def _outbox_stapel_schreiben(art, stapel):
+    if art == "v2l":
+        _v2l_outbox_schreiben(stapel)
+    elif art == "parken":
+        _parkstatus_outbox_schreiben(stapel)
+    elif art == "trip_index":
+        _trip_index_outbox_schreiben(stapel)
+
+
+def _outbox_loop(art):
+    """Arbeite eine Outbox in Stapeln ab, jeweils bis zur Stapelgröße."""
+
+    warteschlange = _outbox_warteschlangen[art]
+    while True:
+        stapel = [warteschlange.get()]
+        while len(stapel) < FLEET_TELEMETRY_OUTBOX_BATCH_MAX:
+            try:
+                stapel.append(warteschlange.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _outbox_stapel_schreiben(art, stapel)
+        except Exception:
+            logging.exception("Outbox %s konnte nicht geschrieben werden", art)
+        finally:
+            for _eintrag in stapel:
+                warteschlange.task_done()
+
+
+def _outbox_abwarten():
+    """Warte, bis alle vorgemerkten Nebenwirkungen geschrieben sind."""
+
+    for art, warteschlange in _outbox_warteschlangen.items():
+        if warteschlange.unfinished_tasks:
+            _outbox_starten(art)
+            warteschlange.join()
+
+
+def _aprs_spaeter_senden(vehicle_data):
+    """Merke den neuesten APRS-Stand vor, ohne den Live-Datenpfad zu blockieren."""
+
+    if aprslib is None or not isinstance(vehicle_data, dict):
+        return
+    drive = vehicle_data.get("drive_state", {})
+    if not isinstance(drive, dict):
+        return
+    if drive.get("latitude") is None or drive.get("longitude") is None:
+        return
+    try:
+        sendekopie = json.loads(json.dumps(vehicle_data))
+    except Exception:
+        sendekopie = dict(vehicle_data)
+    _start_aprs_sender()
+    while _aprs_sendewarteschlange.full():
+        try:
+            _aprs_sendewarteschlange.get_nowait()
+            _aprs_sendewarteschlange.task_done()
+        except queue.Empty:
+            break
+        except Exception:
+            break
+    try:
+        _aprs_sendewarteschlange.put_nowait(sendekopie)
+    except queue.Full:
+        pass
+
+
+_trip_index_tabellen = set()
+
+
+def _trip_index_pfad():
+    # Eigenes Unterverzeichnis, damit Journaldateien die mtime von DATA_DIR
+    # nicht verändern und kein erneutes Auflisten auslösen
+    return TRIP_INDEX_DB or os.path.join(DATA_DIR, "trip_index", "trip_index.db")
+
+
+def _trip_index_conn():
+    pfad = _trip_index_pfad()
+    dir_path = os.path.dirname(pfad)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+    conn = sqlite3.connect(pfad, timeout=TRIP_INDEX_TIMEOUT_SECONDS)
+    conn.row_factory = sqlite3.Row
+    if pfad not in _trip_index_tabellen:
+        try:
+            _ensure_trip_index_tables(conn)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        _trip_index_tabellen.add(pfad)
+    return conn
+
+
+def _ensure_trip_index_tables(conn):
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS trip_verzeichnisse (
+            verzeichnis TEXT PRIMARY KEY,
+            basis TEXT NOT NULL,
+            fahrzeug TEXT NOT NULL,
+            mtime_ns INTEGER
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS trip_dateien (
+            pfad TEXT PRIMARY KEY,
+            verzeichnis TEXT NOT NULL,
+            fahrzeug TEXT NOT NULL,
+            tag TEXT,
+            woche TEXT,
+            monat TEXT,
+            groesse INTEGER,
+            mtime_ns INTEGER,
+            distanz REAL,
+            max_speed REAL,
+            segmente INTEGER,
+            min_lat REAL,
+            max_lat REAL,
+            min_lon REAL,
+            max_lon REAL,
+            metrik_groesse INTEGER,
+            metrik_mtime_ns INTEGER
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS trip_dateien_verzeichnis "
+        "ON trip_dateien (verzeichnis, tag)"
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS trip_kennzahlen (
+            pfad TEXT NOT NULL,
+            art TEXT NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            groesse INTEGER NOT NULL,
+            wert TEXT NOT NULL,
+            PRIMARY KEY (pfad, art)
+        )
+        """
+    )
+    conn.commit()
+
+
+def _trip_index_eintrag(pfad, fahrzeug=None, stat=None):
+    """Baue einen Indexeintrag mit den aus dem Dateinamen abgeleiteten Perioden."""
+
+    verzeichnis = os.path.dirname(pfad)
+    if fahrzeug is None:
+        fahrzeug = os.path.basename(os.path.dirname(verzeichnis))
+    eintrag = {
+        "pfad": pfad,
+        "verzeichnis": verzeichnis,
+        "fahrzeug": fahrzeug,
+        "tag": None,
+        "woche": None,
+        "monat": None,
+        "groesse": None if stat is None else stat.st_size,
+        "mtime_ns": None if stat is None else stat.st_mtime_ns,
+    }
+    tag = _trip_date_from_filename(pfad)
+    if tag is not None:
+        iso_year, iso_week, _ = tag.isocalendar()
+        eintrag["tag"] = tag.strftime("%Y-%m-%d")
+        eintrag["woche"] = f"{iso_year}-W{iso_week:02d}"
+        eintrag["monat"] = tag.strftime("%Y-%m")
+    return eintrag
+
+
+def _trip_index_datei_eintragen(conn, eintrag):
+    conn.execute(
+        """
+        INSERT INTO trip_dateien (
+            pfad, verzeichnis, fahrzeug, tag, woche, monat, groesse, mtime_ns
+        ) VALUES (
+            :pfad, :verzeichnis, :fahrzeug, :tag, :woche, :monat, :groesse, :mtime_ns
+        )
+        ON CONFLICT(pfad) DO UPDATE SET
+            groesse = excluded.groesse,
+            mtime_ns = excluded.mtime_ns
+        """,
+        eintrag,
+    )
+
+
+def _trip_index_verzeichnis_einlesen(conn, verzeichnis, fahrzeug, mtime_ns):
+    """Gleiche die Dateien eines Trip-Verzeichnisses vollständig mit dem Index ab."""
+
+    try:
+        namen = os.listdir(verzeichnis)
+    except OSError:
+        namen = []
+    vorhanden = {}
+    for name in namen:
+        if not name.endswith(".csv"):
+            continue
+        pfad = os.path.join(verzeichnis, name)
+        try:
+            vorhanden[pfad] = os.stat(pfad)
+        except OSError:
+            continue
+    bekannt = {
+        row["pfad"]: (row["groesse"], row["mtime_ns"])
+        for row in conn.execute(
+            "SELECT pfad, groesse, mtime_ns FROM trip_dateien WHERE verzeichnis = ?",
+            (verzeichnis,),
+        )
+    }
+    conn.executemany(
+        "DELETE FROM trip_dateien WHERE pfad = ?",
+        [(pfad,) for pfad in bekannt if pfad not in vorhanden],
+    )
+    for pfad, stat in vorhanden.items():
+        if bekannt.get(pfad) != (stat.st_size, stat.st_mtime_ns):
+            _trip_index_datei_eintragen(
+                conn, _trip_index_eintrag(pfad, fahrzeug, stat)
+            )
+    conn.execute(
+        "UPDATE trip_verzeichnisse SET mtime_ns = ? WHERE verzeichnis = ?",
+        (mtime_ns, verzeichnis),
+    )
 
 
-def _start_aprs_sender():
-    """Starte den APRS-Hintergrundsender bei Bedarf."""
+def _trip_index_fahrzeugverzeichnisse(conn, basis):
+    """Liefere ``(verzeichnis, fahrzeug)`` aller Trip-Verzeichnisse unter ``basis``.
 
-    global _aprs_sender_thread
+    ``basis`` wird nur neu gelistet, wenn sich seine mtime geändert hat.
+    """
 
-    if aprslib is None:
-        return
-    with _aprs_sender_lock:
-        if _aprs_sender_thread is not None and _aprs_sender_thread.is_alive():
-            return
-        _aprs_sender_thread = threading.Thread(
-            target=_aprs_sender_loop,
-            daemon=True,
+    try:
+        stat = os.stat(basis)
+    except OSError:
+        return []
+    row = conn.execute(
+        "SELECT mtime_ns FROM trip_verzeichnisse WHERE verzeichnis = ?", (basis,)
+    ).fetchone()
+    if row is None or row["mtime_ns"] != stat.st_mtime_ns:
+        try:
+            namen = os.listdir(basis)
+        except OSError:
+            namen = []
+        fahrzeuge = {
+            os.path.join(basis, name, "trips"): name
+            for name in namen
+            if str(name).isdigit() and os.path.isdir(os.path.join(basis, name))
+        }
+        for alt in conn.execute(
+            "SELECT verzeichnis, fahrzeug FROM trip_verzeichnisse "
+            "WHERE basis = ? AND verzeichnis != ?",
+            (basis, basis),
+        ).fetchall():
+            if alt["fahrzeug"].isdigit() and alt["verzeichnis"] not in fahrzeuge:
+                conn.execute(
+                    "DELETE FROM trip_dateien WHERE verzeichnis = ?",
+                    (alt["verzeichnis"],),
+                )
+                conn.execute(
+                    "DELETE FROM trip_verzeichnisse WHERE verzeichnis = ?",
+                    (alt["verzeichnis"],),
+                )
+        conn.executemany(
+            "INSERT OR IGNORE INTO trip_verzeichnisse (verzeichnis, basis, fahrzeug) "
+            "VALUES (?, ?, ?)",
+            [(verzeichnis, basis, name) for verzeichnis, name in fahrzeuge.items()],
         )
-        _aprs_sender_thread.start()
+        conn.execute(
+            "INSERT OR REPLACE INTO trip_verzeichnisse "
+            "(verzeichnis, basis, fahrzeug, mtime_ns) VALUES (?, ?, '', ?)",
+            (basis, basis, stat.st_mtime_ns),
+        )
+    return [
+        (row["verzeichnis"], row["fahrzeug"])
+        for row in conn.execute(
+            "SELECT verzeichnis, fahrzeug FROM trip_verzeichnisse "
+            "WHERE basis = ? AND verzeichnis != ? ORDER BY verzeichnis",
+            (basis, basis),
+        )
+        if row["fahrzeug"].isdigit()
+    ]
 
 
-def _aprs_spaeter_senden(vehicle_data):
-    """Merke den neuesten APRS-Stand vor, ohne den Live-Datenpfad zu blockieren."""
+def _trip_index_abgleichen(conn, verzeichnisse=None, vollstaendig=False):
+    """Bringe den Trip-Index mit dem Dateisystem in Einklang.
 
-    if aprslib is None or not isinstance(vehicle_data, dict):
-        return
-    drive = vehicle_data.get("drive_state", {})
-    if not isinstance(drive, dict):
-        return
-    if drive.get("latitude") is None or drive.get("longitude") is None:
-        return
-    try:
-        sendekopie = json.loads(json.dumps(vehicle_data))
-    except Exception:
-        sendekopie = dict(vehicle_data)
-    _start_aprs_sender()
-    while _aprs_sendewarteschlange.full():
+    Pro Verzeichnis genügt ein ``stat``: Ein Verzeichnis wird nur neu gelistet,
+    wenn sich seine mtime geändert hat, ansonsten wird nur die jüngste Datei
+    geprüft, an die laufende Fahrten anhängen. ``vollstaendig`` prüft jede
+    Datei und fängt so auch Änderungen außerhalb der App ab.
+    """
+
+    basis = DATA_DIR
+    if verzeichnisse is None:
+        verzeichnisse = _trip_index_fahrzeugverzeichnisse(conn, basis)
+    for verzeichnis, fahrzeug in verzeichnisse:
+        gespeichert = conn.execute(
+            "SELECT mtime_ns FROM trip_verzeichnisse WHERE verzeichnis = ?",
+            (verzeichnis,),
+        ).fetchone()
+        if gespeichert is None:
+            conn.execute(
+                "INSERT INTO trip_verzeichnisse (verzeichnis, basis, fahrzeug) "
+                "VALUES (?, ?, ?)",
+                (verzeichnis, basis, fahrzeug),
+            )
         try:
-            _aprs_sendewarteschlange.get_nowait()
-            _aprs_sendewarteschlange.task_done()
-        except queue.Empty:
-            break
-        except Exception:
-            break
-    try:
-        _aprs_sendewarteschlange.put_nowait(sendekopie)
-    except queue.Full:
-        pass
+            stat = os.stat(verzeichnis)
+        except OSError:
+            conn.execute(
+                "DELETE FROM trip_dateien WHERE verzeichnis = ?", (verzeichnis,)
+            )
+            conn.execute(
+                "UPDATE trip_verzeichnisse SET mtime_ns = NULL WHERE verzeichnis = ?",
+                (verzeichnis,),
+            )
+            continue
+        if (
+            vollstaendig
+            or gespeichert is None
+            or gespeichert["mtime_ns"] != stat.st_mtime_ns
+        ):
+            _trip_index_verzeichnis_einlesen(
+                conn, verzeichnis, fahrzeug, stat.st_mtime_ns
+            )
+            continue
+        juengste = conn.execute(
+            "SELECT pfad, groesse, mtime_ns FROM trip_dateien WHERE verzeichnis = ? "
+            "ORDER BY tag DESC, pfad DESC LIMIT 1",
+            (verzeichnis,),
+        ).fetchone()
+        if juengste is None:
+            continue
+        signatur = _trip_datei_signatur(juengste["pfad"])
+        if signatur is None:
+            _trip_index_verzeichnis_einlesen(
+                conn, verzeichnis, fahrzeug, stat.st_mtime_ns
+            )
+        elif signatur != (juengste["mtime_ns"], juengste["groesse"]):
+            conn.execute(
+                "UPDATE trip_dateien SET mtime_ns = ?, groesse = ? WHERE pfad = ?",
+                (signatur[0], signatur[1], juengste["pfad"]),
+            )
+    conn.commit()
+    return verzeichnisse
 
 
-def _get_trip_files(vehicle_id=None):
-    """Return a sorted list of available trip CSV paths."""
+def _trip_dateien_durchsuchen(vehicle_id=None):
+    """Liste die Trip-CSV-Dateien direkt aus den Verzeichnissen auf."""
     dirs = []
     if vehicle_id is None:
         try:
@@ -10787,31 +13354,199 @@ def _get_trip_files(vehicle_id=None):
     return files
 
 
+def _trip_index_eintraege(vehicle_id=None):
+    """Liefere die Einträge des Trip-Index, sortiert nach Pfad.
+
+    Jeder Eintrag enthält Pfad, Fahrzeug, Tag, ISO-Woche, Monat, Größe und
+    mtime. Die Kennzahlen ergänzt ``_trip_index_metriken``. Ist der Index nicht
+    nutzbar, werden die Verzeichnisse wie früher direkt durchsucht.
+    """
+
+    verzeichnisse = None
+    if vehicle_id is not None:
+        verzeichnisse = [(trip_dir(vehicle_id), _vehicle_key(vehicle_id))]
+    try:
+        conn = _trip_index_conn()
+        try:
+            eintraege = []
+            for verzeichnis, _fahrzeug in _trip_index_abgleichen(conn, verzeichnisse):
+                eintraege.extend(
+                    dict(row)
+                    for row in conn.execute(
+                        "SELECT * FROM trip_dateien WHERE verzeichnis = ?",
+                        (verzeichnis,),
+                    )
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        logging.warning("Trip-Index nicht verfügbar, durchsuche Verzeichnisse", exc_info=True)
+        _trip_index_tabellen.discard(_trip_index_pfad())
+        eintraege = []
+        for pfad in _trip_dateien_durchsuchen(vehicle_id):
+            try:
+                stat = os.stat(pfad)
+            except OSError:
+                continue
+            eintraege.append(_trip_index_eintrag(pfad, stat=stat))
+        return eintraege
+    eintraege.sort(key=lambda eintrag: eintrag["pfad"])
+    return eintraege
+
+
+def _trip_ausdehnung(path):
+    """Liefere ``(min_lat, max_lat, min_lon, max_lon)`` einer Trip-Datei."""
+
+    spalten = _load_trip_spalten(path)
+    if not len(spalten):
+        return None, None, None, None
+    return min(spalten.lat), max(spalten.lat), min(spalten.lon), max(spalten.lon)
+
+
+def _trip_index_metriken(eintraege):
+    """Ergänze Distanz, Höchstgeschwindigkeit, Segmente und Ausdehnung.
+
+    Gespeicherte Kennzahlen gelten, solange Größe und mtime zum Indexeintrag
+    passen; nur veraltete Einträge werden neu berechnet und zurückgeschrieben.
+    """
+
+    aktualisiert = []
+    for eintrag in eintraege:
+        if eintrag.get("groesse") is not None and (
+            eintrag.get("metrik_groesse"),
+            eintrag.get("metrik_mtime_ns"),
+        ) == (eintrag["groesse"], eintrag["mtime_ns"]):
+            continue
+        pfad = eintrag["pfad"]
+        signatur = _trip_datei_signatur(pfad)
+        if signatur is None:
+            continue
+        min_lat, max_lat, min_lon, max_lon = _trip_ausdehnung(pfad)
+        eintrag.update({
+            "distanz": _trip_distance(pfad),
+            "max_speed": _trip_max_speed(pfad),
+            "segmente": len(_split_trip_segments(pfad)),
+            "min_lat": min_lat,
+            "max_lat": max_lat,
+            "min_lon": min_lon,
+            "max_lon": max_lon,
+            "mtime_ns": signatur[0],
+            "groesse": signatur[1],
+            "metrik_mtime_ns": signatur[0],
+            "metrik_groesse": signatur[1],
+        })
+        aktualisiert.append(eintrag)
+    if aktualisiert:
+        try:
+            conn = _trip_index_conn()
+            try:
+                conn.executemany(
+                    """
+                    UPDATE trip_dateien SET
+                        groesse = :groesse,
+                        mtime_ns = :mtime_ns,
+                        distanz = :distanz,
+                        max_speed = :max_speed,
+                        segmente = :segmente,
+                        min_lat = :min_lat,
+                        max_lat = :max_lat,
+                        min_lon = :min_lon,
+                        max_lon = :max_lon,
+                        metrik_groesse = :metrik_groesse,
+                        metrik_mtime_ns = :metrik_mtime_ns
+                    WHERE pfad = :pfad
+                    """,
+                    aktualisiert,
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError):
+            logging.warning("Trip-Kennzahlen konnten nicht gespeichert werden", exc_info=True)
+    return eintraege
+
+
+def _trip_index_outbox_schreiben(stapel):
+    """Übernimm Größe und mtime gerade beschriebener Trip-Dateien in den Index."""
+
+    eintraege = []
+    for pfad in dict.fromkeys(stapel):
+        try:
+            stat = os.stat(pfad)
+        except OSError:
+            continue
+        eintraege.append(_trip_index_eintrag(pfad, stat=stat))
+    if not eintraege:
+        return
+    conn = _trip_index_conn()
+    try:
+        for eintrag in eintraege:
+            _trip_index_datei_eintragen(conn, eintrag)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _trip_index_aktualisieren():
+    """Gleiche den Trip-Index vollständig ab und berechne veraltete Kennzahlen."""
+
+    try:
+        conn = _trip_index_conn()
+        try:
+            verzeichnisse = _trip_index_abgleichen(conn, vollstaendig=True)
+            conn.executemany(
+                "DELETE FROM trip_kennzahlen WHERE pfad = ?",
+                [
+                    (row["pfad"],)
+                    for row in conn.execute(
+                        "SELECT DISTINCT pfad FROM trip_kennzahlen"
+                    ).fetchall()
+                    if not os.path.exists(row["pfad"])
+                ],
+            )
+            conn.commit()
+            eintraege = [
+                dict(row)
+                for verzeichnis, _fahrzeug in verzeichnisse
+                for row in conn.execute(
+                    "SELECT * FROM trip_dateien WHERE verzeichnis = ?",
+                    (verzeichnis,),
+                )
+            ]
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        logging.warning("Trip-Index konnte nicht abgeglichen werden", exc_info=True)
+        return
+    _trip_index_metriken(eintraege)
+
+
+def _get_trip_files(vehicle_id=None):
+    """Return a sorted list of available trip CSV paths."""
+    return [eintrag["pfad"] for eintrag in _trip_index_eintraege(vehicle_id)]
+
+
 def _get_trip_periods():
     """Return sorted lists of available weeks, months, and days."""
     weeks = set()
     months = set()
     days = set()
-    for path in _get_trip_files():
-        day = _trip_date_from_filename(path)
-        if day is None:
+    for eintrag in _trip_index_eintraege():
+        if eintrag["tag"] is None:
             continue
-        iso_year, iso_week, _ = day.isocalendar()
-        weeks.add(f"{iso_year}-W{iso_week:02d}")
-        months.add(day.strftime("%Y-%m"))
-        days.add(day.strftime("%Y-%m-%d"))
+        weeks.add(eintrag["woche"])
+        months.add(eintrag["monat"])
+        days.add(eintrag["tag"])
     return sorted(weeks), sorted(months), sorted(days)
 
 
 def _get_trip_days():
     """Return sorted list of available trip days."""
-    days = set()
-    for path in _get_trip_files():
-        trip_day = _trip_date_from_filename(path)
-        if trip_day is None:
-            continue
-        days.add(trip_day.strftime("%Y-%m-%d"))
-    return sorted(days)
+    return sorted({
+        eintrag["tag"]
+        for eintrag in _trip_index_eintraege()
+        if eintrag["tag"] is not None
+    })
 
 
 def _trip_date_from_filename(path):
@@ -10837,13 +13572,19 @@ def _trip_datei_signatur(path):
 def _trip_dateien_signatur():
     """Gibt eine kompakte Signatur aller bekannten Trip-Dateien zurück."""
 
-    signatur = []
-    for path in _get_trip_files():
-        signatur.append((path, _trip_datei_signatur(path)))
-    return tuple(signatur)
+    return tuple(
+        (eintrag["pfad"], (eintrag["mtime_ns"], eintrag["groesse"]))
+        for eintrag in _trip_index_eintraege()
+    )
 
 
-def _trip_cache_lesen(cache, path):
+def _trip_cache_lesen(cache, path, art):
+    """Liefere einen abgeleiteten Trip-Wert aus dem Speicher oder dem Trip-Index.
+
+    Der Speicher-Cache gilt nur für diesen Prozess; ``trip_kennzahlen`` teilt
+    die Werte mit dem Aggregationsprozess und überdauert Neustarts.
+    """
+
     signatur = _trip_datei_signatur(path)
     if signatur is None:
         return None
@@ -10851,15 +13592,50 @@ def _trip_cache_lesen(cache, path):
         eintrag = cache.get(path)
         if eintrag and eintrag.get("signatur") == signatur:
             return eintrag.get("wert")
-    return None
+    try:
+        conn = _trip_index_conn()
+        try:
+            row = conn.execute(
+                "SELECT wert FROM trip_kennzahlen "
+                "WHERE pfad = ? AND art = ? AND mtime_ns = ? AND groesse = ?",
+                (path, art, signatur[0], signatur[1]),
+            ).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        logging.warning("Trip-Kennzahl %s für %s nicht lesbar", art, path, exc_info=True)
+        return None
+    if row is None:
+        return None
+    try:
+        wert = json.loads(row["wert"])
+    except ValueError:
+        return None
+    with _trip_file_cache_lock:
+        cache[path] = {"signatur": signatur, "wert": wert}
+    return wert
 
 
-def _trip_cache_schreiben(cache, path, wert):
-    signatur = _trip_datei_signatur(path)
+def _trip_cache_schreiben(cache, path, art, wert, signatur=None):
+    if signatur is None:
+        signatur = _trip_datei_signatur(path)
     if signatur is None:
         return wert
     with _trip_file_cache_lock:
         cache[path] = {"signatur": signatur, "wert": wert}
+    try:
+        conn = _trip_index_conn()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO trip_kennzahlen "
+                "(pfad, art, mtime_ns, groesse, wert) VALUES (?, ?, ?, ?, ?)",
+                (path, art, signatur[0], signatur[1], json.dumps(wert)),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        logging.warning("Trip-Kennzahl %s für %s nicht speicherbar", art, path, exc_info=True)
     return wert
 
 
@@ -10871,49 +13647,290 @@ def _trip_datei_sortierwert(path):
 def _load_trip_period(prefix, key):
     """Load all trip points for the given week or month key."""
     points = []
-    for path in _get_trip_files():
-        day = _trip_date_from_filename(path)
-        if day is None:
-            continue
-        iso_year, iso_week, _ = day.isocalendar()
-        week_key = f"{iso_year}-W{iso_week:02d}"
-        month_key = day.strftime("%Y-%m")
-        if prefix == "week" and week_key != key:
-            continue
-        if prefix == "month" and month_key != key:
-            continue
-        points.extend(_load_trip(path))
+    for eintrag in _trip_index_periode(prefix, key):
+        points.extend(_load_trip(eintrag["pfad"]))
     return points
 
 
+def _trip_index_periode(prefix, key):
+    """Return index entries of the given week or month key."""
+    spalte = {"week": "woche", "month": "monat"}.get(prefix)
+    return [
+        eintrag
+        for eintrag in _trip_index_eintraege()
+        if eintrag["tag"] is not None and (spalte is None or eintrag[spalte] == key)
+    ]
+
+
 def _load_trip(filename):
     """Load all coordinates with optional speed and power from a trip CSV."""
+    spalten = _trip_spalten_lesen(filename)
+    if spalten is not None:
+        return spalten.punkte()
+    return _load_trip_csv(filename)
+
+
+def _load_trip_csv(filename):
+    """Parse a trip CSV line by line into point lists."""
     points = []
     try:
         with open(filename, "r", encoding="utf-8") as f:
             for line in f:
-                parts = line.strip().split(",")
-                if len(parts) < 3:
-                    continue
-                ts, lat, lon = parts[:3]
-                speed = parts[3] if len(parts) >= 4 and parts[3] else None
-                power = parts[4] if len(parts) >= 5 and parts[4] else None
-                heading = parts[5] if len(parts) >= 6 and parts[5] else None
-                gear = parts[6] if len(parts) >= 7 and parts[6] else None
+                point = _trip_zeile_parsen(line)
+                if point is not None:
+                    points.append(point)
+    except Exception:
+        pass
+    return points
+
+
+def _trip_zeile_parsen(line):
+    """Parse one trip CSV line into a point list or return ``None``."""
+    parts = line.strip().split(",")
+    if len(parts) < 3:
+        return None
+    ts, lat, lon = parts[:3]
+    speed = parts[3] if len(parts) >= 4 and parts[3] else None
+    power = parts[4] if len(parts) >= 5 and parts[4] else None
+    heading = parts[5] if len(parts) >= 6 and parts[5] else None
+    gear = parts[6] if len(parts) >= 7 and parts[6] else None
+    try:
+        ts = int(float(ts)) if ts else None
+        lat = float(lat)
+        lon = float(lon)
+        speed = float(speed) if speed is not None else None
+        power = float(power) if power is not None else None
+        heading = float(heading) if heading is not None else None
+    except Exception:
+        return None
+    return [lat, lon, speed, power, ts, heading, gear]
+
+
+TRIP_SPALTEN_ENDUNG = ".tcol"
+TRIP_SPALTEN_KENNUNG = b"TRIPCOL1"
+# Kennung, Zeilen, mtime_ns und Größe der CSV-Datei, Länge der Gangtabelle
+TRIP_SPALTEN_KOPF = struct.Struct("<8sQqqI")
+TRIP_SPALTEN = (
+    ("ts", "q"),
+    ("lat", "d"),
+    ("lon", "d"),
+    ("speed", "d"),
+    ("power", "d"),
+    ("heading", "d"),
+    ("flags", "B"),
+    ("gear", "B"),
+)
+TRIP_SPALTEN_BYTES_JE_PUNKT = sum(array(typ).itemsize for _name, typ in TRIP_SPALTEN)
+TRIP_SPALTE_TS = 1
+TRIP_SPALTE_SPEED = 2
+TRIP_SPALTE_POWER = 4
+TRIP_SPALTE_HEADING = 8
+
+
+class _TripSpalten:
+    """Spaltenweise Sicht auf die Punkte eines Trip-Tages.
+
+    Jede Spalte ist ein ``array`` oder eine ``memoryview`` auf die
+    gespeicherte Datei. ``ts``, ``speed``, ``power`` und ``heading`` gelten
+    nur, wenn ihr Bit in ``flags`` gesetzt ist; ``gear`` verweist mit 1-basiertem
+    Index in ``gaenge``, 0 steht für keinen Gang.
+    """
+
+    __slots__ = tuple(name for name, _typ in TRIP_SPALTEN) + ("gaenge",)
+
+    def __len__(self):
+        return len(self.lat)
+
+    @classmethod
+    def aus_punkten(cls, points):
+        spalten = cls()
+        for name, typ in TRIP_SPALTEN:
+            setattr(spalten, name, array(typ))
+        spalten.gaenge = []
+        codes = {}
+        for lat, lon, speed, power, ts, heading, gear in points:
+            flags = 0
+            spalten.lat.append(lat)
+            spalten.lon.append(lon)
+            for name, bit, wert in (
+                ("ts", TRIP_SPALTE_TS, ts),
+                ("speed", TRIP_SPALTE_SPEED, speed),
+                ("power", TRIP_SPALTE_POWER, power),
+                ("heading", TRIP_SPALTE_HEADING, heading),
+            ):
+                if wert is None:
+                    wert = 0
+                else:
+                    flags |= bit
+                getattr(spalten, name).append(wert)
+            spalten.flags.append(flags)
+            if gear is None:
+                spalten.gear.append(0)
+                continue
+            code = codes.get(gear)
+            if code is None:
+                spalten.gaenge.append(gear)
+                code = codes[gear] = len(spalten.gaenge)
+            spalten.gear.append(code)
+        return spalten
+
+    def werte(self, name, bit, vollstaendig=None):
+        """Liefere eine Spalte als Liste mit ``None`` für fehlende Werte."""
+
+        werte = getattr(self, name).tolist()
+        if vollstaendig is None:
+            vollstaendig = self.vollstaendig()
+        if vollstaendig:
+            return werte
+        return [
+            wert if flags & bit else None
+            for wert, flags in zip(werte, self.flags.tolist())
+        ]
+
+    def vollstaendig(self):
+        """Prüfe, ob jeder Punkt alle optionalen Werte enthält."""
+
+        alle = (
+            TRIP_SPALTE_TS | TRIP_SPALTE_SPEED | TRIP_SPALTE_POWER | TRIP_SPALTE_HEADING
+        )
+        return bytes(self.flags).count(alle) == len(self)
+
+    def punkte(self):
+        """Liefere die Punkte im Format von ``_load_trip``."""
+
+        vollstaendig = self.vollstaendig()
+        gaenge = [None, *self.gaenge]
+        return list(map(list, zip(
+            self.lat.tolist(),
+            self.lon.tolist(),
+            self.werte("speed", TRIP_SPALTE_SPEED, vollstaendig),
+            self.werte("power", TRIP_SPALTE_POWER, vollstaendig),
+            self.werte("ts", TRIP_SPALTE_TS, vollstaendig),
+            self.werte("heading", TRIP_SPALTE_HEADING, vollstaendig),
+            list(map(gaenge.__getitem__, self.gear.tolist())),
+        )))
+
+
+def _trip_spalten_pfad(filename):
+    return os.path.splitext(filename)[0] + TRIP_SPALTEN_ENDUNG
+
+
+def _trip_spalten_schreiben(filename):
+    """Lege die Spaltendatei zu einer Trip-CSV an oder ersetze sie."""
+
+    signatur = _trip_datei_signatur(filename)
+    if signatur is None:
+        return None
+    spalten = _TripSpalten.aus_punkten(_load_trip_csv(filename))
+    gaenge = json.dumps(spalten.gaenge).encode("utf-8")
+    kopf = TRIP_SPALTEN_KOPF.pack(
+        TRIP_SPALTEN_KENNUNG,
+        len(spalten),
+        signatur[0],
+        signatur[1],
+        len(gaenge),
+    )
+    fuellung = -(len(kopf) + len(gaenge)) % 8
+    ziel = _trip_spalten_pfad(filename)
+    tmp = f"{ziel}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(kopf)
+        f.write(gaenge)
+        f.write(b"\0" * fuellung)
+        for name, _typ in TRIP_SPALTEN:
+            getattr(spalten, name).tofile(f)
+    os.replace(tmp, ziel)
+    return spalten
+
+
+def _trip_spalten_lesen(filename):
+    """Bilde die Spaltendatei in den Speicher ab, wenn sie zur CSV passt."""
+
+    signatur = _trip_datei_signatur(filename)
+    if signatur is None or sys.byteorder != "little":
+        return None
+    try:
+        with open(_trip_spalten_pfad(filename), "rb") as f:
+            speicher = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        kennung, zeilen, mtime_ns, groesse, gang_laenge = (
+            TRIP_SPALTEN_KOPF.unpack_from(speicher, 0)
+        )
+        position = TRIP_SPALTEN_KOPF.size
+        gaenge = json.loads(speicher[position:position + gang_laenge])
+    except (struct.error, ValueError):
+        speicher.close()
+        return None
+    position += gang_laenge
+    position += -position % 8
+    if (
+        kennung != TRIP_SPALTEN_KENNUNG
+        or (mtime_ns, groesse) != signatur
+        or len(speicher) != position + zeilen * TRIP_SPALTEN_BYTES_JE_PUNKT
+    ):
+        speicher.close()
+        return None
+    ansicht = memoryview(speicher)
+    spalten = _TripSpalten()
+    spalten.gaenge = gaenge
+    for name, typ in TRIP_SPALTEN:
+        laenge = zeilen * array(typ).itemsize
+        setattr(spalten, name, ansicht[position:position + laenge].cast(typ))
+        position += laenge
+    return spalten
+
+
+def _load_trip_spalten(filename):
+    """Liefere die Punkte einer Trip-Datei spaltenweise."""
+
+    spalten = _trip_spalten_lesen(filename)
+    if spalten is None:
+        spalten = _TripSpalten.aus_punkten(_load_trip_csv(filename))
+    return spalten
+
+
+def _trip_spalten_aktualisieren(heute=None):
+    """Wandle abgeschlossene Trip-Tage in Spaltendateien um.
+
+    Die Datei des laufenden Tages wächst noch und wird weiter aus der CSV
+    gelesen. Spaltendateien ohne zugehörige CSV werden entfernt.
+    """
+
+    if heute is None:
+        heute = datetime.now(LOCAL_TZ).date()
+    umgewandelt = 0
+    verzeichnisse = set()
+    for path in _get_trip_files():
+        verzeichnisse.add(os.path.dirname(path))
+        tag = _trip_date_from_filename(path)
+        if tag is None or tag >= heute:
+            continue
+        if _trip_spalten_lesen(path) is not None:
+            continue
+        try:
+            _trip_spalten_schreiben(path)
+            umgewandelt += 1
+        except Exception:
+            logging.exception("Trip-Spaltendatei für %s fehlgeschlagen", path)
+    for verzeichnis in verzeichnisse:
+        try:
+            namen = os.listdir(verzeichnis)
+        except OSError:
+            continue
+        for name in namen:
+            if not name.endswith(TRIP_SPALTEN_ENDUNG):
+                continue
+            csv_pfad = os.path.join(
+                verzeichnis, name[: -len(TRIP_SPALTEN_ENDUNG)] + ".csv"
+            )
+            if not os.path.exists(csv_pfad):
                 try:
-                    ts = int(float(ts)) if ts else None
-                    lat = float(lat)
-                    lon = float(lon)
-                    speed = float(speed) if speed is not None else None
-                    power = float(power) if power is not None else None
-                    heading = float(heading) if heading is not None else None
-                    gear = gear if gear is not None else None
-                except Exception:
-                    continue
-                points.append([lat, lon, speed, power, ts, heading, gear])
-    except Exception:
-        pass
-    return points
+                    os.remove(os.path.join(verzeichnis, name))
+                except OSError:
+                    pass
+    return umgewandelt
 
 
 def _heatmap_points_for_paths(paths, max_points=None):
@@ -10923,16 +13940,15 @@ def _heatmap_points_for_paths(paths, max_points=None):
 
     trip_points = []
     for path in paths:
-        for entry in _load_trip(path):
-            if len(entry) < 2:
-                continue
-            lat, lon = entry[0], entry[1]
-            if lat is None or lon is None:
-                continue
+        spalten = _load_trip_spalten(path)
+        for lat, lon, speed, power in zip(
+            spalten.lat.tolist(),
+            spalten.lon.tolist(),
+            spalten.werte("speed", TRIP_SPALTE_SPEED),
+            spalten.werte("power", TRIP_SPALTE_POWER),
+        ):
             if not (isfinite(lat) and isfinite(lon)):
                 continue
-            speed = entry[2] if len(entry) >= 3 else None
-            power = entry[3] if len(entry) >= 4 else None
             weight = None
             try:
                 if power is not None:
@@ -10970,80 +13986,229 @@ def _heatmap_points(max_points=None):
 
 def _trip_paths_for_scope(scope, year=None, month=None, week=None, day=None):
     """Return trip file paths filtered by scope."""
-    paths = _get_trip_files()
+    eintraege = _trip_index_eintraege()
     if scope == "all":
-        return paths
+        return [eintrag["pfad"] for eintrag in eintraege]
     filtered = []
-    for path in paths:
-        trip_day = _trip_date_from_filename(path)
+    for eintrag in eintraege:
+        trip_day = eintrag["tag"]
         if trip_day is None:
             continue
-        if scope == "year" and trip_day.year == year:
-            filtered.append(path)
-        elif scope == "month" and trip_day.strftime("%Y-%m") == month:
-            filtered.append(path)
-        elif scope == "week":
-            iso_year, iso_week, _ = trip_day.isocalendar()
-            if f"{iso_year}-W{iso_week:02d}" == week:
-                filtered.append(path)
-        elif scope == "day" and trip_day.strftime("%Y-%m-%d") == day:
-            filtered.append(path)
+        if scope == "year" and int(trip_day[:4]) == year:
+            filtered.append(eintrag["pfad"])
+        elif scope == "month" and eintrag["monat"] == month:
+            filtered.append(eintrag["pfad"])
+        elif scope == "week" and eintrag["woche"] == week:
+            filtered.append(eintrag["pfad"])
+        elif scope == "day" and trip_day == day:
+            filtered.append(eintrag["pfad"])
     return filtered
 
 def _bearing(p1, p2):
     """Compute heading in degrees from p1 to p2."""
-    from math import atan2, cos, sin, radians, degrees
-
-    lat1, lon1 = radians(p1[0]), radians(p1[1])
-    lat2, lon2 = radians(p2[0]), radians(p2[1])
-    dlon = lon2 - lon1
-    y = sin(dlon) * cos(lat2)
-    x = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(dlon)
-    brng = degrees(atan2(y, x))
-    return (brng + 360) % 360
+    return geodaesie.peilung(p1[0], p1[1], p2[0], p2[1])
 
 
 def _haversine(lat1, lon1, lat2, lon2):
     """Compute distance in kilometers between two lat/lon points."""
-    from math import radians, sin, cos, atan2, sqrt
+    return geodaesie.abstand(lat1, lon1, lat2, lon2)
+
+
+TRIP_AKKUMULATOR_KOPF_BYTES = 64
+TRIP_AKKUMULATOR_MAX = max(1, int(os.getenv("TRIP_AKKUMULATOR_MAX", "8")))
+TRIP_FAHRSTUFEN = ("R", "N", "D")
+
+
+class _TripAkkumulator:
+    """Laufende Kennzahlen einer wachsenden Trip-CSV.
+
+    Merkt sich den Byte-Offset hinter der letzten vollständigen Zeile sowie
+    Distanz, Höchstgeschwindigkeit, abgeschlossene Segmente und das offene
+    Segment. ``aktualisieren`` liest nur angehängte Zeilen; schrumpft die Datei
+    oder wurde sie ersetzt, beginnt die Auswertung wieder bei Byte 0.
+    """
+
+    __slots__ = (
+        "inode",
+        "kopf",
+        "offset",
+        "signatur",
+        "letzter",
+        "distanz",
+        "max_speed",
+        "vorheriger_gang",
+        "segmente",
+        "offen",
+    )
+
+    def __init__(self):
+        self.zuruecksetzen()
+
+    def zuruecksetzen(self, inode=None):
+        self.inode = inode
+        self.kopf = b""
+        self.offset = 0
+        self.signatur = None
+        self.letzter = None
+        self.distanz = 0.0
+        self.max_speed = 0.0
+        self.vorheriger_gang = None
+        self.segmente = []
+        self.offen = None
+
+    def aktualisieren(self, filename):
+        """Lies neue Zeilen ein und liefere die aktuelle Signatur der Datei.
+
+        Endet die Datei mitten in einer Zeile, bleibt ``signatur`` leer, bis die
+        Zeile vollständig ist.
+        """
+
+        try:
+            with open(filename, "rb") as f:
+                stat = os.fstat(f.fileno())
+                signatur = (stat.st_mtime_ns, stat.st_size)
+                if signatur == self.signatur:
+                    return signatur
+                if (
+                    stat.st_ino != self.inode
+                    or stat.st_size < self.offset
+                    or f.read(len(self.kopf)) != self.kopf
+                ):
+                    self.zuruecksetzen(stat.st_ino)
+                f.seek(self.offset)
+                neu = f.read(stat.st_size - self.offset)
+        except OSError:
+            return None
+        ende = neu.rfind(b"\n") + 1
+        for zeile in neu[:ende].split(b"\n"):
+            if not zeile:
+                continue
+            point = _trip_zeile_parsen(zeile.decode("utf-8", "replace"))
+            if point is not None:
+                self._punkt_hinzufuegen(point)
+        if len(self.kopf) < TRIP_AKKUMULATOR_KOPF_BYTES:
+            self.kopf = (self.kopf + neu[:ende])[:TRIP_AKKUMULATOR_KOPF_BYTES]
+        self.offset += ende
+        self.signatur = signatur if ende == len(neu) else None
+        return signatur
+
+    def _punkt_hinzufuegen(self, point):
+        lat, lon, speed, _power, ts, _heading, gear = point
+        if self.letzter is not None:
+            self.distanz += _haversine(self.letzter[0], self.letzter[1], lat, lon)
+        if speed is not None and speed > self.max_speed:
+            self.max_speed = speed
+        offen = self.offen
+        if offen is not None:
+            vorher = offen["letzter"]
+            offen["distance"] += _haversine(vorher[0], vorher[1], lat, lon)
+            if (
+                vorher[2] is not None
+                and vorher[2] < 5
+                and vorher[4] is not None
+                and ts is not None
+                and ts > vorher[4]
+            ):
+                offen["wait"] += (ts - vorher[4]) / 1000.0
+            offen["letzter"] = point
+            if gear == "P" and self.vorheriger_gang in TRIP_FAHRSTUFEN:
+                self.segmente.append(self._segment(offen))
+                self.offen = None
+        elif gear in TRIP_FAHRSTUFEN and self.vorheriger_gang in ("P", None):
+            self.offen = {"erster": point, "letzter": point, "distance": 0.0, "wait": 0.0}
+        self.vorheriger_gang = gear
+        self.letzter = point
+
+    @staticmethod
+    def _segment(offen):
+        start_ts = offen["erster"][4]
+        end_ts = offen["letzter"][4]
+        if start_ts is not None and start_ts > 1e12:
+            start_ts /= 1000.0
+        if end_ts is not None and end_ts > 1e12:
+            end_ts /= 1000.0
+        return {
+            "start": start_ts,
+            "end": end_ts,
+            "distance": offen["distance"],
+            "wait": offen["wait"],
+        }
+
+    def alle_segmente(self):
+        segmente = [dict(segment) for segment in self.segmente]
+        if self.offen is not None:
+            segmente.append(self._segment(self.offen))
+        return segmente
 
-    r = 6371.0
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
-    return r * c
+
+_trip_akkumulatoren = OrderedDict()
+_trip_akkumulator_lock = threading.Lock()
+
+
+def _trip_akkumulator_auswerten(filename, auswertung):
+    """Werte eine Trip-Datei ohne Spaltendatei über ihren Akkumulator aus.
+
+    Liefert ``(signatur, wert)`` oder ``None``, wenn eine Spaltendatei vorliegt
+    und der Tag damit abgeschlossen ist. Endet die Datei in einer unvollständigen
+    Zeile, übernimmt ebenfalls die vollständige Auswertung.
+    """
+
+    with _trip_akkumulator_lock:
+        akkumulator = _trip_akkumulatoren.get(filename)
+        if akkumulator is None:
+            if _trip_spalten_lesen(filename) is not None:
+                return None
+            akkumulator = _trip_akkumulatoren[filename] = _TripAkkumulator()
+            while len(_trip_akkumulatoren) > TRIP_AKKUMULATOR_MAX:
+                _trip_akkumulatoren.popitem(last=False)
+        else:
+            _trip_akkumulatoren.move_to_end(filename)
+        signatur = akkumulator.aktualisieren(filename)
+        if signatur is None:
+            _trip_akkumulatoren.pop(filename, None)
+            return None
+        if signatur != akkumulator.signatur:
+            return None
+        return signatur, auswertung(akkumulator)
 
 
 def _trip_distance(filename):
     """Return total distance in km for a trip CSV file."""
-    cached = _trip_cache_lesen(_trip_distance_cache, filename)
+    cached = _trip_cache_lesen(_trip_distance_cache, filename, "distanz")
     if cached is not None:
         return cached
+    laufend = _trip_akkumulator_auswerten(filename, lambda akku: akku.distanz)
+    if laufend is not None:
+        signatur, dist = laufend
+        return _trip_cache_schreiben(
+            _trip_distance_cache, filename, "distanz", dist, signatur
+        )
 
-    points = _load_trip(filename)
-    dist = 0.0
-    for i in range(1, len(points)):
-        lat1, lon1 = points[i - 1][:2]
-        lat2, lon2 = points[i][:2]
-        dist += _haversine(lat1, lon1, lat2, lon2)
-    return _trip_cache_schreiben(_trip_distance_cache, filename, dist)
+    spalten = _load_trip_spalten(filename)
+    dist = geodaesie.strecke(spalten.lat, spalten.lon)
+    return _trip_cache_schreiben(_trip_distance_cache, filename, "distanz", dist)
 
 
 def _trip_max_speed(filename):
     """Return the maximum speed recorded in a trip CSV file in km/h."""
-    cached = _trip_cache_lesen(_trip_speed_cache, filename)
+    cached = _trip_cache_lesen(_trip_speed_cache, filename, "max_speed")
     if cached is not None:
         return cached
+    laufend = _trip_akkumulator_auswerten(filename, lambda akku: akku.max_speed)
+    if laufend is not None:
+        signatur, max_speed = laufend
+        return _trip_cache_schreiben(
+            _trip_speed_cache, filename, "max_speed", max_speed * MILES_TO_KM, signatur
+        )
 
-    points = _load_trip(filename)
+    spalten = _load_trip_spalten(filename)
     max_speed = 0.0
-    for p in points:
-        speed = p[2]
+    for speed in spalten.werte("speed", TRIP_SPALTE_SPEED):
         if speed is not None and speed > max_speed:
             max_speed = speed
-    return _trip_cache_schreiben(_trip_speed_cache, filename, max_speed * MILES_TO_KM)
+    return _trip_cache_schreiben(
+        _trip_speed_cache, filename, "max_speed", max_speed * MILES_TO_KM
+    )
 
 
 def _split_trip_segments(filename):
@@ -11052,77 +14217,64 @@ def _split_trip_segments(filename):
     A new segment starts when shifting from P to R, N or D and ends when
     returning to P from any of these gears.
     """
-    cached = _trip_cache_lesen(_trip_segment_cache, filename)
+    cached = _trip_cache_lesen(_trip_segment_cache, filename, "segmente")
     if cached is not None:
         return cached
+    laufend = _trip_akkumulator_auswerten(
+        filename, lambda akku: akku.alle_segmente()
+    )
+    if laufend is not None:
+        signatur, result = laufend
+        return _trip_cache_schreiben(
+            _trip_segment_cache, filename, "segmente", result, signatur
+        )
 
-    points = _load_trip(filename)
-    segments = []
-    current = []
+    spalten = _load_trip_spalten(filename)
+    gaenge = [None, *spalten.gaenge]
+    grenzen = []
+    start = None
     prev_gear = None
-    for p in points:
-        gear = p[6]
-        if current:
-            current.append(p)
-            if gear == "P" and prev_gear in ("R", "N", "D"):
-                segments.append(current)
-                current = []
-        else:
-            if gear in ("R", "N", "D") and (prev_gear == "P" or prev_gear is None):
-                current.append(p)
+    for index, code in enumerate(spalten.gear.tolist()):
+        gear = gaenge[code]
+        if start is not None:
+            if gear == "P" and prev_gear in TRIP_FAHRSTUFEN:
+                grenzen.append((start, index))
+                start = None
+        elif gear in TRIP_FAHRSTUFEN and prev_gear in ("P", None):
+            start = index
         prev_gear = gear
-    if current:
-        segments.append(current)
+    if start is not None:
+        grenzen.append((start, len(spalten) - 1))
 
     result = []
-    for seg in segments:
-        if not seg:
-            continue
-        dist = 0.0
-        wait = 0.0
-        for i in range(1, len(seg)):
-            lat1, lon1 = seg[i - 1][:2]
-            lat2, lon2 = seg[i][:2]
-            dist += _haversine(lat1, lon1, lat2, lon2)
-            speed = seg[i - 1][2]
-            t1 = seg[i - 1][4]
-            t2 = seg[i][4]
-            if (
-                speed is not None
-                and speed < 5
-                and t1 is not None
-                and t2 is not None
-                and t2 > t1
-            ):
-                wait += (t2 - t1) / 1000.0
-        start_ts = seg[0][4]
-        end_ts = seg[-1][4]
-        if start_ts is not None and start_ts > 1e12:
-            start_ts /= 1000.0
-        if end_ts is not None and end_ts > 1e12:
-            end_ts /= 1000.0
-        result.append({"start": start_ts, "end": end_ts, "distance": dist, "wait": wait})
-    return _trip_cache_schreiben(_trip_segment_cache, filename, result)
+    if grenzen:
+        vollstaendig = spalten.vollstaendig()
+        timestamps = spalten.werte("ts", TRIP_SPALTE_TS, vollstaendig)
+        kennzahlen = geodaesie.abschnitte(
+            spalten.lat,
+            spalten.lon,
+            spalten.werte("speed", TRIP_SPALTE_SPEED, vollstaendig),
+            timestamps,
+            grenzen,
+        )
+        for (erster, letzter), (dist, wait) in zip(grenzen, kennzahlen):
+            start_ts = timestamps[erster]
+            end_ts = timestamps[letzter]
+            if start_ts is not None and start_ts > 1e12:
+                start_ts /= 1000.0
+            if end_ts is not None and end_ts > 1e12:
+                end_ts /= 1000.0
+            result.append(
+                {"start": start_ts, "end": end_ts, "distance": dist, "wait": wait}
+            )
+    return _trip_cache_schreiben(_trip_segment_cache, filename, "segmente", result)
 
 
 def _period_distance(prefix, key):
     """Return distance in km for a week or month selection."""
     dist = 0.0
-    for path in _get_trip_files():
-        fname = os.path.basename(path)
-        date_str = fname.split("_")[-1].split(".")[0]
-        try:
-            day = datetime.strptime(date_str, "%Y%m%d").date()
-        except Exception:
-            continue
-        iso_year, iso_week, _ = day.isocalendar()
-        week_key = f"{iso_year}-W{iso_week:02d}"
-        month_key = day.strftime("%Y-%m")
-        if prefix == "week" and week_key != key:
-            continue
-        if prefix == "month" and month_key != key:
-            continue
-        dist += _trip_distance(path)
+    for eintrag in _trip_index_metriken(_trip_index_periode(prefix, key)):
+        dist += eintrag["distanz"] or 0.0
     return dist
 
 
@@ -12021,7 +15173,6 @@ def _statistics_dependency_signature():
         _parking_log_path(),
         os.path.join(DATA_DIR, "park-loss.log"),
     ]
-    files.extend(_get_trip_files())
 
     signature = []
     for path in files:
@@ -12031,6 +15182,7 @@ def _statistics_dependency_signature():
             signature.append((path, None, None))
             continue
         signature.append((path, stat.st_mtime, stat.st_size))
+    signature.extend(_trip_dateien_signatur())
     return tuple(signature)
 
 
@@ -12148,7 +15300,11 @@ def compute_trip_summaries():
     if weekly or monthly:
         return weekly, monthly
 
-    signature = _trip_dateien_signatur()
+    eintraege = _trip_index_eintraege()
+    signature = tuple(
+        (eintrag["pfad"], (eintrag["mtime_ns"], eintrag["groesse"]))
+        for eintrag in eintraege
+    )
     with _trip_summary_cache_lock:
         if (
             _trip_summary_cache.get("signature") == signature
@@ -12159,18 +15315,13 @@ def compute_trip_summaries():
 
     weekly = {}
     monthly = {}
-    for path in _get_trip_files():
-        fname = os.path.basename(path)
-        date_str = fname.split("_")[-1].split(".")[0]
-        try:
-            day = datetime.strptime(date_str, "%Y%m%d").date()
-        except Exception:
+    for eintrag in _trip_index_metriken(eintraege):
+        if eintrag["tag"] is None:
             continue
-        km = _trip_distance(path)
-        iso_year, iso_week, _ = day.isocalendar()
-        week_key = f"{iso_year}-W{iso_week:02d}"
+        km = eintrag["distanz"] or 0.0
+        week_key = eintrag["woche"]
         weekly[week_key] = round(weekly.get(week_key, 0.0) + km, 2)
-        month_key = day.strftime("%Y-%m")
+        month_key = eintrag["monat"]
         monthly[month_key] = round(monthly.get(month_key, 0.0) + km, 2)
     with _trip_summary_cache_lock:
         _trip_summary_cache["signature"] = signature
@@ -13167,8 +16318,9 @@ def _fetch_data_once(vehicle_id="default"):
             str(vehicle_identifier),
             telemetry_data,
         )
-        _fleet_telemetrie_parkstatus_aufzeichnen(cache_id, telemetry_data, vid)
-        latest_data[cache_id] = telemetry_data
+        _fleet_telemetrie_parkstatus_schreiben(cache_id, telemetry_data, vid)
+        with _fleet_telemetry_lock:
+            latest_data[cache_id] = telemetry_data
         return telemetry_data
     if _nur_fleet_telemetrie_datenquelle():
         data = cached if isinstance(cached, dict) else {}
@@ -13180,7 +16332,8 @@ def _fetch_data_once(vehicle_id="default"):
             _vorklimatisierung_im_stand_erlaubt(data)
         )
         data["_live"] = False
-        latest_data[cache_id] = data
+        with _fleet_telemetry_lock:
+            latest_data[cache_id] = data
         _subscriber_daten_senden(cache_id, data)
         return data
 
@@ -13642,7 +16795,8 @@ def _fetch_data_once(vehicle_id="default"):
             data.pop("api_error", None)
         elif api_error:
             data["api_error"] = api_error
-    latest_data[cache_id] = data
+    with _fleet_telemetry_lock:
+        latest_data[cache_id] = data
     if isinstance(data, dict):
         try:
             cached_copy = dict(data)
@@ -13658,14 +16812,20 @@ def _fetch_data_once(vehicle_id="default"):
 def _vorklimatisierungsanzeige_aktualisieren(vehicle_id=None):
     """Bewerte die Vorklimatisierungsanzeige in aktuellen Live-Daten neu."""
 
-    vehicle_ids = [vehicle_id] if vehicle_id is not None else list(latest_data.keys())
-    for cache_id in vehicle_ids:
-        data = latest_data.get(cache_id)
-        if not isinstance(data, dict):
-            continue
-        data["preconditioning_display_allowed"] = (
-            _vorklimatisierung_im_stand_erlaubt(data)
+    aktualisierte_daten = []
+    with _fleet_telemetry_lock:
+        vehicle_ids = (
+            [vehicle_id] if vehicle_id is not None else list(latest_data.keys())
         )
+        for cache_id in vehicle_ids:
+            data = latest_data.get(cache_id)
+            if not isinstance(data, dict):
+                continue
+            _fleet_telemetrie_ableitungen_ausfuehren(
+                cache_id, data, ("vorklimatisierung",), {"occupant_present"}
+            )
+            aktualisierte_daten.append((cache_id, data))
+    for cache_id, data in aktualisierte_daten:
         _subscriber_daten_senden(cache_id, data)
 
 
@@ -13910,6 +17070,132 @@ def data_only():
     return render_template("data.html", data=data)
 
 
+API_DATA_VERLAUF_MAX = max(1, int(os.getenv("API_DATA_HISTORY_MAX", "16")))
+_api_daten_staende = {}
+_api_daten_lock = threading.Lock()
+
+
+class _ApiDatenStand:
+    """Serialisierter Stand von ``/api/data`` für eine Revision.
+
+    ``teile`` hält das JSON je Teilbaum der obersten Ebene nur für den
+    neuesten Stand; für ältere Revisionen bleiben die Fingerabdrücke, gegen
+    die ``?since=`` vergleicht.
+    """
+
+    def __init__(self, revision, teile, fingerabdruecke):
+        self.revision = revision
+        self.teile = teile
+        self.fingerabdruecke = fingerabdruecke
+
+
+def _api_daten_stand(cache_id, data, revision):
+    """Serialisiere ``data`` einmal je Revision und merke die Fingerabdrücke."""
+
+    with _api_daten_lock:
+        verlauf = _api_daten_staende.setdefault(
+            cache_id, deque(maxlen=API_DATA_VERLAUF_MAX)
+        )
+        if verlauf and verlauf[-1].revision == revision and verlauf[-1].teile:
+            return verlauf[-1]
+    teile = {
+        str(schluessel): app.json.dumps(wert, separators=(",", ":"))
+        for schluessel, wert in list(data.items())
+    }
+    fingerabdruecke = {
+        schluessel: hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+        for schluessel, text in teile.items()
+    }
+    stand = _ApiDatenStand(revision, teile, fingerabdruecke)
+    with _api_daten_lock:
+        for älterer in verlauf:
+            älterer.teile = None
+        if verlauf and verlauf[-1].revision == revision:
+            verlauf.pop()
+        verlauf.append(stand)
+    return stand
+
+
+def _api_daten_basis(cache_id, revision):
+    """Suche den gemerkten Stand einer früheren Revision."""
+
+    with _api_daten_lock:
+        for stand in _api_daten_staende.get(cache_id, ()):
+            if stand.revision == revision:
+                return stand
+    return None
+
+
+def _api_daten_since_lesen(wert):
+    """Lese ``?since=`` als Revision; IDs eines früheren Prozesses zählen nicht."""
+
+    if wert is None or wert == "":
+        return None
+    epoche, _, revision = str(wert).strip().strip('"').rpartition("-")
+    try:
+        revision = int(revision)
+    except ValueError:
+        abort(400, description="since must be a data revision")
+    if epoche and epoche != STREAM_EPOCHE:
+        return None
+    return revision
+
+
+def _api_daten_json(teile, schluessel, entfernt=()):
+    """Setze ein JSON-Objekt aus bereits kodierten Teilbäumen zusammen."""
+
+    felder = [f"{json.dumps(name)}:{teile[name]}" for name in schluessel]
+    felder.extend(f"{json.dumps(name)}:null" for name in entfernt)
+    return "{" + ",".join(felder) + "}"
+
+
+def _api_daten_antwort(cache_id, data):
+    """Beantworte ``/api/data`` mit ETag, ``304`` und ``?since=``-Teilbäumen.
+
+    ``?since=<rev>`` liefert nur die seit dieser Revision geänderten
+    Teilbäume der obersten Ebene; entfernte stehen als ``null`` darin. Ist
+    die Revision nicht mehr bekannt, folgt der vollständige Stand.
+    """
+
+    revision = _latest_data_revision(cache_id)
+    if (
+        revision is None
+        or not isinstance(data, dict)
+        or latest_data.get(cache_id) is not data
+    ):
+        return jsonify(data)
+    etag = f"{STREAM_EPOCHE}-{revision}"
+    seit = _api_daten_since_lesen(request.args.get("since"))
+    if request.if_none_match.contains_weak(etag) or seit == revision:
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        response.headers["X-Data-Revision"] = etag
+        return response
+    stand = _api_daten_stand(cache_id, data, revision)
+    teile = stand.teile
+    reihenfolge = sorted(teile) if app.json.sort_keys else list(teile)
+    basis = _api_daten_basis(cache_id, seit) if seit is not None else None
+    if basis is not None:
+        geändert = [
+            name
+            for name in reihenfolge
+            if basis.fingerabdruecke.get(name) != stand.fingerabdruecke[name]
+        ]
+        entfernt = sorted(set(basis.fingerabdruecke) - set(teile))
+        response = app.response_class(
+            _api_daten_json(teile, geändert, entfernt), mimetype="application/json"
+        )
+        response.headers["X-Data-Base-Revision"] = f"{STREAM_EPOCHE}-{seit}"
+    else:
+        response = app.response_class(
+            _api_daten_json(teile, reihenfolge), mimetype="application/json"
+        )
+        response.set_etag(etag)
+    response.headers["X-Data-Revision"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
 @app.route("/api/data")
 def api_data():
     _start_thread("default")
@@ -13918,7 +17204,7 @@ def api_data():
         data = _fetch_data_once("default")
     _fleet_telemetrie_rohdaten_anreichern(data)
     _fahrtpfad_nach_parkzeit_bereinigen(data)
-    return jsonify(data)
+    return _api_daten_antwort("default", data)
 
 
 @app.route("/api/data/<vehicle_id>")
@@ -13931,7 +17217,7 @@ def api_data_vehicle(vehicle_id):
         data = _fetch_data_once(vehicle_id)
     _fleet_telemetrie_rohdaten_anreichern(data)
     _fahrtpfad_nach_parkzeit_bereinigen(data)
-    return jsonify(data)
+    return _api_daten_antwort(vehicle_id, data)
 
 
 @app.route("/api/heatmap")
@@ -14011,7 +17297,25 @@ def api_heatmap():
 @app.route("/stream")
 @app.route("/stream/<vehicle_id>")
 def stream_vehicle(vehicle_id="default"):
-    """Stream vehicle data to the client using Server-Sent Events."""
+    """Stream vehicle data to the client using Server-Sent Events.
+
+    With ``?mode=delta`` only the first frame and a periodic resync carry the
+    full payload; all other updates are ``delta`` events holding a JSON merge
+    patch against the client's previous revision.
+
+    ``?fields=drive_state.latitude,path`` or ``?profile=map`` restrict the
+    stream to the selected sub-trees; the client is only woken when one of
+    them changes. ``?rate=1hz`` or ``?rate=0.2hz`` select a slower rate
+    class; updates in between are coalesced into the newest state.
+    """
+    rate = (request.args.get("rate") or "").strip().lower() or None
+    try:
+        abo = _stream_abo_lesen(
+            request.args.get("fields"), request.args.get("profile")
+        )
+        intervall = _stream_rate_lesen(rate)
+    except ValueError as exc:
+        abort(400, description=str(exc))
     _start_thread(vehicle_id)
     ip = _client_ip()
     client_schlüssel = getattr(
@@ -14023,86 +17327,165 @@ def stream_vehicle(vehicle_id="default"):
         ),
     )
 
+    delta_modus = request.args.get("mode") == "delta"
+    letzte_ereignis_id = request.headers.get("Last-Event-ID") or request.args.get(
+        "last_event_id"
+    )
+
     def gen():
-        q = eventlet_queue.Queue(maxsize=FLEET_TELEMETRY_STREAM_QUEUE_MAX)
+        q = _StreamQueue(
+            maxsize=FLEET_TELEMETRY_STREAM_QUEUE_MAX,
+            abo=abo,
+            intervall=intervall,
+            rate=rate,
+            client=client_schlüssel,
+        )
         subscribers.setdefault(vehicle_id, []).append(q)
         last_path_len = 0
         last_path_generation = None
         letzter_datenversand = 0.0
+        letzter_empfang_ms = None
+        # Im Delta-Modus: zuletzt an diesen Client gesendeter Stand
+        basis = None
+        letzter_vollstand = 0.0
         try:
             yield ": verbunden\n\n"
+            fortsetzung = _stream_fortsetzung(vehicle_id, letzte_ereignis_id)
+            if fortsetzung is not None:
+                # Nur das Verpasste seit der Last-Event-ID nachreichen
+                vorher, aktuell = fortsetzung
+                vorher = vorher.projektion(abo)
+                aktuell = aktuell.projektion(abo)
+                q.letzter_stand = aktuell
+                vorheriger_pfad = vorher.get("path")
+                if isinstance(vorheriger_pfad, list):
+                    last_path_len = len(vorheriger_pfad)
+                last_path_generation = vorher.get("path_generation")
+                if delta_modus:
+                    basis = vorher
+                    letzter_vollstand = time.monotonic()
+                if aktuell is not vorher and (
+                    abo is None or _stream_abo_geaendert(vorher, aktuell)
+                ):
+                    if delta_modus:
+                        rumpf, last_path_len, last_path_generation = (
+                            aktuell.delta_frame(
+                                vorher, last_path_len, last_path_generation
+                            )
+                        )
+                        msg = _stream_frame(
+                            rumpf,
+                            ereignis="delta",
+                            ereignis_id=_stream_ereignis_id(aktuell.revision),
+                        )
+                        basis = aktuell
+                    else:
+                        rumpf, last_path_len, last_path_generation = aktuell.frame(
+                            last_path_len, last_path_generation
+                        )
+                        msg = _stream_frame(
+                            rumpf,
+                            ereignis_id=_stream_ereignis_id(aktuell.revision),
+                        )
+                    letzter_datenversand = time.monotonic()
+                    yield msg
             # Send the latest data immediately if available
-            if vehicle_id in latest_data:
+            elif vehicle_id in latest_data:
                 _fahrtpfad_nach_parkzeit_bereinigen(latest_data[vehicle_id])
                 initial = _subscriber_stream_payload(latest_data[vehicle_id])
                 if isinstance(initial, dict):
+                    if abo is not None:
+                        initial = _stream_projizieren(initial, abo[1])
+                        q.letzter_stand = _StreamSnapshot(
+                            initial, _stream_revisionen.get(vehicle_id, 0)
+                        )
                     path = initial.get("path")
                     if isinstance(path, list):
                         last_path_len = len(path)
                     last_path_generation = initial.get("path_generation")
+                    if delta_modus:
+                        basis = _StreamSnapshot(
+                            initial, _stream_revisionen.get(vehicle_id, 0)
+                        )
+                        letzter_vollstand = time.monotonic()
+                        initial["stream_revision"] = basis.revision
                     initial["stream_sent_at"] = int(time.time() * 1000)
                 letzter_datenversand = time.monotonic()
-                yield f"data: {json.dumps(initial)}\n\n"
-            while True:
+                ereignis_id = _stream_ereignis_id(_stream_revisionen.get(vehicle_id))
+                kopf = f"id: {ereignis_id}\n" if ereignis_id else ""
+                yield f"{kopf}data: {json.dumps(initial)}\n\n"
+            while not q.verdraengt:
+                sse_latenz = None
+                aus_queue = False
                 try:
                     data = q.get(timeout=FLEET_TELEMETRY_STREAM_KEEPALIVE_SECONDS)
-                    versand_ab = (
-                        letzter_datenversand
-                        + FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS
-                    )
+                    versand_ab = letzter_datenversand + q.intervall
                     while True:
                         rest = versand_ab - time.monotonic()
                         if rest <= 0:
                             break
                         try:
                             data = q.get(timeout=rest)
+                            q.zusammengefasst += 1
                         except queue.Empty:
                             break
                     try:
                         while True:
                             data = q.get_nowait()
+                            q.zusammengefasst += 1
                     except queue.Empty:
                         pass
-                    payload = _subscriber_stream_payload(data)
-                    if isinstance(data, dict):
-                        path = payload.get("path")
-                        path_generation = payload.get("path_generation")
-                        generation_geändert = (
-                            path_generation is not None
-                            and path_generation != last_path_generation
-                        )
-                        if isinstance(path, list):
-                            previous_len = last_path_len
-                            path_len = len(path)
-                            path_reset = generation_geändert or path_len < previous_len
-                            if path_reset:
-                                payload["path_reset"] = True
-                                previous_len = 0
-                            delta = path[previous_len:path_len]
-                            if path_reset:
-                                # When the path resets we send the full path once
-                                payload["path"] = path
-                            elif delta:
-                                payload.pop("path", None)
-                            else:
-                                payload.pop("path", None)
-                            if delta and not path_reset:
-                                payload["path_delta"] = delta
-                            else:
-                                payload.pop("path_delta", None)
-                            last_path_len = path_len
+                    aus_queue = True
+                    wartet_seit = q.abgeholt()
+                    if isinstance(data, dict) and not isinstance(data, _StreamSnapshot):
+                        data = _stream_snapshot_erzeugen(data)
+                        if isinstance(data, _StreamSnapshot):
+                            data = data.projektion(abo)
+                    if isinstance(data, _StreamSnapshot):
+                        empfang_ms = _as_float(data.get("fleet_telemetry_received_at"))
+                        if (
+                            data.get("_live")
+                            and empfang_ms is not None
+                            and empfang_ms != letzter_empfang_ms
+                        ):
+                            letzter_empfang_ms = empfang_ms
+                            sse_latenz = (
+                                data.get("vin") or vehicle_id,
+                                data.feldklasse,
+                                empfang_ms,
+                            )
+                        if (
+                            delta_modus
+                            and basis is not None
+                            and time.monotonic() - letzter_vollstand
+                            < FLEET_TELEMETRY_STREAM_DELTA_SNAPSHOT_SECONDS
+                        ):
+                            rumpf, last_path_len, last_path_generation = (
+                                data.delta_frame(
+                                    basis, last_path_len, last_path_generation
+                                )
+                            )
+                            msg = _stream_frame(
+                                rumpf,
+                                ereignis="delta",
+                                ereignis_id=_stream_ereignis_id(data.revision),
+                            )
                         else:
-                            if generation_geändert:
-                                payload["path_reset"] = True
-                                payload["path"] = []
-                            else:
-                                payload.pop("path", None)
-                            last_path_len = 0
-                        if path_generation is not None:
-                            last_path_generation = path_generation
-                        payload["stream_sent_at"] = int(time.time() * 1000)
+                            rumpf, last_path_len, last_path_generation = data.frame(
+                                last_path_len, last_path_generation
+                            )
+                            if delta_modus:
+                                letzter_vollstand = time.monotonic()
+                            msg = _stream_frame(
+                                rumpf,
+                                revision=data.revision if delta_modus else None,
+                                ereignis_id=_stream_ereignis_id(data.revision),
+                            )
+                        if delta_modus:
+                            basis = data
+                    else:
+                        msg = f"data: {json.dumps(_subscriber_stream_payload(data))}\n\n"
                     letzter_datenversand = time.monotonic()
-                    msg = f"data: {json.dumps(payload)}\n\n"
                 except queue.Empty:
                     aktuelle_daten = latest_data.get(vehicle_id)
                     _fahrtpfad_nach_parkzeit_bereinigen(aktuelle_daten)
@@ -14128,13 +17511,25 @@ def stream_vehicle(vehicle_id="default"):
                         )
                     ):
                         payload = _subscriber_stream_payload(aktuelle_daten)
+                        if abo is not None:
+                            payload = _stream_projizieren(payload, abo[1])
+                        if delta_modus:
+                            basis = _StreamSnapshot(
+                                payload, _stream_revisionen.get(vehicle_id, 0)
+                            )
+                            letzter_vollstand = time.monotonic()
+                            payload["stream_revision"] = basis.revision
                         payload["path_reset"] = True
                         payload["path"] = aktueller_pfad
                         payload["stream_sent_at"] = int(time.time() * 1000)
                         last_path_len = len(aktueller_pfad)
                         if aktuelle_generation is not None:
                             last_path_generation = aktuelle_generation
-                        msg = f"data: {json.dumps(payload)}\n\n"
+                        ereignis_id = _stream_ereignis_id(
+                            _stream_revisionen.get(vehicle_id)
+                        )
+                        kopf = f"id: {ereignis_id}\n" if ereignis_id else ""
+                        msg = f"{kopf}data: {json.dumps(payload)}\n\n"
                     else:
                         heartbeat = {
                             "stream_heartbeat_at": int(time.time() * 1000)
@@ -14147,11 +17542,19 @@ def stream_vehicle(vehicle_id="default"):
                     yield msg
                 except GeneratorExit:
                     break
+                if aus_queue:
+                    q.versand_erfassen(wartet_seit)
+                if sse_latenz is not None:
+                    vin, klasse, empfang_ms = sse_latenz
+                    _fleet_telemetrie_latenz_erfassen(
+                        "sse_write", vin, klasse, time.time() * 1000 - empfang_ms
+                    )
         finally:
             try:
                 subscribers.get(vehicle_id, []).remove(q)
             except ValueError:
                 pass
+            _stream_letzte_trennung[vehicle_id] = time.monotonic()
             _client_stream_getrennt(client_schlüssel)
 
     resp = Response(gen(), mimetype="text/event-stream")
@@ -14162,6 +17565,282 @@ def stream_vehicle(vehicle_id="default"):
     return resp
 
 
+# Binärer Live-Kanal über Socket.IO (Namespace ``/vehicle``)
+#
+# Ein Frame besteht aus ``FAHRZEUG_FRAME_KOPF`` (Version, Art, Revision,
+# Basisrevision, Versandzeit in ms, Bitmaske), danach je gesetztem Bit ein
+# float64 aus ``FAHRZEUG_FRAME_FELDER`` und als Rest UTF-8-JSON mit allen
+# übrigen Feldern (Vollstand) bzw. ``{"patch": ..., Pfadfelder}`` (Delta).
+FAHRZEUG_NAMESPACE = "/vehicle"
+FAHRZEUG_FRAME_VERSION = 1
+FAHRZEUG_FRAME_VOLL = 0
+FAHRZEUG_FRAME_DELTA = 1
+FAHRZEUG_FRAME_HERZSCHLAG = 2
+FAHRZEUG_FRAME_KOPF = struct.Struct("<BBIIdH")
+FAHRZEUG_FRAME_WERT = struct.Struct("<d")
+FAHRZEUG_FRAME_FELDER = (
+    ("drive_state", "latitude"),
+    ("drive_state", "longitude"),
+    ("drive_state", "heading"),
+    ("drive_state", "speed"),
+    ("drive_state", "power"),
+    ("drive_state", "timestamp"),
+    ("charge_state", "battery_level"),
+    ("charge_state", "charger_power"),
+    ("charge_state", "ideal_battery_range"),
+    ("charge_state", "est_battery_range"),
+    ("climate_state", "inside_temp"),
+    ("climate_state", "outside_temp"),
+    ("vehicle_state", "odometer"),
+    (None, "timestamp"),
+    (None, "fleet_telemetry_received_at"),
+)
+
+
+def _fahrzeug_frame_zahl(wert):
+    """Prüfe, ob ein Wert als float64 im Binärteil übertragen werden kann."""
+
+    from math import isfinite
+
+    return (
+        isinstance(wert, (int, float))
+        and not isinstance(wert, bool)
+        and isfinite(wert)
+    )
+
+
+def _fahrzeug_frame_aufteilen(daten):
+    """Trenne heiße Zahlenfelder vom Rest eines Stream-Stands.
+
+    Liefert ``(werte, rest)``; ``werte`` ordnet dem Index in
+    ``FAHRZEUG_FRAME_FELDER`` den Zahlenwert zu. Teilbäume bleiben im Rest
+    auch dann erhalten, wenn sie danach leer sind.
+    """
+
+    werte = {}
+    rest = dict(daten)
+    kopiert = set()
+    for index, (oben, unten) in enumerate(FAHRZEUG_FRAME_FELDER):
+        if oben is None:
+            if _fahrzeug_frame_zahl(rest.get(unten)):
+                werte[index] = rest.pop(unten)
+            continue
+        teil = rest.get(oben)
+        if not isinstance(teil, dict) or not _fahrzeug_frame_zahl(teil.get(unten)):
+            continue
+        if oben not in kopiert:
+            teil = rest[oben] = dict(teil)
+            kopiert.add(oben)
+        werte[index] = teil.pop(unten)
+    return werte, rest
+
+
+def _fahrzeug_frame_packen(art, revision, basis_revision, werte, rest):
+    """Kodiere einen Frame für den ``/vehicle``-Namespace."""
+
+    maske = 0
+    teile = []
+    for index in sorted(werte):
+        maske |= 1 << index
+        teile.append(FAHRZEUG_FRAME_WERT.pack(float(werte[index])))
+    kopf = FAHRZEUG_FRAME_KOPF.pack(
+        FAHRZEUG_FRAME_VERSION,
+        art,
+        revision,
+        basis_revision,
+        time.time() * 1000,
+        maske,
+    )
+    rumpf = json.dumps(rest, separators=(",", ":")).encode("utf-8") if rest else b""
+    return kopf + b"".join(teile) + rumpf
+
+
+def _fahrzeug_frame_lesen(frame):
+    """Dekodiere einen Binärframe zu ``(art, revision, basis, gesendet, werte, rest)``."""
+
+    version, art, revision, basis_revision, gesendet, maske = (
+        FAHRZEUG_FRAME_KOPF.unpack_from(frame)
+    )
+    if version != FAHRZEUG_FRAME_VERSION:
+        raise ValueError(f"unsupported vehicle frame version: {version}")
+    versatz = FAHRZEUG_FRAME_KOPF.size
+    werte = {}
+    for index in range(len(FAHRZEUG_FRAME_FELDER)):
+        if maske & (1 << index):
+            werte[index] = FAHRZEUG_FRAME_WERT.unpack_from(frame, versatz)[0]
+            versatz += FAHRZEUG_FRAME_WERT.size
+    rest = json.loads(frame[versatz:].decode("utf-8")) if len(frame) > versatz else {}
+    return art, revision, basis_revision, gesendet, werte, rest
+
+
+def _fahrzeug_frame_voll(snapshot):
+    """Kodiere einen Vollstand samt komplettem Fahrtpfad."""
+
+    werte, rest = _fahrzeug_frame_aufteilen(snapshot)
+    schluessel, pfadlaenge, generation = snapshot._pfad_zustand(0, None)
+    if schluessel[0] == "delta":
+        schluessel = ("reset",)
+    rest = _stream_pfad_anwenden(rest, schluessel)
+    frame = _fahrzeug_frame_packen(
+        FAHRZEUG_FRAME_VOLL, snapshot.revision, 0, werte, rest
+    )
+    return frame, pfadlaenge, generation
+
+
+def _fahrzeug_frame_delta(basis, snapshot, letzte_pfadlaenge, letzte_generation):
+    """Kodiere die Änderungen von ``basis`` nach ``snapshot``.
+
+    Geänderte heiße Felder stehen im Binärteil; entfallene heiße Felder
+    werden im Merge-Patch als ``null`` gelöscht.
+    """
+
+    alte_werte, alter_rest = _fahrzeug_frame_aufteilen(basis)
+    neue_werte, neuer_rest = _fahrzeug_frame_aufteilen(snapshot)
+    patch = _json_merge_patch(alter_rest, neuer_rest, STREAM_PFAD_FELDER)
+    for index in alte_werte.keys() - neue_werte.keys():
+        oben, unten = FAHRZEUG_FRAME_FELDER[index]
+        if oben is None:
+            patch.setdefault(unten, None)
+            continue
+        teil = neuer_rest.get(oben)
+        if not isinstance(teil, dict) or unten in teil:
+            continue
+        teil_patch = patch.setdefault(oben, {})
+        if isinstance(teil_patch, dict):
+            teil_patch.setdefault(unten, None)
+    werte = {
+        index: wert
+        for index, wert in neue_werte.items()
+        if alte_werte.get(index) != wert
+    }
+    schluessel, pfadlaenge, generation = snapshot._pfad_zustand(
+        letzte_pfadlaenge, letzte_generation
+    )
+    rest = {"patch": patch}
+    pfad = {feld: snapshot[feld] for feld in ("path", "path_delta") if feld in snapshot}
+    rest.update(_stream_pfad_anwenden(pfad, schluessel))
+    frame = _fahrzeug_frame_packen(
+        FAHRZEUG_FRAME_DELTA, snapshot.revision, basis.revision, werte, rest
+    )
+    return frame, pfadlaenge, generation
+
+
+class _FahrzeugKanal:
+    """Socket.IO-Raum eines Fahrzeugs mit gemeinsamem Sendestand.
+
+    Alle Mitglieder bekommen dieselben Frames: ``basis`` ist der zuletzt an den
+    Raum gesendete Stand, ``ausstehend`` der neueste noch nicht gesendete.
+    Zwischenstände innerhalb von ``FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS``
+    werden zusammengefasst.
+    """
+
+    def __init__(self, vehicle_id):
+        self.vehicle_id = vehicle_id
+        self.mitglieder = set()
+        self.basis = None
+        self.pfadlaenge = 0
+        self.generation = None
+        self.ausstehend = None
+        self.signal = threading.Event()
+        self.sender_aktiv = False
+
+
+_fahrzeug_kanaele = {}
+_fahrzeug_kanal_lock = threading.Lock()
+
+
+def _fahrzeug_kanal_melden(cache_id, snapshot):
+    """Übergib einen neuen Stream-Stand an den Socket.IO-Raum des Fahrzeugs."""
+
+    kanal = _fahrzeug_kanaele.get(cache_id)
+    if kanal is None or not kanal.mitglieder:
+        return
+    if not isinstance(snapshot, _StreamSnapshot):
+        return
+    kanal.ausstehend = snapshot
+    kanal.signal.set()
+
+
+def _fahrzeug_kanal_basis(kanal):
+    """Lege den Ausgangsstand eines Raums aus den aktuellen Daten fest."""
+
+    if kanal.basis is not None:
+        return kanal.basis
+    aktuelle_daten = latest_data.get(kanal.vehicle_id)
+    if not isinstance(aktuelle_daten, dict):
+        return None
+    _fahrtpfad_nach_parkzeit_bereinigen(aktuelle_daten)
+    snapshot = _stream_snapshot_erzeugen(
+        aktuelle_daten, _stream_revisionen.get(kanal.vehicle_id, 0)
+    )
+    if not isinstance(snapshot, _StreamSnapshot):
+        return None
+    kanal.basis = snapshot
+    _frame, kanal.pfadlaenge, kanal.generation = snapshot._pfad_zustand(0, None)
+    return snapshot
+
+
+def _fahrzeug_kanal_senden(vehicle_id):
+    """Sende neue Stände und Herzschläge an alle Mitglieder eines Raums."""
+
+    kanal = _fahrzeug_kanaele.get(vehicle_id)
+    if kanal is None:
+        return
+    try:
+        while kanal.mitglieder:
+            kanal.signal.wait(FLEET_TELEMETRY_STREAM_KEEPALIVE_SECONDS)
+            kanal.signal.clear()
+            if not kanal.mitglieder:
+                break
+            snapshot = kanal.ausstehend
+            kanal.ausstehend = None
+            if snapshot is None or snapshot is kanal.basis:
+                frame = _fahrzeug_frame_packen(
+                    FAHRZEUG_FRAME_HERZSCHLAG,
+                    kanal.basis.revision if kanal.basis is not None else 0,
+                    0,
+                    {},
+                    None,
+                )
+                socketio.emit(
+                    "vehicle_frame", frame, to=vehicle_id, namespace=FAHRZEUG_NAMESPACE
+                )
+                continue
+            if kanal.basis is None:
+                frame, kanal.pfadlaenge, kanal.generation = _fahrzeug_frame_voll(
+                    snapshot
+                )
+            else:
+                frame, kanal.pfadlaenge, kanal.generation = _fahrzeug_frame_delta(
+                    kanal.basis, snapshot, kanal.pfadlaenge, kanal.generation
+                )
+            kanal.basis = snapshot
+            socketio.emit(
+                "vehicle_frame", frame, to=vehicle_id, namespace=FAHRZEUG_NAMESPACE
+            )
+            socketio.sleep(FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS)
+    finally:
+        with _fahrzeug_kanal_lock:
+            kanal.sender_aktiv = False
+            if not kanal.mitglieder and _fahrzeug_kanaele.get(vehicle_id) is kanal:
+                _fahrzeug_kanaele.pop(vehicle_id, None)
+
+
+def _fahrzeug_kanal_verlassen(sid):
+    """Entferne eine Socket.IO-Sitzung aus allen Fahrzeugräumen."""
+
+    with _fahrzeug_kanal_lock:
+        for vehicle_id, kanal in list(_fahrzeug_kanaele.items()):
+            if sid not in kanal.mitglieder:
+                continue
+            kanal.mitglieder.discard(sid)
+            leave_room(vehicle_id, sid=sid, namespace=FAHRZEUG_NAMESPACE)
+            if not kanal.mitglieder:
+                kanal.signal.set()
+                if not kanal.sender_aktiv:
+                    _fahrzeug_kanaele.pop(vehicle_id, None)
+
+
 @app.route("/api/vehicles")
 def api_vehicles():
     vehicles = get_vehicle_list()
@@ -14209,6 +17888,7 @@ def _client_detail_liste(now=None):
             continue
         first_seen = data.get("first_seen", now)
         delta = now - first_seen
+        streams = _stream_client_status(client_schlüssel)
         items.append(
             {
                 "ip": data.get("ip"),
@@ -14223,6 +17903,11 @@ def _client_detail_liste(now=None):
                 "pages": pages,
                 "duration": _client_dauer_text(delta),
                 "first_seen_ms": int(first_seen * 1000),
+                "streams": streams,
+                "stream_evictions": data.get("stream_evictions", 0),
+                "stream": _stream_status_text(
+                    streams, data.get("stream_evictions", 0)
+                ),
             }
         )
     for client_schlüssel in expired:
@@ -16117,6 +19802,8 @@ def _service_health_payload():
             "aggregation_running": bool(_aggregation_thread and _aggregation_thread.is_alive()),
             "disabled": DISABLE_STATISTICS_AGGREGATION,
         },
+        "telemetry": _fleet_telemetrie_ingest_status(),
+        "latency": _fleet_telemetrie_latenz_status(),
     }
 
 
@@ -16360,6 +20047,17 @@ def api_health():
     return jsonify(_service_health_payload())
 
 
+@app.route("/metrics")
+@requires_auth
+def metrics():
+    """Liefere Telemetry-Zähler und Latenz-Histogramme als Klartext."""
+
+    return Response(
+        _fleet_telemetrie_metriken_text(),
+        mimetype="text/plain; version=0.0.4",
+    )
+
+
 @app.route("/laden")
 @requires_auth
 def charging_report_page():
@@ -16620,6 +20318,45 @@ def handle_disconnect():
             ptt_timer = None
 
 
+@socketio.on("subscribe", namespace=FAHRZEUG_NAMESPACE)
+def fahrzeug_abonnieren(data=None):
+    """Tritt dem Raum eines Fahrzeugs bei und sende den aktuellen Vollstand.
+
+    Ein erneutes ``subscribe`` wechselt das Fahrzeug bzw. fordert nach einer
+    Revisionslücke einen neuen Vollstand an.
+    """
+
+    vehicle_id = data.get("vehicle") if isinstance(data, dict) else data
+    vehicle_id = str(vehicle_id or "").strip()
+    if not vehicle_id or len(vehicle_id) > 64:
+        return {"ok": False}
+    _start_thread(vehicle_id)
+    sid = request.sid
+    _fahrzeug_kanal_verlassen(sid)
+    with _fahrzeug_kanal_lock:
+        kanal = _fahrzeug_kanaele.get(vehicle_id)
+        if kanal is None:
+            kanal = _fahrzeug_kanaele[vehicle_id] = _FahrzeugKanal(vehicle_id)
+        kanal.mitglieder.add(sid)
+        join_room(vehicle_id)
+        sender_starten = not kanal.sender_aktiv
+        kanal.sender_aktiv = True
+    basis = _fahrzeug_kanal_basis(kanal)
+    if basis is not None:
+        frame, _pfadlaenge, _generation = _fahrzeug_frame_voll(basis)
+        emit("vehicle_frame", frame)
+    if sender_starten:
+        socketio.start_background_task(_fahrzeug_kanal_senden, vehicle_id)
+    return {"ok": True, "vehicle": vehicle_id}
+
+
+@socketio.on("disconnect", namespace=FAHRZEUG_NAMESPACE)
+def fahrzeug_getrennt(*_args):
+    """Entferne eine getrennte Sitzung aus ihrem Fahrzeugraum."""
+
+    _fahrzeug_kanal_verlassen(request.sid)
+
+
 if __name__ == "__main__":
     cli_argumente = _parse_cli_arguments()
     if cli_argumente.statistics_once:
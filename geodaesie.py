@@ -0,0 +1,185 @@
+"""Geodätische Berechnungen über ganze Koordinatenfolgen.
+
+Trip-Auswertungen brauchen Abstände, Peilungen und Wartezeiten für jedes
+Paar aufeinanderfolgender Punkte. Die Folgen-Funktionen rechnen mit NumPy
+vektorisiert, wenn es installiert ist und sich bei der Länge der Folge lohnt,
+sonst in reinem Python mit derselben Haversine-Formel. Das Ergebnis ist in
+beiden Fällen eine Folge mit einem Eintrag je Punktpaar (Liste oder
+``ndarray``); ``strecke`` und ``abschnitte`` liefern gewöhnliche Floats.
+
+``abstand`` und ``peilung`` rechnen ein einzelnes Punktpaar für laufende
+Auswertungen wie das Taxameter.
+
+Alle Folgen-Funktionen nehmen ``numpy=None`` (automatisch), ``True`` oder
+``False``; mit ``True`` ohne installiertes NumPy wird ``RuntimeError``
+ausgelöst.
+"""
+
+from math import atan2, cos, degrees, radians, sin, sqrt
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+ERDRADIUS_KM = 6371.0
+WARTE_GESCHWINDIGKEIT = 5
+# Unterhalb dieser Länge kostet das Umwandeln in Arrays mehr, als NumPy spart
+NUMPY_MINDESTLAENGE = 32
+
+
+def numpy_verfuegbar():
+    return np is not None
+
+
+def _numpy_nutzen(werte, numpy):
+    if numpy is None:
+        return np is not None and len(werte) >= NUMPY_MINDESTLAENGE
+    if numpy and np is None:
+        raise RuntimeError("NumPy ist nicht installiert")
+    return bool(numpy)
+
+
+def _array(werte):
+    """Wandle eine Folge mit ``None`` für fehlende Werte in ein Float-Array."""
+
+    try:
+        return np.asarray(werte, dtype=float)
+    except TypeError:
+        return np.array([np.nan if wert is None else wert for wert in werte], dtype=float)
+
+
+def abstand(lat1, lon1, lat2, lon2):
+    """Abstand zweier Punkte in Kilometern."""
+
+    lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return ERDRADIUS_KM * (2 * atan2(sqrt(a), sqrt(1 - a)))
+
+
+def peilung(lat1, lon1, lat2, lon2):
+    """Peilung von Punkt 1 zu Punkt 2 in Grad, 0 bis unter 360."""
+
+    lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
+    dlon = lon2 - lon1
+    y = sin(dlon) * cos(lat2)
+    x = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(dlon)
+    return (degrees(atan2(y, x)) + 360) % 360
+
+
+def abstaende(lats, lons, numpy=None):
+    """Abstände aufeinanderfolgender Punkte in Kilometern."""
+
+    if _numpy_nutzen(lats, numpy):
+        phi = np.radians(_array(lats))
+        lam = np.radians(_array(lons))
+        a = (
+            np.sin(np.diff(phi) / 2) ** 2
+            + np.cos(phi[:-1]) * np.cos(phi[1:]) * np.sin(np.diff(lam) / 2) ** 2
+        )
+        return ERDRADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)))
+    phi = [radians(wert) for wert in lats]
+    lam = [radians(wert) for wert in lons]
+    cos_phi = [cos(wert) for wert in phi]
+    ergebnis = []
+    for i in range(1, len(phi)):
+        a = (
+            sin((phi[i] - phi[i - 1]) / 2) ** 2
+            + cos_phi[i - 1] * cos_phi[i] * sin((lam[i] - lam[i - 1]) / 2) ** 2
+        )
+        ergebnis.append(ERDRADIUS_KM * (2 * atan2(sqrt(a), sqrt(1 - a))))
+    return ergebnis
+
+
+def strecke(lats, lons, numpy=None):
+    """Gesamtlänge eines Pfads in Kilometern."""
+
+    if len(lats) < 2:
+        return 0.0
+    if _numpy_nutzen(lats, numpy):
+        return float(abstaende(lats, lons, numpy=True).sum())
+    gesamt = 0.0
+    for teil in abstaende(lats, lons, numpy=False):
+        gesamt += teil
+    return gesamt
+
+
+def peilungen(lats, lons, numpy=None):
+    """Peilungen aufeinanderfolgender Punkte in Grad."""
+
+    if _numpy_nutzen(lats, numpy):
+        phi = np.radians(_array(lats))
+        dlam = np.diff(np.radians(_array(lons)))
+        y = np.sin(dlam) * np.cos(phi[1:])
+        x = np.cos(phi[:-1]) * np.sin(phi[1:]) - np.sin(phi[:-1]) * np.cos(phi[1:]) * np.cos(dlam)
+        return (np.degrees(np.arctan2(y, x)) + 360) % 360
+    return [
+        peilung(lats[i - 1], lons[i - 1], lats[i], lons[i])
+        for i in range(1, len(lats))
+    ]
+
+
+def wartemaske(speeds, timestamps, numpy=None):
+    """Markiere Punktpaare, deren erster Punkt langsamer als 5 ist.
+
+    Ein Paar zählt nur, wenn beide Zeitstempel vorhanden sind und die Zeit
+    vorwärts läuft. ``None`` steht für einen fehlenden Wert.
+    """
+
+    if _numpy_nutzen(speeds, numpy):
+        v = _array(speeds)
+        t = _array(timestamps)
+        with np.errstate(invalid="ignore"):
+            return (v[:-1] < WARTE_GESCHWINDIGKEIT) & (t[1:] > t[:-1])
+    return [
+        speeds[i - 1] is not None
+        and speeds[i - 1] < WARTE_GESCHWINDIGKEIT
+        and timestamps[i - 1] is not None
+        and timestamps[i] is not None
+        and timestamps[i] > timestamps[i - 1]
+        for i in range(1, len(speeds))
+    ]
+
+
+def wartezeiten(speeds, timestamps, numpy=None):
+    """Wartezeit in Sekunden je Punktpaar, Zeitstempel in Millisekunden."""
+
+    if _numpy_nutzen(speeds, numpy):
+        t = _array(timestamps)
+        maske = wartemaske(speeds, timestamps, numpy=True)
+        return np.where(maske, np.diff(t) / 1000.0, 0.0)
+    maske = wartemaske(speeds, timestamps, numpy=False)
+    return [
+        (timestamps[i] - timestamps[i - 1]) / 1000.0 if maske[i - 1] else 0.0
+        for i in range(1, len(timestamps))
+    ]
+
+
+def abschnitte(lats, lons, speeds, timestamps, grenzen, numpy=None):
+    """Distanz und Wartezeit für Punktbereiche eines Pfads.
+
+    ``grenzen`` enthält ``(erster, letzter)`` Punktindex je Abschnitt, beide
+    einschließlich. Liefert ``(distanz_km, warte_sekunden)`` je Abschnitt.
+    """
+
+    if not grenzen:
+        return []
+    nutzen = _numpy_nutzen(lats, numpy)
+    distanzen = abstaende(lats, lons, numpy=nutzen)
+    warten = wartezeiten(speeds, timestamps, numpy=nutzen)
+    if nutzen:
+        return [
+            (float(distanzen[erster:letzter].sum()), float(warten[erster:letzter].sum()))
+            for erster, letzter in grenzen
+        ]
+    ergebnis = []
+    for erster, letzter in grenzen:
+        distanz = 0.0
+        wartezeit = 0.0
+        for i in range(erster, letzter):
+            distanz += distanzen[i]
+            wartezeit += warten[i]
+        ergebnis.append((distanz, wartezeit))
+    return ergebnis
+
@@ -36,7 +36,7 @@ async function fetchClients() {
         tbody.innerHTML = '';
         data.clients.forEach(function(c) {
             const tr = document.createElement('tr');
-            ['ip', 'hostname', 'location', 'provider', 'browser', 'os', 'user_agent', 'pages', 'duration'].forEach(function(key) {
+            ['ip', 'hostname', 'location', 'provider', 'browser', 'os', 'user_agent', 'pages', 'duration', 'stream'].forEach(function(key) {
                 const td = document.createElement('td');
                 let value = c[key];
                 if (key === 'pages' && Array.isArray(value)) {
@@ -19,6 +19,31 @@ var NAVIGATIONS_ZIEL_NULL_EPSILON = 1e-6;
 var STREAM_WIEDERVERBINDUNG_MS = 250;
 var STREAM_MAX_VERZOEGERUNG_MS = 10000;
 var streamWiederverbindungsTimer = null;
+var STREAM_TRANSPORT_FELDER = ['path', 'path_delta', 'path_reset', 'stream_sent_at', 'stream_revision'];
+var streamStand = null;
+var streamRevision = null;
+var letzteStreamId = null;
+var streamFahrzeug = null;
+// Binärer Live-Kanal über Socket.IO; SSE bleibt der Rückfall.
+var fahrzeugSocket = null;
+var fahrzeugSocketAbgelehnt = false;
+var FAHRZEUG_FRAME_FELDER = [
+    ['drive_state', 'latitude'],
+    ['drive_state', 'longitude'],
+    ['drive_state', 'heading'],
+    ['drive_state', 'speed'],
+    ['drive_state', 'power'],
+    ['drive_state', 'timestamp'],
+    ['charge_state', 'battery_level'],
+    ['charge_state', 'charger_power'],
+    ['charge_state', 'ideal_battery_range'],
+    ['charge_state', 'est_battery_range'],
+    ['climate_state', 'inside_temp'],
+    ['climate_state', 'outside_temp'],
+    ['vehicle_state', 'odometer'],
+    [null, 'timestamp'],
+    [null, 'fleet_telemetry_received_at']
+];
 // Default view if no coordinates are available
 var DEFAULT_POS = [51.4556, 7.0116];
 var DEFAULT_ZOOM = 18;
@@ -4104,6 +4129,170 @@ function verzoegertenStreamNeuStarten() {
 }
 
 
+function wendeMergePatchAn(ziel, patch) {
+    // JSON Merge Patch (RFC 7386): null entfernt, Objekte werden zusammengeführt.
+    if (patch === null || typeof patch !== 'object' || Array.isArray(patch)) {
+        return patch;
+    }
+    var ergebnis = {};
+    if (ziel && typeof ziel === 'object' && !Array.isArray(ziel)) {
+        ergebnis = Object.assign({}, ziel);
+    }
+    Object.keys(patch).forEach(function(schluessel) {
+        var wert = patch[schluessel];
+        if (wert === null) {
+            delete ergebnis[schluessel];
+        } else {
+            ergebnis[schluessel] = wendeMergePatchAn(ergebnis[schluessel], wert);
+        }
+    });
+    return ergebnis;
+}
+
+function streamStandMerken(data) {
+    if (!data || data.stream_revision == null) {
+        return;
+    }
+    var stand = Object.assign({}, data);
+    STREAM_TRANSPORT_FELDER.forEach(function(feld) {
+        delete stand[feld];
+    });
+    streamStand = stand;
+    streamRevision = data.stream_revision;
+}
+
+function streamDeltaAnwenden(delta) {
+    if (!streamStand || delta.base_revision !== streamRevision) {
+        return null;
+    }
+    streamStand = wendeMergePatchAn(streamStand, delta.patch || {});
+    streamRevision = delta.revision;
+    var data = Object.assign({}, streamStand);
+    ['path', 'path_delta', 'path_reset', 'stream_sent_at'].forEach(function(feld) {
+        if (delta[feld] !== undefined) {
+            data[feld] = delta[feld];
+        }
+    });
+    return data;
+}
+
+function streamDatenVerarbeiten(data) {
+    if (streamIstVerzoegert(data.stream_sent_at)) {
+        verzoegertenStreamNeuStarten();
+        return;
+    }
+    if (!data.error) {
+        aktualisiereStreamSignal(Date.now());
+        handleData(data);
+    }
+}
+
+function fahrzeugFrameLesen(puffer) {
+    // Aufbau wie FAHRZEUG_FRAME_KOPF im Server: <BBIIdH, dann float64-Werte, dann JSON.
+    var bytes = puffer instanceof ArrayBuffer
+        ? new Uint8Array(puffer)
+        : new Uint8Array(puffer.buffer, puffer.byteOffset, puffer.byteLength);
+    var ansicht = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+    if (bytes.byteLength < 20 || ansicht.getUint8(0) !== 1) {
+        return null;
+    }
+    var frame = {
+        art: ansicht.getUint8(1),
+        revision: ansicht.getUint32(2, true),
+        basis: ansicht.getUint32(6, true),
+        gesendet: ansicht.getFloat64(10, true),
+        werte: {},
+        rest: {}
+    };
+    var maske = ansicht.getUint16(18, true);
+    var versatz = 20;
+    for (var i = 0; i < FAHRZEUG_FRAME_FELDER.length; i++) {
+        if (maske & (1 << i)) {
+            frame.werte[i] = ansicht.getFloat64(versatz, true);
+            versatz += 8;
+        }
+    }
+    if (versatz < bytes.byteLength) {
+        frame.rest = JSON.parse(new TextDecoder().decode(bytes.subarray(versatz)));
+    }
+    return frame;
+}
+
+function fahrzeugWerteEintragen(ziel, werte) {
+    Object.keys(werte).forEach(function(index) {
+        var feld = FAHRZEUG_FRAME_FELDER[index];
+        if (feld[0] === null) {
+            ziel[feld[1]] = werte[index];
+            return;
+        }
+        if (!ziel[feld[0]] || typeof ziel[feld[0]] !== 'object') {
+            ziel[feld[0]] = {};
+        }
+        ziel[feld[0]][feld[1]] = werte[index];
+    });
+}
+
+function fahrzeugFrameVerarbeiten(puffer) {
+    var frame = fahrzeugFrameLesen(puffer);
+    if (!frame) {
+        return;
+    }
+    if (frame.art === 2) {
+        aktualisiereStreamSignal(frame.gesendet);
+        return;
+    }
+    var data;
+    if (frame.art === 0) {
+        data = frame.rest;
+        fahrzeugWerteEintragen(data, frame.werte);
+        data.stream_revision = frame.revision;
+        data.stream_sent_at = frame.gesendet;
+        streamStandMerken(data);
+    } else {
+        if (streamRevision != null && frame.revision <= streamRevision) {
+            return;
+        }
+        var delta = frame.rest;
+        delta.patch = delta.patch || {};
+        fahrzeugWerteEintragen(delta.patch, frame.werte);
+        delta.revision = frame.revision;
+        delta.base_revision = frame.basis;
+        delta.stream_sent_at = frame.gesendet;
+        data = streamDeltaAnwenden(delta);
+        if (!data) {
+            // Revisionslücke: Vollstand für dasselbe Fahrzeug anfordern.
+            streamStand = null;
+            fahrzeugSocket.emit('subscribe', {vehicle: currentVehicle});
+            return;
+        }
+    }
+    streamDatenVerarbeiten(data);
+}
+
+function fahrzeugSocketStarten() {
+    if (fahrzeugSocket) {
+        if (fahrzeugSocket.connected) {
+            fahrzeugSocket.emit('subscribe', {vehicle: currentVehicle});
+        }
+        return;
+    }
+    fahrzeugSocket = io('/vehicle', {transports: ['websocket']});
+    fahrzeugSocket.on('connect', function() {
+        if (currentVehicle) {
+            fahrzeugSocket.emit('subscribe', {vehicle: currentVehicle});
+        }
+    });
+    fahrzeugSocket.on('vehicle_frame', fahrzeugFrameVerarbeiten);
+    fahrzeugSocket.on('connect_error', function() {
+        // Kein WebSocket möglich: für diese Seite beim SSE-Stream bleiben.
+        fahrzeugSocketAbgelehnt = true;
+        fahrzeugSocket.close();
+        fahrzeugSocket = null;
+        startStream();
+    });
+}
+
+
 function startStream() {
     if (!currentVehicle) {
         return;
@@ -4116,18 +4305,57 @@ function startStream() {
         eventSource.close();
     }
     showLoading();
-    eventSource = new EventSource('/stream/' + currentVehicle);
+    if (streamFahrzeug !== currentVehicle) {
+        streamStand = null;
+        streamRevision = null;
+        letzteStreamId = null;
+        streamFahrzeug = currentVehicle;
+    }
+    if (
+        !fahrzeugSocketAbgelehnt
+        && typeof io === 'function'
+        && !window.STREAM_PROFIL
+        && !window.STREAM_RATE
+    ) {
+        fahrzeugSocketStarten();
+        return;
+    }
+    var streamUrl = '/stream/' + currentVehicle + '?mode=delta';
+    if (window.STREAM_PROFIL) {
+        // Nur die für diese Seite nötigen Teilbäume abonnieren.
+        streamUrl += '&profile=' + encodeURIComponent(window.STREAM_PROFIL);
+    }
+    if (window.STREAM_RATE) {
+        // Langsamere Ratenklasse, z. B. '0.2hz' für Statusanzeigen.
+        streamUrl += '&rate=' + encodeURIComponent(window.STREAM_RATE);
+    }
+    if (letzteStreamId && streamStand) {
+        // Der Server reicht dann nur nach, was seit dieser ID verpasst wurde.
+        streamUrl += '&last_event_id=' + encodeURIComponent(letzteStreamId);
+    }
+    eventSource = new EventSource(streamUrl);
     eventSource.onmessage = function(e) {
         var data = JSON.parse(e.data);
-        if (streamIstVerzoegert(data.stream_sent_at)) {
-            verzoegertenStreamNeuStarten();
+        if (e.lastEventId) {
+            letzteStreamId = e.lastEventId;
+        }
+        streamStandMerken(data);
+        streamDatenVerarbeiten(data);
+    };
+    eventSource.addEventListener('delta', function(e) {
+        var data = streamDeltaAnwenden(JSON.parse(e.data));
+        if (!data) {
+            // Revision passt nicht zum lokalen Stand: mit vollständigem Stand neu verbinden.
+            streamStand = null;
+            letzteStreamId = null;
+            startStream();
             return;
         }
-        if (!data.error) {
-            aktualisiereStreamSignal(Date.now());
-            handleData(data);
+        if (e.lastEventId) {
+            letzteStreamId = e.lastEventId;
         }
-    };
+        streamDatenVerarbeiten(data);
+    });
     eventSource.addEventListener('stream', function(e) {
         try {
             var data = JSON.parse(e.data);
@@ -1,11 +1,12 @@
 import sqlite3
 import threading
 import time
-import math
 import logging
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+import geodaesie
+
 LOCAL_TZ = ZoneInfo("Europe/Berlin")
 logger = logging.getLogger(__name__)
 
@@ -227,15 +228,7 @@ class Taximeter:
 
     @staticmethod
     def _haversine(p1, p2):
-        lat1, lon1 = p1
-        lat2, lon2 = p2
-        r = 6371.0
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        dphi = math.radians(lat2 - lat1)
-        dlambda = math.radians(lon2 - lon1)
-        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-        return 2 * r * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        return geodaesie.abstand(p1[0], p1[1], p2[0], p2[1])
 
     @staticmethod
     def _round_price(value):
@@ -16,3 +16,28 @@ def isolierte_v2l_datenbank(monkeypatch, tmp_path):
     monkeypatch.setattr(app, "_v2l_datenbankpfad", lambda: str(datenbankpfad))
     monkeypatch.setattr(app, "_v2l_aktive_fahrzeuge", set())
     monkeypatch.setattr(app, "_v2l_status_datenbankpfad", None)
+
+
+@pytest.fixture(autouse=True)
+def isolierter_trip_index(monkeypatch, tmp_path):
+    """Lege den Trip-Index je Test unter ``tmp_path`` statt im Datenverzeichnis an."""
+
+    monkeypatch.setattr(
+        app, "TRIP_INDEX_DB", str(tmp_path / "trip_index" / "trip_index.db")
+    )
+    monkeypatch.setattr(app, "_trip_index_tabellen", set())
+
+
+@pytest.fixture(autouse=True)
+def outbox_im_test_abarbeiten(monkeypatch):
+    """Schreibe vorgemerkte Nebenwirkungen, solange Test-Patches aktiv sind."""
+
+    yield
+    app._outbox_abwarten()
+
+
+@pytest.fixture(autouse=True)
+def profilsteuerung_zuruecksetzen():
+    """Beginne jeden Test ohne gemerkte Profilauswertung."""
+
+    app._fleet_telemetry_profile_steuerung.zuruecksetzen()
@@ -39,6 +39,30 @@ def test_client_details_liefern_startzeit(monkeypatch):
     assert data["clients"][0]["first_seen_ms"] == 1935000
 
 
+def test_client_details_zeigen_stream_verzug(monkeypatch):
+    q = app._StreamQueue(maxsize=1, rate="1hz", intervall=1.0, client="127.0.0.1")
+    q.zusammengefasst = 3
+    q.versand_erfassen(app.time.monotonic() - 0.25)
+    monkeypatch.setattr(app, "subscribers", {"veh-1": [q]})
+    app.active_clients.clear()
+    app.active_clients["127.0.0.1"] = _client_eintrag(1935.0, 2000.0)
+    app.active_clients["127.0.0.1"]["stream_evictions"] = 1
+
+    try:
+        items = app._client_detail_liste(now=2000.0)
+    finally:
+        app.active_clients.clear()
+
+    stream = items[0]["streams"][0]
+    assert stream["rate"] == "1hz"
+    assert stream["sent"] == 1
+    assert stream["lag_ms"] >= 250
+    assert items[0]["stream_evictions"] == 1
+    assert items[0]["stream"].startswith("1hz, Verzug ")
+    assert "3 zusammengefasst" in items[0]["stream"]
+    assert "1× wegen Rückstau getrennt" in items[0]["stream"]
+
+
 def test_clients_seite_enthaelt_startzeit(monkeypatch):
     monkeypatch.setattr(app, "load_config", lambda vehicle_id=None: {})
     monkeypatch.setattr(app.time, "time", lambda: 2000.0)
@@ -50,6 +50,47 @@ def test_api_daten_bleiben_trotz_privatmodus_real(monkeypatch):
     assert "privacy_radius_m" not in payload
 
 
+def test_api_daten_unterstuetzen_etag_und_since(monkeypatch):
+    monkeypatch.setattr(app_module, "load_config", lambda vehicle_id=None: {})
+    monkeypatch.setattr(app_module, "_start_thread", lambda vehicle_id: None)
+    monkeypatch.setattr(app_module, "_fahrtpfad_nach_parkzeit_bereinigen", lambda _daten: False)
+    monkeypatch.setattr(app_module, "_api_daten_staende", {})
+    cache = app_module._RevisionierteDaten()
+    cache["fahrzeug"] = {
+        "drive_state": {"speed": 10},
+        "charge_state": {"battery_level": 80},
+        "state": "online",
+    }
+    monkeypatch.setattr(app_module, "latest_data", cache)
+    client = app.test_client()
+
+    erste = client.get("/api/data/fahrzeug")
+    etag = erste.headers["ETag"]
+    revision = erste.headers["X-Data-Revision"]
+    assert erste.get_json()["charge_state"]["battery_level"] == 80
+    assert etag == f'"{revision}"'
+    assert client.get(
+        "/api/data/fahrzeug", headers={"If-None-Match": etag}
+    ).status_code == 304
+    assert client.get(f"/api/data/fahrzeug?since={revision}").status_code == 304
+
+    daten = dict(cache["fahrzeug"])
+    daten["drive_state"] = {"speed": 20}
+    daten.pop("state")
+    cache["fahrzeug"] = daten
+
+    geändert = client.get(f"/api/data/fahrzeug?since={revision}")
+    assert geändert.status_code == 200
+    assert geändert.get_json() == {"drive_state": {"speed": 20}, "state": None}
+    assert geändert.headers["X-Data-Base-Revision"] == revision
+    assert geändert.headers["X-Data-Revision"] != revision
+    assert client.get(
+        "/api/data/fahrzeug", headers={"If-None-Match": etag}
+    ).status_code == 200
+    assert client.get("/api/data/fahrzeug?since=alt-1").get_json() == daten
+    assert client.get("/api/data/fahrzeug?since=x").status_code == 400
+
+
 def test_apiliste_aktualisiert_vor_ausgabe(monkeypatch, tmp_path):
     erfasst = {}
 
@@ -601,6 +642,26 @@ def test_health_api(monkeypatch):
 
     assert response.status_code == 200
     assert "polling" in data
+    assert "queued" in data["telemetry"]
+    assert "worker_alive" in data["telemetry"]
+
+
+def test_metrics_liefert_latenz_histogramme(monkeypatch):
+    monkeypatch.setenv("TESLA_EMAIL", "test@example.org")
+    monkeypatch.setenv("TESLA_PASSWORD", "geheim")
+    monkeypatch.setattr(app_module, "_fleet_telemetry_latenzen", {})
+    app_module._fleet_telemetrie_latenz_erfassen("queue_wait", "VIN1", "kritisch", 3.0)
+
+    response = app.test_client().get("/metrics", headers=auth_headers())
+    text = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    labels = 'vehicle="VIN1",field_class="kritisch",stage="queue_wait"'
+    assert f'tesla_dashboard_pipeline_latency_ms_bucket{{{labels},le="2"}} 0' in text
+    assert f'tesla_dashboard_pipeline_latency_ms_bucket{{{labels},le="5"}} 1' in text
+    assert f"tesla_dashboard_pipeline_latency_ms_count{{{labels}}} 1" in text
+    assert "tesla_dashboard_telemetry_dropped_total" in text
 
 
 def test_health_api_fasst_cache_aliase_zusammen(monkeypatch):
@@ -0,0 +1,80 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+import geodaesie
+
+
+LATS = [51.45, 51.4512, 51.4531, 51.4531, 51.4550, 51.4602]
+LONS = [7.01, 7.0123, 7.0151, 7.0151, 7.0190, 7.0221]
+SPEEDS = [0.0, 3.0, None, 12.0, 4.0, 30.0]
+TIMESTAMPS = [1000, 3000, 6000, None, 10000, 9000]
+
+
+def _benchmark_laden():
+    pfad = Path(__file__).resolve().parents[1] / "tools" / "geodaesie_benchmark.py"
+    spec = importlib.util.spec_from_file_location("geodaesie_benchmark", pfad)
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+def test_fallback_entspricht_den_einzelnen_punktpaaren():
+    paare = list(zip(LATS, LONS, LATS[1:], LONS[1:]))
+
+    assert geodaesie.abstaende(LATS, LONS, numpy=False) == [
+        geodaesie.abstand(*paar) for paar in paare
+    ]
+    assert geodaesie.peilungen(LATS, LONS, numpy=False) == [
+        geodaesie.peilung(*paar) for paar in paare
+    ]
+    assert geodaesie.wartemaske(SPEEDS, TIMESTAMPS, numpy=False) == [
+        True, True, False, False, False,
+    ]
+    assert geodaesie.wartezeiten(SPEEDS, TIMESTAMPS, numpy=False) == [
+        2.0, 3.0, 0.0, 0.0, 0.0,
+    ]
+    distanzen = geodaesie.abstaende(LATS, LONS, numpy=False)
+    assert geodaesie.abschnitte(
+        LATS, LONS, SPEEDS, TIMESTAMPS, [(0, 2), (3, 5)], numpy=False
+    ) == [
+        (0.0 + distanzen[0] + distanzen[1], 5.0),
+        (0.0 + distanzen[3] + distanzen[4], 0.0),
+    ]
+    assert geodaesie.strecke(LATS[:1], LONS[:1]) == 0.0
+
+
+def test_numpy_und_fallback_stimmen_ueberein():
+    pytest.importorskip("numpy")
+    grenzen = [(0, 2), (1, 5)]
+
+    for funktion, argumente in (
+        (geodaesie.abstaende, (LATS, LONS)),
+        (geodaesie.peilungen, (LATS, LONS)),
+        (geodaesie.wartezeiten, (SPEEDS, TIMESTAMPS)),
+    ):
+        assert list(funktion(*argumente, numpy=True)) == pytest.approx(
+            funktion(*argumente, numpy=False)
+        )
+    assert list(geodaesie.wartemaske(SPEEDS, TIMESTAMPS, numpy=True)) == (
+        geodaesie.wartemaske(SPEEDS, TIMESTAMPS, numpy=False)
+    )
+    for mit, ohne in zip(
+        geodaesie.abschnitte(LATS, LONS, SPEEDS, TIMESTAMPS, grenzen, numpy=True),
+        geodaesie.abschnitte(LATS, LONS, SPEEDS, TIMESTAMPS, grenzen, numpy=False),
+    ):
+        assert mit == pytest.approx(ohne)
+
+
+def test_benchmark_misst_ein_kleines_jahr():
+    benchmark = _benchmark_laden()
+
+    ergebnis = benchmark.benchmark_ausfuehren(tage=3, punkte=50, wiederholungen=1)
+
+    assert ergebnis["punkte"] == 150
+    assert ergebnis["strecke_km"] > 0
+    if geodaesie.numpy_verfuegbar():
+        assert ergebnis["abweichung"] < 1e-9
+    else:
+        assert "nicht installiert" in benchmark.bericht_erstellen(ergebnis)
@@ -83,3 +83,22 @@ def test_bereiche_auswahl_nutzt_live_ansicht_begriffe():
     assert probefahrt_messung.bereiche_auswahl(
         ["bewegung", "karte", "instrumente"]
     ) == ("bewegung", "karte", "instrumente")
+
+
+def test_mitschnitt_aus_zeilen_liefert_rohdaten_zurueck(tmp_path):
+    pfad = tmp_path / "fahrt.tdmq.gz"
+
+    anzahl = probefahrt_messung.mitschnitt_aus_zeilen(
+        [
+            '100.250\ttesla/VIN123/v/Location\t{"latitude":51.0,"longitude":7.0}',
+            "keine Messzeile",
+            '101.000\ttesla/VIN123/v/VehicleSpeed\t50',
+        ],
+        pfad,
+    )
+
+    assert anzahl == 2
+    assert list(probefahrt_messung.mitschnitt_lesen(pfad)) == [
+        (100.25, "tesla/VIN123/v/Location", b'{"latitude":51.0,"longitude":7.0}'),
+        (101.0, "tesla/VIN123/v/VehicleSpeed", b"50"),
+    ]
@@ -0,0 +1,67 @@
+import importlib.util
+from pathlib import Path
+
+import app
+
+
+MODULPFAD = Path(__file__).resolve().parents[1] / "tools" / "profil_benchmark.py"
+SPEZIFIKATION = importlib.util.spec_from_file_location(
+    "profil_benchmark",
+    MODULPFAD,
+)
+profil_benchmark = importlib.util.module_from_spec(SPEZIFIKATION)
+SPEZIFIKATION.loader.exec_module(profil_benchmark)
+
+
+def test_profilsteuerung_ueberspringt_ohne_andere_entscheidungen():
+    ablauf = (
+        ("parken", 600, 30),
+        ("fahren", 300, 1),
+        ("parken", 300, 10),
+        ("laden", 600, 10),
+    )
+    steuerung = app._fleet_telemetry_profile_steuerung
+    status = app._fleet_telemetry_profile_status
+
+    ergebnis = profil_benchmark.benchmark_ausfuehren(app, ablauf=ablauf)
+
+    assert ergebnis["gleicher_verlauf"] is True
+    assert ergebnis["gespart"]["uebersprungen"] > 0
+    assert ergebnis["voll"]["uebersprungen"] == 0
+    angefordert = [
+        profil for _zeit, art, profil in ergebnis["gespart"]["verlauf"]
+        if art == "angefordert"
+    ]
+    assert angefordert == ["live", "parked", "live", "live_extended", "parked", "charging"]
+    assert app._fleet_telemetry_profile_steuerung is steuerung
+    assert app._fleet_telemetry_profile_status is status
+
+
+def test_profilsteuerung_schreibt_bewegungszeit_gedrosselt(monkeypatch):
+    gespeichert = []
+    uhr = profil_benchmark.SimulierteUhr(1_000.0)
+    steuerung = app._FleetTelemetrieProfilsteuerung(uhr=uhr)
+    monkeypatch.setattr(
+        app,
+        "_fleet_telemetrie_profile_status_speichern",
+        lambda: gespeichert.append(uhr.jetzt),
+    )
+    status = {"target": "live", "live_retry_last_moving_at": 0.0}
+
+    for sekunde in range(60):
+        uhr.jetzt = 1_000.0 + sekunde
+        vorher = dict(status)
+        status["live_retry_last_moving_at"] = uhr.jetzt
+        if steuerung._speichern_noetig(vorher, status, uhr.jetzt):
+            app._fleet_telemetrie_profile_status_speichern()
+    vorher = dict(status)
+    status["target"] = "parked"
+    assert steuerung._speichern_noetig(vorher, status, 1_060.0)
+
+    nachlauf = app.FLEET_TELEMETRIE_PROFILE_LIVE_NEUVERSAND_BEWEGUNGSNACHLAUF_SECONDS
+    assert gespeichert[0] == 1_000.0
+    assert all(
+        spaeter - frueher >= nachlauf / 2
+        for frueher, spaeter in zip(gespeichert, gespeichert[1:])
+    )
+    assert len(gespeichert) < 60
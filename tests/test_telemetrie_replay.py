@@ -0,0 +1,64 @@
+import importlib.util
+from pathlib import Path
+
+import app
+
+
+MODULPFAD = Path(__file__).resolve().parents[1] / "tools" / "telemetrie_replay.py"
+SPEZIFIKATION = importlib.util.spec_from_file_location(
+    "telemetrie_replay",
+    MODULPFAD,
+)
+telemetrie_replay = importlib.util.module_from_spec(SPEZIFIKATION)
+SPEZIFIKATION.loader.exec_module(telemetrie_replay)
+
+
+def _dateistand(pfad):
+    try:
+        return Path(pfad).read_bytes()
+    except OSError:
+        return None
+
+
+def test_gruppen_bilden_folgt_worker_grenzen():
+    nachrichten = [(100.0 + index * 0.01, "t", b"1") for index in range(5)]
+    nachrichten.append((101.0, "t", b"1"))
+
+    gruppen = telemetrie_replay.gruppen_bilden(nachrichten, 3, 0.05)
+
+    assert [len(gruppe) for gruppe in gruppen] == [3, 2, 1]
+
+
+def test_replay_misst_stufen_und_stellt_app_wieder_her(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "_fleet_telemetrie_fahrzeuge", lambda: [])
+    monkeypatch.setattr(app, "latest_data", {"vorher": {"wert": 1}})
+    monkeypatch.setattr(
+        app,
+        "_fleet_telemetrie_runtime_config",
+        lambda: {"topic_base": "tesla"},
+    )
+    sperre = app._fleet_telemetry_lock
+    statusdatei = app.TESLA_FLEET_TELEMETRY_PROFILE_STATUS_FILE
+    statusdatei_vorher = _dateistand(statusdatei)
+    nachrichten = [
+        (100.0, "tesla/VIN123/v/VehicleSpeed", b"50"),
+        (100.5, "tesla/VIN123/v/Soc", b"80.5"),
+        (101.0, "tesla/VIN123/v/Gear", b'"D"'),
+    ]
+
+    ergebnis = telemetrie_replay.replay_ausfuehren(
+        app,
+        nachrichten,
+        daten_verzeichnis=tmp_path,
+    )
+
+    assert ergebnis["nachrichten"] == 3
+    assert ergebnis["stufen"]["dekodieren"]["anzahl"] == 3
+    assert ergebnis["stufen"]["uebernehmen"]["anzahl"] >= 1
+    assert ergebnis["sperre"]["halten"]["anzahl"] >= 1
+    assert ergebnis["speicher"]["spitze_bytes_pro_nachricht"] > 0
+    assert app._fleet_telemetry_lock is sperre
+    assert app.latest_data == {"vorher": {"wert": 1}}
+    assert app.TESLA_FLEET_TELEMETRY_PROFILE_STATUS_FILE == statusdatei
+    assert statusdatei_vorher == _dateistand(statusdatei)
+    assert "Durchsatz:" in telemetrie_replay.bericht_erstellen(ergebnis)
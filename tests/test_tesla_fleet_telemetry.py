@@ -26,6 +26,18 @@ def _routeline_protobuf(polyline):
     return base64.b64encode(payload).decode("ascii")
 
 
+def _sse_felder(frame):
+    felder = {}
+    for zeile in frame.strip().split("\n"):
+        name, _, wert = zeile.partition(": ")
+        felder[name] = wert
+    return felder
+
+
+def _sse_daten(frame):
+    return json.loads(_sse_felder(frame)["data"])
+
+
 def _telemetrie_stream_details(vin="TESTVIN"):
     return [{
         "vin": vin,
@@ -618,6 +630,7 @@ def test_fleet_telemetrie_mqtt_zeichnet_parkstatus_auf(monkeypatch):
         b"84",
         {"topic_base": "tesla"},
     )
+    app._outbox_abwarten()
 
     assert {vehicle_id for vehicle_id, _data in parking_aufrufe} == {"veh-1"}
 
@@ -1237,7 +1250,351 @@ def test_fleet_telemetrie_mqtt_batch_default_ist_200_und_stream_latest_only():
         'os.getenv("TESLA_FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS", "0.25")'
         in inhalt
     )
-    assert "q = eventlet_queue.Queue(maxsize=FLEET_TELEMETRY_STREAM_QUEUE_MAX)" in inhalt
+    assert "q = _StreamQueue(\n            maxsize=FLEET_TELEMETRY_STREAM_QUEUE_MAX," in inhalt
+
+
+def test_fleet_telemetrie_eingangspuffer_haelt_neuesten_wert_je_topic(monkeypatch):
+    puffer = app._FleetTelemetrieEingangspuffer(100)
+    monkeypatch.setattr(app, "_fleet_telemetry_message_queue", puffer)
+    monkeypatch.setattr(app, "_fleet_telemetry_queue_zusammengefasst", 0)
+    monkeypatch.setattr(app, "_fleet_telemetry_queue_zusammengefasst_felder", {})
+
+    app._fleet_telemetrie_mqtt_einreihen("tesla/VIN1/v/PackCurrent", b"1", 1)
+    app._fleet_telemetrie_mqtt_einreihen("tesla/VIN1/v/Gear", b'"D"', 2)
+    app._fleet_telemetrie_mqtt_einreihen("tesla/VIN1/v/PackCurrent", b"2", 3)
+    app._fleet_telemetrie_mqtt_einreihen("tesla/VIN2/v/PackCurrent", b"9", 4)
+    app._fleet_telemetrie_mqtt_einreihen("tesla/VIN1/v/PackCurrent", b"3", 5)
+
+    eintraege = []
+    while not puffer.empty():
+        eintraege.append(puffer.get_nowait())
+
+    assert eintraege == [
+        ("tesla/VIN1/v/PackCurrent", b"3", 5),
+        ("tesla/VIN1/v/Gear", b'"D"', 2),
+        ("tesla/VIN2/v/PackCurrent", b"9", 4),
+    ]
+    assert app._fleet_telemetry_queue_zusammengefasst == 2
+    assert app._fleet_telemetry_queue_zusammengefasst_felder == {"PackCurrent": 2}
+    with pytest.raises(app.queue.Empty):
+        puffer.get(timeout=0.01)
+
+
+def test_fleet_telemetrie_eingangspuffer_behaelt_platz_bei_rueckstau():
+    puffer = app._FleetTelemetrieEingangspuffer(0)
+    puffer.put_nowait(("tesla/VIN1/v/Location", b"0", 0))
+
+    for runde in range(1, 50):
+        puffer.put_nowait((f"tesla/VIN1/v/Feld{runde}", b"1", runde))
+        assert puffer.put_nowait(
+            ("tesla/VIN1/v/Location", str(runde).encode(), runde)
+        ) == ("tesla/VIN1/v/Location", True)
+
+    assert puffer.qsize() == 50
+    assert puffer.get_nowait() == ("tesla/VIN1/v/Location", b"49", 49)
+    assert puffer.get_nowait() == ("tesla/VIN1/v/Feld1", b"1", 1)
+
+
+def test_fleet_telemetrie_eingangspuffer_haelt_verbindungsreihenfolge(monkeypatch):
+    connected_at = "2026-06-14T14:47:57Z"
+    disconnected_at = "2026-06-14T14:47:59Z"
+    disconnected_ms = int(
+        datetime(2026, 6, 14, 14, 47, 59, tzinfo=timezone.utc).timestamp() * 1000
+    )
+    connected_ms = disconnected_ms - 2000
+    monkeypatch.setattr(app, "_fleet_telemetrie_cache_ids", lambda vin: ["veh-1"])
+    monkeypatch.setattr(app, "_load_cached", lambda vehicle_id: {})
+    monkeypatch.setattr(app, "_save_cached", lambda vehicle_id, data: None)
+    monkeypatch.setattr(app, "latest_data", {})
+    monkeypatch.setattr(app, "subscribers", {})
+    monkeypatch.setattr(app, "_fleet_telemetry_offline_seit", {})
+    puffer = app._FleetTelemetrieEingangspuffer(100)
+
+    for eintrag in (
+        (
+            "tesla/TESTVIN/connectivity",
+            f'{{"Status": "CONNECTED", "CreatedAt": "{connected_at}"}}'.encode("utf-8"),
+            connected_ms,
+        ),
+        ("tesla/TESTVIN/v/Gear", b'"P"', connected_ms + 1000),
+        ("tesla/TESTVIN/v/InsideTemp", b"21", connected_ms + 1500),
+        (
+            "tesla/TESTVIN/connectivity",
+            f'{{"Status": "DISCONNECTED", "CreatedAt": "{disconnected_at}"}}'.encode(
+                "utf-8"
+            ),
+            disconnected_ms,
+        ),
+    ):
+        puffer.put_nowait(eintrag)
+    nachrichten = [puffer.get_nowait() for _ in range(puffer.qsize())]
+
+    assert [topic.rsplit("/", 1)[1] for topic, _payload, _zeit in nachrichten] == [
+        "Gear",
+        "InsideTemp",
+        "connectivity",
+    ]
+    app._fleet_telemetrie_mqtt_messages_verarbeiten(nachrichten, {"topic_base": "tesla"})
+    assert app.latest_data["veh-1"]["state"] == "offline"
+
+    # Ein Feld nach dem Verbindungsereignis überholt es nicht.
+    puffer.put_nowait(("tesla/TESTVIN/v/Gear", b'"P"', 1))
+    puffer.put_nowait(("tesla/TESTVIN/connectivity", b"{}", 2))
+    puffer.put_nowait(("tesla/TESTVIN/v/Gear", b'"D"', 3))
+    assert [puffer.get_nowait()[2] for _ in range(2)] == [2, 3]
+
+
+def test_fleet_telemetrie_eingangspuffer_zaehlt_verdraengte_felder(monkeypatch):
+    puffer = app._FleetTelemetrieEingangspuffer(2)
+    monkeypatch.setattr(app, "_fleet_telemetry_message_queue", puffer)
+    monkeypatch.setattr(app, "_fleet_telemetry_queue_verworfen", 0)
+    monkeypatch.setattr(app, "_fleet_telemetry_queue_verworfen_felder", {})
+    monkeypatch.setattr(app, "_fleet_telemetry_queue_warnung", app.time.time())
+
+    app._fleet_telemetrie_mqtt_einreihen("tesla/VIN1/v/Location", b"{}", 1)
+    app._fleet_telemetrie_mqtt_einreihen("tesla/VIN1/connectivity", b"{}", 2)
+    app._fleet_telemetrie_mqtt_einreihen("tesla/VIN1/v/Odometer", b"1", 3)
+
+    assert puffer.qsize() == 2
+    assert app._fleet_telemetry_queue_verworfen == 1
+    assert app._fleet_telemetry_queue_verworfen_felder == {"Location": 1}
+    status = app._fleet_telemetrie_ingest_status()
+    assert status["dropped_by_field"] == {"Location": 1}
+
+
+def test_outbox_ersetzt_bei_rueckstau_aeltere_samples_desselben_fahrzeugs(monkeypatch):
+    warteschlange = app._OutboxWarteschlange(3, lambda eintrag: eintrag[0])
+    monkeypatch.setattr(app, "_outbox_warteschlangen", {"parken": warteschlange})
+    monkeypatch.setattr(app, "_outbox_starten", lambda art: None)
+    monkeypatch.setattr(app, "_outbox_verworfen", {})
+    monkeypatch.setattr(app, "_outbox_warnung", app.time.time())
+
+    for eintrag in (("A", 1), ("B", 1), ("A", 2), ("A", 3), ("C", 1)):
+        app._outbox_vormerken("parken", eintrag)
+
+    assert app._fleet_telemetrie_ingest_status()["outbox"] == {
+        "parken": {"queued": 3, "queue_max": 3, "dropped": 2},
+    }
+    assert [warteschlange.get_nowait() for _ in range(3)] == [
+        ("A", 2),
+        ("A", 3),
+        ("C", 1),
+    ]
+    for _ in range(3):
+        warteschlange.task_done()
+    warteschlange.join()
+
+
+def test_fleet_telemetrie_verarbeitet_kritische_felder_zuerst(monkeypatch):
+    aufrufe = []
+    monkeypatch.setattr(
+        app,
+        "_fleet_telemetrie_mqtt_events_verarbeiten",
+        lambda events: aufrufe.append(
+            [event.get("field") or event["typ"] for event in events]
+        ) or True,
+    )
+    bulk_puffer = app.OrderedDict()
+    cfg = {"topic_base": "tesla"}
+
+    assert app._fleet_telemetrie_mqtt_messages_verarbeiten(
+        [
+            ("tesla/VIN1/v/InsideTemp", b"21", 1),
+            ("tesla/VIN1/v/TpmsPressureFl", b"2.9", 2),
+            ("tesla/VIN1/v/Location", b'{"latitude":51.0,"longitude":7.0}', 3),
+            ("tesla/VIN1/v/MediaNowPlayingTitle", b'"Song"', 4),
+            ("tesla/VIN1/v/VehicleSpeed", b"50", 5),
+            ("tesla/VIN1/v/TpmsPressureFl", b"3.0", 6),
+        ],
+        cfg,
+        bulk_puffer=bulk_puffer,
+    )
+
+    assert aufrufe == [["Location", "VehicleSpeed"], ["InsideTemp"]]
+    assert list(bulk_puffer) == [
+        ("VIN1", "MediaNowPlayingTitle"),
+        ("VIN1", "TpmsPressureFl"),
+    ]
+    assert bulk_puffer[("VIN1", "TpmsPressureFl")]["value"] == 3.0
+
+    assert app._fleet_telemetrie_bulk_verarbeiten(bulk_puffer)
+    assert aufrufe[-1] == ["MediaNowPlayingTitle", "TpmsPressureFl"]
+    assert not bulk_puffer
+
+
+def test_fleet_telemetrie_connectivity_bleibt_in_ankunftsreihenfolge(monkeypatch):
+    disconnected_at = "2026-06-14T14:47:59Z"
+    disconnected_ms = int(
+        datetime(2026, 6, 14, 14, 47, 59, tzinfo=timezone.utc).timestamp() * 1000
+    )
+    monkeypatch.setattr(app, "_fleet_telemetrie_cache_ids", lambda vin: ["veh-1"])
+    monkeypatch.setattr(app, "_load_cached", lambda vehicle_id: {})
+    monkeypatch.setattr(app, "_save_cached", lambda vehicle_id, data: None)
+    monkeypatch.setattr(app, "latest_data", {})
+    monkeypatch.setattr(app, "subscribers", {})
+    monkeypatch.setattr(app, "_fleet_telemetry_offline_seit", {})
+    bulk_puffer = app.OrderedDict()
+    cfg = {"topic_base": "tesla"}
+
+    app._fleet_telemetrie_mqtt_messages_verarbeiten(
+        [
+            ("tesla/TESTVIN/v/MediaNowPlayingTitle", b'"Song"', disconnected_ms - 3000),
+            ("tesla/TESTVIN/v/InsideTemp", b"21", disconnected_ms - 2000),
+            ("tesla/TESTVIN/v/VehicleSpeed", b"0", disconnected_ms - 1000),
+            (
+                "tesla/TESTVIN/connectivity",
+                f'{{"Status": "DISCONNECTED", "CreatedAt": "{disconnected_at}"}}'.encode(
+                    "utf-8"
+                ),
+                disconnected_ms,
+            ),
+            ("tesla/TESTVIN/v/TpmsPressureFl", b"2.9", disconnected_ms - 500),
+        ],
+        cfg,
+        bulk_puffer=bulk_puffer,
+    )
+
+    daten = app.latest_data["veh-1"]
+    assert daten["state"] == "offline"
+    assert daten["state_since_ms"] == disconnected_ms
+    assert daten["vehicle_state"]["media_info"]["now_playing_title"] == "Song"
+    assert list(bulk_puffer) == [("TESTVIN", "TpmsPressureFl")]
+
+    assert not app._fleet_telemetrie_bulk_verarbeiten(bulk_puffer)
+    assert not bulk_puffer
+    assert app.latest_data["veh-1"]["state"] == "offline"
+
+
+def test_fleet_telemetrie_ohne_bulk_puffer_verarbeitet_alle_felder(monkeypatch):
+    aufrufe = []
+    monkeypatch.setattr(
+        app,
+        "_fleet_telemetrie_mqtt_events_verarbeiten",
+        lambda events: aufrufe.append([event["field"] for event in events]) or True,
+    )
+
+    app._fleet_telemetrie_mqtt_messages_verarbeiten(
+        [
+            ("tesla/VIN1/v/TpmsPressureFl", b"2.9", 1),
+            ("tesla/VIN1/v/Gear", b'"D"', 2),
+        ],
+        {"topic_base": "tesla"},
+    )
+
+    assert aufrufe == [["Gear"], ["TpmsPressureFl"]]
+
+
+def test_fleet_telemetrie_payload_wird_direkt_aus_bytes_gelesen(monkeypatch):
+    monkeypatch.setattr(app, "_fleet_telemetry_payload_cache", {})
+
+    assert app._fleet_telemetrie_decode_payload(b'{"latitude": 51.0}') == {
+        "latitude": 51.0
+    }
+    assert app._fleet_telemetrie_decode_payload(memoryview(b"42")) == 42
+    assert app._fleet_telemetrie_decode_payload(b"kein json") == "kein json"
+    assert app._fleet_telemetrie_decode_payload(b'"\xff"') == "\ufffd"
+
+
+def test_fleet_telemetrie_gleiche_payload_wird_nicht_erneut_geparst(monkeypatch):
+    monkeypatch.setattr(app, "_fleet_telemetry_payload_cache", {})
+    topic = "tesla/VIN1/v/Location"
+
+    erster = app._fleet_telemetrie_decode_payload(b'{"latitude": 51.0}', topic)
+    monkeypatch.setattr(
+        app.json,
+        "loads",
+        lambda *_args, **_kwargs: pytest.fail("Payload erneut geparst"),
+    )
+    zweiter = app._fleet_telemetrie_decode_payload(b'{"latitude": 51.0}', topic)
+
+    assert zweiter is erster
+
+
+def test_fleet_telemetrie_topic_wird_einmal_zerlegt():
+    app._fleet_telemetrie_topic_zerlegen.cache_clear()
+    cfg = {"topic_base": "tesla"}
+
+    for _ in range(3):
+        event = app._fleet_telemetrie_mqtt_event(
+            "tesla/VIN1/v/Media/Title", b'"Song"', cfg, 1
+        )
+        assert event["vin"] == "VIN1"
+        assert event["field"] == "Media/Title"
+    assert app._fleet_telemetrie_mqtt_event("andere/VIN1/v/Gear", b"1", cfg, 1) is None
+    assert app._fleet_telemetrie_mqtt_event("tesla/VIN1/v", b"1", cfg, 1) is None
+
+    info = app._fleet_telemetrie_topic_zerlegen.cache_info()
+    assert info.misses == 3
+    assert info.hits == 2
+
+
+def test_fleet_telemetrie_runtime_config_wird_nur_bei_aenderung_gelesen(
+    monkeypatch, tmp_path
+):
+    pfad = tmp_path / "runtime.json"
+    pfad.write_text('{"enabled": true, "topic_base": "auto"}', encoding="utf-8")
+    monkeypatch.setattr(app, "TESLA_FLEET_TELEMETRY_RUNTIME_FILE", str(pfad))
+    monkeypatch.setattr(
+        app, "_fleet_telemetry_runtime_cache", {"schluessel": None, "cfg": {}}
+    )
+    monkeypatch.delenv("TESLA_FLEET_TELEMETRY_ENABLED", raising=False)
+
+    assert app._fleet_telemetrie_runtime_config()["topic_base"] == "auto"
+    original_open = open
+    monkeypatch.setattr(
+        "builtins.open",
+        lambda *args, **kwargs: pytest.fail("Konfiguration erneut gelesen"),
+    )
+    cfg = app._fleet_telemetrie_runtime_config()
+    cfg["topic_base"] = "veraendert"
+    assert app._fleet_telemetrie_runtime_config()["topic_base"] == "auto"
+    monkeypatch.setattr("builtins.open", original_open)
+
+    pfad.write_text('{"enabled": true, "topic_base": "neu"}', encoding="utf-8")
+    app.os.utime(pfad, ns=(1, 1))
+    assert app._fleet_telemetrie_runtime_config()["topic_base"] == "neu"
+
+
+def test_latenz_histogramm_rundet_perzentile_auf_klassengrenzen():
+    histogramm = app._LatenzHistogramm()
+    for dauer in (0.5, 3, 3, 4, 40, 120000):
+        histogramm.erfassen(dauer)
+
+    assert histogramm.anzahl == 6
+    assert histogramm.perzentil(50) == 5.0
+    assert histogramm.perzentil(80) == 50.0
+    assert histogramm.perzentil(99) == 120000
+
+
+def test_fleet_telemetrie_misst_pipeline_stufen_je_feldklasse(monkeypatch):
+    monkeypatch.setattr(app, "_fleet_telemetry_latenzen", {})
+    monkeypatch.setattr(app, "_fleet_telemetrie_cache_ids", lambda vin: ["veh-1"])
+    monkeypatch.setattr(app, "_load_cached", lambda vehicle_id: {})
+    monkeypatch.setattr(app, "_subscriber_daten_senden", lambda *args: None)
+    monkeypatch.setattr(app, "_aprs_spaeter_senden", lambda *args: None)
+    monkeypatch.setattr(
+        app,
+        "_fleet_telemetrie_cache_spaeter_speichern",
+        lambda *args: None,
+    )
+    monkeypatch.setattr(app, "latest_data", {})
+
+    app._fleet_telemetrie_wartezeit_erfassen(
+        [("tesla/TESTVIN/v/VehicleSpeed", b"50", app.time.time() * 1000 - 20)]
+    )
+    assert app._fleet_telemetrie_v_felder_aktualisieren(
+        "TESTVIN",
+        [("VehicleSpeed", 50, 2000), ("InsideTemp", 21, 2001)],
+    )
+
+    stufen = {
+        eintrag["stage"]: eintrag
+        for eintrag in app._fleet_telemetrie_latenz_status()
+        if eintrag["vehicle"] == "TESTVIN"
+    }
+    assert set(stufen) >= {"queue_wait", "apply", "enrichment", "profile", "fanout"}
+    assert {eintrag["field_class"] for eintrag in stufen.values()} == {"kritisch"}
+    assert stufen["queue_wait"]["p50_ms"] >= 10
 
 
 def test_stream_sendet_ungepuffert_und_unkomprimiert(monkeypatch):
@@ -1301,8 +1658,8 @@ def test_stream_liefert_subscriber_snapshot_direkt_aus(monkeypatch):
         })
 
         payload = next(response.response).decode("utf-8")
-        assert payload.startswith("data: ")
-        daten = json.loads(payload.removeprefix("data: ").strip())
+        assert "data" in _sse_felder(payload)
+        daten = _sse_daten(payload)
         assert daten["fleet_telemetry_received_at"] == 1234
         assert daten["drive_state"]["speed"] == 1
         assert isinstance(daten["stream_sent_at"], int)
@@ -1331,7 +1688,7 @@ def test_stream_entfernt_reine_telemetrie_diagnose(monkeypatch):
     try:
         assert next(response.response).decode("utf-8") == ": verbunden\n\n"
         payload = next(response.response).decode("utf-8")
-        daten = json.loads(payload.removeprefix("data: ").strip())
+        daten = _sse_daten(payload)
         assert daten["fleet_telemetry_received_at"] == 1234
         assert daten["drive_state"]["speed"] == 12
         assert isinstance(daten["stream_sent_at"], int)
@@ -1357,7 +1714,7 @@ def test_streamstart_fordert_kein_telemetrieprofil_an(monkeypatch):
 
     try:
         assert next(response.response).decode("utf-8") == ": verbunden\n\n"
-        assert next(response.response).decode("utf-8").startswith("data: ")
+        assert "data" in _sse_felder(next(response.response).decode("utf-8"))
         assert angefordert == []
     finally:
         response.close()
@@ -1380,6 +1737,156 @@ def test_subscriber_stream_bekommt_stabile_snapshots(monkeypatch):
     assert snapshot["path"] == [[51.0, 7.0]]
 
 
+def test_subscriber_snapshots_teilen_unveraenderte_teilbaeume(monkeypatch):
+    ziel_queue = app.queue.Queue(maxsize=5)
+    daten = {
+        "drive_state": {"speed": 1, "shift_state": "D"},
+        "vehicle_config": {"car_type": "models", "wheel_type": "Slipstream19"},
+        "fleet_telemetry_raw": {"VehicleSpeed": 1},
+        "charge_state": {"battery_level": 80},
+        "path": [[51.0, 7.0]],
+    }
+    monkeypatch.setattr(app, "_daten_kopien", {})
+    monkeypatch.setattr(app, "_stream_revisionen", {})
+    monkeypatch.setattr(app, "subscribers", {"veh-1": [ziel_queue]})
+
+    app._subscriber_daten_senden("veh-1", daten)
+    daten["drive_state"]["speed"] = 2
+    daten["path"].append([51.1, 7.1])
+    app._subscriber_daten_senden("veh-1", daten)
+    daten["charge_state"]["battery_level"] = True
+    app._subscriber_daten_senden("veh-1", daten)
+
+    erster = ziel_queue.get_nowait()
+    zweiter = ziel_queue.get_nowait()
+    dritter = ziel_queue.get_nowait()
+    assert zweiter["vehicle_config"] is erster["vehicle_config"]
+    assert zweiter["drive_state"] is not erster["drive_state"]
+    assert erster["drive_state"]["speed"] == 1
+    assert zweiter["path"][0] is erster["path"][0]
+    assert erster["path"] == [[51.0, 7.0]]
+    assert zweiter["path"] == [[51.0, 7.0], [51.1, 7.1]]
+    assert dritter["charge_state"]["battery_level"] is True
+    assert erster["charge_state"]["battery_level"] == 80
+    assert app._json_merge_patch(zweiter, dritter) == {
+        "charge_state": {"battery_level": True},
+    }
+
+
+def test_cache_kopie_ohne_live_metadaten_teilt_teilbaeume(monkeypatch):
+    monkeypatch.setattr(app, "_daten_kopien", {})
+    daten = {
+        "_live": True,
+        "state_checked_at": 1,
+        "gui_settings": {"gui_distance_units": "km/hr"},
+        "drive_state": {"speed": 1},
+    }
+
+    erste = app._fleet_telemetrie_cache_kopie(daten, "veh-1")
+    daten["drive_state"]["speed"] = 2
+    zweite = app._fleet_telemetrie_cache_kopie(daten, "veh-1")
+
+    assert "_live" not in zweite and "state_checked_at" not in zweite
+    assert zweite["gui_settings"] is erste["gui_settings"]
+    assert erste["drive_state"] == {"speed": 1}
+    assert zweite["drive_state"] == {"speed": 2}
+    assert daten["_live"] is True
+
+
+def test_cache_journal_schreibt_nur_geaenderte_felder(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "_cache_journal_staende", {})
+    daten = {
+        "state": "online",
+        "drive_state": {"speed": 10, "heading": 90, "shift_state": "D"},
+        "charge_state": {"battery_level": 80},
+    }
+
+    app._save_cached("veh-1", daten)
+    snapshot = pathlib.Path(app._cache_file("veh-1")).read_text(encoding="utf-8")
+    daten["drive_state"]["speed"] = None
+    del daten["drive_state"]["shift_state"]
+    daten["charge_state"] = 5
+    del daten["state"]
+    app._save_cached("veh-1", daten)
+    app._save_cached("veh-1", daten)
+
+    assert pathlib.Path(app._cache_file("veh-1")).read_text(encoding="utf-8") == snapshot
+    zeilen = pathlib.Path(app._cache_journal_file("veh-1")).read_text(
+        encoding="utf-8"
+    ).splitlines()
+    assert len(zeilen) == 2
+    assert json.loads(zeilen[1]) == {
+        "set": {"charge_state": 5},
+        "del": ["state"],
+        "merge": {"drive_state": {"speed": None}},
+        "merge_del": {"drive_state": ["shift_state"]},
+    }
+    assert app._load_cached("veh-1") == daten
+
+
+def test_cache_journal_uebersteht_abgebrochene_schreibvorgaenge(
+    monkeypatch,
+    tmp_path,
+):
+    monkeypatch.setattr(app, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "_cache_journal_staende", {})
+    monkeypatch.setattr(app, "CACHE_JOURNAL_MAX_BYTES", 100)
+    daten = {"drive_state": {"speed": 0, "odometer": 1000.0}}
+
+    app._save_cached("veh-1", daten)
+    for geschwindigkeit in range(1, 6):
+        daten["drive_state"]["speed"] = geschwindigkeit
+        app._save_cached("veh-1", daten)
+    journal = pathlib.Path(app._cache_journal_file("veh-1"))
+    assert len(journal.read_text(encoding="utf-8").splitlines()) < 6
+    assert app._load_cached("veh-1") == daten
+
+    # Abgeschnittene letzte Journalzeile nach einem Absturz.
+    with journal.open("a", encoding="utf-8") as datei:
+        datei.write('{"merge":{"drive_state":{"spe')
+    assert app._load_cached("veh-1") == daten
+
+    # Absturz nach neuem Snapshot, aber vor dem neuen Journal: das alte
+    # Journal gehört zu einer anderen Generation und wird ignoriert.
+    altes_journal = journal.read_text(encoding="utf-8")
+    monkeypatch.setattr(app, "_cache_journal_staende", {})
+    daten["drive_state"]["speed"] = 99
+    app._save_cached("veh-1", daten)
+    journal.write_text(altes_journal + '{"merge":{"drive_state":{"speed":1}}}\n')
+    assert app._load_cached("veh-1") == daten
+
+
+def test_cache_journal_haengt_fahrtpfad_nur_an(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "_cache_journal_staende", {})
+    pfad = [[51.45 + index * 1e-4, 7.01, 30, "D"] for index in range(1000)]
+    daten = {"state": "online", "path": pfad, "path_generation": 1}
+
+    app._save_cached("veh-1", daten)
+    snapshot = pathlib.Path(app._cache_file("veh-1")).read_text(encoding="utf-8")
+    journal = pathlib.Path(app._cache_journal_file("veh-1"))
+    for index in range(60):
+        pfad.append([51.6 + index * 1e-4, 7.02, 40, "D"])
+        app._save_cached("veh-1", daten)
+
+    zeilen = journal.read_text(encoding="utf-8").splitlines()
+    assert len(zeilen) == 61
+    assert max(len(zeile) for zeile in zeilen[1:]) < 100
+    assert json.loads(zeilen[-1]) == {"path_append": [[51.6059, 7.02, 40, "D"]]}
+    assert pathlib.Path(app._cache_file("veh-1")).read_text(encoding="utf-8") == snapshot
+    assert app._load_cached("veh-1") == daten
+
+    daten["path"] = [[52.0, 8.0, 10, "D"]]
+    daten["path_generation"] = 2
+    app._save_cached("veh-1", daten)
+
+    assert json.loads(journal.read_text(encoding="utf-8").splitlines()[-1]) == {
+        "set": {"path": [[52.0, 8.0, 10, "D"]], "path_generation": 2},
+    }
+    assert app._load_cached("veh-1") == daten
+
+
 def test_subscriber_stream_ersetzt_rueckstand_durch_neuesten_snapshot(monkeypatch):
     ziel_queue = app.queue.Queue(maxsize=1)
     monkeypatch.setattr(app, "subscribers", {"veh-1": [ziel_queue]})
@@ -1392,6 +1899,383 @@ def test_subscriber_stream_ersetzt_rueckstand_durch_neuesten_snapshot(monkeypatc
     assert ziel_queue.empty()
 
 
+def test_subscriber_teilen_einen_snapshot_je_revision(monkeypatch):
+    erste_queue = app.queue.Queue(maxsize=1)
+    zweite_queue = app.queue.Queue(maxsize=1)
+    kopien = []
+    original_kopie = app._subscriber_daten_kopie
+    monkeypatch.setattr(
+        app,
+        "_subscriber_daten_kopie",
+        lambda daten, *args: kopien.append(1) or original_kopie(daten, *args),
+    )
+    monkeypatch.setattr(app, "_stream_revisionen", {})
+    monkeypatch.setattr(app, "subscribers", {"veh-1": [erste_queue, zweite_queue]})
+
+    app._subscriber_daten_senden("veh-1", {
+        "drive_state": {"speed": 1},
+        "fleet_telemetry_last_field": "VehicleSpeed",
+        "path": [[51.0, 7.0], [51.1, 7.1]],
+    })
+
+    erster = erste_queue.get_nowait()
+    assert erster is zweite_queue.get_nowait()
+    assert len(kopien) == 1
+    assert erster.revision == 1
+    assert erster.feldklasse == "kritisch"
+    assert "fleet_telemetry_last_field" not in erster
+
+    rumpf, pfadlaenge, _generation = erster.frame(1, None)
+    assert erster.frame(1, None)[0] is rumpf
+    assert pfadlaenge == 2
+    daten = json.loads(app._stream_frame(rumpf, 5).removeprefix("data: "))
+    assert daten["path_delta"] == [[51.1, 7.1]]
+    assert "path" not in daten
+    assert daten["stream_sent_at"] == 5
+    assert erster["path"] == [[51.0, 7.0], [51.1, 7.1]]
+
+
+def test_subscriber_ohne_client_erzeugt_keinen_snapshot(monkeypatch):
+    monkeypatch.setattr(app, "_stream_revisionen", {})
+    monkeypatch.setattr(app, "_stream_letzte_trennung", {})
+    monkeypatch.setattr(app, "subscribers", {})
+    monkeypatch.setattr(
+        app,
+        "_subscriber_stream_payload",
+        lambda daten: (_ for _ in ()).throw(AssertionError("keine Kopie erwartet")),
+    )
+
+    app._subscriber_daten_senden("veh-1", {"drive_state": {"speed": 1}})
+
+    assert app._stream_revisionen == {"veh-1": 1}
+
+
+def test_json_merge_patch_enthaelt_nur_aenderungen():
+    alt = {"a": 1, "b": {"c": 2, "d": 3}, "e": [1], "weg": True, "path": [1]}
+    neu = {"a": 1, "b": {"c": 2, "d": 4}, "e": [1, 2], "neu": None, "path": [1, 2]}
+
+    assert app._json_merge_patch(alt, neu, app.STREAM_PFAD_FELDER) == {
+        "b": {"d": 4},
+        "e": [1, 2],
+        "neu": None,
+        "weg": None,
+    }
+
+
+def test_stream_delta_modus_sendet_merge_patch(monkeypatch):
+    monkeypatch.setattr(app, "_start_thread", lambda vehicle_id: None)
+    monkeypatch.setattr(app, "_fahrtpfad_nach_parkzeit_bereinigen", lambda _daten: False)
+    monkeypatch.setattr(app, "_stream_revisionen", {"veh-1": 7})
+    monkeypatch.setattr(app, "subscribers", {})
+    monkeypatch.setattr(app, "latest_data", {
+        "veh-1": {
+            "drive_state": {"speed": 10, "shift_state": "D"},
+            "charge_state": {"battery_level": 80},
+            "path": [[51.0, 7.0]],
+        },
+    })
+
+    response = app.app.test_client().get("/stream/veh-1?mode=delta", buffered=False)
+
+    try:
+        assert next(response.response).decode("utf-8") == ": verbunden\n\n"
+        initial = _sse_daten(next(response.response).decode("utf-8"))
+        assert initial["stream_revision"] == 7
+        assert initial["charge_state"]["battery_level"] == 80
+
+        app._subscriber_daten_senden("veh-1", {
+            "drive_state": {"speed": 20, "shift_state": "D"},
+            "charge_state": {"battery_level": 80},
+            "path": [[51.0, 7.0], [51.1, 7.1]],
+        })
+        frame = next(response.response).decode("utf-8")
+        assert _sse_felder(frame)["event"] == "delta"
+        delta = _sse_daten(frame)
+        assert delta["revision"] == 8
+        assert delta["base_revision"] == 7
+        assert delta["patch"] == {"drive_state": {"speed": 20}}
+        assert delta["path_delta"] == [[51.1, 7.1]]
+        assert isinstance(delta["stream_sent_at"], int)
+    finally:
+        response.close()
+
+
+def _stream_verlauf_vorbereiten(monkeypatch):
+    monkeypatch.setattr(app, "_start_thread", lambda vehicle_id: None)
+    monkeypatch.setattr(app, "_fahrtpfad_nach_parkzeit_bereinigen", lambda _daten: False)
+    monkeypatch.setattr(app, "subscribers", {})
+    monkeypatch.setattr(app, "_stream_verlauf", {})
+    monkeypatch.setattr(app, "_stream_letzte_trennung", {"veh-1": app.time.monotonic()})
+    monkeypatch.setattr(app, "_stream_revisionen", {})
+    monkeypatch.setattr(app, "latest_data", {
+        "veh-1": {"drive_state": {"speed": 30}, "path": [[51.0, 7.0]] * 3},
+    })
+    for speed, punkte in ((10, 1), (20, 2), (30, 3)):
+        app._subscriber_daten_senden(
+            "veh-1",
+            {"drive_state": {"speed": speed}, "path": [[51.0, 7.0]] * punkte},
+        )
+
+
+def test_stream_fortsetzung_sendet_nur_verpasste_aenderungen(monkeypatch):
+    _stream_verlauf_vorbereiten(monkeypatch)
+
+    response = app.app.test_client().get(
+        "/stream/veh-1?mode=delta",
+        headers={"Last-Event-ID": f"{app.STREAM_EPOCHE}-1"},
+        buffered=False,
+    )
+
+    try:
+        assert next(response.response).decode("utf-8") == ": verbunden\n\n"
+        frame = _sse_felder(next(response.response).decode("utf-8"))
+        assert frame["id"] == f"{app.STREAM_EPOCHE}-3"
+        assert frame["event"] == "delta"
+        delta = json.loads(frame["data"])
+        assert delta["base_revision"] == 1
+        assert delta["patch"] == {"drive_state": {"speed": 30}}
+        assert delta["path_delta"] == [[51.0, 7.0]] * 2
+    finally:
+        response.close()
+
+
+def test_stream_fortsetzung_mit_fremder_id_sendet_vollstand(monkeypatch):
+    _stream_verlauf_vorbereiten(monkeypatch)
+
+    response = app.app.test_client().get(
+        "/stream/veh-1",
+        headers={"Last-Event-ID": "anderer-prozess-2"},
+        buffered=False,
+    )
+
+    try:
+        assert next(response.response).decode("utf-8") == ": verbunden\n\n"
+        frame = _sse_felder(next(response.response).decode("utf-8"))
+        assert frame["id"] == f"{app.STREAM_EPOCHE}-3"
+        daten = json.loads(frame["data"])
+        assert daten["drive_state"]["speed"] == 30
+        assert len(daten["path"]) == 3
+    finally:
+        response.close()
+
+
+def test_stream_abo_liest_profil_und_felder():
+    schluessel, felder = app._stream_abo_lesen(
+        "charge_state.battery_level,drive_state.speed", "map"
+    )
+
+    assert felder["drive_state"] >= {"latitude", "longitude", "speed"}
+    assert felder["charge_state"] == {"battery_level"}
+    assert felder["path"] is None
+    assert felder["path_generation"] is None
+    assert app._stream_abo_lesen("drive_state.speed,path")[0] == (
+        "drive_state.speed,path,path_generation"
+    )
+    assert app._stream_abo_lesen() is None
+    with pytest.raises(ValueError):
+        app._stream_abo_lesen(profile="unbekannt")
+
+
+def test_stream_abo_weckt_nur_bei_abonnierter_aenderung(monkeypatch):
+    monkeypatch.setattr(app, "_stream_revisionen", {})
+    monkeypatch.setattr(app, "_stream_verlauf", {})
+    monkeypatch.setattr(app, "_stream_letzte_trennung", {})
+    q = app._StreamQueue(maxsize=5, abo=app._stream_abo_lesen("drive_state.speed"))
+    monkeypatch.setattr(app, "subscribers", {"veh-1": [q]})
+
+    app._subscriber_daten_senden(
+        "veh-1",
+        {"drive_state": {"speed": 10}, "charge_state": {"battery_level": 80}},
+    )
+    app._subscriber_daten_senden(
+        "veh-1",
+        {
+            "drive_state": {"speed": 10},
+            "charge_state": {"battery_level": 79},
+            "timestamp": 1,
+        },
+    )
+    app._subscriber_daten_senden("veh-1", {"drive_state": {"speed": 11}})
+
+    assert q.qsize() == 2
+    assert dict(q.get_nowait()) == {"drive_state": {"speed": 10}}
+    assert q.get_nowait().revision == 3
+
+
+def test_stream_rate_liest_ratenklassen():
+    assert app._stream_rate_lesen() is None
+    assert app._stream_rate_lesen("1hz") == 1.0
+    assert app._stream_rate_lesen("0.2hz") == 5.0
+    assert app._stream_rate_lesen("100hz") == (
+        app.FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS
+    )
+    for ungueltig in ("schnell", "0hz", "-1hz", "0.001hz", "nanhz"):
+        with pytest.raises(ValueError):
+            app._stream_rate_lesen(ungueltig)
+
+
+def test_stream_ratenklasse_fasst_zwischenstaende_zusammen(monkeypatch):
+    monkeypatch.setattr(app, "_start_thread", lambda vehicle_id: None)
+    monkeypatch.setattr(app, "_fahrtpfad_nach_parkzeit_bereinigen", lambda _daten: False)
+    monkeypatch.setattr(app, "subscribers", {})
+    monkeypatch.setattr(app, "_stream_revisionen", {})
+    monkeypatch.setattr(app, "latest_data", {})
+    monkeypatch.setattr(app, "FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS", 0.05)
+    client = app.app.test_client()
+
+    response = client.get("/stream/veh-1?rate=5hz", buffered=False)
+
+    try:
+        assert next(response.response).decode("utf-8") == ": verbunden\n\n"
+        q = app.subscribers["veh-1"][0]
+        assert q.intervall == pytest.approx(0.2)
+        assert q.rate == "5hz"
+        for speed in (10, 20, 30):
+            app._subscriber_daten_senden("veh-1", {"drive_state": {"speed": speed}})
+        daten = _sse_daten(next(response.response).decode("utf-8"))
+        assert daten["drive_state"]["speed"] == 30
+        assert q.zusammengefasst == 2
+        assert q.wartet_seit is None
+        naechster = app.time.monotonic()
+        app._subscriber_daten_senden("veh-1", {"drive_state": {"speed": 40}})
+        daten = _sse_daten(next(response.response).decode("utf-8"))
+        assert daten["drive_state"]["speed"] == 40
+        assert app.time.monotonic() - naechster >= 0.15
+        heartbeat = _sse_felder(next(response.response).decode("utf-8"))
+        assert heartbeat["event"] == "stream"
+        assert q.gesendet == 2
+        assert q.status()["lag_ms"] >= 150
+    finally:
+        response.close()
+    assert client.get("/stream/veh-1?rate=schnell").status_code == 400
+
+
+def test_langsamer_stream_client_wird_verdraengt(monkeypatch):
+    monkeypatch.setattr(app, "_stream_revisionen", {})
+    monkeypatch.setattr(app, "_stream_verlauf", {})
+    monkeypatch.setattr(app, "_stream_letzte_trennung", {})
+    monkeypatch.setattr(app, "active_clients", {"client-1": {"pages": ["index.html"]}})
+    langsam = app._StreamQueue(maxsize=1, client="client-1")
+    flott = app._StreamQueue(maxsize=1)
+    monkeypatch.setattr(app, "subscribers", {"veh-1": [langsam, flott]})
+
+    app._subscriber_daten_senden("veh-1", {"drive_state": {"speed": 10}})
+    flott.get_nowait()
+    flott.abgeholt()
+    langsam.wartet_seit -= app.FLEET_TELEMETRY_STREAM_SLOW_CONSUMER_SECONDS + 1
+    app._subscriber_daten_senden("veh-1", {"drive_state": {"speed": 20}})
+
+    assert app.subscribers["veh-1"] == [flott]
+    assert langsam.verdraengt
+    assert app.active_clients["client-1"]["stream_evictions"] == 1
+    assert flott.get_nowait()["drive_state"]["speed"] == 20
+
+
+def test_fahrzeug_frame_packt_heisse_felder_binaer():
+    alt = app._StreamSnapshot({
+        "drive_state": {"latitude": 51.0, "longitude": 7.0, "shift_state": "D"},
+        "charge_state": {"battery_level": 80, "charging_state": "Disconnected"},
+        "path": [[51.0, 7.0]],
+    }, 4)
+    neu = app._StreamSnapshot({
+        "drive_state": {"latitude": 51.1, "longitude": 7.0, "shift_state": "D"},
+        "charge_state": {"charging_state": "Charging"},
+        "path": [[51.0, 7.0], [51.1, 7.0]],
+    }, 5)
+
+    voll, pfadlaenge, generation = app._fahrzeug_frame_voll(alt)
+    art, revision, basis, _gesendet, werte, rest = app._fahrzeug_frame_lesen(voll)
+    assert (art, revision, basis, pfadlaenge) == (app.FAHRZEUG_FRAME_VOLL, 4, 0, 1)
+    assert werte == {0: 51.0, 1: 7.0, 6: 80.0}
+    assert rest["drive_state"] == {"shift_state": "D"}
+    assert rest["path"] == [[51.0, 7.0]]
+
+    delta, pfadlaenge, _generation = app._fahrzeug_frame_delta(
+        alt, neu, pfadlaenge, generation
+    )
+    art, revision, basis, _gesendet, werte, rest = app._fahrzeug_frame_lesen(delta)
+    assert (art, revision, basis, pfadlaenge) == (app.FAHRZEUG_FRAME_DELTA, 5, 4, 2)
+    assert werte == {0: 51.1}
+    assert rest["patch"] == {
+        "charge_state": {"battery_level": None, "charging_state": "Charging"},
+    }
+    assert rest["path_delta"] == [[51.1, 7.0]]
+    assert len(delta) < len(json.dumps(dict(neu)))
+
+
+def test_fahrzeug_namespace_sendet_raum_frames(monkeypatch):
+    monkeypatch.setattr(app, "_start_thread", lambda vehicle_id: None)
+    monkeypatch.setattr(app, "_fahrtpfad_nach_parkzeit_bereinigen", lambda _daten: False)
+    monkeypatch.setattr(app, "subscribers", {})
+    monkeypatch.setattr(app, "_stream_revisionen", {"veh-1": 3})
+    monkeypatch.setattr(app, "_stream_verlauf", {})
+    monkeypatch.setattr(app, "_stream_letzte_trennung", {})
+    monkeypatch.setattr(app, "_fahrzeug_kanaele", {})
+    monkeypatch.setattr(app, "FLEET_TELEMETRY_STREAM_MIN_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr(app, "latest_data", {
+        "veh-1": {"drive_state": {"speed": 10, "shift_state": "D"}},
+    })
+    client = app.socketio.test_client(app.app, namespace=app.FAHRZEUG_NAMESPACE)
+
+    def frames():
+        return [
+            app._fahrzeug_frame_lesen(paket["args"][0])
+            for paket in client.get_received(app.FAHRZEUG_NAMESPACE)
+            if paket["name"] == "vehicle_frame"
+        ]
+
+    try:
+        antwort = client.emit(
+            "subscribe",
+            {"vehicle": "veh-1"},
+            namespace=app.FAHRZEUG_NAMESPACE,
+            callback=True,
+        )
+        assert antwort == {"ok": True, "vehicle": "veh-1"}
+        (voll,) = frames()
+        assert voll[:3] == (app.FAHRZEUG_FRAME_VOLL, 3, 0)
+        assert voll[4] == {3: 10.0}
+
+        app._subscriber_daten_senden(
+            "veh-1", {"drive_state": {"speed": 20, "shift_state": "D"}}
+        )
+        app.socketio.sleep(0.1)
+        (delta,) = [frame for frame in frames() if frame[0] != app.FAHRZEUG_FRAME_HERZSCHLAG]
+        assert delta[:3] == (app.FAHRZEUG_FRAME_DELTA, 4, 3)
+        assert delta[4] == {3: 20.0}
+        assert delta[5]["patch"] == {}
+    finally:
+        client.disconnect(namespace=app.FAHRZEUG_NAMESPACE)
+    app.socketio.sleep(app.FLEET_TELEMETRY_STREAM_KEEPALIVE_SECONDS + 0.1)
+    assert app._fahrzeug_kanaele == {}
+
+
+def test_stream_profil_sendet_nur_abonnierte_teilbaeume(monkeypatch):
+    monkeypatch.setattr(app, "_start_thread", lambda vehicle_id: None)
+    monkeypatch.setattr(app, "_fahrtpfad_nach_parkzeit_bereinigen", lambda _daten: False)
+    monkeypatch.setattr(app, "subscribers", {})
+    monkeypatch.setattr(app, "latest_data", {
+        "veh-1": {
+            "drive_state": {"latitude": 51.0, "longitude": 7.0, "power": 12},
+            "charge_state": {"battery_level": 80},
+            "path": [[51.0, 7.0]],
+        },
+    })
+    client = app.app.test_client()
+
+    response = client.get("/stream/veh-1?profile=map", buffered=False)
+
+    try:
+        assert next(response.response).decode("utf-8") == ": verbunden\n\n"
+        daten = _sse_daten(next(response.response).decode("utf-8"))
+        assert daten["drive_state"] == {"latitude": 51.0, "longitude": 7.0}
+        assert daten["path"] == [[51.0, 7.0]]
+        assert "charge_state" not in daten
+    finally:
+        response.close()
+    assert client.get("/stream/veh-1?profile=unbekannt").status_code == 400
+
+
 def test_fahrtpfad_nutzt_serverzeit_für_zehn_minuten(monkeypatch):
     parkbeginn = 1_700_000_000_000
     pfad = [[51.0, 7.0], [51.1, 7.1]]
@@ -1456,15 +2340,11 @@ def test_stream_setzt_fahrtpfad_ohne_neue_telemetrie_zurück(monkeypatch):
 
     try:
         assert next(response.response).decode("utf-8") == ": verbunden\n\n"
-        initial = json.loads(
-            next(response.response).decode("utf-8").removeprefix("data: ")
-        )
+        initial = _sse_daten(next(response.response).decode("utf-8"))
         assert initial["path"] == pfad
 
         jetzt[0] = parkbeginn + app.FAHRTPFAD_NACH_PARKEN_MS
-        reset = json.loads(
-            next(response.response).decode("utf-8").removeprefix("data: ")
-        )
+        reset = _sse_daten(next(response.response).decode("utf-8"))
 
         assert reset["path_reset"] is True
         assert reset["path"] == []
@@ -1497,9 +2377,7 @@ def test_stream_erkennt_neuen_fahrtpfad_auch_bei_gleicher_punktzahl(
 
     try:
         assert next(response.response).decode("utf-8") == ": verbunden\n\n"
-        erstes_payload = json.loads(
-            next(response.response).decode("utf-8").removeprefix("data: ")
-        )
+        erstes_payload = _sse_daten(next(response.response).decode("utf-8"))
         assert erstes_payload["path"] == alter_pfad
 
         app._subscriber_daten_senden(
@@ -1510,9 +2388,7 @@ def test_stream_erkennt_neuen_fahrtpfad_auch_bei_gleicher_punktzahl(
                 "path_generation": 5,
             },
         )
-        neuer_streamstand = json.loads(
-            next(response.response).decode("utf-8").removeprefix("data: ")
-        )
+        neuer_streamstand = _sse_daten(next(response.response).decode("utf-8"))
 
         assert neuer_streamstand["path_reset"] is True
         assert neuer_streamstand["path"] == neuer_pfad
@@ -1553,6 +2429,106 @@ def test_fleet_telemetrie_adressauflösung_blockiert_livepfad_nicht(monkeypatch)
     assert geplant == [("veh-1", 51.0, 7.0)]
 
 
+def test_fleet_telemetrie_ableitungen_inkrementell_wie_vollstaendig(monkeypatch):
+    import copy
+
+    monkeypatch.setattr(app, "latest_data", {})
+    monkeypatch.setattr(app, "_load_cached", lambda _cache_id: None)
+    monkeypatch.setattr(app, "address_cache", {})
+    monkeypatch.setattr(app, "track_park_time", lambda data: None)
+    monkeypatch.setattr(app, "park_duration_string", lambda _start: "")
+    monkeypatch.setattr(app, "track_drive_path", lambda data: None)
+    monkeypatch.setattr(app, "trip_path", [])
+    monkeypatch.setattr(
+        app, "_fleet_telemetrie_adresse_spaeter_aktualisieren", lambda *_args: None
+    )
+
+    def ladeinformationen(cache_id, data):
+        charge = data["charge_state"]
+        charge["abgeleitet"] = (charge.get("battery_level"), charge.get("charger_power"))
+        return data
+
+    monkeypatch.setattr(
+        app, "_fleet_telemetrie_ladeinformationen_aktualisieren", ladeinformationen
+    )
+    reihenfolge = (
+        "vorklimatisierung",
+        *app.FLEET_TELEMETRIE_DASHBOARD_ABLEITUNGEN,
+        "oeffnungen",
+    )
+    assert set(reihenfolge) == set(app.FLEET_TELEMETRIE_ABLEITUNGEN)
+    assert "charge_state" in app.FLEET_TELEMETRIE_ABLEITUNGEN["ladeinformationen"][
+        "eingaben"
+    ]
+    assert app.FLEET_TELEMETRIE_ABLEITUNGEN["parkzeit"]["eingaben"] is None
+
+    basis = {
+        "id_s": "veh-1",
+        "state": "online",
+        "timestamp": 1_700_000_000_000,
+        "drive_state": {
+            "latitude": 51.0,
+            "longitude": 7.0,
+            "shift_state": "P",
+            "speed": 0,
+            "active_route_destination": "Essen",
+            "active_route_minutes_to_arrival": 12,
+        },
+        "charge_state": {"battery_level": 70},
+        "vehicle_state": {"locked": True, "fd_window": 0},
+        "climate_state": {},
+        "vehicle_config": {},
+        "gui_settings": {},
+        "fleet_telemetry_raw": {"FdWindow": "WindowStateClosed"},
+    }
+    app._fleet_telemetrie_ableitungen_ausfuehren("veh-1", basis, reihenfolge)
+    werte = (
+        None,
+        0,
+        1,
+        12.5,
+        True,
+        False,
+        "Unknown",
+        {"latitude": 52.5, "longitude": 13.4},
+    )
+    geprueft = 0
+    for feld in sorted(app.FLEET_TELEMETRIE_FELDHANDLER):
+        for wert in werte:
+            inkrementell = copy.deepcopy(basis)
+            vollstaendig = copy.deepcopy(basis)
+            try:
+                app._fleet_telemetrie_setze_feld(inkrementell, feld, wert, 1_700_000_001_000)
+            except Exception:
+                continue
+            app._fleet_telemetrie_setze_feld(vollstaendig, feld, wert, 1_700_000_001_000)
+
+            app._fleet_telemetrie_ableitungen_ausfuehren(
+                "veh-1", inkrementell, reihenfolge, {feld}
+            )
+            app._fleet_telemetrie_ableitungen_ausfuehren(
+                "veh-1", vollstaendig, reihenfolge
+            )
+
+            assert inkrementell == vollstaendig, (feld, wert)
+            geprueft += 1
+
+    assert geprueft > len(app.FLEET_TELEMETRIE_FELDHANDLER)
+
+    # Eingaben außerhalb der Telemetry, z. B. aus /api/occupant
+    for anwesend in (True, False):
+        monkeypatch.setattr(app, "occupant_present", anwesend)
+        inkrementell = copy.deepcopy(basis)
+        vollstaendig = copy.deepcopy(basis)
+        app._fleet_telemetrie_ableitungen_ausfuehren(
+            "veh-1", inkrementell, reihenfolge, {"occupant_present"}
+        )
+        app._fleet_telemetrie_ableitungen_ausfuehren("veh-1", vollstaendig, reihenfolge)
+
+        assert inkrementell == vollstaendig, anwesend
+        assert inkrementell["preconditioning_display_allowed"] is not anwesend
+
+
 def test_fleet_telemetrie_adress_worker_sendet_spaetes_update(monkeypatch):
     ziel_queue = app.queue.Queue(maxsize=1)
     monkeypatch.setattr(app, "address_cache", {})
@@ -1575,6 +2551,68 @@ def test_fleet_telemetrie_adress_worker_sendet_spaetes_update(monkeypatch):
     assert app.address_cache["veh-1"]["address"] == "Teststraße 1, 45143 Essen"
 
 
+def test_fleet_telemetrie_feldhandler_tabelle_deckt_bekannte_felder_ab():
+    for feld in (
+        "Location",
+        "Gear",
+        "Soc",
+        "DoorState",
+        "HvacPower",
+        "CarType",
+        "SettingDistanceUnit",
+        *app.FLEET_TELEMETRIE_TPMS_DRUCKFELDER,
+        *app.FLEET_TELEMETRIE_TPMS_ZEITFELDER,
+    ):
+        assert app.FLEET_TELEMETRIE_FELDHANDLER[feld] is (
+            app._fleet_telemetrie_feldhandler_suchen(feld)
+        )
+    assert app.FLEET_TELEMETRIE_FELDBEREICHE["Gear"] == "drive_state"
+    assert app.FLEET_TELEMETRIE_FELDBEREICHE["TpmsPressureFl"] == "vehicle_state"
+    assert app._fleet_telemetrie_feldhandler_suchen(
+        "MediaNowPlayingTitle"
+    ) is app._fleet_telemetrie_feld_media
+    assert app._fleet_telemetrie_feldhandler_suchen(
+        "SoftwareUpdateVersion"
+    ) is app._fleet_telemetrie_feld_software_update
+    assert app._fleet_telemetrie_feldhandler_suchen("UnbekanntesFeld") is None
+
+
+def test_fleet_telemetrie_unbekanntes_feld_landet_nur_in_rohdaten():
+    daten = {}
+
+    assert app._fleet_telemetrie_setze_feld(daten, "UnbekanntesFeld", 5, 1234)
+
+    assert daten["fleet_telemetry_raw"] == {"UnbekanntesFeld": 5}
+    assert all(
+        daten[bereich] == {}
+        for bereich in (
+            "drive_state",
+            "charge_state",
+            "vehicle_state",
+            "climate_state",
+            "vehicle_config",
+            "gui_settings",
+        )
+    )
+
+
+def test_fleet_telemetrie_einfacher_feldhandler_schreibt_alle_ziele():
+    daten = {}
+
+    assert app._fleet_telemetrie_setze_feld(
+        daten, "DriverSeatOccupied", "true", 1234
+    )
+    assert app._fleet_telemetrie_setze_feld(
+        daten, "ChargePortLatch", "ChargePortLatchEngaged", 1235
+    )
+
+    assert daten["vehicle_state"]["is_user_present"] is True
+    assert daten["vehicle_state"]["driver_present"] is True
+    assert daten["vehicle_state"]["timestamp"] == 1234
+    assert daten["charge_state"]["charge_port_latch"] == "Engaged"
+    assert daten["charge_state"]["timestamp"] == 1235
+
+
 def test_fleet_telemetrie_verwirft_ungueltige_navigationskoordinaten():
     daten = {
         "drive_state": {
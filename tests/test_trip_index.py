@@ -0,0 +1,179 @@
+import os
+
+import app
+
+
+def _trip_schreiben(pfad, zeilen):
+    pfad.parent.mkdir(parents=True, exist_ok=True)
+    pfad.write_text("".join(f"{zeile}\n" for zeile in zeilen), encoding="utf-8")
+
+
+def test_trip_index_listet_nur_geaenderte_verzeichnisse_neu(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "TRIP_INDEX_DB", None)
+    trips = tmp_path / "1" / "trips"
+    _trip_schreiben(trips / "trip_20260510.csv", ["1778400000000,51.45,7.01,30,,,D"])
+    _trip_schreiben(trips / "trip_20260504.csv", ["1778300000000,51.45,7.01,30,,,D"])
+    (tmp_path / "default" / "trips").mkdir(parents=True)
+
+    assert app._get_trip_periods() == (
+        ["2026-W19"],
+        ["2026-05"],
+        ["2026-05-04", "2026-05-10"],
+    )
+
+    aufrufe = []
+    listdir = os.listdir
+    monkeypatch.setattr(
+        app.os, "listdir", lambda pfad: aufrufe.append(pfad) or listdir(pfad)
+    )
+    assert app._get_trip_days() == ["2026-05-04", "2026-05-10"]
+    assert aufrufe == []
+
+    app._log_trip_point(
+        1778400001000, 51.46, 7.02, 40, filename=str(trips / "trip_20260510.csv")
+    )
+    app._outbox_abwarten()
+    _trip_schreiben(trips / "trip_20260511.csv", ["1778500000000,51.45,7.01,30,,,D"])
+
+    assert app._trip_paths_for_scope("week", week="2026-W20") == [
+        str(trips / "trip_20260511.csv"),
+    ]
+    assert aufrufe == [str(trips)]
+    eintrag = app._trip_index_eintraege()[1]
+    assert eintrag["groesse"] == (trips / "trip_20260510.csv").stat().st_size
+
+
+def test_trip_index_speichert_kennzahlen(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "TRIP_INDEX_DB", None)
+    monkeypatch.setattr(app, "_load_cached_statistics", lambda: {})
+    pfad = tmp_path / "1" / "trips" / "trip_20260510.csv"
+    _trip_schreiben(pfad, [
+        "1778400000000,51.45,7.01,30,,,D",
+        "1778400060000,51.46,7.03,40,,,D",
+    ])
+
+    app._trip_index_aktualisieren()
+    erwartet = app._trip_distance(str(pfad))
+    monkeypatch.setattr(
+        app, "_trip_distance", lambda path: (_ for _ in ()).throw(AssertionError(path))
+    )
+    with app._trip_summary_cache_lock:
+        app._trip_summary_cache.update({"signature": None, "data": None})
+
+    eintrag = app._trip_index_eintraege()[0]
+    assert eintrag["distanz"] == erwartet
+    assert eintrag["max_speed"] == 40 * app.MILES_TO_KM
+    assert eintrag["segmente"] == 1
+    assert (eintrag["min_lat"], eintrag["max_lon"]) == (51.45, 7.03)
+    assert app._period_distance("month", "2026-05") == erwartet
+    assert app.compute_trip_summaries() == (
+        {"2026-W19": round(erwartet, 2)},
+        {"2026-05": round(erwartet, 2)},
+    )
+
+
+def test_trip_kennzahlen_ueberdauern_neustart(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "TRIP_INDEX_DB", None)
+    pfad = tmp_path / "1" / "trips" / "trip_20260510.csv"
+    _trip_schreiben(pfad, [
+        "1778400000000,51.45,7.01,30,,,D",
+        "1778400060000,51.46,7.03,40,,,D",
+        "1778400120000,51.46,7.03,0,,,P",
+    ])
+    distanz = app._trip_distance(str(pfad))
+    segmente = app._split_trip_segments(str(pfad))
+    geschwindigkeit = app._trip_max_speed(str(pfad))
+
+    for cache in (
+        app._trip_distance_cache,
+        app._trip_speed_cache,
+        app._trip_segment_cache,
+    ):
+        cache.clear()
+    laden = app._load_trip_spalten
+    monkeypatch.setattr(
+        app, "_load_trip_spalten", lambda path: (_ for _ in ()).throw(AssertionError(path))
+    )
+    monkeypatch.setattr(
+        app, "_load_trip", lambda path: (_ for _ in ()).throw(AssertionError(path))
+    )
+
+    assert app._trip_distance(str(pfad)) == distanz
+    assert app._trip_max_speed(str(pfad)) == geschwindigkeit
+    assert app._split_trip_segments(str(pfad)) == segmente
+
+    with pfad.open("a", encoding="utf-8") as datei:
+        datei.write("1778400180000,51.47,7.05,20,,,D\n")
+    monkeypatch.setattr(app, "_load_trip_spalten", laden)
+
+    assert app._trip_distance(str(pfad)) > distanz
+
+
+def _vollstaendig_auswerten(monkeypatch, pfad, ziel):
+    ziel.write_bytes(pfad.read_bytes())
+    with monkeypatch.context() as m:
+        m.setattr(app, "_trip_akkumulator_auswerten", lambda *args: None)
+        return (
+            app._trip_distance(str(ziel)),
+            app._trip_max_speed(str(ziel)),
+            app._split_trip_segments(str(ziel)),
+        )
+
+
+def test_trip_akkumulator_liest_nur_angehaengte_zeilen(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "TRIP_INDEX_DB", None)
+    pfad = tmp_path / "1" / "trips" / "trip_20260510.csv"
+    _trip_schreiben(pfad, ["1778400000000,51.45,7.01,0,,,P"])
+    gaenge = "PDDDDNDDPPPRDDDDPP"
+
+    for index, gang in enumerate(gaenge, start=1):
+        with pfad.open("a", encoding="utf-8") as datei:
+            datei.write(
+                f"{1778400000000 + index * 7000},{51.45 + index * 0.001:.6f},"
+                f"{7.01 + (index % 4) * 0.002:.6f},{(index * 13) % 45},,,{gang}\n"
+            )
+            if index == 5:
+                datei.write("kaputt\n")
+        erwartet = _vollstaendig_auswerten(
+            monkeypatch, pfad, tmp_path / f"trip_2026051{index % 10}.csv"
+        )
+        assert (
+            app._trip_distance(str(pfad)),
+            app._trip_max_speed(str(pfad)),
+            app._split_trip_segments(str(pfad)),
+        ) == erwartet
+        assert app._trip_akkumulatoren[str(pfad)].offset == pfad.stat().st_size
+
+    with pfad.open("a", encoding="utf-8") as datei:
+        datei.write("1778400200000,51.6,7.")
+    erwartet = _vollstaendig_auswerten(monkeypatch, pfad, tmp_path / "trip_20260520.csv")
+    assert app._trip_distance(str(pfad)) == erwartet[0]
+
+    _trip_schreiben(pfad, [
+        "1778400000000,52.45,8.01,0,,,P",
+        "1778400060000,52.46,8.03,40,,,D",
+    ])
+    erwartet = _vollstaendig_auswerten(monkeypatch, pfad, tmp_path / "trip_20260521.csv")
+    assert app._split_trip_segments(str(pfad)) == erwartet[2]
+    assert app._trip_distance(str(pfad)) == erwartet[0]
+
+
+def test_trip_index_ausfall_liefert_aktuelle_signatur(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "DATA_DIR", str(tmp_path))
+    pfad = tmp_path / "1" / "trips" / "trip_20260510.csv"
+    _trip_schreiben(pfad, ["1778400000000,51.45,7.01,30,,,D"])
+
+    def _kaputt():
+        raise app.sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(app, "_trip_index_conn", _kaputt)
+    vorher = app._trip_dateien_signatur()
+    with pfad.open("a", encoding="utf-8") as datei:
+        datei.write("1778400001000,51.46,7.02,40,,,D\n")
+
+    assert vorher[0][1][1] is not None
+    assert app._trip_dateien_signatur() != vorher
@@ -0,0 +1,63 @@
+import os
+from datetime import date
+
+import app
+
+
+def _trip_schreiben(pfad, zeilen):
+    pfad.parent.mkdir(parents=True, exist_ok=True)
+    pfad.write_text("".join(f"{zeile}\n" for zeile in zeilen), encoding="utf-8")
+
+
+def test_spaltendatei_liefert_dieselben_punkte_wie_csv(tmp_path):
+    pfad = tmp_path / "1" / "trips" / "trip_20260510.csv"
+    _trip_schreiben(pfad, [
+        "1778400000000,51.45,7.01,30.5,12.0,90,D",
+        "1778400001000,51.46,7.02,,,,",
+        "kaputt",
+        ",51.47,7.03,0,-3.5,,P",
+        "1778400003000,51.48,x,1,2,3,D",
+        "1778400004000,51.49,7.05,nan,0,359.5,R",
+    ])
+    erwartet = app._load_trip_csv(str(pfad))
+
+    app._trip_spalten_schreiben(str(pfad))
+    spalten = app._trip_spalten_lesen(str(pfad))
+
+    assert isinstance(spalten.lat, memoryview)
+    assert len(spalten) == 4
+    assert spalten.gaenge == ["D", "P", "R"]
+    assert repr(spalten.punkte()) == repr(erwartet)
+    assert repr(app._load_trip(str(pfad))) == repr(erwartet)
+
+
+def test_veraltete_spaltendatei_wird_ignoriert(tmp_path):
+    pfad = tmp_path / "trip_20260510.csv"
+    _trip_schreiben(pfad, ["1778400000000,51.45,7.01,30,,,D"])
+    app._trip_spalten_schreiben(str(pfad))
+
+    with pfad.open("a", encoding="utf-8") as datei:
+        datei.write("1778400001000,51.46,7.02,40,,,D\n")
+
+    assert app._trip_spalten_lesen(str(pfad)) is None
+    assert [punkt[2] for punkt in app._load_trip(str(pfad))] == [30.0, 40.0]
+    assert app._trip_max_speed(str(pfad)) == 40.0 * app.MILES_TO_KM
+
+
+def test_umwandlung_laesst_laufenden_tag_aus_und_raeumt_auf(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "DATA_DIR", str(tmp_path))
+    trips = tmp_path / "1" / "trips"
+    gestern = trips / "trip_20260509.csv"
+    heute = trips / "trip_20260510.csv"
+    _trip_schreiben(gestern, ["1778300000000,51.45,7.01,30,,,D"])
+    _trip_schreiben(heute, ["1778400000000,51.45,7.01,30,,,D"])
+    verwaist = trips / f"trip_20260501{app.TRIP_SPALTEN_ENDUNG}"
+    verwaist.write_bytes(b"alt")
+
+    anzahl = app._trip_spalten_aktualisieren(heute=date(2026, 5, 10))
+
+    assert anzahl == 1
+    assert app._trip_spalten_lesen(str(gestern)) is not None
+    assert not os.path.exists(app._trip_spalten_pfad(str(heute)))
+    assert not verwaist.exists()
+    assert app._trip_spalten_aktualisieren(heute=date(2026, 5, 10)) == 0
@@ -165,6 +165,7 @@ def test_unveraenderte_packwerte_werden_mit_neuem_zeitstempel_integriert(
             ("PackVoltage", 400.0, start_ms + 10_000),
         ],
     )
+    app._outbox_abwarten()
 
     verbindung = app._v2l_datenbank_öffnen()
     try:
@@ -185,6 +186,49 @@ def test_unveraenderte_packwerte_werden_mit_neuem_zeitstempel_integriert(
     assert sitzung["messabdeckung_prozent"] == pytest.approx(100.0)
 
 
+
+def test_v2l_telemetrie_schreibt_ueber_outbox_ausserhalb_der_sperre(
+    monkeypatch,
+):
+    start_ms = 1_700_250_000_000
+    daten = _v2l_daten(start_ms)
+    monkeypatch.setattr(app, "latest_data", {"fahrzeug-1": daten})
+    profile = []
+    monkeypatch.setattr(
+        app,
+        "_fleet_telemetrie_profile_aktualisieren",
+        lambda cache_id, aktuelle_daten: profile.append(cache_id) or aktuelle_daten,
+    )
+    app._v2l_aktive_fahrzeuge_laden_ungesperrt()
+    datenbank_öffnen = app._v2l_datenbank_öffnen
+
+    def gesperrt():
+        raise AssertionError("Datenbankzugriff unter der Telemetry-Sperre")
+
+    monkeypatch.setattr(app, "_v2l_datenbank_öffnen", gesperrt)
+    for versatz in range(3):
+        daten["charge_state"]["timestamp"] = start_ms + versatz * 1000
+        app._v2l_telemetrie_vormerken(
+            "fahrzeug-1",
+            daten,
+            timestamp_ms=start_ms + versatz * 1000,
+        )
+    assert "v2l_active" not in daten
+    monkeypatch.setattr(app, "_v2l_datenbank_öffnen", datenbank_öffnen)
+
+    app._outbox_abwarten()
+
+    verbindung = app._v2l_datenbank_öffnen()
+    try:
+        zeile = app._v2l_aktive_sitzung_ungesperrt(verbindung, "fahrzeug-1")
+    finally:
+        verbindung.close()
+    assert zeile is not None
+    assert daten["v2l_active"] is True
+    assert daten["v2l_session_id"] == zeile["id"]
+    assert profile == ["fahrzeug-1"]
+    assert "fahrzeug-1" in app._v2l_aktive_fahrzeuge
+
 def test_v2l_gesamtsumme_ist_unabhaengig_vom_anzeigelimit():
     verbindung = app._v2l_datenbank_öffnen()
     try:
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Vergleiche die Geodäsie-Funktionen mit NumPy und in reinem Python.
+
+Erzeugt ein synthetisches Jahr an Trip-Tagen im Speicher und misst je Pfad
+die Gesamtstrecke, die Peilungen und Distanz/Wartezeit der Fahrtabschnitte,
+einmal über den NumPy-Pfad und einmal über den Python-Fallback aus
+``geodaesie``. Ohne installiertes NumPy wird nur der Fallback gemessen.
+"""
+
+import argparse
+import math
+import sys
+import time
+from array import array
+from pathlib import Path
+
+
+TOOLVERZEICHNIS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLVERZEICHNIS.parent))
+
+import geodaesie  # noqa: E402
+
+
+def jahr_erzeugen(tage, punkte):
+    """Liefere je Tag ``(lats, lons, speeds, timestamps, grenzen)``."""
+
+    jahr = []
+    for tag in range(tage):
+        beginn = 1_767_225_600_000 + tag * 86_400_000
+        lats = array("d")
+        lons = array("d")
+        speeds = []
+        timestamps = []
+        for index in range(punkte):
+            winkel = (index + tag) / 500
+            lats.append(51.45 + math.sin(winkel) * 0.05)
+            lons.append(7.01 + math.cos(winkel) * 0.05)
+            speeds.append(abs(math.sin(winkel * 3)) * 70 if index % 7 else None)
+            timestamps.append(beginn + index * 1000)
+        abschnitt = max(2, punkte // 4)
+        grenzen = [
+            (erster, min(punkte - 1, erster + abschnitt - 1))
+            for erster in range(0, punkte - 1, abschnitt)
+        ]
+        jahr.append((lats, lons, speeds, timestamps, grenzen))
+    return jahr
+
+
+def auswerten(jahr, numpy):
+    """Werte alle Tage aus und liefere Summen zum Vergleich."""
+
+    strecke = 0.0
+    peilungen = 0
+    abschnitte = []
+    for lats, lons, speeds, timestamps, grenzen in jahr:
+        strecke += geodaesie.strecke(lats, lons, numpy=numpy)
+        peilungen += len(geodaesie.peilungen(lats, lons, numpy=numpy))
+        abschnitte.extend(
+            geodaesie.abschnitte(lats, lons, speeds, timestamps, grenzen, numpy=numpy)
+        )
+    return strecke, peilungen, abschnitte
+
+
+def dauer_ms(jahr, numpy, wiederholungen):
+    beste = float("inf")
+    ergebnis = None
+    for _ in range(wiederholungen):
+        beginn = time.perf_counter()
+        ergebnis = auswerten(jahr, numpy)
+        beste = min(beste, time.perf_counter() - beginn)
+    return beste * 1000, ergebnis
+
+
+def abweichung(a, b):
+    """Größte relative Abweichung zweier Auswertungen."""
+
+    werte = [(a[0], b[0])]
+    for (dist_a, warte_a), (dist_b, warte_b) in zip(a[2], b[2]):
+        werte.append((dist_a, dist_b))
+        werte.append((warte_a, warte_b))
+    return max(
+        abs(x - y) / max(abs(x), abs(y), 1e-12)
+        for x, y in werte
+    )
+
+
+def benchmark_ausfuehren(tage=365, punkte=2000, wiederholungen=3):
+    """Führe alle Messungen aus und liefere die Ergebnisse als Dictionary."""
+
+    jahr = jahr_erzeugen(tage, punkte)
+    python_ms, python_ergebnis = dauer_ms(jahr, False, wiederholungen)
+    ergebnis = {
+        "tage": tage,
+        "punkte": tage * punkte,
+        "python_ms": python_ms,
+        "strecke_km": python_ergebnis[0],
+        "numpy_ms": None,
+        "abweichung": None,
+    }
+    if geodaesie.numpy_verfuegbar():
+        numpy_ms, numpy_ergebnis = dauer_ms(jahr, True, wiederholungen)
+        ergebnis["numpy_ms"] = numpy_ms
+        ergebnis["abweichung"] = abweichung(python_ergebnis, numpy_ergebnis)
+    return ergebnis
+
+
+def bericht_erstellen(ergebnis):
+    zeilen = [
+        f"{ergebnis['tage']} Trip-Tage, {ergebnis['punkte']} Punkte, "
+        f"{ergebnis['strecke_km']:.1f} km",
+        f"  Python-Fallback  {ergebnis['python_ms']:10.1f} ms",
+    ]
+    if ergebnis["numpy_ms"] is None:
+        zeilen.append("  NumPy            nicht installiert")
+    else:
+        zeilen.append(f"  NumPy            {ergebnis['numpy_ms']:10.1f} ms")
+        zeilen.append(
+            f"  Faktor           {ergebnis['python_ms'] / max(ergebnis['numpy_ms'], 1e-9):10.1f}x"
+        )
+        zeilen.append(f"  max. Abweichung  {ergebnis['abweichung']:10.2e}")
+    return "\n".join(zeilen)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tage", type=int, default=365)
+    parser.add_argument("--punkte", type=int, default=2000)
+    parser.add_argument("--wiederholungen", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    ergebnis = benchmark_ausfuehren(
+        tage=max(1, args.tage),
+        punkte=max(2, args.punkte),
+        wiederholungen=max(1, args.wiederholungen),
+    )
+    print(bericht_erstellen(ergebnis))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# © 2026 Erik Schauer, do1ffe@darc.de
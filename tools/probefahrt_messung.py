@@ -2,10 +2,12 @@
 """Messe frische Fleet-Telemetrie direkt am MQTT-Broker."""
 
 import argparse
+import gzip
 import json
 import os
 import selectors
 import shutil
+import struct
 import subprocess
 import sys
 import time
@@ -51,6 +53,9 @@ KRITISCHE_LIVE_FELDER = {
     "GpsHeading",
 }
 
+MITSCHNITT_KENNUNG = b"TDMQ1\n"
+MITSCHNITT_KOPF = struct.Struct("<dHI")
+
 
 def zeitstempel():
     """Erzeuge einen UTC-Zeitstempel für Dateinamen."""
@@ -97,6 +102,70 @@ def mqtt_zeile_lesen(zeile, topic_basis="tesla"):
     return eintrag
 
 
+def mitschnitt_schreiben(datei, empfangen, topic, payload):
+    """Hänge eine MQTT-Nachricht an einen kompakten Mitschnitt an.
+
+    Jeder Eintrag besteht aus Empfangszeit, Topic-Länge und Payload-Länge
+    gefolgt von den Rohbytes; ``datei`` muss binär geöffnet sein.
+    """
+
+    if isinstance(topic, str):
+        topic = topic.encode("utf-8")
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    datei.write(MITSCHNITT_KOPF.pack(float(empfangen), len(topic), len(payload)))
+    datei.write(topic)
+    datei.write(payload)
+
+
+def mitschnitt_oeffnen(pfad):
+    """Öffne einen neuen gzip-Mitschnitt und schreibe die Kennung."""
+
+    datei = gzip.open(pfad, "wb")
+    datei.write(MITSCHNITT_KENNUNG)
+    return datei
+
+
+def mitschnitt_lesen(pfad):
+    """Liefere ``(empfangen, topic, payload)`` aus einem Mitschnitt.
+
+    Das Topic wird als Text, die Payload als Rohbytes geliefert. Ein
+    abgeschnittener letzter Eintrag wird ignoriert.
+    """
+
+    with gzip.open(pfad, "rb") as datei:
+        if datei.read(len(MITSCHNITT_KENNUNG)) != MITSCHNITT_KENNUNG:
+            raise ValueError(f"{pfad} ist kein Fleet-Telemetry-Mitschnitt.")
+        while True:
+            kopf = datei.read(MITSCHNITT_KOPF.size)
+            if len(kopf) < MITSCHNITT_KOPF.size:
+                return
+            empfangen, topic_laenge, payload_laenge = MITSCHNITT_KOPF.unpack(kopf)
+            topic = datei.read(topic_laenge)
+            payload = datei.read(payload_laenge)
+            if len(topic) < topic_laenge or len(payload) < payload_laenge:
+                return
+            yield empfangen, topic.decode("utf-8", errors="replace"), payload
+
+
+def mitschnitt_aus_zeilen(zeilen, pfad):
+    """Schreibe vorhandene TSV-Messzeilen als Mitschnitt; liefert die Anzahl."""
+
+    anzahl = 0
+    with mitschnitt_oeffnen(pfad) as datei:
+        for zeile in zeilen:
+            teile = zeile.rstrip("\n").split("\t", 2)
+            if len(teile) != 3:
+                continue
+            try:
+                empfangen = float(teile[0])
+            except ValueError:
+                continue
+            mitschnitt_schreiben(datei, empfangen, teile[1], teile[2])
+            anzahl += 1
+    return anzahl
+
+
 def luecken_berechnen(zeiten):
     """Berechne die größte Lücke zwischen frischen MQTT-Nachrichten."""
 
@@ -271,6 +340,9 @@ def vorhandene_datei_auswerten(args):
             json.dumps(auswertung, ensure_ascii=False, indent=2),
             encoding="utf-8",
         )
+    if args.mitschnitt:
+        anzahl = mitschnitt_aus_zeilen(zeilen, args.mitschnitt)
+        print(f"Mitschnitt: {args.mitschnitt} ({anzahl} Nachrichten)")
 
 
 def messung_starten(args):
@@ -309,6 +381,7 @@ def messung_starten(args):
     selector = selectors.DefaultSelector()
     assert prozess.stdout is not None
     selector.register(prozess.stdout, selectors.EVENT_READ)
+    mitschnitt = mitschnitt_oeffnen(args.mitschnitt) if args.mitschnitt else None
 
     try:
         with ausgabe.open("w", encoding="utf-8") as f:
@@ -321,7 +394,19 @@ def messung_starten(args):
                     f.write(zeile)
                     f.flush()
                     zeilen.append(zeile.rstrip("\n"))
+                    if mitschnitt is not None:
+                        teile = zeile.rstrip("\n").split("\t", 2)
+                        if len(teile) == 3:
+                            try:
+                                empfangen = float(teile[0])
+                            except ValueError:
+                                empfangen = time.time()
+                            mitschnitt_schreiben(
+                                mitschnitt, empfangen, teile[1], teile[2]
+                            )
     finally:
+        if mitschnitt is not None:
+            mitschnitt.close()
         if prozess.poll() is None:
             prozess.terminate()
             try:
@@ -347,6 +432,8 @@ def messung_starten(args):
 
     print(f"Messdatei: {ausgabe}")
     print(f"JSON: {json_datei}")
+    if args.mitschnitt:
+        print(f"Mitschnitt: {args.mitschnitt}")
     if fehler:
         print(f"mosquitto_sub stderr: {fehler}", file=sys.stderr)
     print(bericht_erstellen(auswertung, bereiche_auswahl(args.bereich)))
@@ -386,6 +473,13 @@ def parser_erstellen():
         help="Retained MQTT-Werte einbeziehen. Standardmäßig werden nur frische Werte gemessen.",
     )
     parser.add_argument("--auswerten", help="Vorhandene TSV-Messdatei auswerten.")
+    parser.add_argument(
+        "--mitschnitt",
+        help=(
+            "Kompakten Mitschnitt (gzip) für tools/telemetrie_replay.py schreiben; "
+            "mit --auswerten wird die TSV-Datei umgewandelt."
+        ),
+    )
     return parser
 
 
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Miss die Profilsteuerung der Fleet Telemetry mit simulierter Uhr.
+
+Ein synthetischer Tagesablauf aus Parken, Fahrt, Parken und Laden läuft durch
+``_fleet_telemetrie_profile_aktualisieren``. Tesla bestätigt angeforderte
+Profile nach einer festen Verzögerung. Die Simulation läuft einmal mit und
+einmal ohne übersprungene Auswertungen; beide Durchläufe müssen dieselben
+Profile zu denselben Zeitpunkten anfordern und anzeigen.
+
+Der Profilstatus wird in ein temporäres Verzeichnis geschrieben.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+TOOLVERZEICHNIS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLVERZEICHNIS.parent))
+
+START = 1_800_000_000.0
+BESTAETIGUNG_SEKUNDEN = 3.0
+
+# (Phase, Dauer in Sekunden, Abstand der Telemetry-Ereignisse in Sekunden)
+ABLAUF = (
+    ("parken", 1200, 30),
+    ("fahren", 1800, 1),
+    ("parken", 900, 10),
+    ("laden", 3600, 10),
+    ("parken", 1800, 30),
+)
+
+
+class SimulierteUhr:
+    """Uhr, die nur vorrückt, wenn die Simulation es verlangt."""
+
+    def __init__(self, jetzt=START):
+        self.jetzt = float(jetzt)
+
+    def __call__(self):
+        return self.jetzt
+
+
+def fahrzeugdaten(app, phase, jetzt, empfangen, abstaende):
+    """Erzeuge den Dashboard-Datensatz eines Telemetry-Ereignisses."""
+
+    jetzt_ms = int(jetzt * 1000)
+    if phase == "fahren":
+        felder = (*app.FLEET_TELEMETRIE_PROFILE_LIVE_STABIL_FELDER, "VehicleSpeed")
+    else:
+        felder = ("Soc",)
+    for feld in felder:
+        vorher = empfangen.get(feld)
+        if vorher is not None:
+            abstaende[feld] = jetzt_ms - vorher
+        empfangen[feld] = jetzt_ms
+    drive = {"shift_state": "P", "speed": 0}
+    charge = {"charging_state": "Disconnected"}
+    if phase == "fahren":
+        drive = {"shift_state": "D", "speed": 50}
+    elif phase == "laden":
+        charge = {"charging_state": "Charging", "charger_power": 11}
+    return {
+        "state": "online",
+        "drive_state": drive,
+        "charge_state": charge,
+        "vehicle_state": {"locked": True},
+        "climate_state": {},
+        "fleet_telemetry_received_at": jetzt_ms,
+        "fleet_telemetry_updated_at": jetzt_ms,
+        "state_checked_at": jetzt_ms,
+        "fleet_telemetry_field_received_at": dict(empfangen),
+        "fleet_telemetry_field_interval_ms": dict(abstaende),
+    }
+
+
+def ereignisse(ablauf=ABLAUF, start=START):
+    """Liefere ``(zeitpunkt, phase)`` für jedes Telemetry-Ereignis."""
+
+    jetzt = float(start)
+    for phase, dauer, abstand in ablauf:
+        ende = jetzt + dauer
+        while jetzt < ende:
+            yield jetzt, phase
+            jetzt += abstand
+
+
+def profil_bestaetigen(status, profil, jetzt):
+    """Übernehme ein Profil so, wie es nach Teslas Bestätigung aussieht."""
+
+    status.update({
+        "current": profil,
+        "last_posted_at": jetzt,
+        "last_posted_profile": profil,
+        "last_error": None,
+        "config_synced": True,
+        "config_sync_state": "synced",
+        "config_sync_profile": profil,
+        "config_sync_checked_at": jetzt,
+        "config_sync_updated_at": jetzt,
+        "config_sync_error": None,
+        "config_sync_details": [{"source": "telemetry_stream", "synced": True}],
+        "updated_at": jetzt,
+    })
+
+
+@contextmanager
+def steuerung_isoliert(app, steuerung, verzeichnis, anforderungen):
+    """Tausche Profilstatus, Steuerung und Versand gegen Simulationsobjekte."""
+
+    ersetzt = {
+        "TESLA_FLEET_KEY_DIR": str(verzeichnis),
+        "TESLA_FLEET_TELEMETRY_PROFILE_STATUS_FILE": str(
+            Path(verzeichnis) / "profile_status.json"
+        ),
+        "_fleet_telemetry_profile_status": app._fleet_telemetrie_profile_status_standard(),
+        "_fleet_telemetry_profile_steuerung": steuerung,
+        "_fleet_telemetrie_profile_aktiviert": lambda: True,
+        "_fleet_telemetrie_profile_spaeter_anwenden": anforderungen.append,
+    }
+    vorher = {name: getattr(app, name) for name in ersetzt}
+    try:
+        for name, wert in ersetzt.items():
+            setattr(app, name, wert)
+        yield
+    finally:
+        for name, wert in vorher.items():
+            setattr(app, name, wert)
+
+
+def simulation_ausfuehren(app, sparen=True, ablauf=ABLAUF, verzeichnis=None):
+    """Spiele den Ablauf durch und liefere Verlauf und Laufzeiten."""
+
+    uhr = SimulierteUhr()
+    steuerung = app._FleetTelemetrieProfilsteuerung(uhr=uhr, sparen=sparen)
+    anforderungen = []
+    verlauf = []
+    laufzeiten = []
+    offene_bestaetigung = None
+    empfangen = {}
+    abstaende = {}
+    with tempfile.TemporaryDirectory() as temp:
+        with steuerung_isoliert(
+            app,
+            steuerung,
+            verzeichnis or temp,
+            anforderungen,
+        ):
+            for jetzt, phase in ereignisse(ablauf):
+                uhr.jetzt = jetzt
+                status = app._fleet_telemetry_profile_status
+                if (
+                    offene_bestaetigung is not None
+                    and jetzt >= offene_bestaetigung[0]
+                ):
+                    profil_bestaetigen(status, offene_bestaetigung[1], jetzt)
+                    offene_bestaetigung = None
+                data = fahrzeugdaten(app, phase, jetzt, empfangen, abstaende)
+                anzahl = len(anforderungen)
+                beginn = time.perf_counter()
+                app._fleet_telemetrie_profile_aktualisieren("default", data)
+                laufzeiten.append(time.perf_counter() - beginn)
+                if len(anforderungen) > anzahl:
+                    profil = anforderungen[-1]
+                    offene_bestaetigung = (jetzt + BESTAETIGUNG_SEKUNDEN, profil)
+                    verlauf.append((jetzt - START, "angefordert", profil))
+                anzeige = (
+                    data.get("telemetry_profile"),
+                    data.get("telemetry_profile_target"),
+                    data.get("telemetry_config_sync_state"),
+                )
+                if not verlauf or verlauf[-1][1:] != ("angezeigt", anzeige):
+                    verlauf.append((jetzt - START, "angezeigt", anzeige))
+    laufzeiten.sort()
+    return {
+        "ereignisse": len(laufzeiten),
+        "auswertungen": steuerung.auswertungen,
+        "uebersprungen": steuerung.uebersprungen,
+        "mittel_us": sum(laufzeiten) / max(1, len(laufzeiten)) * 1e6,
+        "p95_us": laufzeiten[int(len(laufzeiten) * 0.95)] * 1e6 if laufzeiten else 0.0,
+        "verlauf": verlauf,
+    }
+
+
+def benchmark_ausfuehren(app, ablauf=ABLAUF):
+    """Vergleiche die Steuerung mit und ohne übersprungene Auswertungen."""
+
+    gespart = simulation_ausfuehren(app, sparen=True, ablauf=ablauf)
+    voll = simulation_ausfuehren(app, sparen=False, ablauf=ablauf)
+    return {
+        "gespart": gespart,
+        "voll": voll,
+        "gleicher_verlauf": gespart["verlauf"] == voll["verlauf"],
+    }
+
+
+def bericht_erstellen(ergebnis):
+    zeilen = [
+        "Profilsteuerung mit simulierter Uhr",
+        f"Ereignisse: {ergebnis['voll']['ereignisse']}",
+        "",
+        f"{'Modus':<10} {'Auswertungen':>13} {'übersprungen':>13} "
+        f"{'mittel µs':>10} {'p95 µs':>10}",
+    ]
+    for modus in ("voll", "gespart"):
+        werte = ergebnis[modus]
+        zeilen.append(
+            f"{modus:<10} {werte['auswertungen']:>13} {werte['uebersprungen']:>13} "
+            f"{werte['mittel_us']:>10.1f} {werte['p95_us']:>10.1f}"
+        )
+    zeilen.append("")
+    zeilen.append(
+        "Verlauf identisch: "
+        + ("ja" if ergebnis["gleicher_verlauf"] else "NEIN")
+    )
+    return "\n".join(zeilen)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--verlauf",
+        action="store_true",
+        help="Angeforderte und angezeigte Profile zusätzlich als JSON ausgeben.",
+    )
+    args = parser.parse_args(argv)
+
+    import app
+
+    ergebnis = benchmark_ausfuehren(app)
+    print(bericht_erstellen(ergebnis))
+    if args.verlauf:
+        print(json.dumps(ergebnis["gespart"]["verlauf"], ensure_ascii=False, indent=2))
+    return 0 if ergebnis["gleicher_verlauf"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# © 2026 Erik Schauer, do1ffe@darc.de
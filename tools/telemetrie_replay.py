@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""Spiele einen Fleet-Telemetry-Mitschnitt ohne Broker durch die Ingest-Pipeline.
+
+Der Mitschnitt wird mit ``tools/probefahrt_messung.py --mitschnitt`` erzeugt
+(oder aus einer vorhandenen TSV-Messdatei umgewandelt). Die Nachrichten laufen
+in Gruppen wie im MQTT-Worker durch ``_fleet_telemetrie_mqtt_messages_verarbeiten``.
+Gemessen werden Durchsatz, Laufzeiten der einzelnen Verarbeitungsstufen,
+Haltezeiten der Telemetry-Sperre und der Speicherbedarf je Nachricht.
+
+Alle Schreibzugriffe landen in einem temporären Datenverzeichnis; Adressauflösung
+und APRS-Versand werden während der Wiedergabe nicht gestartet.
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+
+TOOLVERZEICHNIS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLVERZEICHNIS.parent))
+sys.path.insert(0, str(TOOLVERZEICHNIS))
+
+import probefahrt_messung  # noqa: E402
+
+
+MESSSTUFEN = (
+    ("dekodieren", "_fleet_telemetrie_mqtt_event"),
+    ("uebernehmen", "_fleet_telemetrie_v_felder_aktualisieren"),
+    ("feld_setzen", "_fleet_telemetrie_setze_feld"),
+    ("anreichern", "_fleet_telemetrie_dashboard_daten_anreichern"),
+    ("v2l", "_v2l_telemetrie_vormerken"),
+    ("profil", "_fleet_telemetrie_profile_aktualisieren"),
+    ("parkstatus", "_fleet_telemetrie_parkstatus_aufzeichnen"),
+    ("verteilen", "_subscriber_daten_senden"),
+    ("v2l_schreiben", "_v2l_outbox_schreiben"),
+    ("park_schreiben", "_parkstatus_outbox_schreiben"),
+)
+
+PERZENTILE = (50, 95, 99)
+STATUSDATEIEN = (
+    "TESLA_FLEET_TELEMETRY_RUNTIME_FILE",
+    "TESLA_FLEET_VEHICLES_FILE",
+    "TESLA_FLEET_TELEMETRY_CONFIG_REQUEST_FILE",
+    "TESLA_FLEET_TELEMETRY_ACTIVE_CONFIG_FILE",
+    "TESLA_FLEET_TELEMETRY_PROFILE_STATUS_FILE",
+    "TESLA_FLEET_OAUTH_TOKEN_FILE",
+)
+
+
+def nachrichten_laden(pfad):
+    """Lade ``(empfangen, topic, payload)`` aus Mitschnitt oder TSV-Messdatei."""
+
+    pfad = Path(pfad)
+    with pfad.open("rb") as datei:
+        kennung = datei.read(2)
+    if kennung == b"\x1f\x8b":
+        nachrichten = list(probefahrt_messung.mitschnitt_lesen(pfad))
+    else:
+        nachrichten = []
+        for zeile in pfad.read_text(encoding="utf-8", errors="replace").splitlines():
+            teile = zeile.split("\t", 2)
+            if len(teile) != 3:
+                continue
+            try:
+                empfangen = float(teile[0])
+            except ValueError:
+                continue
+            nachrichten.append((empfangen, teile[1], teile[2].encode("utf-8")))
+    nachrichten.sort(key=lambda eintrag: eintrag[0])
+    return nachrichten
+
+
+def gruppen_bilden(nachrichten, gruppen_max, gruppen_sekunden):
+    """Teile Nachrichten wie der MQTT-Worker in Verarbeitungsgruppen auf."""
+
+    gruppen = []
+    aktuelle = []
+    gruppen_start = None
+    for eintrag in nachrichten:
+        if aktuelle and (
+            len(aktuelle) >= gruppen_max
+            or eintrag[0] - gruppen_start > gruppen_sekunden
+        ):
+            gruppen.append(aktuelle)
+            aktuelle = []
+        if not aktuelle:
+            gruppen_start = eintrag[0]
+        aktuelle.append(eintrag)
+    if aktuelle:
+        gruppen.append(aktuelle)
+    return gruppen
+
+
+def perzentil(werte, anteil):
+    """Liefere das Perzentil ``anteil`` (0-100) nach dem Nearest-Rank-Verfahren."""
+
+    if not werte:
+        return None
+    sortiert = sorted(werte)
+    index = min(len(sortiert) - 1, max(0, math.ceil(anteil / 100 * len(sortiert)) - 1))
+    return sortiert[index]
+
+
+def verteilung(werte_sekunden):
+    """Fasse Laufzeiten in Millisekunden mit Perzentilen zusammen."""
+
+    werte = [wert * 1000.0 for wert in werte_sekunden]
+    if not werte:
+        return {"anzahl": 0}
+    ergebnis = {"anzahl": len(werte)}
+    for anteil in PERZENTILE:
+        ergebnis[f"p{anteil}_ms"] = round(perzentil(werte, anteil), 4)
+    ergebnis["max_ms"] = round(max(werte), 4)
+    ergebnis["summe_ms"] = round(sum(werte), 3)
+    return ergebnis
+
+
+class ZeitmessendeSperre:
+    """Umhülle eine Sperre und messe Warte- und Haltezeiten."""
+
+    def __init__(self, sperre, wartezeiten, haltezeiten):
+        self._sperre = sperre
+        self._wartezeiten = wartezeiten
+        self._haltezeiten = haltezeiten
+        self._erhalten = []
+
+    def acquire(self, *args, **kwargs):
+        beginn = time.perf_counter()
+        erhalten = self._sperre.acquire(*args, **kwargs)
+        if erhalten:
+            jetzt = time.perf_counter()
+            self._wartezeiten.append(jetzt - beginn)
+            self._erhalten.append(jetzt)
+        return erhalten
+
+    def release(self):
+        if self._erhalten:
+            self._haltezeiten.append(time.perf_counter() - self._erhalten.pop())
+        self._sperre.release()
+
+    def locked(self):
+        return self._sperre.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *_exc):
+        self.release()
+        return False
+
+
+def _zeitmessung(funktion, messwerte):
+    """Umhülle ``funktion`` und sammle ihre Laufzeiten in ``messwerte``."""
+
+    @wraps(funktion)
+    def _gemessen(*args, **kwargs):
+        beginn = time.perf_counter()
+        try:
+            return funktion(*args, **kwargs)
+        finally:
+            messwerte.append(time.perf_counter() - beginn)
+
+    return _gemessen
+
+
+@contextmanager
+def pipeline_isoliert(app, daten_verzeichnis):
+    """Leite Schreibzugriffe um und halte Netzwerkdienste der App an."""
+
+    schluessel_verzeichnis = Path(daten_verzeichnis) / "tesla_fleet"
+    ersetzt = {
+        "DATA_DIR": str(daten_verzeichnis),
+        "TESLA_FLEET_KEY_DIR": str(schluessel_verzeichnis),
+        "_fleet_telemetry_profile_status": app._fleet_telemetrie_profile_status_standard(),
+        "_fleet_telemetrie_adresse_worker_starten": lambda: None,
+        "_start_aprs_sender": lambda: None,
+    }
+    # Beim Import aus TESLA_FLEET_KEY_DIR abgeleitete Dateien mit umleiten
+    for name in STATUSDATEIEN:
+        ersetzt[name] = str(
+            schluessel_verzeichnis / os.path.basename(getattr(app, name))
+        )
+    vorher = {name: getattr(app, name) for name in ersetzt}
+    latest_vorher = dict(app.latest_data)
+    app.latest_data.clear()
+    app._fleet_telemetry_payload_cache.clear()
+    app._fleet_telemetrie_topic_zerlegen.cache_clear()
+    try:
+        for name, wert in ersetzt.items():
+            setattr(app, name, wert)
+        yield
+    finally:
+        for name, wert in vorher.items():
+            setattr(app, name, wert)
+        app.latest_data.clear()
+        app.latest_data.update(latest_vorher)
+
+
+@contextmanager
+def stufen_messen(app, messwerte):
+    """Instrumentiere Verarbeitungsstufen und Telemetry-Sperre."""
+
+    vorher = {}
+    for stufe, name in MESSSTUFEN:
+        vorher[name] = getattr(app, name)
+        setattr(app, name, _zeitmessung(vorher[name], messwerte[stufe]))
+    globale_sperre = app._fleet_telemetry_lock
+    app._fleet_telemetry_lock = ZeitmessendeSperre(
+        globale_sperre, messwerte["sperre_warten"], messwerte["sperre_halten"]
+    )
+    try:
+        yield
+    finally:
+        app._fleet_telemetry_lock = globale_sperre
+        for name, funktion in vorher.items():
+            setattr(app, name, funktion)
+
+
+def _wiedergabe(app, gruppen, cfg, tempo, messwerte=None, speicher=None):
+    """Spiele Gruppen ab; ``tempo`` ``None`` bedeutet maximale Geschwindigkeit."""
+
+    if not gruppen:
+        return 0.0
+    erster = gruppen[0][0][0]
+    faktor = tempo or 1.0
+    start_wand = time.time()
+    start = time.perf_counter()
+    bulk_puffer = OrderedDict()
+    bulk_faellig = None
+    for gruppe in gruppen:
+        gruppen_zeit = gruppe[0][0]
+        if bulk_faellig is not None and gruppen_zeit >= bulk_faellig:
+            app._fleet_telemetrie_bulk_verarbeiten(bulk_puffer)
+            bulk_faellig = None
+        if tempo:
+            warten = (gruppen_zeit - erster) / tempo - (time.perf_counter() - start)
+            if warten > 0:
+                time.sleep(warten)
+        nachrichten = [
+            (
+                topic,
+                payload,
+                int((start_wand + (empfangen - erster) / faktor) * 1000),
+            )
+            for empfangen, topic, payload in gruppe
+        ]
+        if speicher is not None:
+            tracemalloc.reset_peak()
+            belegt_vorher = tracemalloc.get_traced_memory()[0]
+        beginn = time.perf_counter()
+        app._fleet_telemetrie_mqtt_messages_verarbeiten(
+            nachrichten, cfg, bulk_puffer=bulk_puffer
+        )
+        ende = time.perf_counter()
+        if speicher is not None:
+            belegt, spitze = tracemalloc.get_traced_memory()
+            speicher["spitze"] += max(0, spitze - belegt_vorher)
+            speicher["netto"] += belegt - belegt_vorher
+        if messwerte is not None:
+            messwerte["gruppe"].append(ende - beginn)
+            if tempo:
+                for empfangen, _topic, _payload in gruppe:
+                    geplant = start + (empfangen - erster) / tempo
+                    messwerte["ende_zu_ende"].append(max(0.0, ende - geplant))
+        if bulk_puffer and bulk_faellig is None:
+            bulk_faellig = gruppen_zeit + app.FLEET_TELEMETRY_MQTT_BULK_SECONDS
+        # Der MQTT-Worker gibt zwischen Gruppen beim Socket-Lesen ab; so
+        # kommen auch hier Outbox-Schreiber zwischendurch zum Zug.
+        time.sleep(0)
+    app._fleet_telemetrie_bulk_verarbeiten(bulk_puffer)
+    app._outbox_abwarten()
+    return time.perf_counter() - start
+
+
+def replay_ausfuehren(
+    app,
+    nachrichten,
+    tempo=None,
+    topic_basis=None,
+    speicher_messen=True,
+    daten_verzeichnis=None,
+):
+    """Spiele ``nachrichten`` durch die Pipeline und liefere die Kennzahlen."""
+
+    cfg = app._fleet_telemetrie_runtime_config()
+    if topic_basis:
+        cfg["topic_base"] = topic_basis
+    gruppen = gruppen_bilden(
+        nachrichten,
+        app.FLEET_TELEMETRY_MQTT_BATCH_MAX,
+        app.FLEET_TELEMETRY_MQTT_BATCH_SECONDS,
+    )
+    messwerte = defaultdict(list)
+    eigenes_verzeichnis = daten_verzeichnis is None
+    if eigenes_verzeichnis:
+        daten_verzeichnis = tempfile.mkdtemp(prefix="telemetrie-replay-")
+    try:
+        with pipeline_isoliert(app, Path(daten_verzeichnis) / "zeitmessung"):
+            with stufen_messen(app, messwerte):
+                dauer = _wiedergabe(app, gruppen, cfg, tempo, messwerte)
+        speicher = None
+        if speicher_messen:
+            speicher = {"spitze": 0, "netto": 0}
+            with pipeline_isoliert(app, Path(daten_verzeichnis) / "speicher"):
+                tracemalloc.start()
+                try:
+                    _wiedergabe(app, gruppen, cfg, None, speicher=speicher)
+                finally:
+                    tracemalloc.stop()
+    finally:
+        if eigenes_verzeichnis:
+            shutil.rmtree(daten_verzeichnis, ignore_errors=True)
+
+    anzahl = len(nachrichten)
+    ergebnis = {
+        "nachrichten": anzahl,
+        "gruppen": len(gruppen),
+        "tempo": tempo or "max",
+        "dauer_s": round(dauer, 4),
+        "nachrichten_pro_s": round(anzahl / dauer, 1) if dauer > 0 else None,
+        "stufen": {
+            stufe: verteilung(messwerte[stufe])
+            for stufe in ["gruppe", "ende_zu_ende"] + [s for s, _n in MESSSTUFEN]
+            if messwerte[stufe]
+        },
+        "sperre": {
+            "warten": verteilung(messwerte["sperre_warten"]),
+            "halten": verteilung(messwerte["sperre_halten"]),
+        },
+    }
+    if speicher is not None and anzahl:
+        ergebnis["speicher"] = {
+            "spitze_bytes_pro_nachricht": round(speicher["spitze"] / anzahl, 1),
+            "netto_bytes_pro_nachricht": round(speicher["netto"] / anzahl, 1),
+        }
+    return ergebnis
+
+
+def bericht_erstellen(ergebnis):
+    """Erstelle eine lesbare Zusammenfassung der Replay-Messung."""
+
+    zeilen = [
+        "Fleet-Telemetry-Replay",
+        f"Nachrichten: {ergebnis['nachrichten']} in {ergebnis['gruppen']} Gruppen",
+        f"Tempo: {ergebnis['tempo']}",
+        f"Dauer: {ergebnis['dauer_s']:.3f} s",
+        f"Durchsatz: {ergebnis['nachrichten_pro_s']} Nachrichten/s",
+        "",
+        "Stufe            Anzahl     p50 ms     p95 ms     p99 ms     max ms",
+    ]
+    abschnitte = list(ergebnis["stufen"].items())
+    abschnitte += [
+        (f"sperre_{name}", werte) for name, werte in ergebnis["sperre"].items()
+    ]
+    for name, werte in abschnitte:
+        if not werte.get("anzahl"):
+            continue
+        zeilen.append(
+            f"{name:<16} {werte['anzahl']:>6} {werte['p50_ms']:>10.3f} "
+            f"{werte['p95_ms']:>10.3f} {werte['p99_ms']:>10.3f} {werte['max_ms']:>10.3f}"
+        )
+    speicher = ergebnis.get("speicher")
+    if speicher:
+        zeilen.append("")
+        zeilen.append(
+            "Speicher je Nachricht: "
+            f"{speicher['spitze_bytes_pro_nachricht']:.0f} B Spitze, "
+            f"{speicher['netto_bytes_pro_nachricht']:.0f} B netto"
+        )
+    return "\n".join(zeilen)
+
+
+def grenzen_pruefen(ergebnis, args):
+    """Liefere Verstöße gegen die angegebenen Regressionsgrenzen."""
+
+    verstoesse = []
+    durchsatz = ergebnis.get("nachrichten_pro_s") or 0
+    if args.min_durchsatz is not None and durchsatz < args.min_durchsatz:
+        verstoesse.append(
+            f"Durchsatz {durchsatz} < {args.min_durchsatz} Nachrichten/s"
+        )
+    gruppe = ergebnis["stufen"].get("gruppe") or {}
+    if args.max_p95_ms is not None and (gruppe.get("p95_ms") or 0) > args.max_p95_ms:
+        verstoesse.append(
+            f"Gruppen-p95 {gruppe.get('p95_ms')} ms > {args.max_p95_ms} ms"
+        )
+    return verstoesse
+
+
+def tempo_lesen(wert):
+    """Lese ``max`` oder einen positiven Beschleunigungsfaktor."""
+
+    if str(wert).strip().lower() in {"max", "0"}:
+        return None
+    tempo = float(wert)
+    if tempo <= 0:
+        raise argparse.ArgumentTypeError("Tempo muss größer als 0 oder 'max' sein.")
+    return tempo
+
+
+def parser_erstellen():
+    """Erstelle den Kommandozeilenparser."""
+
+    parser = argparse.ArgumentParser(
+        description="Fleet-Telemetry-Mitschnitt ohne Broker durch die Ingest-Pipeline spielen.",
+    )
+    parser.add_argument("mitschnitt", help="Mitschnitt (gzip) oder TSV-Messdatei.")
+    parser.add_argument(
+        "--tempo",
+        type=tempo_lesen,
+        default=None,
+        help="Wiedergabetempo: 1 für Echtzeit, N für N-fach, max (Standard) ohne Pausen.",
+    )
+    parser.add_argument("--topic-basis", help="Topic-Basis, falls abweichend von der Konfiguration.")
+    parser.add_argument("--json-datei", help="Ergebnis als JSON schreiben.")
+    parser.add_argument(
+        "--ohne-speicher",
+        action="store_true",
+        help="Speichermessung mit tracemalloc auslassen.",
+    )
+    parser.add_argument(
+        "--min-durchsatz",
+        type=float,
+        help="Mit Fehlercode beenden, wenn weniger Nachrichten/s erreicht werden.",
+    )
+    parser.add_argument(
+        "--max-p95-ms",
+        type=float,
+        help="Mit Fehlercode beenden, wenn das p95 der Gruppenlaufzeit darüber liegt.",
+    )
+    return parser
+
+
+def main(argv=None):
+    """Starte die Replay-Messung."""
+
+    args = parser_erstellen().parse_args(argv)
+    nachrichten = nachrichten_laden(args.mitschnitt)
+    if not nachrichten:
+        raise SystemExit(f"{args.mitschnitt} enthält keine MQTT-Nachrichten.")
+
+    import app
+
+    ergebnis = replay_ausfuehren(
+        app,
+        nachrichten,
+        tempo=args.tempo,
+        topic_basis=args.topic_basis,
+        speicher_messen=not args.ohne_speicher,
+    )
+    print(bericht_erstellen(ergebnis))
+    if args.json_datei:
+        Path(args.json_datei).write_text(
+            json.dumps(ergebnis, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+    verstoesse = grenzen_pruefen(ergebnis, args)
+    for verstoss in verstoesse:
+        print(f"Grenze überschritten: {verstoss}", file=sys.stderr)
+    return 1 if verstoesse else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# © 2026 Erik Schauer, do1ffe@darc.de
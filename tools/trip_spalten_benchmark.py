@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Vergleiche Trip-CSV-Dateien mit den Spaltendateien aus ``_trip_spalten_schreiben``.
+
+Erzeugt einen synthetischen Monat an Trip-Tagen in einem temporären
+Verzeichnis und misst das Laden über die CSV, über ``_load_trip`` mit
+Spaltendatei und über die Spaltenansicht aus ``_load_trip_spalten``.
+"""
+
+import argparse
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+TOOLVERZEICHNIS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLVERZEICHNIS.parent))
+
+
+def monat_erzeugen(verzeichnis, tage, punkte):
+    """Schreibe ``tage`` Trip-CSV-Dateien mit je ``punkte`` Punkten."""
+
+    pfade = []
+    verzeichnis.mkdir(parents=True, exist_ok=True)
+    for tag in range(tage):
+        pfad = verzeichnis / f"trip_202605{tag + 1:02d}.csv"
+        beginn = 1_777_593_600_000 + tag * 86_400_000
+        zeilen = []
+        for index in range(punkte):
+            winkel = index / 500
+            zeilen.append(
+                f"{beginn + index * 1000},"
+                f"{51.45 + math.sin(winkel) * 0.05:.6f},"
+                f"{7.01 + math.cos(winkel) * 0.05:.6f},"
+                f"{abs(math.sin(winkel * 3)) * 70:.1f},"
+                f"{math.cos(winkel * 2) * 40:.2f},"
+                f"{(index * 7) % 360},"
+                f"{'P' if index % 900 < 30 else 'D'}"
+            )
+        pfad.write_text("\n".join(zeilen) + "\n", encoding="utf-8")
+        pfade.append(str(pfad))
+    return pfade
+
+
+def dauer_ms(funktion, pfade, wiederholungen):
+    beste = float("inf")
+    for _ in range(wiederholungen):
+        beginn = time.perf_counter()
+        for pfad in pfade:
+            funktion(pfad)
+        beste = min(beste, time.perf_counter() - beginn)
+    return beste * 1000
+
+
+def benchmark_ausfuehren(app, tage=30, punkte=5000, wiederholungen=3):
+    """Führe alle Messungen aus und liefere die Ergebnisse als Dictionary."""
+
+    with tempfile.TemporaryDirectory() as temp:
+        pfade = monat_erzeugen(Path(temp) / "1" / "trips", tage, punkte)
+        csv_ms = dauer_ms(app._load_trip, pfade, wiederholungen)
+        beginn = time.perf_counter()
+        for pfad in pfade:
+            app._trip_spalten_schreiben(pfad)
+        umwandlung_ms = (time.perf_counter() - beginn) * 1000
+        for pfad in pfade:
+            if repr(app._load_trip(pfad)) != repr(app._load_trip_csv(pfad)):
+                raise SystemExit(f"Spaltendatei weicht von {pfad} ab.")
+        listen_ms = dauer_ms(app._load_trip, pfade, wiederholungen)
+        spalten_ms = dauer_ms(app._trip_spalten_lesen, pfade, wiederholungen)
+        csv_bytes = sum(Path(pfad).stat().st_size for pfad in pfade)
+        spalten_bytes = sum(
+            Path(app._trip_spalten_pfad(pfad)).stat().st_size for pfad in pfade
+        )
+    return {
+        "tage": tage,
+        "punkte": tage * punkte,
+        "csv_ms": csv_ms,
+        "umwandlung_ms": umwandlung_ms,
+        "listen_ms": listen_ms,
+        "spalten_ms": spalten_ms,
+        "csv_bytes": csv_bytes,
+        "spalten_bytes": spalten_bytes,
+    }
+
+
+def bericht_erstellen(ergebnis):
+    zeilen = [
+        f"{ergebnis['tage']} Trip-Tage, {ergebnis['punkte']} Punkte",
+        f"  CSV parsen             {ergebnis['csv_ms']:10.1f} ms",
+        f"  Spalten -> Punktlisten {ergebnis['listen_ms']:10.1f} ms",
+        f"  Spaltenansicht (mmap)  {ergebnis['spalten_ms']:10.1f} ms",
+        f"  Umwandlung einmalig    {ergebnis['umwandlung_ms']:10.1f} ms",
+        f"  Größe CSV              {ergebnis['csv_bytes'] / 1e6:10.2f} MB",
+        f"  Größe Spalten          {ergebnis['spalten_bytes'] / 1e6:10.2f} MB",
+    ]
+    return "\n".join(zeilen)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tage", type=int, default=30)
+    parser.add_argument("--punkte", type=int, default=5000)
+    parser.add_argument("--wiederholungen", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    import app
+
+    ergebnis = benchmark_ausfuehren(
+        app,
+        tage=max(1, args.tage),
+        punkte=max(1, args.punkte),
+        wiederholungen=max(1, args.wiederholungen),
+    )
+    print(bericht_erstellen(ergebnis))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# © 2026 Erik Schauer, do1ffe@darc.de